@@ -2091,6 +2091,8 @@ All parameter, weight, gradient are variables in Paddle.
          int time_out = 0,
          int sleep_inter = 0,
          bool redirect_stderr = false) -> std::vector<std::string> {
+        // release the GIL so that commands can run in parallel threads
+        pybind11::gil_scoped_release release;
         return paddle::framework::shell_execute_cmd(
             cmd, time_out, sleep_inter, redirect_stderr);
       },
@@ -14,7 +14,7 @@
 
 import wave
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Iterator, Optional, Tuple, Union
 
 import numpy as np
 
@@ -34,6 +34,69 @@ def _error_message():
     return warn_msg
 
 
+def _open_wave(filepath):
+    if hasattr(filepath, 'read'):
+        file_obj = filepath
+    else:
+        file_obj = open(filepath, 'rb')
+
+    try:
+        file_ = wave.open(file_obj)
+    except wave.Error:
+        file_obj.seek(0)
+        file_obj.close()
+        err_msg = _error_message()
+        raise NotImplementedError(err_msg)
+
+    # default_subtype = "PCM_16", only support PCM16 WAV
+    if file_.getsampwidth() != 2:
+        file_obj.close()
+        err_msg = _error_message()
+        raise NotImplementedError(err_msg)
+    return file_obj, file_
+
+
+def _check_frames(frames, frame_offset, num_frames):
+    # returns the valid frame_offset and the number of frames to read
+    if frame_offset < 0:
+        raise ValueError(
+            "frame_offset should be non-negative, but got {}".format(
+                frame_offset
+            )
+        )
+    frame_offset = min(frame_offset, frames)
+    remain_frames = frames - frame_offset
+    if num_frames == -1:
+        return frame_offset, remain_frames
+    if num_frames < 0:
+        raise ValueError(
+            "num_frames should be -1 or non-negative, but got {}".format(
+                num_frames
+            )
+        )
+    return frame_offset, min(num_frames, remain_frames)
+
+
+def _frames_to_array(audio_content, channels):
+    audio_as_np16 = np.frombuffer(audio_content, dtype='<i2')
+    return np.reshape(audio_as_np16, (-1, channels))
+
+
+def _to_waveform(audio_as_np16, normalize, channels_first):
+    audio_as_np32 = audio_as_np16.astype(np.float32)
+    if normalize:
+        # dtype = "float32"
+        audio_norm = audio_as_np32 / (2**15)
+    else:
+        # dtype = "int16"
+        audio_norm = audio_as_np32
+
+    # waveform with shape (time, channels)
+    if channels_first:
+        audio_norm = np.ascontiguousarray(audio_norm.T)
+    return audio_norm
+
+
 def info(filepath: str) -> AudioInfo:
     """Get signal information of input audio file.
 
@@ -126,43 +189,106 @@ def load(
             paddle.audio.save(filepath, waveform, sample_rate)
             wav_data_read, sr = paddle.audio.load(filepath)
     """
-    if hasattr(filepath, 'read'):
-        file_obj = filepath
-    else:
-        file_obj = open(filepath, 'rb')
-
-    try:
-        file_ = wave.open(file_obj)
-    except wave.Error:
-        file_obj.seek(0)
-        file_obj.close()
-        err_msg = _error_message()
-        raise NotImplementedError(err_msg)
-
+    file_obj, file_ = _open_wave(filepath)
     channels = file_.getnchannels()
     sample_rate = file_.getframerate()
     frames = file_.getnframes()  # audio frame
-
-    audio_content = file_.readframes(frames)
+    # wave.open stops at the start of the data chunk
+    data_offset = file_obj.tell()
+    frame_offset, num_frames = _check_frames(frames, frame_offset, num_frames)
+
+    audio_as_np16 = None
+    if not hasattr(filepath, 'read'):
+        # map the PCM data, only the pages of the requested frames are read
+        try:
+            audio_as_np16 = np.memmap(
+                filepath,
+                dtype='<i2',
+                mode='r',
+                offset=data_offset,
+                shape=(frames, channels),
+            )[frame_offset : frame_offset + num_frames]
+        except ValueError:
+            # data chunk is truncated, fallback to read frames
+            audio_as_np16 = None
+    if audio_as_np16 is None:
+        file_.setpos(frame_offset)
+        audio_as_np16 = _frames_to_array(file_.readframes(num_frames), channels)
     file_obj.close()
 
-    # default_subtype = "PCM_16", only support PCM16 WAV
-    audio_as_np16 = np.frombuffer(audio_content, dtype=np.int16)
-    audio_as_np32 = audio_as_np16.astype(np.float32)
-    if normalize:
-        # dtype = "float32"
-        audio_norm = audio_as_np32 / (2**15)
-    else:
-        # dtype = "int16"
-        audio_norm = audio_as_np32
+    waveform = _to_waveform(audio_as_np16, normalize, channels_first)
+    return paddle.to_tensor(waveform), sample_rate
 
-    waveform = np.reshape(audio_norm, (frames, channels))
-    if num_frames != -1:
-        waveform = waveform[frame_offset : frame_offset + num_frames, :]
-    waveform = paddle.to_tensor(waveform)
-    if channels_first:
-        waveform = paddle.transpose(waveform, perm=[1, 0])
-    return waveform, sample_rate
+
+def stream(
+    filepath: Union[str, Path],
+    chunk_frames: int,
+    frame_offset: int = 0,
+    num_frames: int = -1,
+    normalize: bool = True,
+    channels_first: bool = True,
+) -> Iterator[paddle.Tensor]:
+    """Load audio data from file chunk by chunk, only the frames of current chunk are read into memory,
+    which is suitable for streaming long recordings.
+
+    Args:
+        chunk_frames: number of frames of each chunk, the last chunk may be shorter.
+        frame_offset: from 0 to total frames,
+        num_frames: from -1 (means total frames) or number frames which want to read,
+        normalize:
+            if True: return audio which norm to (-1, 1), dtype=float32
+            if False: return audio with raw data, dtype=int16
+
+        channels_first:
+            if True: return audio with shape (channels, time)
+
+    Return:
+        Iterator[paddle.Tensor]: audio content of each chunk.
+
+    Examples:
+        .. code-block:: python
+
+            import os
+            import paddle
+            from paddle.audio.backends import wave_backend
+
+            sample_rate = 16000
+            wav_duration = 0.5
+            num_channels = 1
+            num_frames = sample_rate * wav_duration
+            wav_data = paddle.linspace(-1.0, 1.0, num_frames) * 0.1
+            waveform = wav_data.tile([num_channels, 1])
+            base_dir = os.getcwd()
+            filepath = os.path.join(base_dir, "test.wav")
+
+            paddle.audio.save(filepath, waveform, sample_rate)
+            for chunk in wave_backend.stream(filepath, chunk_frames=1600):
+                print(chunk.shape) # [1, 1600]
+    """
+    if chunk_frames <= 0:
+        raise ValueError(
+            "chunk_frames should be positive, but got {}".format(chunk_frames)
+        )
+
+    file_obj, file_ = _open_wave(filepath)
+    try:
+        channels = file_.getnchannels()
+        frames = file_.getnframes()
+        frame_offset, num_frames = _check_frames(
+            frames, frame_offset, num_frames
+        )
+        file_.setpos(frame_offset)
+        while num_frames > 0:
+            audio_content = file_.readframes(min(chunk_frames, num_frames))
+            if not audio_content:
+                break
+            audio_as_np16 = _frames_to_array(audio_content, channels)
+            num_frames -= audio_as_np16.shape[0]
+            yield paddle.to_tensor(
+                _to_waveform(audio_as_np16, normalize, channels_first)
+            )
+    finally:
+        file_obj.close()
 
 
 def save(
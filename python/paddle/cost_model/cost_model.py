@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
+import collections
 import json
 import os
+import re
 
 import numpy as np
 
@@ -21,10 +24,155 @@ import paddle
 import paddle.static as static
 from paddle.fluid import core
 
+# e.g. "x (Variable) - dtype: float32, shape: [16, 128]" or
+# "inputs (list<Variable>[2]) - dtype: float32, shape: [1]; "
+_VARIABLE_CONFIG_PATTERN = re.compile(
+    r"^(\S+) \((?:Variable|list<Variable>\[(\d+)\])\) - "
+    r"dtype: (\w+), shape: \[([^\]]*)\]"
+)
+
+# op types in programs whose names are different in the benchmark data
+_OP_NAME_MAPPING = {
+    "c_embedding": "embedding",
+    "matmul_v2": "matmul",
+    "transpose2": "transpose",
+    "reshape2": "reshape",
+    "unsqueeze2": "unsqueeze",
+    "reduce_sum": "sum",
+    "elementwise_add": "add",
+    "elementwise_sub": "subtract",
+    "elementwise_mul": "multiply",
+    "elementwise_div": "divide",
+}
+
+# an op cost in the index, time is None if the op is not benchmarked in the
+# direction, and numel is the total number of elements of the inputs
+_OpCost = collections.namedtuple(
+    '_OpCost', ['time', 'raw_time', 'config', 'numel']
+)
+
+
+# types of variables which have dtype and shape, the others, e.g. feed,
+# fetch and step scopes variables, are not counted as inputs of ops
+_TENSOR_VAR_TYPES = [
+    core.VarDesc.VarType.LOD_TENSOR,
+    core.VarDesc.VarType.SELECTED_ROWS,
+    core.VarDesc.VarType.LOD_TENSOR_ARRAY,
+]
+
+# a config matches a dtype if the name of dtype is in the config
+_DTYPE_NAMES = [
+    "bool",
+    "int",
+    "int8",
+    "uint8",
+    "int16",
+    "int32",
+    "int64",
+    "float16",
+    "bfloat16",
+    "float32",
+    "float64",
+    "complex64",
+    "complex128",
+]
+
+
+def _normalize_dtype(dtype):
+    # "paddle.float32", "VarType.FP32" and np.float32 to "float32"
+    dtype = str(dtype).split('.')[-1].lower().strip("'>")
+    return {
+        "fp16": "float16",
+        "fp32": "float32",
+        "fp64": "float64",
+        "bf16": "bfloat16",
+    }.get(dtype, dtype)
+
+
+def _numel(shape):
+    return int(np.prod(shape)) if len(shape) > 0 else 1
+
+
+def _parse_config(config):
+    # returns dtypes matched and the total number of elements of the
+    # variables in config
+    dtypes = [dtype for dtype in _DTYPE_NAMES if dtype in config]
+    numel = 0
+    for line in config.split("\n"):
+        match = _VARIABLE_CONFIG_PATTERN.match(line.strip())
+        if match is None:
+            continue
+        _, num_vars, _, shape = match.groups()
+        shape = [int(dim) for dim in shape.split(",") if dim.strip()]
+        numel += _numel(shape) * (int(num_vars) if num_vars else 1)
+    return dtypes, numel
+
+
+def _to_time(raw_time):
+    try:
+        return float(raw_time)
+    except (TypeError, ValueError):
+        return None
+
+
+def _input_numel(shape):
+    # shape of an input, list of shapes of inputs or the number of elements
+    if isinstance(shape, int):
+        return shape
+    if len(shape) > 0 and isinstance(shape[0], (list, tuple)):
+        return sum(_numel(s) for s in shape)
+    return _numel(shape)
+
+
+def _op_config(block, op, batch_size):
+    # returns the op type, forward or not, the dtype of the first input and
+    # the config of inputs in the same format as the benchmark data, where
+    # the inputs of backward ops are counted as their forward ops
+    forward = not op.type.endswith("_grad")
+    op_type = op.type if forward else op.type[: -len("_grad")]
+    dtype = None
+    config = ""
+    for arg_name in op.input_names:
+        for name in op.input(arg_name):
+            if not block.has_var(name) or name.endswith("@GRAD"):
+                continue
+            var = block.var(name)
+            if var.type not in _TENSOR_VAR_TYPES:
+                continue
+            if dtype is None:
+                dtype = _normalize_dtype(var.dtype)
+            shape = [batch_size if dim < 0 else dim for dim in var.shape]
+            config += "{} (Variable) - dtype: {}, shape: {}\n".format(
+                arg_name.lower(), _normalize_dtype(var.dtype), shape
+            )
+    return op_type, forward, dtype or "float32", config
+
+
+def _interpolate(costs, numels, numel):
+    # costs are sorted by numels, and linearly interpolated, or scaled from
+    # the nearest one out of the benchmarked range
+    index = bisect.bisect_left(numels, numel)
+    if index < len(costs) and numels[index] == numel:
+        # the last loaded one of the same size, e.g. the profiled one
+        last = bisect.bisect_right(numels, numel) - 1
+        return costs[last].time, costs[last]
+    if index == 0 or index == len(costs):
+        nearest = costs[0] if index == 0 else costs[-1]
+        if nearest.numel == 0:
+            return nearest.time, nearest
+        return nearest.time * numel / nearest.numel, nearest
+    lower, upper = costs[index - 1], costs[index]
+    ratio = (numel - lower.numel) / (upper.numel - lower.numel)
+    nearest = lower if ratio < 0.5 else upper
+    return lower.time + (upper.time - lower.time) * ratio, nearest
+
 
 class CostModel:
     def __init__(self):
-        pass
+        # index of op costs keyed by (op name, dtype, forward)
+        self._static_cost_index = {}
+        # op costs sorted by numel for interpolation, built lazily
+        self._sorted_cost_index = {}
 
     def build_program(self):
         paddle.enable_static()
@@ -71,10 +219,67 @@ class CostModel:
         with open(static_cost_data_path, 'r') as load_f:
             load_dict = json.load(load_f)
         self._static_cost_data = load_dict
+        for op_data in load_dict:
+            dtypes, numel = _parse_config(op_data["config"])
+            for forward, time_key in [
+                (True, "paddle_gpu_time"),
+                (False, "paddle_gpu_time_backward"),
+            ]:
+                for dtype in dtypes:
+                    self._add_op_cost(
+                        op_data["op"],
+                        dtype,
+                        forward,
+                        op_data[time_key],
+                        op_data["config"],
+                        numel,
+                    )
         # return all static cost data
         return load_dict
 
-    def get_static_op_time(self, op_name, forward=True, dtype="float32"):
+    def _add_op_cost(self, op_name, dtype, forward, raw_time, config, numel):
+        key = (op_name, dtype, forward)
+        cost = _OpCost(_to_time(raw_time), raw_time, config, numel)
+        self._static_cost_index.setdefault(key, []).append(cost)
+        self._sorted_cost_index.pop(key, None)
+
+    def _sorted_op_costs(self, key):
+        if key not in self._sorted_cost_index:
+            costs = sorted(
+                (
+                    cost
+                    for cost in self._static_cost_index.get(key, [])
+                    if cost.time is not None
+                ),
+                key=lambda cost: cost.numel,
+            )
+            numels = [cost.numel for cost in costs]
+            self._sorted_cost_index[key] = (costs, numels)
+        return self._sorted_cost_index[key]
+
+    def get_static_op_time(
+        self, op_name, forward=True, dtype="float32", shape=None
+    ):
+        """
+        Get the time of op from the static benchmark data and the loaded
+        profile data, in milliseconds.
+
+        Args:
+            op_name(str): name of the op, e.g. "conv2d".
+            forward(bool, optional): whether to get the forward time or the
+                backward time of op. Default: True.
+            dtype(str|paddle.dtype, optional): data type of the inputs of op.
+                Default: "float32".
+            shape(list|tuple|int, optional): shape of the input, list of
+                shapes of the inputs or the total number of elements of the
+                inputs. If it is given, the time is interpolated between the
+                benchmarked configs by the number of elements, otherwise the
+                time of the last benchmarked config is returned. Default: None.
+
+        Returns:
+            dict: "op_time" is the time of op, and "config" is the benchmarked
+            config used, or an empty dict if the op is not benchmarked.
+        """
         # if forward is True, return op forward time, otherwise return op backward time.
         if op_name is None:
             raise ValueError(
@@ -82,12 +287,87 @@ class CostModel:
             )
 
         op_cost = {}
-        for op_data in self._static_cost_data:
-            if (op_data["op"] == op_name) and (dtype in op_data["config"]):
-                if forward:
-                    op_cost["op_time"] = op_data["paddle_gpu_time"]
-                else:
-                    op_cost["op_time"] = op_data["paddle_gpu_time_backward"]
-                op_cost["config"] = op_data["config"]
+        key = (op_name, _normalize_dtype(dtype), forward)
+        if shape is None:
+            costs = self._static_cost_index.get(key, None)
+            if costs:
+                op_cost["op_time"] = costs[-1].raw_time
+                op_cost["config"] = costs[-1].config
+            return op_cost
 
+        costs, numels = self._sorted_op_costs(key)
+        if costs:
+            op_time, nearest = _interpolate(costs, numels, _input_numel(shape))
+            op_cost["op_time"] = str(op_time)
+            op_cost["config"] = nearest.config
         return op_cost
+
+    def _get_op_type_time(self, op_type, forward, dtype, numel):
+        for name in [op_type, _OP_NAME_MAPPING.get(op_type, None)]:
+            if name is None:
+                continue
+            op_cost = self.get_static_op_time(name, forward, dtype, numel)
+            if op_cost:
+                return float(op_cost["op_time"])
+        return None
+
+    def get_program_time(self, program, batch_size=1):
+        """
+        Estimate the time of the ops in the global block of a static program
+        by the static benchmark data and the loaded profile data, in
+        milliseconds. The time of each op is interpolated by the total
+        number of elements of its inputs, and the time of a backward op
+        not benchmarked is estimated as twice the forward time.
+
+        Args:
+            program(Program): the static program to estimate.
+            batch_size(int, optional): the size of unknown dimensions of the
+                input shapes. Default: 1.
+
+        Returns:
+            dict: "program_time" is the sum of the time of ops, "op_times" is
+            the list of time of each op, which is None if the op is not
+            benchmarked, and "missing_ops" is the sorted list of types of
+            those ops.
+        """
+        block = program.global_block()
+        op_times = []
+        missing_ops = set()
+        for op in block.ops:
+            op_type, forward, dtype, config = _op_config(block, op, batch_size)
+            _, numel = _parse_config(config)
+            op_time = self._get_op_type_time(op_type, forward, dtype, numel)
+            if op_time is None and not forward:
+                op_time = self._get_op_type_time(op_type, True, dtype, numel)
+                op_time = None if op_time is None else 2 * op_time
+            if op_time is None:
+                missing_ops.add(op.type)
+            op_times.append(op_time)
+
+        return {
+            "program_time": sum(t for t in op_times if t is not None),
+            "op_times": op_times,
+            "missing_ops": sorted(missing_ops),
+        }
+
+    def load_profile_data(self, program, cost_data, batch_size=1):
+        """
+        Load the time of ops measured by `core.CostModel().profile_measure`
+        into the index, which is used by get_static_op_time and
+        get_program_time together with the static benchmark data.
+
+        Args:
+            program(Program): the static program measured.
+            cost_data(core.CostData): the measured cost data of the program.
+            batch_size(int, optional): the size of unknown dimensions of the
+                input shapes when measuring. Default: 1.
+        """
+        block = program.global_block()
+        for op_id, op in enumerate(block.ops):
+            op_type, forward, dtype, config = _op_config(block, op, batch_size)
+            dtypes, numel = _parse_config(config)
+            op_time = cost_data.get_op_time_ms(op_id)
+            for dtype in dtypes or [dtype]:
+                self._add_op_cost(
+                    op_type, dtype, forward, str(op_time), config, numel
+                )
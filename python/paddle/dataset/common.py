@@ -22,6 +22,7 @@ import shutil
 import sys
 import tempfile
 
+import numpy as np
 import requests
 
 import paddle
@@ -223,3 +224,87 @@ def _check_exists_and_download(path, url, md5, module_name, download=True):
         raise ValueError(
             '{} not exists and auto download disabled'.format(path)
         )
+
+
+def _cached_array_paths(src_paths, names, module_name):
+    # cache files are identified by path, size and modification time of
+    # the source files, so that changed source files are decoded again
+    hash_md5 = hashlib.md5()
+    for path in src_paths:
+        stat = os.stat(path)
+        hash_md5.update(
+            '{}:{}:{}'.format(
+                os.path.abspath(path), stat.st_size, stat.st_mtime_ns
+            ).encode()
+        )
+    digest = hash_md5.hexdigest()[:16]
+
+    dirname = os.path.dirname(os.path.abspath(src_paths[0]))
+    if not os.access(dirname, os.W_OK):
+        dirname = os.path.join(DATA_HOME, module_name)
+    prefix = os.path.join(
+        dirname, '{}.{}'.format(os.path.basename(src_paths[0]), digest)
+    )
+    return ['{}.{}.npy'.format(prefix, name) for name in names]
+
+
+def _remove_stale_cached_arrays(cache_paths, names):
+    # cache files of the source files before they changed are never loaded
+    # again, they only differ from the current ones in the digest
+    for path, name in zip(cache_paths, names):
+        suffix = '.{}.npy'.format(name)
+        # strip the suffix and the 16 hex digits of digest with its dot
+        prefix = path[: -len(suffix) - 17]
+        pattern = '{}.{}{}'.format(
+            glob.escape(prefix), '[0-9a-f]' * 16, glob.escape(suffix)
+        )
+        for stale_path in glob.glob(pattern):
+            if stale_path != path:
+                try:
+                    os.remove(stale_path)
+                except OSError:
+                    pass
+
+
+def _load_cached_arrays(src_paths, names, decode_fn, module_name):
+    """
+    Load arrays decoded from source files of dataset, arrays are decoded
+    by :attr:`decode_fn` once and saved as .npy files, which are memory
+    mapped read-only in subsequent loads, so that processes loading the
+    same dataset share the pages.
+
+    Args:
+        src_paths(list[str]): source files of the arrays.
+        names(list[str]): names of the arrays, used in cache file names.
+        decode_fn(callable): decode source files and return the arrays in
+            order of :attr:`names`.
+        module_name(str): dataset name, cache files are saved under
+            DATA_HOME/module_name if directory of source files is not
+            writable.
+
+    Returns:
+        list[numpy.ndarray]: arrays in order of :attr:`names`.
+    """
+    cache_paths = _cached_array_paths(src_paths, names, module_name)
+    if all(os.path.exists(path) for path in cache_paths):
+        try:
+            return [np.load(path, mmap_mode='r') for path in cache_paths]
+        except (OSError, ValueError):
+            # broken cache files, decode again
+            pass
+
+    arrays = decode_fn()
+    try:
+        os.makedirs(os.path.dirname(cache_paths[0]), exist_ok=True)
+        for array, path in zip(arrays, cache_paths):
+            # write to a temporary file and rename it, so that concurrent
+            # loaders never read a partially written cache file
+            tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+            with open(tmp_path, 'wb') as f:
+                np.save(f, np.ascontiguousarray(array))
+            os.replace(tmp_path, path)
+        _remove_stale_cached_arrays(cache_paths, names)
+        return [np.load(path, mmap_mode='r') for path in cache_paths]
+    except OSError:
+        # cache is optional, use decoded arrays directly
+        return list(arrays)
@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
 import sys
 
+import numpy as np
+
 __all__ = []
 
 
@@ -83,16 +86,12 @@ class DataGenerator:
                 continue
             batch_samples.append(user_parsed_line)
             if len(batch_samples) == self.batch_size_:
-                batch_iter = self.generate_batch(batch_samples)
-                for sample in batch_iter():
-                    sys.stdout.write(self._gen_str(sample))
+                self._write_batch(batch_samples)
                 batch_samples = []
         if len(batch_samples) > 0:
-            batch_iter = self.generate_batch(batch_samples)
-            for sample in batch_iter():
-                sys.stdout.write(self._gen_str(sample))
+            self._write_batch(batch_samples)
 
-    def run_from_stdin(self):
+    def run_from_stdin(self, columnar=False):
         '''
         This function reads the data row from stdin, parses it with the
         process function, and further parses the return value of the
@@ -100,6 +99,16 @@ class DataGenerator:
         be wrote to stdout and the corresponding protofile will be
         generated.
 
+        If `columnar` is True, the data rows are read from stdin a batch at
+        a time, and each batch of rows is parsed into columns of slots by
+        generate_columnar_batch, which are formatted at a time and wrote to
+        stdout. It saves the per-sample processing in python, see
+        generate_columnar_batch for details.
+
+        Args:
+            columnar(bool, optional): whether to process the data rows a
+                batch at a time with generate_columnar_batch. Default: False.
+
         Example:
 
             .. code-block:: python
@@ -117,6 +126,10 @@ class DataGenerator:
                 mydata.run_from_stdin()
 
         '''
+        if columnar:
+            self._run_columnar_from_stdin()
+            return
+
         batch_samples = []
         for line in sys.stdin:
             line_iter = self.generate_sample(line)
@@ -125,14 +138,26 @@ class DataGenerator:
                     continue
                 batch_samples.append(user_parsed_line)
                 if len(batch_samples) == self.batch_size_:
-                    batch_iter = self.generate_batch(batch_samples)
-                    for sample in batch_iter():
-                        sys.stdout.write(self._gen_str(sample))
+                    self._write_batch(batch_samples)
                     batch_samples = []
         if len(batch_samples) > 0:
-            batch_iter = self.generate_batch(batch_samples)
-            for sample in batch_iter():
-                sys.stdout.write(self._gen_str(sample))
+            self._write_batch(batch_samples)
+
+    def _write_batch(self, batch_samples):
+        # write a batch at a time instead of a sample at a time
+        batch_iter = self.generate_batch(batch_samples)
+        sys.stdout.write(
+            "".join([self._gen_str(sample) for sample in batch_iter()])
+        )
+
+    def _run_columnar_from_stdin(self):
+        while True:
+            lines = list(itertools.islice(sys.stdin, self.batch_size_))
+            if not lines:
+                break
+            columns = self.generate_columnar_batch(lines)
+            if columns is not None:
+                sys.stdout.write(self._gen_columnar_str(columns))
 
     def _gen_str(self, line):
         '''
@@ -233,6 +258,149 @@ class DataGenerator:
 
         return local_iter
 
+    def generate_columnar_batch(self, lines):
+        '''
+        This function needs to be overridden by the user to use the columnar
+        mode of run_from_stdin. It processes a batch of original data rows
+        into columns of slots, e.g. parses the rows with numpy at a time.
+
+        Args:
+            lines(list): a batch of original data rows, the number of rows is
+                the batch size set by set_batch, except for the last batch.
+
+        Returns:
+            A list or tuple of slots in the same order as the rows returned by
+            generate_sample, or None to skip the batch. Each slot is a tuple
+            of name and values, and the values can be:
+
+            1. a 2-D numpy array in shape [batch_size, num_feasigns], when
+            every row of the slot has the same number of feasigns;
+            2. a tuple of a 1-D numpy array of all the feasigns in the batch
+            and a 1-D numpy array of the number of feasigns of each row.
+
+            For example:
+            [("words", np.array([[1926, 8, 17], [1, 2, 3]])),
+             ("tags", (np.array([1, 2, 3]), np.array([1, 2]))),
+             ("label", np.array([[1], [0]]))]
+            is the same as the rows returned by generate_sample:
+            [("words", [1926, 8, 17]), ("tags", [1]), ("label", [1])]
+            [("words", [1, 2, 3]), ("tags", [2, 3]), ("label", [0])]
+
+        Example:
+
+            .. code-block:: python
+
+                import numpy as np
+                import paddle.distributed.fleet.data_generator as dg
+                class MyData(dg.MultiSlotDataGenerator):
+
+                    def generate_columnar_batch(self, lines):
+                        data = np.array(
+                            [line.split() for line in lines], dtype='int64')
+                        return [("words", data[:, :-1]), ("label", data[:, -1:])]
+
+                mydata = MyData()
+                mydata.set_batch(1024)
+                mydata.run_from_stdin(columnar=True)
+        '''
+        raise NotImplementedError(
+            "Please rewrite this function to return a list or tuple of "
+            "columns: [(name, values), ...]"
+        )
+
+    def _gen_columnar_str(self, columns):
+        '''
+        Further processing the output of the generate_columnar_batch()
+        function rewritten by user, outputting data that can be directly
+        read by the datafeed, the same as _gen_str() of each row.
+
+        Args:
+            columns(list|tuple): the output of generate_columnar_batch().
+
+        Returns:
+            Return a string data of the batch that can be read directly by
+            the datafeed.
+        '''
+        raise NotImplementedError(
+            "pls use MultiSlotDataGenerator or MultiSlotStringDataGenerator"
+        )
+
+
+def _columns_to_rows(columns):
+    # returns names, numpy dtypes and rows formatted as "num id1 id2 ..." of
+    # each slot
+    if isinstance(columns, zip):
+        columns = list(columns)
+    if not isinstance(columns, (list, tuple)):
+        raise ValueError(
+            "the output of generate_columnar_batch() must be in list or tuple "
+            "type. Example: [('words', np.array([[1926, 8, 17]])), "
+            "('label', np.array([[1]]))]"
+        )
+    names = []
+    dtypes = []
+    slot_rows = []
+    batch_size = None
+    for item in columns:
+        name, values = item
+        if not isinstance(name, str):
+            raise ValueError("name%s must be in str type" % type(name))
+        if isinstance(values, tuple):
+            values, lengths = values
+            values = np.asarray(values)
+            lengths = np.asarray(lengths)
+            if values.ndim != 1 or lengths.ndim != 1:
+                raise ValueError(
+                    "the values and lengths of slot %s must be 1-D arrays"
+                    % name
+                )
+            if lengths.sum() != values.shape[0]:
+                raise ValueError(
+                    "the sum of lengths of slot %s must be equal to the "
+                    "number of values, but received %d and %d."
+                    % (name, lengths.sum(), values.shape[0])
+                )
+            if (lengths <= 0).any():
+                raise ValueError(
+                    "the elements of each field can not be empty, you need "
+                    "padding it in generate_columnar_batch()."
+                )
+            offsets = np.concatenate([[0], np.cumsum(lengths)]).tolist()
+            flat = [str(v) for v in values.tolist()]
+            rows = [
+                str(end - begin) + " " + " ".join(flat[begin:end])
+                for begin, end in zip(offsets[:-1], offsets[1:])
+            ]
+        else:
+            values = np.asarray(values)
+            if values.ndim != 2:
+                raise ValueError(
+                    "the values of slot %s must be a 2-D array or a tuple of "
+                    "values and lengths, but received %d-D array."
+                    % (name, values.ndim)
+                )
+            if values.shape[1] == 0:
+                raise ValueError(
+                    "the elements of each field can not be empty, you need "
+                    "padding it in generate_columnar_batch()."
+                )
+            prefix = str(values.shape[1]) + " "
+            rows = [prefix + " ".join(map(str, row)) for row in values.tolist()]
+        if batch_size is None:
+            batch_size = len(rows)
+        elif batch_size != len(rows):
+            raise ValueError(
+                "the batch size of all slots must be the same, but slot %s "
+                "has %d rows while others have %d rows."
+                % (name, len(rows), batch_size)
+            )
+        names.append(name)
+        dtypes.append(values.dtype)
+        slot_rows.append(rows)
+    if not slot_rows or batch_size == 0:
+        return names, dtypes, ""
+    return names, dtypes, "\n".join(map(" ".join, zip(*slot_rows))) + "\n"
+
 
 # TODO: guru4elephant
 # add more generalized DataGenerator that can adapt user-defined slot
@@ -281,6 +449,26 @@ class MultiSlotStringDataGenerator(DataGenerator):
             output += " ".join(out_str)
         return output + "\n"
 
+    def _gen_columnar_str(self, columns):
+        '''
+        Further processing the output of the generate_columnar_batch()
+        function rewritten by user, outputting data that can be directly
+        read by the MultiSlotDataFeed.
+
+        The input columns will be in this format:
+            >>> [(name, np.array([[str(feasign), ...], ...])), ...]
+            >>> or [(name, (np.array([str(feasign), ...]), lengths)), ...]
+        The output will be the same as _gen_str() of each row.
+
+        Args:
+            columns(list|tuple): the output of generate_columnar_batch().
+
+        Returns:
+            Return a string data that can be read directly by the MultiSlotDataFeed.
+        '''
+        _, _, output = _columns_to_rows(columns)
+        return output
+
 
 class MultiSlotDataGenerator(DataGenerator):
     def _gen_str(self, line):
@@ -384,3 +572,59 @@ class MultiSlotDataGenerator(DataGenerator):
                             )
                     output += " " + str(elem)
         return output + "\n"
+
+    def _gen_columnar_str(self, columns):
+        '''
+        Further processing the output of the generate_columnar_batch()
+        function rewritten by user, outputting data that can be directly
+        read by the MultiSlotDataFeed, and updating proto_info information.
+
+        The input columns will be in this format:
+            >>> [(name, np.array([[feasign, ...], ...])), ...]
+            >>> or [(name, (np.array([feasign, ...]), lengths)), ...]
+        The output will be the same as _gen_str() of each row, and a slot
+        is of float type if the dtype of its values is floating point.
+
+        For example, if the input is like this:
+            >>> [("words", np.array([[1926, 8, 17], [1, 2, 3]])),
+            >>>  ("label", np.array([[1], [0]]))]
+        the output will be:
+            >>> 3 1926 8 17 1 1
+            >>> 3 1 2 3 1 0
+        the proto_info will be:
+            >>> [("words", "uint64"), ("label", "uint64")]
+
+        Args:
+            columns(list|tuple): the output of generate_columnar_batch().
+
+        Returns:
+            Return a string data that can be read directly by the MultiSlotDataFeed.
+        '''
+        names, dtypes, output = _columns_to_rows(columns)
+        proto_info = []
+        for name, dtype in zip(names, dtypes):
+            if dtype.kind == 'f':
+                proto_info.append((name, "float"))
+            elif dtype.kind in 'iu':
+                proto_info.append((name, "uint64"))
+            else:
+                raise ValueError(
+                    "the type of element%s must be in int or float" % dtype
+                )
+
+        if self._proto_info is None:
+            self._proto_info = proto_info
+            return output
+        if len(proto_info) != len(self._proto_info):
+            raise ValueError(
+                "the complete field set of two given line are inconsistent."
+            )
+        for index, (name, slot_type) in enumerate(proto_info):
+            if name != self._proto_info[index][0]:
+                raise ValueError(
+                    "the field name of two given line are not match: require<%s>, get<%s>."
+                    % (self._proto_info[index][0], name)
+                )
+            if slot_type == "float":
+                self._proto_info[index] = (name, "float")
+        return output
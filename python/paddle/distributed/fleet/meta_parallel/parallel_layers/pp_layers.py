@@ -49,6 +49,7 @@ import paddle.framework as framework
 import paddle.nn as nn
 from paddle.incubate.distributed.fleet import recompute_hybrid
 
+from ...recompute.recompute_planner import RecomputePlanner
 from ...utils.log_util import layer_to_str, logger
 
 __all__ = []
@@ -214,8 +215,10 @@ class PipelineLayer(nn.Layer):
         topology(CommunicateTopology, optional): topo of hybrid parallel, if it is None, 'num_stages' parameters must be given.
         loss_fn(callable, optional): Loss function.
         seg_method(str, optional): the method of splitting pp layer, default 'uniform', or use specific layer to split, method's name must be start with 'layer:'.
-        recompute_interval(int, optional): the number of layers to be used recompute, the value of 0 represents no recompute. default 0.
-        recompute_ctx(dict,optional): the context of recompute, when 'recompute_interval' > 0, the context must be given.
+        recompute_interval(int|str, optional): the number of layers to be used recompute, the value of 0 represents no recompute. 'auto' plans the layers
+                to recompute by profiling the first micro batch with grad, to minimize the time of recompute under the 'memory_budget' (int) of recompute_ctx,
+                the bytes of activations allowed in the forward of a micro batch. default 0.
+        recompute_ctx(dict,optional): the context of recompute, when 'recompute_interval' > 0 or 'auto', the context must be given.
         num_virtual_pipeline_stages(int, optional): the num of virtual pipeline stages for interleave pp.
     Examples:
         .. code-block:: python
@@ -330,11 +333,17 @@ class PipelineLayer(nn.Layer):
         self._topo = topology
         self._recompute_interval = recompute_interval
         self.recompute_ctx = recompute_ctx
+        # the planners of recompute for each model chunk
+        self._recompute_planners = {}
 
-        if recompute_interval > 0:
+        if recompute_interval == "auto" or recompute_interval > 0:
             assert (
                 recompute_ctx is not None
             ), "recompute_ctx must be not None for recompute."
+            if recompute_interval == "auto":
+                assert (
+                    'memory_budget' in recompute_ctx
+                ), "recompute_ctx must have memory_budget for auto recompute."
 
             offload = recompute_ctx.get('offload', False)
             partition = recompute_ctx.get('partition', False)
@@ -703,6 +712,8 @@ class PipelineLayer(nn.Layer):
 
         if self._recompute_interval == 0:
             input = self.forward_function(0, len(self.run_function))(input)
+        elif self._recompute_interval == "auto":
+            input = self._forward_with_planner(input, chunk_id)
         else:
             num_layers = len(self.run_function)
             for start_idx in range(0, num_layers, self._recompute_interval):
@@ -723,6 +734,42 @@ class PipelineLayer(nn.Layer):
 
         return input
 
+    def _forward_with_planner(self, input, chunk_id):
+        planner = self._recompute_planners.get(chunk_id, None)
+        if planner is None:
+            planner = RecomputePlanner(self.recompute_ctx['memory_budget'])
+            self._recompute_planners[chunk_id] = planner
+
+        num_layers = len(self.run_function)
+        if not isinstance(input, tuple):
+            input = (input,)
+        if planner.segments is None:
+            if not framework._dygraph_tracer()._has_grad:
+                return self.forward_function(0, num_layers)(*input)
+            output = planner.profile(
+                [self.forward_function(i, i + 1) for i in range(num_layers)],
+                *input
+            )
+            planner.solve()
+            return output
+
+        for start_idx, end_idx, need_recompute in planner.segments:
+            funcs = self.run_function[start_idx:end_idx]
+
+            if not isinstance(input, tuple):
+                input = (input,)
+
+            if need_recompute and self._need_recompute(funcs, input):
+                input = recompute_hybrid(
+                    self.recompute_ctx,
+                    self.forward_function(start_idx, end_idx),
+                    *input
+                )
+            else:
+                input = self.forward_function(start_idx, end_idx)(*input)
+
+        return input
+
     def _need_recompute(self, funcs, inputs):
         if not any(
             not input_.stop_gradient
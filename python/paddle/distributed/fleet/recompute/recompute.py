@@ -24,6 +24,7 @@ from paddle.distributed.fleet.meta_parallel.parallel_layers.random import (
 from paddle.framework import core, in_dygraph_mode
 
 from ..utils.log_util import logger
+from .recompute_planner import RecomputePlanner
 
 __all__ = []
 
@@ -327,6 +328,116 @@ def _recompute_without_reentrant(
     return outputs
 
 
+class _OffloadedTensor:
+    """
+    An activation saved by autograd, which is copied to the pinned host memory
+    in forward and prefetched back to the device in backward. The copies are
+    not blocking and issued on the stream of computation, so they are ordered
+    with the kernels reading or reusing the device memory.
+    """
+
+    def __init__(self, tensor, index):
+        self.index = index
+        self.device_id = tensor.place.gpu_device_id()
+        self.host_tensor = tensor._copy_to(core.CUDAPinnedPlace(), False)
+        self.tensor = None
+
+    def prefetch(self):
+        if self.tensor is None:
+            self.tensor = self.host_tensor._copy_to(
+                paddle.CUDAPlace(self.device_id), False
+            )
+
+    def get(self):
+        self.prefetch()
+        # the device copy is released once the backward no longer needs it
+        tensor, self.tensor = self.tensor, None
+        return tensor
+
+
+def _need_offload(tensor):
+    # the parameters stay on device, and the activations on host have nothing
+    # to offload
+    return (
+        isinstance(tensor, core.eager.Tensor)
+        and tensor.place.is_gpu_place()
+        and not tensor.persistable
+        and tensor._numel() > 0
+    )
+
+
+def _offload_without_reentrant(function, prefetch_depth, *args, **kwargs):
+    """
+    offload the activations saved by autograd in function to the pinned host memory rather than recompute them,
+    the offloaded activations are prefetched back to device prefetch_depth tensors ahead in backward.
+    """
+    offloaded = []
+
+    def pack(x):
+        if not _need_offload(x):
+            return x
+        offloaded.append(_OffloadedTensor(x, len(offloaded)))
+        return offloaded[-1]
+
+    def unpack(x):
+        if not isinstance(x, _OffloadedTensor):
+            return x
+        # the backward uses the activations roughly in the reversed order
+        for holder in offloaded[max(x.index - prefetch_depth, 0) : x.index]:
+            holder.prefetch()
+        return x.get()
+
+    with paddle.autograd.saved_tensors_hooks(pack, unpack):
+        outputs = function(*args, **kwargs)
+
+    return outputs
+
+
+def _is_expensive_layer(function):
+    # the layers with the weights of matmul or conv dominate the compute, while
+    # the others, such as activations, dropout and norms, are cheap to recompute
+    return isinstance(function, paddle.nn.Layer) and any(
+        len(param.shape) >= 2 for param in function.parameters()
+    )
+
+
+def _run_functions(functions):
+    def do_run(*inputs):
+        for function in functions:
+            inputs = function(*inputs)
+            inputs = inputs if isinstance(inputs, tuple) else (inputs,)
+        return inputs[0] if len(inputs) == 1 else inputs
+
+    return do_run
+
+
+def _recompute_selective(functions, preserve_rng_state, *args):
+    """
+    run functions one after another, offload the activations of expensive functions and recompute the cheap ones
+    consecutively.
+    """
+    begin = 0
+    while begin < len(functions):
+        expensive = _is_expensive_layer(functions[begin])
+        end = begin + 1
+        while (
+            end < len(functions)
+            and _is_expensive_layer(functions[end]) == expensive
+        ):
+            end += 1
+        run_function = _run_functions(functions[begin:end])
+        if expensive:
+            outputs = _offload_without_reentrant(run_function, 1, *args)
+        else:
+            outputs = _recompute_without_reentrant(
+                run_function, preserve_rng_state, *args
+            )
+        args = outputs if isinstance(outputs, tuple) else (outputs,)
+        begin = end
+
+    return outputs
+
+
 def recompute(function, *args, **kwargs):
     """
     recompute intermediate activations to save then memory.
@@ -342,7 +453,12 @@ def recompute(function, *args, **kwargs):
                         will be restored when the forward recalculation of backpropagation is performed, its default value is True.
                         the key-value pair of use_reentrant is used to indicate which implementation of recompute you will be used.
                         'use_reentrant=True' means to use the PyLayer implementation of recompute, 'use_reentrant=False' means to
-                        use the Hook implementation of recompute, its default value is True.
+                        use the Hook implementation of recompute, its default value is True. The key-value pair of policy
+                        chooses how to save the memory of activations, 'recompute' (default) recomputes them in backward,
+                        'offload' moves the activations saved by autograd to the pinned host memory asynchronously in forward
+                        and prefetches them back in backward, 'selective' runs the sublayers of a 'Sequential' function
+                        one after another, offloads those with the weights of matmul or conv and recomputes the others.
+                        'offload' and 'selective' are implemented by hooks and ignore use_reentrant.
     Returns:
         Output of function on args.
 
@@ -437,6 +553,31 @@ def recompute(function, *args, **kwargs):
     # whether to use reentrant method to implement recompute
     use_reentrant = kwargs.pop('use_reentrant', True)
 
+    policy = kwargs.pop('policy', 'recompute')
+    if policy not in ['recompute', 'offload', 'selective']:
+        raise ValueError(
+            "The policy of recompute should be 'recompute', 'offload' or 'selective', but got {}.".format(
+                policy
+            )
+        )
+
+    if policy == 'offload':
+        return _offload_without_reentrant(function, 1, *args, **kwargs)
+
+    if policy == 'selective':
+        if kwargs:
+            raise ValueError(
+                "Error, kwargs(dict parameter) are not supported by the selective policy of recompute."
+            )
+        if framework._dygraph_tracer()._has_grad:
+            check_recompute_necessary(args)
+        functions = (
+            list(function.children())
+            if isinstance(function, paddle.nn.Sequential)
+            else [function]
+        )
+        return _recompute_selective(functions, preserve, *args)
+
     if kwargs and use_reentrant:
         raise ValueError(
             "Error, if you want to send kwargs(dict parameter) to function, please set use_reentrant=False."
@@ -451,6 +592,57 @@ def recompute(function, *args, **kwargs):
         return _recompute_without_reentrant(function, preserve, *args, **kwargs)
 
 
+# the planners of recompute_sequential with segments='auto', one for each model
+_planners = weakref.WeakKeyDictionary()
+
+
+def _recompute_sequential_auto(ctx, functions, *args, **kwargs):
+    """
+    profile the first step with grad of functions, then recompute the segments planned under the memory budget in the later steps.
+    """
+    if not isinstance(functions, paddle.nn.Sequential):
+        raise ValueError(
+            "The segments='auto' of recompute_sequential only supports paddle.nn.Sequential, but got {}.".format(
+                type(functions)
+            )
+        )
+    memory_budget = ctx.get('memory_budget', None)
+    preserve_rng_state = ctx.get('preserve_rng_state', True)
+    policy = ctx.get('policy', 'recompute')
+
+    planner = _planners.get(functions, None)
+    if planner is None or planner.memory_budget != memory_budget:
+        planner = RecomputePlanner(memory_budget)
+        _planners[functions] = planner
+
+    functions = list(functions.children())
+    if planner.segments is None:
+        if not framework._dygraph_tracer()._has_grad:
+            return _run_functions(functions)(*args)
+        outputs = planner.profile(functions, *args)
+        planner.solve()
+        return outputs
+
+    for begin, end, need_recompute in planner.segments:
+        run_function = _run_functions(functions[begin:end])
+        if not need_recompute:
+            outputs = run_function(*args)
+        elif policy == 'selective' and not kwargs:
+            outputs = _recompute_selective(
+                functions[begin:end], preserve_rng_state, *args
+            )
+        else:
+            outputs = recompute(
+                run_function,
+                *args,
+                preserve_rng_state=preserve_rng_state,
+                policy=policy,
+                **kwargs
+            )
+        args = outputs if isinstance(outputs, tuple) else (outputs,)
+    return outputs
+
+
 def recompute_sequential(ctx, functions, *args, **kwargs):
     """
     recompute intermediate activations to save the memory for 'Sequential' models. use 'ctx' to transmit some context params, it is similar to 'recompute_hybrid' API.
@@ -458,7 +650,10 @@ def recompute_sequential(ctx, functions, *args, **kwargs):
     Parameters:
         ctx(dict): include 'segments' and  'preserve_rng_state' keys, the key 'segments' (int, default 1), represents the number of chunks to create in the model,
                    the key 'preserve_rng_state' (bool, optional, default=True) indicate whether to save the forward rng. If it is True, then the last forward rng value will be
-                   restored when the forward recalculation of backpropagation is performed.
+                   restored when the forward recalculation of backpropagation is performed, the key 'policy' (str, optional, default='recompute') is the policy of
+                   recompute for each chunk, see 'recompute' API. If 'segments' is 'auto', the chunks to recompute are planned by profiling the first step
+                   with grad, the activation bytes and forward time of each layer, to minimize the time of recompute under the key 'memory_budget' (int), the bytes
+                   of activations allowed in a forward step.
         functions(paddle.nn.Sequential): layer of sequence of layers that describes part of forward pass of the model
               whose intermediate activations will be released to save memory in forward stage and will be recomputed
               in backward stage for gradient calculation.
@@ -477,7 +672,11 @@ def recompute_sequential(ctx, functions, *args, **kwargs):
             output = recompute_sequential({'segments' : 1}, model, input)
     """
     segments = ctx.get('segments', 1)
+    if segments == 'auto':
+        return _recompute_sequential_auto(ctx, functions, *args, **kwargs)
+
     preserve_rng_state = ctx.get('preserve_rng_state', True)
+    policy = ctx.get('policy', 'recompute')
 
     def _run_func(begin, end, funcs):
         def do_run(input):
@@ -495,10 +694,16 @@ def recompute_sequential(ctx, functions, *args, **kwargs):
     end = -1
     for begin in range(0, segment_size * (segments - 1), segment_size):
         end = begin + segment_size - 1
+        if policy == 'selective' and not kwargs:
+            args = _recompute_selective(
+                functions[begin : end + 1], preserve_rng_state, *args
+            )
+            continue
         args = recompute(
             _run_func(begin, end, functions),
             *args,
             preserve_rng_state=preserve_rng_state,
+            policy=policy,
             **kwargs
         )
     return _run_func(end + 1, len(functions) - 1, functions)(args)
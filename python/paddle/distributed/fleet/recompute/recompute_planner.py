@@ -0,0 +1,227 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import numpy as np
+
+import paddle
+from paddle.framework import core
+from paddle.utils import flatten
+
+from ..utils.log_util import logger
+
+__all__ = []
+
+# the number of units the memory is quantized to when solving
+_MEMORY_UNITS = 512
+# the max number of candidates for the activations of the largest segment
+_MAX_PEAK_CANDIDATES = 64
+
+
+def _tensor_bytes(tensor):
+    return tensor._numel() * core.size_of_dtype(tensor.dtype)
+
+
+def _inputs_bytes(inputs):
+    return sum(
+        _tensor_bytes(x)
+        for x in flatten(list(inputs))
+        if isinstance(x, core.eager.Tensor)
+    )
+
+
+def _synchronize():
+    place = paddle.framework._current_expected_place()
+    if not isinstance(place, core.CPUPlace):
+        paddle.device.synchronize()
+
+
+class RecomputePlanner:
+    """
+    Plan which layers of a sequence to recompute under a memory budget of activations.
+
+    The planner profiles one forward step layer by layer, the bytes of the activations saved by autograd, the bytes of
+    the inputs and the forward time of each layer, then solves for the segments of consecutive layers to recompute,
+    which minimize the time of recompute while the activations kept in forward and the largest segment recomputed in
+    backward fit in the memory budget.
+
+    Args:
+        memory_budget(int): the bytes of activations allowed in a forward step.
+    """
+
+    def __init__(self, memory_budget):
+        if memory_budget is None or memory_budget <= 0:
+            raise ValueError(
+                "The memory_budget of recompute should be a positive number of bytes, but got {}.".format(
+                    memory_budget
+                )
+            )
+        self.memory_budget = memory_budget
+        self.activation_bytes = None
+        self.input_bytes = None
+        self.forward_times = None
+        self.segments = None
+
+    def profile(self, functions, *args):
+        """
+        run functions one after another on args without recompute and record the cost of each function, the outputs
+        of a function are the inputs of the next one.
+        """
+        self.activation_bytes = []
+        self.input_bytes = []
+        self.forward_times = []
+        for function in functions:
+            saved = {}
+
+            def pack(x):
+                if not x.persistable and x._is_initialized():
+                    saved[x.data_ptr()] = _tensor_bytes(x)
+                return x
+
+            def unpack(x):
+                return x
+
+            self.input_bytes.append(_inputs_bytes(args))
+            _synchronize()
+            start = time.time()
+            with paddle.autograd.saved_tensors_hooks(pack, unpack):
+                outputs = function(*args)
+            _synchronize()
+            self.forward_times.append(time.time() - start)
+            self.activation_bytes.append(sum(saved.values()))
+            args = outputs if isinstance(outputs, tuple) else (outputs,)
+        return outputs
+
+    def solve(self):
+        """
+        solve the segments from the profile, each one is a tuple of (begin, end, need_recompute) of the functions.
+        """
+        self.segments = _solve_segments(
+            self.activation_bytes,
+            self.input_bytes,
+            self.forward_times,
+            self.memory_budget,
+        )
+        logger.info(
+            "Recompute segments under the memory budget {} bytes: {}".format(
+                self.memory_budget,
+                ", ".join(
+                    "[{}, {})".format(begin, end)
+                    for begin, end, need_recompute in self.segments
+                    if need_recompute
+                ),
+            )
+        )
+        return self.segments
+
+
+def _solve_segments(
+    activation_bytes, input_bytes, forward_times, memory_budget
+):
+    """
+    The activations kept of a plan are those of the layers not recomputed and the inputs of the segments recomputed,
+    with the activations of the largest segment regenerated in backward on top. For each candidate of the largest
+    segment, a dynamic programming over the layers and the quantized memory kept finds the least recompute time.
+    """
+    num_layers = len(activation_bytes)
+    activations = np.asarray(activation_bytes, dtype='float64')
+    prefix_activations = np.concatenate([[0.0], np.cumsum(activations)])
+    prefix_times = np.concatenate([[0.0], np.cumsum(forward_times)])
+
+    peaks = np.unique(
+        [
+            prefix_activations[end] - prefix_activations[begin]
+            for begin in range(num_layers)
+            for end in range(begin + 1, num_layers + 1)
+        ]
+        + [0.0]
+    )
+    if len(peaks) > _MAX_PEAK_CANDIDATES:
+        peaks = peaks[
+            np.linspace(0, len(peaks) - 1, _MAX_PEAK_CANDIDATES).astype('int64')
+        ]
+
+    # round up, so the memory of a plan is never underestimated
+    unit = max(memory_budget, prefix_activations[-1] + sum(input_bytes))
+    unit = max(unit / _MEMORY_UNITS, 1.0)
+    activation_units = np.ceil(activations / unit).astype('int64')
+    input_units = np.ceil(np.asarray(input_bytes) / unit).astype('int64')
+    num_units = int(activation_units.sum() + input_units.sum()) + 1
+
+    best = None
+    for peak in peaks:
+        times = np.full((num_layers + 1, num_units), np.inf)
+        parents = np.zeros((num_layers + 1, num_units), dtype='int64')
+        times[0][0] = 0.0
+        for begin in range(num_layers):
+            row = times[begin]
+            reachable = np.isfinite(row)
+            if not reachable.any():
+                continue
+            # keep the activations of the layer
+            shift = activation_units[begin]
+            candidates = np.full(num_units, np.inf)
+            candidates[shift:] = row[: num_units - shift]
+            improved = candidates < times[begin + 1]
+            times[begin + 1][improved] = candidates[improved]
+            parents[begin + 1][improved] = -begin - 1
+            # recompute the layers of [begin, end), keep the inputs only
+            shift = input_units[begin]
+            for end in range(begin + 1, num_layers + 1):
+                if prefix_activations[end] - prefix_activations[begin] > peak:
+                    break
+                candidates = np.full(num_units, np.inf)
+                candidates[shift:] = row[: num_units - shift] + (
+                    prefix_times[end] - prefix_times[begin]
+                )
+                improved = candidates < times[end]
+                times[end][improved] = candidates[improved]
+                parents[end][improved] = begin
+
+        final = times[num_layers]
+        memory = np.arange(num_units) * unit + peak
+        for kept in np.nonzero(np.isfinite(final))[0]:
+            if memory[kept] <= memory_budget:
+                key = (False, final[kept], memory[kept])
+            else:
+                key = (True, memory[kept], final[kept])
+            if best is None or key < best[0]:
+                best = (key, parents, kept)
+
+    (over_budget, _, _), parents, kept = best
+    if over_budget:
+        logger.warning(
+            "The activations can not fit in the memory budget {} bytes of recompute, recompute with the least memory.".format(
+                memory_budget
+            )
+        )
+
+    segments = []
+    end = num_layers
+    while end > 0:
+        parent = int(parents[end][kept])
+        if parent < 0:
+            begin = -parent - 1
+            kept -= activation_units[begin]
+            if segments and not segments[-1][2]:
+                segments[-1] = (begin, segments[-1][1], False)
+            else:
+                segments.append((begin, end, False))
+        else:
+            begin = parent
+            kept -= input_units[begin]
+            segments.append((begin, end, True))
+        end = begin
+    return segments[::-1]
@@ -13,12 +13,16 @@
 # limitations under the License.
 
 import abc
+import collections
 import functools
 import multiprocessing
 import os
 import re
 import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 
 # (TODO: GhostScreaming) It will be removed later.
 from paddle.fluid import core
@@ -48,6 +52,23 @@ class FSShellCmdAborted(ExecuteError):
     pass
 
 
+class TransferStats(
+    collections.namedtuple(
+        'TransferStats', ['files', 'skipped_files', 'bytes', 'seconds']
+    )
+):
+    """
+    Statistics of an upload or download, `files` and `bytes` only count the
+    transferred files, `skipped_files` are the ones already up to date.
+    """
+
+    __slots__ = ()
+
+    @property
+    def bytes_per_sec(self):
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+
 class FS:
     @abc.abstractmethod
     def ls_dir(self, fs_path):
@@ -421,6 +442,128 @@ def _handle_errors(max_time_out=None):
     return decorator
 
 
+class _MetadataCache:
+    """
+    Cache of the remote metadata. `stats` maps a path to None if it doesn't
+    exist or a dict of `is_dir` and `size`, `lists` maps a directory to its
+    sub directories and files. The entries expire after `ttl` seconds.
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._lists = {}
+
+    @staticmethod
+    def key(fs_path):
+        return os.path.normpath(urlparse(fs_path).path)
+
+    @staticmethod
+    def _parent(key):
+        return os.path.dirname(key) or "."
+
+    def _get(self, cache, key):
+        entry = cache.get(key)
+        if entry is None or time.time() - entry[0] >= self.ttl:
+            return None
+        return entry
+
+    def get_stat(self, fs_path):
+        """
+        Returns:
+            (hit, stat): the stat is valid only when hit is True.
+        """
+        if self.ttl <= 0:
+            return False, None
+        key = self.key(fs_path)
+        with self._lock:
+            entry = self._get(self._stats, key)
+            if entry is not None:
+                return True, entry[1]
+            # not in the listing of its parent
+            entry = self._get(self._lists, self._parent(key))
+            if entry is not None and key != self._parent(key):
+                return True, None
+        return False, None
+
+    def put_stat(self, fs_path, stat):
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._stats[self.key(fs_path)] = (time.time(), stat)
+
+    def get_list(self, fs_path):
+        if self.ttl <= 0:
+            return None
+        with self._lock:
+            entry = self._get(self._lists, self.key(fs_path))
+        if entry is None:
+            return None
+        dirs, files = entry[1]
+        return list(dirs), list(files)
+
+    def put_list(self, fs_path, entries):
+        """
+        entries(list): (name, is_dir, size) of the items under fs_path.
+        """
+        if self.ttl <= 0:
+            return
+        key = self.key(fs_path)
+        now = time.time()
+        with self._lock:
+            for name, is_dir, size in entries:
+                self._stats[os.path.normpath(os.path.join(key, name))] = (
+                    now,
+                    {'is_dir': is_dir, 'size': size},
+                )
+            self._stats[key] = (now, {'is_dir': True, 'size': 0})
+            self._lists[key] = (
+                now,
+                (
+                    [name for name, is_dir, _ in entries if is_dir],
+                    [name for name, is_dir, _ in entries if not is_dir],
+                ),
+            )
+
+    def invalidate(self, fs_path, deleted=False):
+        """
+        Invalidate fs_path after it's written. A deleted path is cached as
+        not existing, otherwise its parents are invalidated too because they
+        may be created along with it.
+        """
+        if self.ttl <= 0:
+            return
+        key = self.key(fs_path)
+        prefix = key.rstrip("/") + "/"
+        with self._lock:
+            for cache in [self._stats, self._lists]:
+                for k in list(cache.keys()):
+                    if k == key or k.startswith(prefix):
+                        del cache[k]
+
+            parent = self._parent(key)
+            if deleted:
+                self._stats[key] = (time.time(), None)
+                entry = self._lists.get(parent)
+                if entry is not None:
+                    name = os.path.basename(key)
+                    dirs, files = entry[1]
+                    self._lists[parent] = (
+                        entry[0],
+                        (
+                            [d for d in dirs if d != name],
+                            [f for f in files if f != name],
+                        ),
+                    )
+                return
+
+            while parent != key:
+                self._stats.pop(parent, None)
+                self._lists.pop(parent, None)
+                key, parent = parent, self._parent(parent)
+
+
 class HDFSClient(FS):
     """
     A tool of HDFS.
@@ -429,6 +572,11 @@ class HDFSClient(FS):
         hadoop_home(str): Hadoop home.
         configs(dict): Hadoop config. It is a dictionary and needs to contain the
             keys: "fs.default.name" and "hadoop.job.ugi".
+        time_out(int): The timeout of the retried operations in ms. Default is 5 minutes.
+        sleep_inter(int): The interval between the retries in ms. Default is 1 second.
+        cache_ttl(int): How long in ms the metadata of listed or checked paths is
+            cached. The cache is invalidated by the writes of this client, but not
+            the writes of others. Default is 0, which disables the cache.
 
     Examples:
 
@@ -451,8 +599,9 @@ class HDFSClient(FS):
         hadoop_home,
         configs,
         time_out=5 * 60 * 1000,  # ms
-        sleep_inter=1000,
-    ):  # ms
+        sleep_inter=1000,  # ms
+        cache_ttl=0,  # ms
+    ):
         self.pre_commands = []
         hadoop_bin = '%s/bin/hadoop' % hadoop_home
         self.pre_commands.append(hadoop_bin)
@@ -470,6 +619,7 @@ class HDFSClient(FS):
         self._bd_err_re = re.compile(
             r'\s?responseErrorMsg\s?\:.*, errorCode\:\s?[0-9]+, path\:'
         )
+        self._cache = _MetadataCache(cache_ttl / 1000.0)
 
     def _run_cmd(self, cmd, redirect_stderr=False, retry_times=5):
         exe_cmd = "{} -{}".format(self._base_cmd, cmd)
@@ -552,6 +702,10 @@ class HDFSClient(FS):
         return self._ls_dir(fs_path)
 
     def _ls_dir(self, fs_path):
+        cached = self._cache.get_list(fs_path)
+        if cached is not None:
+            return cached
+
         cmd = "ls {}".format(fs_path)
         ret, lines = self._run_cmd(cmd)
 
@@ -560,6 +714,7 @@ class HDFSClient(FS):
 
         dirs = []
         files = []
+        entries = []
         for line in lines:
             arr = line.split()
             if len(arr) != 8:
@@ -570,9 +725,80 @@ class HDFSClient(FS):
                 dirs.append(p)
             else:
                 files.append(p)
+            entries.append((p, arr[0][0] == 'd', int(arr[4])))
 
+        self._cache.put_list(fs_path, entries)
         return dirs, files
 
+    def stat_paths(self, fs_paths, batch_size=64):
+        """
+        Get the metadata of many remote HDFS paths by one command per `batch_size` paths.
+
+        Args:
+            fs_paths(list): The HDFS paths.
+            batch_size(int): The max number of paths checked by one command. Default is 64.
+
+        Returns:
+            List: For each path, None if it doesn't exist, otherwise a dict of its
+            `path`, `is_dir` and `size`.
+
+        Examples:
+
+            .. code-block:: text
+
+                from paddle.distributed.fleet.utils import HDFSClient
+
+                hadoop_home = "/home/client/hadoop-client/hadoop/"
+                configs = {
+                    "fs.default.name": "hdfs://xxx.hadoop.com:54310",
+                    "hadoop.job.ugi": "hello,hello123"
+                }
+
+                client = HDFSClient(hadoop_home, configs)
+                paths = ["hdfs:/test_hdfs_client/{}/donefile".format(i) for i in range(10)]
+                exists = [stat is not None for stat in client.stat_paths(paths)]
+        """
+        stats = [None] * len(fs_paths)
+        missed = []
+        for i, fs_path in enumerate(fs_paths):
+            hit, stat = self._cache.get_stat(fs_path)
+            if hit and (stat is None or stat['size'] is not None):
+                stats[i] = stat
+            else:
+                missed.append(i)
+
+        for begin in range(0, len(missed), batch_size):
+            batch = missed[begin : begin + batch_size]
+            found = self._try_stat([fs_paths[i] for i in batch])
+            for i in batch:
+                stats[i] = found.get(self._cache.key(fs_paths[i]))
+                self._cache.put_stat(fs_paths[i], stats[i])
+
+        return [
+            None if stat is None else dict(stat, path=fs_path)
+            for fs_path, stat in zip(fs_paths, stats)
+        ]
+
+    @_handle_errors()
+    def _try_stat(self, fs_paths):
+        cmd = "ls -d {}".format(" ".join(fs_paths))
+        # the command fails when any of the paths doesn't exist, so it's
+        # retried by _handle_errors only for the other errors
+        ret, lines = self._run_cmd(cmd, redirect_stderr=True, retry_times=0)
+        if ret != 0 and self._test_match(lines):
+            raise ExecuteError(cmd)
+
+        found = {}
+        for line in lines:
+            arr = line.split(None, 7)
+            if len(arr) != 8 or arr[0][0] not in 'd-' or len(arr[0]) < 10:
+                continue
+            found[self._cache.key(arr[7])] = {
+                'is_dir': arr[0][0] == 'd',
+                'size': int(arr[4]),
+            }
+        return found
+
     def _test_match(self, lines):
         for l in lines:
             m = self._bd_err_re.match(l)
@@ -607,12 +833,20 @@ class HDFSClient(FS):
                 client = HDFSClient(hadoop_home, configs)
                 ret = client.is_file("hdfs:/test_hdfs_client")
         """
+        if self._cache.ttl > 0:
+            stat = self.stat_paths([fs_path])[0]
+            return stat is not None and stat['is_dir']
+
         if not self.is_exist(fs_path):
             return False
 
         return self._is_dir(fs_path)
 
     def _is_dir(self, fs_path):
+        hit, stat = self._cache.get_stat(fs_path)
+        if hit and stat is not None:
+            return stat['is_dir']
+
         cmd = "test -d {}".format(fs_path)
         ret, lines = self._run_cmd(cmd, redirect_stderr=True, retry_times=1)
         if ret:
@@ -651,6 +885,10 @@ class HDFSClient(FS):
                 client = HDFSClient(hadoop_home, configs)
                 ret = client.is_file("hdfs:/test_hdfs_client")
         """
+        if self._cache.ttl > 0:
+            stat = self.stat_paths([fs_path])[0]
+            return stat is not None and not stat['is_dir']
+
         if not self.is_exist(fs_path):
             return False
 
@@ -683,6 +921,9 @@ class HDFSClient(FS):
                 client = HDFSClient(hadoop_home, configs)
                 ret = client.is_exist("hdfs:/test_hdfs_client")
         """
+        if self._cache.ttl > 0:
+            return self.stat_paths([fs_path])[0] is not None
+
         cmd = "test -e {} ".format(fs_path)
         ret, out = self._run_cmd(cmd, redirect_stderr=True, retry_times=1)
         if ret != 0:
@@ -710,15 +951,34 @@ class HDFSClient(FS):
         self._try_upload(local_dir, dest_dir)
 
     # can't retry
-    def upload(self, local_path, fs_path, multi_processes=5, overwrite=False):
+    def upload(
+        self,
+        local_path,
+        fs_path,
+        multi_processes=None,
+        overwrite=False,
+        batch_size=64,
+    ):
         """
         Upload the local path to remote HDFS.
 
+        The files are uploaded by `batch_size` files per hadoop command with
+        `multi_processes` commands at the same time. The files which already
+        exist on HDFS with the same size are skipped, so an interrupted upload
+        of a directory can be resumed by uploading it again. The files which
+        exist on HDFS with a different size raise FSFileExistsError unless
+        `overwrite` is True.
+
         Args:
             local_path(str): The local path.
             fs_path(str): The HDFS path.
-            multi_processes(int|1): the upload data process at the same time, default=5
+            multi_processes(int|None): the upload commands running at the same time, default is None,
+                which means it's decided by the number of batches and CPUs.
             overwrite(bool|False): will overwrite file on HDFS or not
+            batch_size(int|64): the max number of files uploaded by one command.
+
+        Returns:
+            TransferStats: the number of uploaded and skipped files, the uploaded bytes and time cost.
 
         Examples:
 
@@ -735,57 +995,70 @@ class HDFSClient(FS):
                 client = HDFSClient(hadoop_home, configs)
                 client.upload("test_hdfs_client", "hdfs:/test_hdfs_client")
         """
-
-        def __subprocess_upload(hdfs_path_single, datas):
-            for data in datas:
-                self._try_upload(data, hdfs_path_single)
-
-        def get_local_files(path):
-            """
-            get local files
-            Args:
-                path(str): local path
-            Returns:
-                list of local files
-            """
-            rlist = []
-
-            if not os.path.exists(path):
-                return rlist
-
-            if os.path.isdir(path):
-                for file in os.listdir(path):
-                    t = os.path.join(path, file)
-                    rlist.append(t)
-            else:
-                rlist.append(path)
-            return rlist
-
         local = LocalFS()
         if not local.is_exist(local_path):
             raise FSFileNotExistsError("{} not exists".format(local_path))
 
-        all_files = get_local_files(local_path)
-        if not all_files:
-            print("there are nothing need to upload, function exit")
-            return
-
         if self.is_exist(fs_path) and overwrite:
             self.delete(fs_path)
             self.mkdirs(fs_path)
 
-        procs = []
-        for i in range(multi_processes):
-            process_datas = self._split_files(all_files, i, multi_processes)
-            p = multiprocessing.Process(
-                target=__subprocess_upload, args=(fs_path, process_datas)
+        if os.path.isdir(local_path):
+            files, dirs = self._local_files_size(local_path)
+            if self.is_exist(fs_path):
+                fs_files, fs_dirs = self._fs_files_size(fs_path)
+            else:
+                fs_files, fs_dirs = {}, []
+            fs_dir = fs_path.rstrip("/")
+            tasks = [
+                (os.path.join(local_path, rel), fs_dir + "/" + rel, size)
+                for rel, size in files.items()
+            ]
+            new_dirs = set(dirs) - set(fs_dirs)
+            if not fs_files and not fs_dirs:
+                new_dirs.add("")
+            self._mkdirs_batch(
+                sorted((fs_dir + "/" + d).rstrip("/") for d in new_dirs),
+                batch_size,
             )
-            procs.append(p)
-            p.start()
+        else:
+            if self.is_dir(fs_path):
+                fs_path = "{}/{}".format(
+                    fs_path.rstrip("/"), os.path.basename(local_path)
+                )
+            fs_files = (
+                self._fs_files_size(fs_path)[0]
+                if self.is_exist(fs_path)
+                else {}
+            )
+            tasks = [(local_path, fs_path, os.path.getsize(local_path))]
+            files = {"": tasks[0][2]}
 
-        # complete the processes
-        for proc in procs:
-            proc.join()
+        conflicts = [
+            task[1]
+            for task, rel in zip(tasks, files)
+            if rel in fs_files and fs_files[rel] != task[2]
+        ]
+        if conflicts and not overwrite:
+            raise FSFileExistsError(
+                "{} exist already with different sizes".format(
+                    ", ".join(conflicts)
+                )
+            )
+
+        todo = [
+            task
+            for task, rel in zip(tasks, files)
+            if fs_files.get(rel) != task[2]
+        ]
+        return self._transfer(
+            "put",
+            todo,
+            len(tasks) - len(todo),
+            multi_processes,
+            batch_size,
+            overwrite,
+        )
 
     @_handle_errors()
     def _try_upload(self, local_path, fs_path):
@@ -793,6 +1066,7 @@ class HDFSClient(FS):
         ret = 0
         try:
             ret, _ = self._run_cmd(cmd)
+            self._cache.invalidate(fs_path)
             if ret != 0:
                 raise ExecuteError(cmd)
         except Exception as e:
@@ -800,15 +1074,32 @@ class HDFSClient(FS):
             raise e
 
     # can't retry
-    def download(self, fs_path, local_path, multi_processes=5, overwrite=False):
+    def download(
+        self,
+        fs_path,
+        local_path,
+        multi_processes=None,
+        overwrite=False,
+        batch_size=64,
+    ):
         """
         Download remote HDFS path to the local.
 
+        The files are downloaded by `batch_size` files per hadoop command with
+        `multi_processes` commands at the same time. The local files with the
+        same size as the remote ones are skipped, so an interrupted download
+        of a directory can be resumed by downloading it again.
+
         Args:
             fs_path(str):  The HDFS path.
             local_path(str): The local path.
-            multi_processes(int|1): the download data process at the same time, default=1
-            overwrite(bool): is overwrite
+            multi_processes(int|None): the download commands running at the same time, default is None,
+                which means it's decided by the number of batches and CPUs.
+            overwrite(bool): download all the files even if they are up to date
+            batch_size(int|64): the max number of files downloaded by one command.
+
+        Returns:
+            TransferStats: the number of downloaded and skipped files, the downloaded bytes and time cost.
 
         Examples:
 
@@ -825,38 +1116,177 @@ class HDFSClient(FS):
                 client = HDFSClient(hadoop_home, configs)
                 client.download("hdfs:/test_hdfs_client", "./")
         """
-
-        def __subprocess_download(local_path, datas):
-            """
-            download file from HDFS
-            Args:
-                local_path(str): the local file path
-                datas(str): the hdfs file path list
-            """
-            for data in datas:
-                self._try_download(data, local_path)
-
         if not self.is_exist(fs_path):
             raise FSFileNotExistsError("{} not exits".format(fs_path))
-        # download file
-        if self.is_file(fs_path):
-            return self._try_download(fs_path, local_path)
-        # download dir
-        dirs, all_filenames = self.ls_dir(fs_path)
-        all_files = [fs_path + "/" + i for i in all_filenames]
-        all_files.extend([fs_path + "/" + i for i in dirs])
-        procs = []
-        for i in range(multi_processes):
-            process_datas = self._split_files(all_files, i, multi_processes)
-            p = multiprocessing.Process(
-                target=__subprocess_download, args=(local_path, process_datas)
+
+        files, dirs = self._fs_files_size(fs_path)
+        if "" in files:
+            # download file
+            if os.path.isdir(local_path):
+                local_path = os.path.join(
+                    local_path, os.path.basename(fs_path.rstrip("/"))
+                )
+            tasks = [(fs_path, local_path, files[""])]
+        else:
+            # download dir
+            fs_dir = fs_path.rstrip("/")
+            tasks = [
+                (fs_dir + "/" + rel, os.path.join(local_path, rel), size)
+                for rel, size in files.items()
+            ]
+            for d in [""] + dirs:
+                os.makedirs(os.path.join(local_path, d), exist_ok=True)
+
+        todo = [
+            task
+            for task in tasks
+            if overwrite
+            or not os.path.isfile(task[1])
+            or os.path.getsize(task[1]) != task[2]
+        ]
+        return self._transfer(
+            "get", todo, len(tasks) - len(todo), multi_processes, batch_size
+        )
+
+    def _local_files_size(self, local_dir):
+        """
+        list the files under local_dir recursively
+        Returns:
+            files(dict): the relative path of each file to its size
+            dirs(list): the relative path of all the sub directories
+        """
+        files = {}
+        dirs = []
+        for root, dir_names, file_names in os.walk(local_dir):
+            rel_root = os.path.relpath(root, local_dir)
+            rel_root = "" if rel_root == "." else rel_root + "/"
+            dirs.extend(rel_root + d for d in dir_names)
+            for name in file_names:
+                files[rel_root + name] = os.path.getsize(
+                    os.path.join(root, name)
+                )
+        return files, dirs
+
+    def _fs_files_size(self, fs_path):
+        """
+        list the files under fs_path recursively by one command
+        Returns:
+            files(dict): the relative path of each file to its size, the
+                relative path of fs_path itself is "" if it's a file
+            dirs(list): the relative path of all the sub directories
+        """
+        cmd = "ls -R {}".format(fs_path)
+        ret, lines = self._run_cmd(cmd)
+        if ret != 0:
+            raise ExecuteError(cmd)
+
+        root = urlparse(fs_path).path.rstrip("/")
+        files = {}
+        dirs = []
+        for line in lines:
+            arr = line.split(None, 7)
+            if len(arr) != 8:
+                continue
+
+            path = urlparse(arr[7]).path
+            if path == root:
+                rel = ""
+            elif path.startswith(root + "/"):
+                rel = path[len(root) + 1 :]
+            else:
+                continue
+            if arr[0][0] == 'd':
+                dirs.append(rel)
+            elif not rel.endswith("._COPYING_"):
+                # skip the files being copied by hadoop
+                files[rel] = int(arr[4])
+        return files, dirs
+
+    def _mkdirs_batch(self, fs_paths, batch_size):
+        for i in range(0, len(fs_paths), batch_size):
+            cmd = "mkdir -p {}".format(" ".join(fs_paths[i : i + batch_size]))
+            ret, _ = self._run_cmd(cmd)
+            for fs_path in fs_paths[i : i + batch_size]:
+                self._cache.invalidate(fs_path)
+            if ret != 0:
+                raise ExecuteError(cmd)
+
+    def _transfer(
+        self, cmd, tasks, skipped, multi_processes, batch_size, overwrite=False
+    ):
+        """
+        transfer the (src, dst, size) tasks by `put` or `get` commands, the
+        files of a directory going to the same sub directory are batched in
+        one command. The files of `put` are overwritten only if `overwrite`
+        is True or the batch is retried.
+        """
+        groups = collections.defaultdict(list)
+        batches = []
+        for src, dst, _ in tasks:
+            if len(tasks) > 1:
+                groups[os.path.dirname(dst)].append(src)
+            else:
+                batches.append(([src], dst))
+        for dst_dir, srcs in groups.items():
+            for i in range(0, len(srcs), batch_size):
+                batches.append((srcs[i : i + batch_size], dst_dir))
+
+        if multi_processes is None:
+            multi_processes = min(len(batches), 4 * (os.cpu_count() or 1), 32)
+
+        start = time.time()
+        if batches:
+            with ThreadPoolExecutor(max(multi_processes, 1)) as pool:
+                list(
+                    pool.map(
+                        lambda batch: self._try_transfer(
+                            cmd, *batch, overwrite, {"retry": False}
+                        ),
+                        batches,
+                    )
+                )
+        stats = TransferStats(
+            files=len(tasks),
+            skipped_files=skipped,
+            bytes=sum(task[2] for task in tasks),
+            seconds=time.time() - start,
+        )
+        logger.info(
+            "{} {} files ({} bytes) in {:.2f}s at {:.2f} MB/s, "
+            "skipped {} files".format(
+                cmd,
+                stats.files,
+                stats.bytes,
+                stats.seconds,
+                stats.bytes_per_sec / 1024 / 1024,
+                stats.skipped_files,
             )
-            procs.append(p)
-            p.start()
+        )
+        return stats
 
-        # complete the processes
-        for proc in procs:
-            proc.join()
+    @_handle_errors()
+    def _try_transfer(self, cmd, srcs, dst, overwrite, state):
+        if cmd == "put":
+            # overwrite the files uploaded by the failed tries of the batch
+            force = overwrite or state["retry"]
+            state["retry"] = True
+            cmd = "put {}{} {}".format(
+                "-f " if force else "", " ".join(srcs), dst
+            )
+        else:
+            # hadoop can't get a file to an existing local path
+            local_fs = LocalFS()
+            if len(srcs) == 1 and not os.path.isdir(dst):
+                local_fs.delete(dst)
+            else:
+                for src in srcs:
+                    local_fs.delete(os.path.join(dst, os.path.basename(src)))
+            cmd = "get {} {}".format(" ".join(srcs), dst)
+        ret, _ = self._run_cmd(cmd)
+        if cmd.startswith("put"):
+            self._cache.invalidate(dst)
+        if ret != 0:
+            raise ExecuteError(cmd)
 
     @_handle_errors()
     def _try_download(self, fs_path, local_path):
@@ -901,6 +1331,7 @@ class HDFSClient(FS):
 
         cmd = "mkdir {} ".format(fs_path)
         ret, out = self._run_cmd(cmd, redirect_stderr=True)
+        self._cache.invalidate(fs_path)
         if ret != 0:
             for l in out:
                 if "No such file or directory" in l:
@@ -912,6 +1343,7 @@ class HDFSClient(FS):
         if out_hdfs and not self.is_exist(fs_path):
             cmd = "mkdir -p {}".format(fs_path)
             ret, _ = self._run_cmd(cmd)
+            self._cache.invalidate(fs_path)
             if ret != 0:
                 raise ExecuteError(cmd)
 
@@ -960,6 +1392,8 @@ class HDFSClient(FS):
         ret = 0
         try:
             ret, _ = self._run_cmd(cmd, retry_times=1)
+            self._cache.invalidate(fs_src_path, deleted=ret == 0)
+            self._cache.invalidate(fs_dst_path)
             if ret != 0:
                 raise ExecuteError(cmd)
         except Exception as e:
@@ -970,12 +1404,14 @@ class HDFSClient(FS):
     def _rmr(self, fs_path):
         cmd = "rmr {}".format(fs_path)
         ret, _ = self._run_cmd(cmd)
+        self._cache.invalidate(fs_path, deleted=ret == 0)
         if ret != 0:
             raise ExecuteError(cmd)
 
     def _rm(self, fs_path):
         cmd = "rm {}".format(fs_path)
         ret, _ = self._run_cmd(cmd)
+        self._cache.invalidate(fs_path, deleted=ret == 0)
         if ret != 0:
             raise ExecuteError(cmd)
 
@@ -1046,6 +1482,7 @@ class HDFSClient(FS):
     def _touchz(self, fs_path):
         cmd = "touchz {}".format(fs_path)
         ret, _ = self._run_cmd(cmd)
+        self._cache.invalidate(fs_path)
         if ret != 0:
             raise ExecuteError(cmd)
 
@@ -155,7 +155,9 @@ class HTTPMaster(Master):
                 time.sleep(0.1)
                 continue
 
-            rjson = self.client.get_prefix(prefix)
+            # block in the master until all the peers put their values, so
+            # that the peers are released together without polling
+            rjson = self.client.wait_prefix(prefix, size, timeout=10)
             self.ctx.logger.debug("sync peers {}".format(rjson))
             if rjson and len(rjson) == size:
                 if rank < 0:
@@ -170,7 +172,7 @@ class HTTPMaster(Master):
                         ret[int(k.split('/')[-1])] = v
                     return ret, rank
             else:
-                time.sleep(0.5)
+                time.sleep(0.1)
         return [], 0
 
 
@@ -60,6 +60,22 @@ class KVClient:
         except:
             return ""
 
+    def wait_prefix(self, key, size, timeout=30):
+        # block in the server until there are at least size keys under the
+        # prefix or timeout, then return like get_prefix
+        key = key if key.startswith('/') else "/{}".format(key)
+        u = "{}{}".format(self.endpoint, key)
+        try:
+            r = requests.get(
+                u,
+                params={'wait': size, 'timeout': timeout},
+                timeout=timeout + 3,
+            )
+            if r.status_code == 200:
+                return r.json()
+        except:
+            return ""
+
     def delete(self, key):
         key = key if key.startswith('/') else "/{}".format(key)
         u = "{}{}".format(self.endpoint, key)
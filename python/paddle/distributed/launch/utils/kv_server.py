@@ -15,16 +15,27 @@
 import http.server as SimpleHTTPServer
 import json
 import threading
-from http.server import HTTPServer
+import time
+from http.server import ThreadingHTTPServer
 from multiprocessing import Process
+from urllib.parse import parse_qs, urlsplit
 
 
 class KVHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
     def do_GET(self):
+        # GET /prefix?wait=N&timeout=T blocks until there are at least N keys
+        # under prefix or T seconds passed, then returns like GET /prefix
+        url = urlsplit(self.path)
+        path = url.path
+        query = parse_qs(url.query)
+        if 'wait' in query:
+            timeout = float(query.get('timeout', ['60'])[0])
+            self.server.wait_prefix(path, int(query['wait'][0]), timeout)
+
         with self.server.kv_lock:
             ret = {}
             for k, v in self.server.kv.items():
-                if k.startswith(self.path):
+                if k.startswith(path):
                     ret[k] = v.decode(encoding="utf-8")
             if ret:
                 self.output(200, json.dumps(ret).encode("utf-8"))
@@ -39,6 +50,8 @@ class KVHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
         try:
             value = self.rfile.read(content_length)
             with self.server.kv_lock:
+                if self.path not in self.server.kv:
+                    self.server.update_watches(self.path, 1)
                 self.server.kv[self.path] = value
                 self.output(200)
                 return
@@ -49,6 +62,7 @@ class KVHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
         with self.server.kv_lock:
             if self.path in self.server.kv:
                 del self.server.kv[self.path]
+                self.server.update_watches(self.path, -1)
                 self.output(200)
             else:
                 self.output(404)
@@ -65,15 +79,62 @@ class KVHandler(SimpleHTTPServer.SimpleHTTPRequestHandler):
         return
 
 
-class KVServer(HTTPServer):
+class _PrefixWatch:
+    def __init__(self, lock, count):
+        self.cond = threading.Condition(lock)
+        self.count = count
+        # number of waiters of each target count
+        self.targets = {}
+
+
+class KVServer(ThreadingHTTPServer):
+    # handle requests in threads, and accept the connections of all the
+    # peers blocking in GET with wait at the same time
+    daemon_threads = True
+    request_queue_size = 1024
+
     def __init__(self, port):
         super().__init__(('', port), KVHandler)
         self.kv_lock = threading.Lock()
         self.kv = {'/healthy': b'ok'}
+        # watches of prefixes being waited, keyed by prefix
+        self.watches = {}
         self.port = port
         self.stopped = False
         self.started = False
 
+    def update_watches(self, key, delta):
+        # called with kv_lock held when a key is added or deleted, and only
+        # wakes the waiters up when the number of keys reaches their targets
+        for prefix, watch in self.watches.items():
+            if key.startswith(prefix):
+                watch.count += delta
+                if watch.count >= min(watch.targets):
+                    watch.cond.notify_all()
+
+    def wait_prefix(self, prefix, size, timeout):
+        with self.kv_lock:
+            watch = self.watches.get(prefix, None)
+            if watch is None:
+                count = sum(1 for k in self.kv if k.startswith(prefix))
+                watch = _PrefixWatch(self.kv_lock, count)
+                self.watches[prefix] = watch
+            watch.targets[size] = watch.targets.get(size, 0) + 1
+            try:
+                end = time.time() + timeout
+                while watch.count < size and not self.stopped:
+                    remaining = end - time.time()
+                    if remaining <= 0:
+                        break
+                    watch.cond.wait(min(remaining, 1.0))
+                return watch.count >= size
+            finally:
+                watch.targets[size] -= 1
+                if watch.targets[size] == 0:
+                    del watch.targets[size]
+                if not watch.targets:
+                    del self.watches[prefix]
+
     def start(self):
         self.listen_thread = threading.Thread(target=self.serve_forever)
         self.listen_thread.start()
@@ -82,8 +143,12 @@ class KVServer(HTTPServer):
     def stop(self):
         self.shutdown()
         self.listen_thread.join()
-        self.server_close()
+        # release the waiters blocking in GET with wait
         self.stopped = True
+        with self.kv_lock:
+            for watch in self.watches.values():
+                watch.cond.notify_all()
+        self.server_close()
 
 
 class PKVServer:
@@ -112,7 +177,6 @@ if __name__ == '__main__':
     # kv = PKVServer(8090)
     kv = KVServer(8090)
     kv.start()
-    import time
 
     # print("serve at 8090 for 600 s")
 
@@ -240,6 +240,17 @@ class DataParallel(layers.Layer):
                                                 will affect computing performance. Therefore, if all parameters
                                                 are sure to participate in the loss calculation and the
                                                 autograd graph construction, please set it False. Default: False.
+        use_flat_buffers(bool, optional): Whether to place the trainable parameters and their gradients
+                                          as views in a few flat buffers of each dtype, whose sizes are
+                                          limited like comm_buffer_size and last_comm_buffer_size. The
+                                          gradient buffers are allreduced without copying the gradients,
+                                          ``clear_gradients`` zeroes each of them with one kernel, and
+                                          the optimizers in multi tensor mode update the parameter
+                                          buffers in place. The gradients of the parameters not used in
+                                          the forward pass are zeros instead of None. Sparse gradients
+                                          are not supported. The model should be decorated for amp
+                                          before, since the buffers keep the dtypes of parameters.
+                                          Default: False.
 
     Returns:
         Layer: The data paralleled module.
@@ -368,6 +379,7 @@ class DataParallel(layers.Layer):
         last_comm_buffer_size=1,
         find_unused_parameters=False,
         group=None,
+        use_flat_buffers=False,
     ):
         super().__init__(layers.full_name() + "_data_parallel")
 
@@ -379,6 +391,8 @@ class DataParallel(layers.Layer):
         self.find_unused_parameters = find_unused_parameters
         self.grad_need_sync = True
         self.group = group
+        self._use_flat_buffers = use_flat_buffers
+        self._grad_storages = None
         self.var_dtype = (
             core.eager.Tensor if in_dygraph_mode() else core.VarBase
         )
@@ -416,16 +430,21 @@ class DataParallel(layers.Layer):
             if not paddle.is_compiled_with_xpu():
                 sync_params_buffers(self._layers)
 
-            self.comm_buffer_size = int(comm_buffer_size * 1024 * 1024)
-            # NOTE(shenliang03): We can set environment variables to control
-            # the size of the group, Default: 1MB. The role of this small group is:
-            # when the last group allreduce, the overlap cannot work. Making the
-            # the last group small is useful to improve performance.
-            self.last_comm_buffer_size = int(
-                last_comm_buffer_size * 1024 * 1024
-            )
+        self.comm_buffer_size = int(comm_buffer_size * 1024 * 1024)
+        # NOTE(shenliang03): We can set environment variables to control
+        # the size of the group, Default: 1MB. The role of this small group is:
+        # when the last group allreduce, the overlap cannot work. Making the
+        # the last group small is useful to improve performance.
+        self.last_comm_buffer_size = int(last_comm_buffer_size * 1024 * 1024)
+
+        if self._use_flat_buffers:
+            # NOTE: The flat buffers are built for single card as well, since
+            # clear_gradients and the optimizers still benefit from them.
+            self._init_flat_buffers()
+        elif self._strategy.nranks > 1:
             self.init_reducer()
-        else:
+
+        if self._strategy.nranks <= 1:
             warnings.warn(
                 "The program will return to single-card operation. "
                 "Please check 1, whether you use spawn or fleetrun "
@@ -490,6 +509,235 @@ class DataParallel(layers.Layer):
                 self.find_unused_parameters,
             )
 
+    @imperative_base.no_grad
+    def _init_flat_buffers(self):
+        """
+        Place the trainable parameters and their gradients as views in the
+        buffers of ParamStorage and GradStorage, which are grouped by dtype
+        and size like the groups of EagerReducer. The gradient buffers are
+        allreduced by the backward hooks of parameters instead of the reducer.
+        """
+        from paddle.distributed.fleet.meta_parallel.sharding.group_sharded_storage import (
+            GradStorage,
+            ParamStorage,
+        )
+
+        flat_dtypes = [paddle.float16, paddle.bfloat16, paddle.float32]
+        size_limits = [self.last_comm_buffer_size, self.comm_buffer_size]
+        # the buckets of each dtype, and all of them in the order created
+        dtype_buckets = {}
+        buckets = []
+        # the trainable parameters synchronized one by one
+        self._unflat_params = []
+        # the trainable parameters cleared one by one
+        self._other_params = []
+        params_set = set()
+        for sublayer in self.sublayers():
+            for _, param in sublayer.named_parameters(include_sublayers=False):
+                if param is None or param in params_set:
+                    continue
+                params_set.add(param)
+                if not param.trainable:
+                    continue
+                if getattr(param, "no_sync", False):
+                    self._other_params.append(param)
+                    continue
+                if (
+                    isinstance(sublayer, paddle.nn.layer.common.Embedding)
+                    and sublayer._sparse
+                ):
+                    raise ValueError(
+                        "DataParallel with use_flat_buffers does not support "
+                        "the sparse gradient of '%s'." % param.name
+                    )
+                if param.dtype not in flat_dtypes or param._numel() == 0:
+                    self._unflat_params.append(param)
+                    self._other_params.append(param)
+                    continue
+
+                nbytes = param._numel() * core.size_of_dtype(param.dtype)
+                dtype_bucket = dtype_buckets.setdefault(param.dtype, [])
+                # the first bucket is allreduced last, so it is kept small
+                limit = size_limits[0 if len(dtype_bucket) <= 1 else 1]
+                if not dtype_bucket or dtype_bucket[-1][1] + nbytes > limit:
+                    dtype_bucket.append([[], 0])
+                    buckets.append(dtype_bucket[-1])
+                dtype_bucket[-1][0].append(param)
+                dtype_bucket[-1][1] += nbytes
+
+        # The gradients of the last parameters are ready first in backward,
+        # so the buckets are allreduced in the reversed order.
+        self._param_storages = []
+        self._grad_storages = []
+        for index, (params, _) in enumerate(reversed(buckets)):
+            dtype = params[0].dtype
+            device = (
+                "cpu"
+                if params[0].place.is_cpu_place()
+                else paddle.get_device().split(":")[0]
+            )
+            size = sum(param._numel() for param in params)
+            param2align = {param.name: 0 for param in params}
+
+            param_storage = ParamStorage(size, dtype, device)
+            param_storage.add_rank_params(
+                params, param2align, convert_gpu=device != "cpu"
+            )
+            grad_storage = GradStorage(
+                size,
+                dtype=dtype,
+                device=device,
+                destination=None,
+                parm2align=param2align,
+            )
+            offset = 0
+            for param in params:
+                grad_storage.add_grad(param, 0)
+                # NOTE: The optimizers find the slices of the buffers by these
+                # attributes, see paddle.optimizer.optimizer._get_flat_view.
+                param._flat_param = (param_storage.buffer, offset)
+                param._flat_grad = (grad_storage.buffer, offset)
+                param._register_backward_hook(
+                    self._get_flat_reduce_fn(param, grad_storage)
+                )
+                offset += param._numel()
+            self._param_storages.append(param_storage)
+            self._grad_storages.append(grad_storage)
+
+        self._flat_grad_need_sync = False
+        self._next_grad_storage = 0
+        self._flat_tasks = []
+
+    def _get_flat_reduce_fn(self, param, grad_storage):
+        @imperative_base.no_grad
+        def reduce(*_):
+            self._attach_flat_grad(param)
+            # with find_unused_parameters, all the buffers are allreduced
+            # after backward, since the unused parameters are unknown
+            if not self._flat_grad_need_sync or self.find_unused_parameters:
+                return
+            grad_storage.params_checked_in += 1
+            if grad_storage.all_checked_in:
+                self._allreduce_flat_grads()
+
+        return reduce
+
+    def _attach_flat_grad(self, param):
+        """
+        Make the gradient of param the view of the gradient buffer again, if
+        it is released by clear_gradient(False) or replaced.
+        """
+        buffer, offset = param._flat_grad
+        grad = param.grad
+        if grad is not None and grad.data_ptr() == (
+            buffer.data_ptr() + offset * core.size_of_dtype(buffer.dtype)
+        ):
+            return
+        view = buffer._slice(offset, offset + param._numel())
+        view.get_tensor()._set_dims(param.shape)
+        if grad is None:
+            view.zero_()
+        else:
+            paddle.assign(grad, output=view)
+        param._copy_gradient_from(view)
+
+    def _allreduce_flat_grads(self):
+        """
+        Allreduce the gradient buffers whose gradients are all checked in
+        asynchronously, in the same order on all ranks.
+        """
+        while self._next_grad_storage < len(self._grad_storages):
+            grad_storage = self._grad_storages[self._next_grad_storage]
+            if not grad_storage.all_checked_in:
+                break
+            grad_storage.buffer.scale_(1.0 / self._strategy.nranks)
+            self._flat_tasks.append(
+                paddle.distributed.all_reduce(
+                    grad_storage.buffer, group=self.group, sync_op=False
+                )
+            )
+            grad_storage.sent = True
+            self._next_grad_storage += 1
+
+    @imperative_base.no_grad
+    def _finish_flat_grads_sync(self):
+        """
+        Called after backward, allreduce the gradients not synchronized in the
+        backward hooks, such as those of the unused parameters, and wait for
+        all the allreduce.
+        """
+        self._flat_grad_need_sync = False
+        for grad_storage in self._grad_storages[self._next_grad_storage :]:
+            for param in grad_storage._params:
+                self._attach_flat_grad(param)
+            grad_storage.params_checked_in = len(grad_storage._params)
+        self._allreduce_flat_grads()
+
+        for param in self._unflat_params:
+            if param.grad is None:
+                param._copy_gradient_from(paddle.zeros_like(param))
+            param.grad.scale_(1.0 / self._strategy.nranks)
+            self._flat_tasks.append(
+                paddle.distributed.all_reduce(
+                    param.grad, group=self.group, sync_op=False
+                )
+            )
+
+        for task in self._flat_tasks:
+            task.wait()
+        self._flat_tasks = []
+
+    def _prepare_flat_grads(self):
+        for grad_storage in self._grad_storages:
+            for param in grad_storage._params:
+                # clear_gradient(True) zeroes the gradient in place, but makes
+                # the next backward replace it instead of accumulating into it
+                param._unset_fake_empty()
+
+        if (
+            self._strategy.nranks > 1
+            and self.grad_need_sync
+            and not self._flat_grad_need_sync
+        ):
+            for grad_storage in self._grad_storages:
+                grad_storage.reset_checked_in()
+            self._next_grad_storage = 0
+            self._flat_grad_need_sync = True
+            core.eager._add_backward_final_hook(self._finish_flat_grads_sync)
+
+    def clear_gradients(self):
+        """
+        Clear the gradients of all parameters for this layer. With
+        use_flat_buffers, each gradient buffer is zeroed by one kernel.
+
+        Returns:
+            None
+
+        Examples:
+            .. code-block:: python
+
+                # required: distributed
+                import paddle
+                import paddle.distributed as dist
+
+                dist.init_parallel_env()
+                linear = paddle.nn.Linear(13, 5)
+                dp_linear = paddle.DataParallel(linear, use_flat_buffers=True)
+                adam = paddle.optimizer.Adam(learning_rate=0.01,
+                                             parameters=dp_linear.parameters())
+                out = dp_linear(paddle.rand([2, 13]))
+                out.backward()
+                adam.step()
+                dp_linear.clear_gradients()
+
+        """
+        if self._grad_storages is None:
+            return super().clear_gradients()
+        for grad_storage in self._grad_storages:
+            grad_storage.buffer.zero_()
+        for param in self._other_params:
+            param.clear_gradient()
+
     def _find_varbase(self, obj):
         var_type = core.eager.Tensor if in_dygraph_mode() else core.VarBase
         if isinstance(obj, var_type):
@@ -547,7 +795,10 @@ class DataParallel(layers.Layer):
 
     def forward(self, *inputs, **kwargs):
         outputs = self._layers(*inputs, **kwargs)
-        if (
+        if self._grad_storages is not None:
+            if framework._dygraph_tracer()._has_grad:
+                self._prepare_flat_grads()
+        elif (
             self._strategy.nranks > 1
             and framework._dygraph_tracer()._has_grad
             and self.grad_need_sync
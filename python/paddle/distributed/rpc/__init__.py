@@ -16,6 +16,7 @@ from paddle.distributed.rpc.rpc import (
     init_rpc,
     shutdown,
     rpc_async,
+    rpc_async_batch,
     rpc_sync,
     get_worker_info,
     get_all_worker_infos,
@@ -26,6 +27,7 @@ __all__ = [
     "init_rpc",
     "shutdown",
     "rpc_async",
+    "rpc_async_batch",
     "rpc_sync",
     "get_worker_info",
     "get_all_worker_infos",
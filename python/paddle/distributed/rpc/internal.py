@@ -13,20 +13,81 @@
 # limitations under the License.
 
 import pickle
+import struct
 from collections import namedtuple
 
 PythonFunc = namedtuple("PythonFunc", ["func", "args", "kwargs"])
 """Some Python code interfaces called in C++"""
 
+# Messages with out-of-band buffers start with the magic, followed by the
+# number of buffers, the length of pickled data and buffers, the pickled data
+# and the buffers. Pickled data always starts with the PROTO opcode b'\x80',
+# which never conflicts with the magic.
+_OOB_MAGIC = b"PDRPC5\0"
+_LENGTH_FORMAT = "<Q"
+_LENGTH_SIZE = struct.calcsize(_LENGTH_FORMAT)
+# out-of-band buffers need pickle protocol 5, which is new in Python 3.8
+_HAS_OOB_PICKLE = pickle.HIGHEST_PROTOCOL >= 5
+
 
 def _serialize(obj):
-    return pickle.dumps(obj)
+    # the contiguous buffers of numpy arrays are pickled out-of-band and
+    # copied into the message only once
+    if not _HAS_OOB_PICKLE:
+        return pickle.dumps(obj)
+    buffers = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    if not buffers:
+        return data
+    buffers = [buf.raw() for buf in buffers]
+    lengths = [len(data)] + [buf.nbytes for buf in buffers]
+    header = struct.pack(
+        "<{}Q".format(len(lengths) + 1), len(buffers), *lengths
+    )
+    return b"".join([_OOB_MAGIC, header, data] + buffers)
 
 
 def _deserialize(obj):
-    return pickle.loads(obj)
+    if not _HAS_OOB_PICKLE or not obj.startswith(_OOB_MAGIC):
+        return pickle.loads(obj)
+    # copy the message once into a writable buffer, and the arrays are
+    # loaded as views on it
+    message = memoryview(bytearray(obj))
+    offset = len(_OOB_MAGIC)
+    (num_buffers,) = struct.unpack_from(_LENGTH_FORMAT, message, offset)
+    offset += _LENGTH_SIZE
+    lengths = struct.unpack_from(
+        "<{}Q".format(num_buffers + 1), message, offset
+    )
+    offset += _LENGTH_SIZE * (num_buffers + 1)
+    views = []
+    for length in lengths:
+        views.append(message[offset : offset + length])
+        offset += length
+    return pickle.loads(views[0], buffers=views[1:])
 
 
 def _run_py_func(python_func):
     result = python_func.func(*python_func.args, **python_func.kwargs)
     return result
+
+
+class _RemoteException:
+    # an exception raised by a call in a batch, which is raised when the
+    # future of the call is waited
+    def __init__(self, exception):
+        try:
+            pickle.dumps(exception)
+        except Exception:
+            exception = RuntimeError(repr(exception))
+        self.exception = exception
+
+
+def _run_py_funcs(python_funcs):
+    results = []
+    for python_func in python_funcs:
+        try:
+            results.append(_run_py_func(python_func))
+        except Exception as e:
+            results.append(_RemoteException(e))
+    return results
@@ -12,22 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import datetime
 import os
 import pickle
-import time
+import threading
 from collections import namedtuple
 
 import paddle.fluid.core as core
 from paddle.distributed.launch.context import Node
-from paddle.distributed.rpc.internal import PythonFunc, _serialize
+from paddle.distributed.rpc.internal import (
+    PythonFunc,
+    _RemoteException,
+    _run_py_funcs,
+    _serialize,
+)
 from paddle.distributed.utils.launch_utils import logger
 
 WorkerInfo = namedtuple("WorkerInfo", ["name", "rank", "ip", "port"])
 
 _DEFAULT_RPC_TIMEOUT = -1
 _MAX_RPC_TIMEOUT_MS = 0x7FFFFFFF
-_BARRIER_TIMEOUT_MAX_DAYS = 99999999
 # tcp store for `_barrier_never_timeout`
 _barrier_store = None
 # count the number of `_barrier_never_timeout` is called and
@@ -216,6 +219,89 @@ def rpc_async(to, fn, args=None, kwargs=None, timeout=_DEFAULT_RPC_TIMEOUT):
     return _invoke_rpc(to, fn, args, kwargs, timeout)
 
 
+class _BatchFuture:
+    # waits the future of the batch once and shares the results
+    def __init__(self, future):
+        self._future = future
+        self._results = None
+        self._lock = threading.Lock()
+
+    def results(self):
+        with self._lock:
+            if self._results is None:
+                self._results = self._future.wait()
+                self._future = None
+        return self._results
+
+
+class _BatchItemFuture:
+    def __init__(self, batch_future, index):
+        self._batch_future = batch_future
+        self._index = index
+
+    def wait(self):
+        result = self._batch_future.results()[self._index]
+        if isinstance(result, _RemoteException):
+            raise result.exception
+        return result
+
+
+def rpc_async_batch(to, calls, timeout=_DEFAULT_RPC_TIMEOUT):
+    """
+    Make a non-blocking RPC call to run a batch of functions on worker ``to``.
+    The calls are sent in one message and run in order on worker ``to``,
+    which saves the overhead of sending many fine-grained calls one by one.
+
+    Args:
+        to (str): name of the destination worker.
+        calls (list): a list of calls, and each call is a tuple of ``fn``,
+                       and the optional ``args`` tuple and ``kwargs`` dict
+                       for the ``fn`` invocation, e.g. ``(fn, (1, 2))``.
+        timeout (int, optional): timeout in seconds to use for the batch, see
+                                   ``rpc_async`` for details. The default value is -1.
+
+    Returns:
+        Returns a list of future objects that can be waited on, one for each
+        call in ``calls``. When completed, the return value of the call can be
+        got by `fut.wait()`, and the exception raised by the call is raised by
+        `fut.wait()`.
+
+    Examples:
+        .. code-block:: python
+
+            import paddle.distributed.rpc as rpc
+
+            def add(a, b):
+                return a + b
+
+            rpc.init_rpc("worker0", rank=0, world_size=1,
+                    master_endpoint="127.0.0.1:8005")
+            futs = rpc.rpc_async_batch(
+                "worker0", [(add, (2, 3)), (add, (4,), {"b": 5})])
+            print([fut.wait() for fut in futs])
+            rpc.shutdown()
+
+    """
+    python_funcs = []
+    for call in calls:
+        if not isinstance(call, (list, tuple)) or not 1 <= len(call) <= 3:
+            raise ValueError(
+                "Each call should be a tuple of fn, args and kwargs, "
+                "but received {}.".format(call)
+            )
+        fn, args, kwargs = (tuple(call) + (None, None))[:3]
+        python_funcs.append(PythonFunc(fn, args or (), kwargs or {}))
+    if not python_funcs:
+        return []
+    batch_future = _BatchFuture(
+        _invoke_rpc(to, _run_py_funcs, (python_funcs,), None, timeout)
+    )
+    return [
+        _BatchItemFuture(batch_future, index)
+        for index in range(len(python_funcs))
+    ]
+
+
 def _invoke_rpc(to, fn, args, kwargs, timeout):
     args = args if args else ()
     kwargs = kwargs if kwargs else {}
@@ -227,9 +313,9 @@ def _invoke_rpc(to, fn, args, kwargs, timeout):
 
 
 def _barrier_never_timeout(global_rank, global_world_size):
-    # max timeout
-    timeout = datetime.timedelta(days=_BARRIER_TIMEOUT_MAX_DAYS)
-
+    # The barrier is built on the counter and the blocking wait of the store,
+    # which notifies the waiters when the key is set, so that each rank only
+    # sends a few requests to the store instead of polling.
     if global_world_size < 2:
         return
 
@@ -238,33 +324,20 @@ def _barrier_never_timeout(global_rank, global_world_size):
     _barrier_count += 1
     is_master = global_rank == 0
 
-    def _check_keys_ready(wait_keys):
-        start_time = time.time()
-        while len(wait_keys) > 0:
-            time.sleep(0.1)
-            elapse_time = time.time() - start_time
-            if datetime.timedelta(seconds=elapse_time) > timeout:
-                raise RuntimeError(
-                    "Keys {} are not ready sinck rank {} is waiting them.".format(
-                        wait_keys, global_rank
-                    )
-                )
-            wait_keys = list(
-                filter(lambda key: int(_barrier_store.get(key)) != 1, wait_keys)
-            )
+    # the last arriving rank releases all the ranks
+    arrived = _barrier_store.add(barrier_prefix + "arrived", 1)
+    if arrived == global_world_size:
+        _barrier_store.set(barrier_prefix + "released", b"1")
+    _barrier_store.wait(barrier_prefix + "released")
 
+    # Note: the master must exit in the end to ensure that the TcpServer is
+    # destroyed after all the workers finish accessing it.
     if is_master:
-        # the master will add key, wait for all workers'exiting key and exit in the end.
-        # Note: the master must exit in the end to ensure that the TcpServer is destroyed in the end.
-        wait_keys = [
-            barrier_prefix + str(rank) for rank in range(1, global_world_size)
-        ]
-        _barrier_store.add(barrier_prefix + str(0), 1)
-        _check_keys_ready(wait_keys)
+        _barrier_store.wait(barrier_prefix + "exited")
     else:
-        wait_keys = [barrier_prefix + str(0)]
-        _check_keys_ready(wait_keys)
-        _barrier_store.add(barrier_prefix + str(global_rank), 1)
+        exited = _barrier_store.add(barrier_prefix + "exiting", 1)
+        if exited == global_world_size - 1:
+            _barrier_store.set(barrier_prefix + "exited", b"1")
 
 
 def shutdown():
@@ -14,9 +14,11 @@
 
 import paddle
 import numbers
+import operator
 import numpy as np
 from ..framework import _non_static_mode
 from .. import core, layers
+from .flat import FIELD_PREFIX, _flatten_batch
 
 from collections.abc import Sequence, Mapping
 
@@ -79,6 +81,254 @@ def default_collate_fn(batch):
     )
 
 
+# leaf kinds of the sample structure recorded by _CachedCollateFn
+_ARRAY = 0
+_NUMBER = 1
+_STRING = 2
+_TENSOR = 3
+
+
+def _make_getter(path):
+    if len(path) == 0:
+        return None
+    if len(path) == 1:
+        return operator.itemgetter(path[0])
+
+    def _getter(sample):
+        for key in path:
+            sample = sample[key]
+        return sample
+
+    return _getter
+
+
+class _CachedCollateFn:
+    """
+    Structure cached batch collating function, the output is the same
+    as :code:`default_collate_fn`.
+
+    The nested structure of samples, and the shape and dtype of each numpy
+    array field, are learned from the first sample of the first batch,
+    following batches are collated by writing each field of each sample
+    into the preallocated output buffers directly, without recursively
+    parsing the structure and stacking the fields in every batch. If a
+    sample does not match the recorded structure (e.g. the keys of a dict,
+    the length of a list or the shape of a field changes), the batch falls
+    back to :code:`default_collate_fn` and the structure is learned again
+    from the next batch.
+
+    The flat list of collated fields and the batch structure of the last
+    batch are also cached, so :code:`flatten` can skip parsing the batch
+    again before feeding it into the blocking queue.
+
+    Args:
+        reuse_buffer(bool): whether to reuse the output buffers across
+            batches. Only enable it when the collated batch is copied
+            before the next batch is collated. Default False.
+        allocator(callable, optional): function with signature
+            :code:`allocator(shape, dtype)` to allocate the output buffer
+            of numpy array and number fields, e.g. to allocate buffers in
+            shared memory. Default None, which means :code:`numpy.empty`.
+    """
+
+    def __init__(self, reuse_buffer=False, allocator=None):
+        self._reuse_buffer = reuse_buffer
+        self._allocator = allocator or np.empty
+        self._reset()
+
+    def _reset(self):
+        self._spec = None
+        self._leaves = []
+        self._nodes = []
+        self._buffers = {}
+        self._last = None
+
+    def __getstate__(self):
+        # learned structure and buffers are not shared with subprocesses
+        return {
+            '_reuse_buffer': self._reuse_buffer,
+            '_allocator': self._allocator,
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._reset()
+
+    def _set_allocator(self, allocator):
+        # buffers allocated by a custom allocator, e.g. in the shared memory
+        # buffers of a worker, are managed by the allocator and not reused
+        self._allocator = allocator
+        self._reuse_buffer = False
+        self._buffers = {}
+
+    def _learn(self, sample, path):
+        if isinstance(sample, np.ndarray):
+            self._leaves.append(
+                (_ARRAY, _make_getter(path), sample.shape, sample.dtype)
+            )
+            return _ARRAY
+        elif isinstance(sample, (paddle.Tensor, core.eager.Tensor)):
+            self._leaves.append((_TENSOR, _make_getter(path), None, None))
+            return _TENSOR
+        elif isinstance(sample, numbers.Number):
+            self._leaves.append(
+                (
+                    _NUMBER,
+                    _make_getter(path),
+                    type(sample),
+                    np.asarray(sample).dtype,
+                )
+            )
+            return _NUMBER
+        elif isinstance(sample, (str, bytes)):
+            self._leaves.append((_STRING, _make_getter(path), None, None))
+            return _STRING
+        elif isinstance(sample, Mapping):
+            self._nodes.append((_make_getter(path), list(sample.keys())))
+            return {
+                key: self._learn(sample[key], path + (key,)) for key in sample
+            }
+        elif isinstance(sample, Sequence):
+            self._nodes.append((_make_getter(path), len(sample)))
+            return [
+                self._learn(field, path + (i,))
+                for i, field in enumerate(sample)
+            ]
+        raise TypeError(
+            "batch data con only contains: tensor, numpy.ndarray, "
+            "dict, list, number, but got {}".format(type(sample))
+        )
+
+    def _get_buffer(self, leaf_idx, shape, dtype):
+        if not self._reuse_buffer:
+            return self._allocator(shape, dtype)
+        buf = self._buffers.get(leaf_idx)
+        if buf is None or buf.shape[0] < shape[0]:
+            buf = self._allocator(shape, dtype)
+            self._buffers[leaf_idx] = buf
+        return buf[: shape[0]]
+
+    def _match_nodes(self, batch):
+        # the keys of dicts and the lengths of lists in every sample should
+        # be the same as the learned ones, or some fields are lost silently
+        for getter, keys in self._nodes:
+            fields = batch if getter is None else list(map(getter, batch))
+            if isinstance(keys, list):
+                if list(fields[0].keys()) != keys:
+                    return False
+                if not all(
+                    isinstance(f, Mapping) and f.keys() == fields[0].keys()
+                    for f in fields
+                ):
+                    return False
+            elif not all(
+                isinstance(f, Sequence)
+                and not isinstance(f, (str, bytes))
+                and len(f) == keys
+                for f in fields
+            ):
+                return False
+        return True
+
+    def _collate_leaves(self, batch):
+        batch_size = len(batch)
+        outputs = []
+        for leaf_idx, leaf in enumerate(self._leaves):
+            kind, getter, shape, dtype = leaf
+            fields = batch if getter is None else list(map(getter, batch))
+            if kind == _ARRAY:
+                if {(f.shape, f.dtype) for f in fields} != {(shape, dtype)}:
+                    return None
+                out = self._get_buffer(leaf_idx, (batch_size,) + shape, dtype)
+                if len(shape) > 0:
+                    # concatenate into the buffer directly, which is faster
+                    # than np.stack as no expanded view is created per sample
+                    np.concatenate(
+                        fields,
+                        axis=0,
+                        out=out.reshape((-1,) + shape[1:]),
+                    )
+                else:
+                    out[:] = fields
+            elif kind == _NUMBER:
+                # number type is recorded in place of shape
+                if set(map(type, fields)) != {shape}:
+                    return None
+                out = self._get_buffer(leaf_idx, (batch_size,), dtype)
+                out[:] = fields
+            elif kind == _TENSOR:
+                if not all(
+                    isinstance(f, (paddle.Tensor, core.eager.Tensor))
+                    for f in fields
+                ):
+                    return None
+                out = paddle.stack(fields, axis=0)
+            else:
+                if not all(isinstance(f, (str, bytes)) for f in fields):
+                    return None
+                out = list(fields)
+            outputs.append(out)
+        return outputs
+
+    def _build(self, spec, outputs, leaf_idx, flat):
+        if isinstance(spec, Mapping):
+            batch, structure = {}, {}
+            for key, field_spec in spec.items():
+                batch[key], structure[key], leaf_idx = self._build(
+                    field_spec, outputs, leaf_idx, flat
+                )
+            return batch, structure, leaf_idx
+        elif isinstance(spec, list):
+            batch, structure = [], []
+            for field_spec in spec:
+                field, field_struct, leaf_idx = self._build(
+                    field_spec, outputs, leaf_idx, flat
+                )
+                batch.append(field)
+                structure.append(field_struct)
+            return batch, structure, leaf_idx
+
+        field = outputs[leaf_idx]
+        if spec == _STRING:
+            # list of strings is kept in structure, the same as _flatten_batch
+            return field, list(field), leaf_idx + 1
+        structure = '{}{}'.format(FIELD_PREFIX, len(flat))
+        flat.append(field)
+        return field, structure, leaf_idx + 1
+
+    def __call__(self, batch):
+        try:
+            if self._spec is None:
+                self._spec = self._learn(batch[0], ())
+            outputs = None
+            if self._match_nodes(batch):
+                outputs = self._collate_leaves(batch)
+        except (KeyError, IndexError, TypeError, AttributeError):
+            outputs = None
+
+        if outputs is None:
+            # structure, shape or dtype changed, learn again in next batch
+            self._reset()
+            return default_collate_fn(batch)
+
+        flat = []
+        collated, structure, _ = self._build(self._spec, outputs, 0, flat)
+        self._last = (collated, flat, structure)
+        return collated
+
+    def flatten(self, batch):
+        """
+        Return the flat fields and the structure of the batch, which is the
+        same as :code:`_flatten_batch`, the cached result is returned if the
+        batch is the last batch collated by this function.
+        """
+        last = self._last
+        self._last = None
+        if last is None or last[0] is not batch:
+            return _flatten_batch(batch)
+        return last[1], last[2]
+
+
 def default_convert_fn(batch):
     """
     Default batch converting function for :code:`paddle.io.DataLoader`.
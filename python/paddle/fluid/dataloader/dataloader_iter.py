@@ -43,7 +43,10 @@ from ..multiprocess_utils import (
 )
 from .fetcher import _IterableDatasetFetcher, _MapDatasetFetcher
 from .batch_sampler import _InfiniteIterableSampler
-from .collate import default_collate_fn, default_convert_fn
+from .collate import (
+    default_convert_fn,
+    _CachedCollateFn,
+)
 from .worker import (
     ParentWatchDog,
     get_worker_info,
@@ -54,6 +57,7 @@ from .worker import (
     _ResumeIteration,
 )
 from .flat import _flatten_batch, _restore_batch
+from .shm_ring import _use_shm_ring, _ShmRingReader, _RingPayload
 from paddle.profiler.timer import benchmark
 
 __all__ = ['get_worker_info']
@@ -89,6 +93,37 @@ def _clear_loader():
 CleanupFuncRegistrar.register(_clear_loader)
 
 
+class _SamplerHandoff:
+    """
+    Thread safe iterator of sampler indices, which can be handed off
+    from a DataLoader iterator to a new one. After handed off, the old
+    iterator gets no more indices and only outputs its outstanding
+    batches.
+
+    Args:
+        sampler_iter(iterator): iterator of sampler indices.
+    """
+
+    def __init__(self, sampler_iter):
+        self._sampler_iter = sampler_iter
+        self._lock = threading.Lock()
+        self._handed_off = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        with self._lock:
+            if self._handed_off:
+                raise StopIteration
+            return next(self._sampler_iter)
+
+    def handoff(self):
+        with self._lock:
+            self._handed_off = True
+        return _SamplerHandoff(self._sampler_iter)
+
+
 class _DataLoaderIterBase:
     """
     Iterator implement of DataLoader, will load and feed mini-batch
@@ -96,9 +131,11 @@ class _DataLoaderIterBase:
 
     Args:
         loader(instance of DataLoader): instance of `fluid.io.DataLoader`
+        sampler_iter(_SamplerHandoff, optional): sampler indices handed
+            off from another iterator, see _DataLoaderIterAutoTune
     """
 
-    def __init__(self, loader):
+    def __init__(self, loader, sampler_iter=None):
         self._dataset = loader.dataset
         self._feed_list = loader.feed_list or []
         self._places = loader.places
@@ -116,10 +153,19 @@ class _DataLoaderIterBase:
         self._worker_init_fn = loader.worker_init_fn
         self._dataset_kind = loader.dataset_kind
         self._pin_memory = loader.pin_memory
+        self._autotune = loader._autotune
 
-        self._sampler_iter = iter(self._index_sampler)
+        if sampler_iter is None:
+            sampler_iter = self._new_sampler_iter()
+        self._sampler_iter = sampler_iter
         if self._auto_collate_batch:
-            self._collate_fn = loader.collate_fn or default_collate_fn
+            # NOTE: collated batch is copied into LoDTensor before next batch
+            # is collated in main process or in workers with shared memory,
+            # while it is pickled asynchronously by worker queue otherwise,
+            # so output buffers can only be reused in the former cases
+            self._collate_fn = loader.collate_fn or _CachedCollateFn(
+                reuse_buffer=self._num_workers == 0 or self._use_shared_memory
+            )
         else:
             self._collate_fn = loader.collate_fn or default_convert_fn
 
@@ -142,6 +188,20 @@ class _DataLoaderIterBase:
             else:
                 return _InfiniteIterableSampler(self._dataset, 1)
 
+    def _new_sampler_iter(self):
+        sampler_iter = iter(self._index_sampler)
+        # NOTE: the remaining indices of map-style dataset may be handed
+        # off to an iterator with new num_workers in autotune
+        if (
+            self._autotune is not None
+            and self._dataset_kind == _DatasetKind.MAP
+        ):
+            sampler_iter = _SamplerHandoff(sampler_iter)
+        return sampler_iter
+
+    def _handoff_sampler(self):
+        return self._sampler_iter.handoff()
+
     def __iter__(self):
         return self
 
@@ -165,8 +225,8 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
     loader.data in main process
     """
 
-    def __init__(self, loader):
-        super().__init__(loader)
+    def __init__(self, loader, sampler_iter=None):
+        super().__init__(loader, sampler_iter)
 
         self._dataset_fetcher = _DatasetKind.create_fetcher(
             self._dataset_kind,
@@ -255,7 +315,10 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
                 break
 
             # flat batch and record structure infos
-            batch, structure = _flatten_batch(batch)
+            if isinstance(self._collate_fn, _CachedCollateFn):
+                batch, structure = self._collate_fn.flatten(batch)
+            else:
+                batch, structure = _flatten_batch(batch)
             self._structure_infos.append(structure)
 
             if self._thread_done_event.is_set():
@@ -368,8 +431,8 @@ class _DataLoaderIterSingleProcess(_DataLoaderIterBase):
 
 
 class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
-    def __init__(self, loader):
-        super().__init__(loader)
+    def __init__(self, loader, sampler_iter=None):
+        super().__init__(loader, sampler_iter)
 
         self._persistent_workers = loader._persistent_workers
         self._resume_worker_cnt = 0
@@ -427,7 +490,9 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         else:
             self._worker_shm_buffer_size = 0
         self._main_thread_shm_buffer_size = (
-            (self._worker_shm_buffer_size) * 2 * self._num_workers
+            self._worker_shm_buffer_size
+            * self._prefetch_factor
+            * self._num_workers
         )
 
         # init workers and indices queues and put 2 indices in each indices queue
@@ -450,6 +515,20 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         # create data_queue for workers
         self._data_queue = multiprocessing.Queue()
 
+        # NOTE: in shm ring mode, each worker collates batches into its
+        # shared memory buffers with "_prefetch_factor" slots in flight,
+        # and the slot is given back to the worker by _shm_ring_queues
+        # after batch is mapped as LoDTensors without copy
+        self._shm_ring_queues = [None] * self._num_workers
+        self._shm_ring_reader = None
+        if self._use_shared_memory and _use_shm_ring():
+            self._shm_ring_queues = [
+                multiprocessing.Queue() for _ in range(self._num_workers)
+            ]
+            self._shm_ring_reader = _ShmRingReader(
+                self._shm_ring_queues, self._prefetch_factor
+            )
+
         # event for workers and thread, thread event is only need
         # in multi-processing mode
         self._workers_done_event = multiprocessing.Event()
@@ -475,6 +554,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._use_shared_memory,
                     self._base_seed,
                     self._worker_shm_buffer_size,
+                    self._shm_ring_queues[i],
                 ),
             )
             worker.daemon = True
@@ -568,7 +648,7 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
 
         # 4. reset _sampler_iter and put prefetch indices to start next epoch
         # init workers and indices queues and put 2 indices in each indices queue
-        self._sampler_iter = iter(self._index_sampler)
+        self._sampler_iter = self._new_sampler_iter()
         for _ in range(self._outstanding_capacity):
             self._try_put_indices()
 
@@ -598,6 +678,10 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     for q in self._indices_queues:
                         q.cancel_join_thread()
                         q.close()
+                    if self._shm_ring_reader is not None:
+                        for q in self._shm_ring_queues:
+                            q.cancel_join_thread()
+                            q.close()
             finally:
                 core._erase_process_pids(id(self))
                 self._shutdown = True
@@ -762,6 +846,12 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
                     self._exit_thread_unexpectedly()
                     batch.reraise()
 
+                # map batch out of the shared memory buffers as soon as it
+                # is received, so the slot is given back to the worker even
+                # if the batch is cached in _task_infos for order keeping
+                if isinstance(batch, _RingPayload):
+                    batch = self._shm_ring_reader.unpack(batch)
+
                 if idx == self._rcvd_idx:
                     del self._task_infos[idx]
                     self._structure_infos.append(structure)
@@ -801,6 +891,32 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
             self._batches_outstanding += 1
             self._send_idx += 1
 
+    def _set_prefetch_factor(self, prefetch_factor):
+        # NOTE: only increasing is supported for a running iterator, the
+        # outstanding indices and shm ring slots are added in place, while
+        # the capacity of blocking_queue is not changed, the batches more
+        # than it are cached in _data_queue
+        if prefetch_factor <= self._prefetch_factor:
+            return
+        if self._shm_ring_reader is not None:
+            self._shm_ring_reader.extend(prefetch_factor)
+        self._prefetch_factor = prefetch_factor
+        if self._worker_shm_buffer_size > 0:
+            self._main_thread_shm_buffer_size = (
+                self._worker_shm_buffer_size
+                * self._prefetch_factor
+                * self._num_workers
+            )
+            core._set_max_memory_map_allocation_pool_size(
+                self._main_thread_shm_buffer_size
+            )
+        outstanding_capacity = self._outstanding_capacity
+        self._outstanding_capacity = self._prefetch_factor * max(
+            self._num_workers, len(self._places)
+        )
+        for _ in range(self._outstanding_capacity - outstanding_capacity):
+            self._try_put_indices()
+
     def __del__(self):
         self._try_shutdown_all()
 
@@ -869,3 +985,74 @@ class _DataLoaderIterMultiProcess(_DataLoaderIterBase):
         for _ in range(len(self._places)):
             self._batches_outstanding -= 1
             self._try_put_indices()
+
+
+class _DataLoaderIterAutoTune:
+    """
+    Iterator of DataLoader in autotune, which measures the time waiting
+    for data of each step and applies the configs decided by
+    :code:`AuToTune` to the loading iterator.
+
+    prefetch_factor is increased in place. For map-style dataset, a new
+    loading iterator is created with the remaining sampler indices when
+    num_workers is changed, and the old one is drained in order. For
+    iterable-style dataset, whose samples of workers are split by
+    num_workers, new num_workers takes effect in next iteration.
+
+    Args:
+        loader(instance of DataLoader): instance of `fluid.io.DataLoader`
+    """
+
+    def __init__(self, loader):
+        self._loader = loader
+        self._autotune = loader._autotune
+        self._autotune.start()
+        self._iter = loader._create_iter()
+        # old iterators to be drained in order before self._iter
+        self._draining = []
+
+    def __iter__(self):
+        return self
+
+    def __len__(self):
+        return len(self._iter)
+
+    def __next__(self):
+        start = time.time()
+        data = self._next_data()
+        if not self._autotune.done:
+            configs = self._autotune.step(time.time() - start)
+            if configs:
+                self._apply(configs)
+        return data
+
+    def _next_data(self):
+        while self._draining:
+            try:
+                return next(self._draining[0])
+            except StopIteration:
+                old = self._draining.pop(0)
+                if (
+                    isinstance(old, _DataLoaderIterMultiProcess)
+                    and old._persistent_workers
+                ):
+                    old._reader.shutdown()
+                    old._try_shutdown_all()
+        return next(self._iter)
+
+    def _apply(self, configs):
+        loader = self._loader
+        if 'prefetch_factor' in configs:
+            loader.prefetch_factor = configs['prefetch_factor']
+            if isinstance(self._iter, _DataLoaderIterMultiProcess):
+                self._iter._set_prefetch_factor(loader.prefetch_factor)
+        if 'num_workers' in configs:
+            loader._set_num_workers(configs['num_workers'])
+            if loader.dataset_kind != _DatasetKind.MAP:
+                self._autotune.defer()
+                return
+            # the batches outstanding in the old iterator are output first,
+            # which overlaps with the start of new workers
+            sampler_iter = self._iter._handoff_sampler()
+            self._draining.append(self._iter)
+            self._iter = loader._create_iter(sampler_iter)
@@ -0,0 +1,267 @@
+#   Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mmap
+import os
+import queue
+
+import numpy as np
+
+from .. import core
+
+__all__ = []
+
+_SHM_DIR = '/dev/shm'
+
+
+def _use_shm_ring():
+    if not os.path.isdir(_SHM_DIR):
+        return False
+    return os.environ.get('FLAGS_dataloader_use_shm_ring', False) in [
+        1,
+        '1',
+        True,
+        'True',
+        'true',
+    ]
+
+
+class _RingPayload:
+    """
+    Batch data sent through the worker result queue in shm ring mode,
+    only the meta info of the shared memory buffers are pickled.
+
+    Each item of :attr:`fields` is :code:`(ipc_name, size, type_idx,
+    shape)` for arrays in shared memory buffers, or the field itself for
+    data not in buffers (e.g. Tensors).
+    """
+
+    def __init__(self, worker_id, slot, fields):
+        self.worker_id = worker_id
+        self.slot = slot
+        self.fields = fields
+
+
+class _SharedBuffer:
+    """
+    Shared memory buffer of a worker, which is a LoDTensor in the
+    reference counted memory map allocation, so that main process maps it
+    as a LoDTensor without copy, and the worker knows whether main process
+    still references it by the reference count.
+
+    Args:
+        numel(int): number of elements of the buffer.
+        dtype(numpy.dtype): data type of the buffer.
+    """
+
+    def __init__(self, numel, dtype):
+        self._tensor = core.LoDTensor()
+        self._tensor.set(np.empty([numel], dtype), core.CPUPlace())
+        (
+            ipc_name,
+            self.size,
+            self.type_idx,
+            _,
+            _,
+        ) = self._tensor._share_filename()
+        self.ipc_name = ipc_name
+        with open(os.path.join(_SHM_DIR, ipc_name.lstrip('/')), 'r+b') as f:
+            self._map = mmap.mmap(f.fileno(), 0)
+        # the data follows the header, whose first field is the reference
+        # count of the allocation
+        self._refcount = np.ndarray([], np.int32, buffer=self._map)
+        self.data = np.ndarray(
+            [numel], dtype, buffer=self._map, offset=len(self._map) - self.size
+        )
+        self.last_used = 0
+
+    @property
+    def address(self):
+        return self.data.__array_interface__['data'][0]
+
+    def is_free(self):
+        # not referenced by main process
+        return int(self._refcount) == 1
+
+    def fit(self, numel, dtype):
+        return self.data.dtype == dtype and len(self.data) >= numel
+
+
+class _ShmRingWriter:
+    """
+    Worker side of the shared memory ring, each worker collates batches
+    into its shared memory buffers directly. The buffers of a batch are
+    kept until main process has mapped them and put the slot back to
+    :attr:`free_queue`, and then reused once main process has released
+    the LoDTensors mapping them.
+
+    Args:
+        worker_id(int): id of the worker.
+        free_queue(multiprocessing.Queue): queue of free slot indices.
+    """
+
+    def __init__(self, worker_id, free_queue):
+        self._worker_id = worker_id
+        self._free_queue = free_queue
+        # buffers of the batches sent, by slot
+        self._slot_buffers = {}
+        # buffers given back, which are reused if they are free
+        self._buffers = []
+        # buffers of the batch being collated
+        self._allocated = []
+        self._slot = None
+        self._num_slots = 0
+        self._step = 0
+
+    def acquire(self, done_event, timeout):
+        """
+        Block until a free slot is got, return False if done_event set.
+        The slot is kept if the last acquired slot has not been packed,
+        e.g. fetching the last batch failed.
+        """
+        while self._slot is None:
+            if done_event.is_set():
+                return False
+            try:
+                self._slot = self._free_queue.get(timeout=timeout)
+            except queue.Empty:
+                continue
+            self._num_slots = max(self._num_slots, self._slot + 1)
+            self._buffers.extend(self._slot_buffers.pop(self._slot, []))
+        self._buffers.extend(self._allocated)
+        self._allocated = []
+        return True
+
+    def _take_buffer(self, numel, dtype):
+        # the smallest free one which fits
+        candidates = [
+            buffer
+            for buffer in self._buffers
+            if buffer.fit(numel, dtype) and buffer.is_free()
+        ]
+        if candidates:
+            buffer = min(candidates, key=lambda buffer: buffer.size)
+            self._buffers.remove(buffer)
+        else:
+            buffer = _SharedBuffer(max(numel, 1), dtype)
+        buffer.last_used = self._step
+        self._allocated.append(buffer)
+        return buffer
+
+    def allocate(self, shape, dtype):
+        """
+        Allocator for :code:`_CachedCollateFn`, each array is allocated in
+        a shared memory buffer, and fallback to :code:`numpy.empty` if no
+        slot is acquired.
+        """
+        if self._slot is None:
+            return np.empty(shape, dtype)
+        dtype = np.dtype(dtype)
+        numel = int(np.prod(shape))
+        buffer = self._take_buffer(numel, dtype)
+        return buffer.data[:numel].reshape(shape)
+
+    def _buffer_of(self, arr):
+        if not arr.flags.c_contiguous:
+            return None
+        address = arr.__array_interface__['data'][0]
+        for buffer in self._allocated:
+            if buffer.address == address and buffer.data.dtype == arr.dtype:
+                return buffer
+        return None
+
+    def pack(self, flat_batch):
+        """
+        Send flat batch by the meta info of its buffers, arrays already
+        allocated in buffers by :code:`allocate` are not copied again. Non
+        numpy array fields are sent as they are.
+        """
+        fields = []
+        for field in flat_batch:
+            if isinstance(field, np.ndarray):
+                buffer = self._buffer_of(field)
+                if buffer is None:
+                    buffer = self._take_buffer(field.size, field.dtype)
+                    buffer.data[: field.size] = field.reshape([-1])
+                field = (
+                    buffer.ipc_name,
+                    buffer.size,
+                    buffer.type_idx,
+                    list(field.shape),
+                )
+            fields.append(field)
+
+        payload = _RingPayload(self._worker_id, self._slot, fields)
+        self._slot_buffers[self._slot] = self._allocated
+        self._allocated = []
+        self._slot = None
+        self._step += 1
+        # drop the buffers not reused for a round of all slots, e.g. the
+        # ones outgrown or still referenced by main process
+        self._buffers = [
+            buffer
+            for buffer in self._buffers
+            if self._step - buffer.last_used <= 2 * self._num_slots
+        ]
+        return payload
+
+    def release(self):
+        # the shared memory files are unlinked when the last reference of
+        # main process or this worker is released
+        self._slot_buffers = {}
+        self._buffers = []
+        self._allocated = []
+
+
+class _ShmRingReader:
+    """
+    Main process side of the shared memory ring, map the buffers of
+    batches as LoDTensors without copy and give the slots back to
+    workers.
+
+    Args:
+        free_queues(list): free slot queue of each worker.
+        slab_num(int): number of slots of each worker.
+    """
+
+    def __init__(self, free_queues, slab_num):
+        self._free_queues = free_queues
+        self._slab_num = 0
+        self.extend(slab_num)
+
+    def extend(self, slab_num):
+        """
+        Increase the number of slots of each worker to :attr:`slab_num`.
+        """
+        for free_queue in self._free_queues:
+            for slot in range(self._slab_num, slab_num):
+                free_queue.put(slot)
+        self._slab_num = max(self._slab_num, slab_num)
+
+    def unpack(self, payload):
+        """
+        Map the arrays in shared memory buffers as LoDTensors and give the
+        slot back to the worker, the buffers are reused by the worker after
+        the LoDTensors are released.
+        """
+        tensor_list = []
+        for field in payload.fields:
+            if isinstance(field, tuple):
+                ipc_name, size, type_idx, shape = field
+                field = core.LoDTensor._new_shared_filename(
+                    (ipc_name, size, type_idx, shape, [])
+                )
+            tensor_list.append(field)
+        self._free_queues[payload.worker_id].put(payload.slot)
+        return tensor_list
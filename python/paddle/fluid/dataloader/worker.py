@@ -27,6 +27,8 @@ from ..multiprocess_utils import (
 )
 from ..framework import _non_static_mode, _in_eager_without_dygraph_check
 from .flat import _flatten_batch
+from .collate import _CachedCollateFn
+from .shm_ring import _ShmRingWriter
 
 import queue
 
@@ -276,7 +278,9 @@ def _worker_loop(
     use_shared_memory,
     base_seed,
     shm_cahce_size=0,
+    shm_ring_queue=None,
 ):
+    shm_ring = None
     try:
         # NOTE: [ mmap files clear ] When the child process exits unexpectedly,
         # some shared memory objects may have been applied for but have not yet
@@ -320,6 +324,14 @@ def _worker_loop(
         except:
             init_exception = _WorkerException(worker_id)
 
+        # NOTE: in shm ring mode, batches are collated into the shared memory
+        # buffers owned by this worker and only the meta info of buffers is
+        # sent through out_queue, see shm_ring.py
+        if use_shared_memory and shm_ring_queue is not None:
+            shm_ring = _ShmRingWriter(worker_id, shm_ring_queue)
+            if isinstance(collate_fn, _CachedCollateFn):
+                collate_fn._set_allocator(shm_ring.allocate)
+
         iterator_drained = False
         parent_watch_dog = ParentWatchDog()
 
@@ -354,6 +366,10 @@ def _worker_loop(
                     batch = init_exception
                     init_exception = None
                 else:
+                    if shm_ring is not None and not shm_ring.acquire(
+                        done_event, MP_STATUS_CHECK_INTERVAL
+                    ):
+                        continue
                     # NOTE: GPU tensor operation is not supported in sub-process
                     #       but default device is GPU in paddle-gpu version, which
                     #       may copy CPU tensor to GPU even if users want to use
@@ -373,8 +389,19 @@ def _worker_loop(
             else:
                 if isinstance(batch, _WorkerException):
                     out_queue.put((idx, batch, None))
-                batch, structure = _flatten_batch(batch)
-                if use_shared_memory:
+                if isinstance(collate_fn, _CachedCollateFn):
+                    batch, structure = collate_fn.flatten(batch)
+                else:
+                    batch, structure = _flatten_batch(batch)
+                if shm_ring is not None:
+                    batch = [
+                        b
+                        if isinstance(b, np.ndarray)
+                        else b.value().get_tensor()
+                        for b in batch
+                    ]
+                    out_queue.put((idx, shm_ring.pack(batch), structure))
+                elif use_shared_memory:
 
                     def numpy2lodtensor(arr):
                         lodtensor = core.Tensor()
@@ -398,3 +425,5 @@ def _worker_loop(
     finally:
         if use_shared_memory:
             _cleanup_mmap()
+            if shm_ring is not None:
+                shm_ring.release()
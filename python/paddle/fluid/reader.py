@@ -18,7 +18,6 @@ import numpy as np
 import threading
 import paddle
 import time
-import copy
 
 from .framework import (
     Program,
@@ -40,10 +39,11 @@ from .multiprocess_utils import (
     _cleanup,
     _set_SIGCHLD_handler,
 )
-from .dataloader import BatchSampler, Dataset, IterableDataset, Subset
+from .dataloader import BatchSampler, Dataset, IterableDataset
 from .dataloader.dataloader_iter import (
     _DataLoaderIterSingleProcess,
     _DataLoaderIterMultiProcess,
+    _DataLoaderIterAutoTune,
     _DatasetKind,
     default_collate_fn,
 )
@@ -172,140 +172,165 @@ class DataLoaderBase:
 
 
 class AuToTune:
-    def __init__(self, loader):
-        self.loader = loader
-        self.max_num_worker = multiprocessing.cpu_count() / 2
+    """
+    Online tuner of DataLoader. During the first TUNING_STEPS steps of
+    iterating the DataLoader, the time the training loop waits for data
+    and the time of each step are measured every window of steps. While
+    the waiting time is a considerable part of the step time, num_workers
+    is doubled, and then prefetch_factor (together with the shared memory
+    ring slots and cache of workers) is doubled, a change is rolled back if it
+    does not reduce the waiting time. The tuning is done without a
+    separate pass over the dataset before training.
+    """
 
-    def __call__(self):
-        # use default loader
-        if (not USE_AUTOTUNE) or (not self.need_autotune()):
-            return self.loader.num_workers
-
-        # get autotune loader
-        auto_tune_loader = self.get_autotune_loader()
-        if auto_tune_loader is None:
-            return self.loader.num_workers
-
-        # pick the best num_workers
-        auto_tune_start = time.time()
-        logging.debug("========= DataLoader Auto Tune =========")
-        logging.debug(
-            "User config for DataLoader: " + str(self.loader.num_workers)
-        )
-        best_num_workers = 0
-        min_cost = float("inf")
-        logging.debug(
-            "Tuning Range for num_workers: 0 ~ " + str(self.max_num_worker)
-        )
-        num_workers = 0
-        while num_workers < self.max_num_worker:
-            auto_tune_loader.num_workers = num_workers
-            avg_cost = self.evaluate_reader_cost(auto_tune_loader)
-            if min_cost * 0.75 > avg_cost:
-                min_cost = avg_cost
-                best_num_workers = num_workers
-            else:
-                update_num = self.is_best(
-                    auto_tune_loader,
-                    best_num_workers,
-                    min_cost,
-                    self.max_num_worker,
-                )
-                if update_num == best_num_workers:
-                    break
-                else:
-                    best_num_workers = update_num
-            logging.debug(
-                "num_workers: "
-                + str(num_workers)
-                + " avg_cost: "
-                + str(avg_cost)
-            )
-            num_workers += 2
-        logging.info(
-            "auto_tune dataLoader best_num_workers: " + str(best_num_workers)
-        )
-        logging.debug(
-            "AutoTuning Cost for DataLoader: "
-            + str(time.time() - auto_tune_start)
-            + ' seconds'
-        )
+    # reading is the bottleneck if the training loop waits for data
+    # longer than this ratio of the step time
+    WAIT_RATIO = 0.05
+    # a change is kept only if it reduces the waiting time by this ratio
+    MIN_GAIN = 0.25
+    MAX_PREFETCH_FACTOR = 16
 
-        # tune the default loader's num_workers
-        return best_num_workers
+    def __init__(self, loader, use_shared_memory=True):
+        self.loader = loader
+        self.use_shared_memory = use_shared_memory
+        self.max_num_workers = max(multiprocessing.cpu_count() // 2, 1)
+        self.window = max(min(TUNING_STEPS // 10, 50), 1)
+        self.tuning_steps = TUNING_STEPS
+        self.steps = 0
+        self.done = False
+        self._knob = 'num_workers'
+        # knob, value before the last change and the waiting time then
+        self._last_change = None
+        self._deferred = False
+        self.start()
 
-    def need_autotune(self):
+    @staticmethod
+    def need_autotune():
         if sys.platform == 'darwin' or sys.platform == 'win32':
             return False
         else:
             return True
 
-    def get_sub_dataset(self, dataset, batch_size):
-        num_samples = min(batch_size * TUNING_STEPS, len(dataset))
-        sub_dataset = Subset(dataset, indices=list(range(num_samples)))
-        return sub_dataset
+    def start(self):
+        """
+        Start measuring a new iteration of the DataLoader.
+        """
+        self._deferred = False
+        self._last_step_end = None
+        self._reset_window(skip_steps=1)
 
-    def get_autotune_loader(self):
-        loader = copy.copy(self.loader)
-        batch_size = self.loader.batch_sampler.batch_size
-        if isinstance(
-            self.loader.batch_sampler, paddle.io.DistributedBatchSampler
-        ):
-            dataset = self.loader.batch_sampler.dataset
-            sub_dataset = self.get_sub_dataset(dataset, batch_size)
-            loader.batch_sampler = paddle.io.DistributedBatchSampler(
-                dataset=sub_dataset,
-                batch_size=batch_size,
-                num_replicas=self.loader.batch_sampler.nranks,
-                rank=self.loader.batch_sampler.local_rank,
-                shuffle=self.loader.batch_sampler.shuffle,
-                drop_last=self.loader.batch_sampler.drop_last,
-            )
-        elif isinstance(self.loader.batch_sampler, paddle.io.BatchSampler):
-            dataset = self.loader.batch_sampler.sampler.data_source
-            sub_dataset = self.get_sub_dataset(dataset, batch_size)
-            loader.batch_sampler = paddle.io.BatchSampler(
-                dataset=sub_dataset,
-                batch_size=batch_size,
-                drop_last=self.loader.batch_sampler.drop_last,
+    def defer(self):
+        """
+        Stop measuring until next iteration, for the change takes effect
+        in next iteration.
+        """
+        self._deferred = True
+
+    def _reset_window(self, skip_steps=0):
+        self._wait_cost = 0.0
+        self._step_cost = 0.0
+        self._window_steps = 0
+        # the first step of an iteration or after a change includes the
+        # start of workers, which is not measured
+        self._skip_steps = skip_steps
+
+    def step(self, wait_cost):
+        """
+        Record a step which waits :attr:`wait_cost` seconds for data,
+        return the configs to be changed or None.
+        """
+        now = time.time()
+        step_cost = (
+            wait_cost
+            if self._last_step_end is None
+            else now - self._last_step_end
+        )
+        self._last_step_end = now
+        self.steps += 1
+        if self.steps >= self.tuning_steps:
+            self._finish()
+            return None
+        if self._deferred:
+            return None
+        if self._skip_steps > 0:
+            self._skip_steps -= 1
+            return None
+
+        self._wait_cost += wait_cost
+        self._step_cost += step_cost
+        self._window_steps += 1
+        if self._window_steps < self.window:
+            return None
+        wait_cost = self._wait_cost / self._window_steps
+        wait_ratio = self._wait_cost / max(self._step_cost, 1e-9)
+        configs = self._decide(wait_cost, wait_ratio)
+        self._reset_window(skip_steps=1 if configs else 0)
+        if configs:
+            logging.info(
+                "DataLoader autotune: wait ratio {:.3f} at step {}, "
+                "change {}".format(wait_ratio, self.steps, configs)
             )
-        else:
-            loader = None
-        return loader
-
-    def evaluate_reader_cost(self, reader):
-        costs = []
-        avg_cost = 0
-        start = time.time()
-        for i, data in enumerate(reader):
-            costs.append(time.time() - start)
-            start = time.time()
-        if len(costs) > 2:
-            avg_cost = sum(costs[2:]) / len(costs[2:])
-        else:
-            avg_cost = sum(costs[0:]) / len(costs[0:])
-        return avg_cost
-
-    def is_best(self, reader, best_workers, best_time, num_work_boundary):
-        step = 0
-        num_workers = best_workers + 1
-        boundary = 1
-        while num_workers < num_work_boundary and step < 5:
-            self.loader.num_workers = num_workers
-            time = self.evaluate_reader_cost(reader)
-            logging.debug(
-                "for back num_workers: "
-                + str(num_workers)
-                + " avg_cost: "
-                + str(time)
+        return configs
+
+    def _decide(self, wait_cost, wait_ratio):
+        loader = self.loader
+        if self._last_change is not None:
+            knob, value, last_wait_cost = self._last_change
+            self._last_change = None
+            if wait_cost > last_wait_cost * (1 - self.MIN_GAIN):
+                # the last change does not help, roll it back and turn to
+                # the next knob
+                self._next_knob()
+                return {knob: value}
+
+        if wait_ratio < self.WAIT_RATIO:
+            self._finish()
+            return None
+
+        if self._knob == 'num_workers':
+            if loader.num_workers < self.max_num_workers:
+                num_workers = min(
+                    max(loader.num_workers * 2, 2), self.max_num_workers
+                )
+                self._last_change = (
+                    'num_workers',
+                    loader.num_workers,
+                    wait_cost,
+                )
+                return {'num_workers': num_workers}
+            self._next_knob()
+        if self._knob == 'prefetch_factor':
+            if (
+                loader.num_workers > 0
+                and loader.prefetch_factor < self.MAX_PREFETCH_FACTOR
+            ):
+                prefetch_factor = min(
+                    loader.prefetch_factor * 2, self.MAX_PREFETCH_FACTOR
+                )
+                self._last_change = (
+                    'prefetch_factor',
+                    loader.prefetch_factor,
+                    wait_cost,
+                )
+                return {'prefetch_factor': prefetch_factor}
+            self._next_knob()
+        self._finish()
+        return None
+
+    def _next_knob(self):
+        self._knob = 'prefetch_factor' if self._knob == 'num_workers' else None
+
+    def _finish(self):
+        if not self.done:
+            self.done = True
+            logging.info(
+                "DataLoader autotune done after {} steps: num_workers {}, "
+                "prefetch_factor {}".format(
+                    self.steps,
+                    self.loader.num_workers,
+                    self.loader.prefetch_factor,
+                )
             )
-            step += 1
-            if time < best_time * 0.70 * boundary:
-                return num_workers
-            else:
-                num_workers += 1
-            boundary *= 0.80
-        return best_workers
 
 
 class DataLoader:
@@ -593,7 +618,9 @@ class DataLoader:
 
         self._persistent_workers = persistent_workers
         self._iterator = None
-        self.num_workers = AuToTune(self).__call__()
+        self._autotune = None
+        if USE_AUTOTUNE and AuToTune.need_autotune():
+            self._autotune = AuToTune(self, use_shared_memory)
 
     def __len__(self):
         if self.dataset_kind == _DatasetKind.ITER:
@@ -605,16 +632,38 @@ class DataLoader:
                 return len(self.dataset)
 
     def __iter__(self):
+        if self._autotune is not None and not self._autotune.done:
+            return _DataLoaderIterAutoTune(self)
+        return self._create_iter()
+
+    def _create_iter(self, sampler_iter=None):
+        if sampler_iter is not None and self._persistent_workers:
+            # the old persistent iterator handing off sampler_iter is
+            # drained and shut down by _DataLoaderIterAutoTune
+            self._iterator = None
         if self.num_workers == 0:
-            return _DataLoaderIterSingleProcess(self)
+            return _DataLoaderIterSingleProcess(self, sampler_iter)
         elif self._persistent_workers:
+            if (
+                self._iterator is not None
+                and self._iterator._num_workers != self.num_workers
+            ):
+                # num_workers is changed by autotune
+                self._iterator._try_shutdown_all()
+                self._iterator = None
             if self._iterator is None:
-                self._iterator = _DataLoaderIterMultiProcess(self)
+                self._iterator = _DataLoaderIterMultiProcess(self, sampler_iter)
             else:
                 self._iterator._reset()
             return self._iterator
         else:
-            return _DataLoaderIterMultiProcess(self)
+            return _DataLoaderIterMultiProcess(self, sampler_iter)
+
+    def _set_num_workers(self, num_workers):
+        self.num_workers = num_workers
+        self.use_shared_memory = (
+            self._autotune.use_shared_memory and num_workers > 0
+        )
 
     def __call__(self):
         return self.__iter__()
@@ -0,0 +1,42 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+
+import paddle
+from paddle.cost_model import CostModel
+
+paddle.enable_static()
+
+# Benchmark of querying the static cost data, which is not run in the unit
+# tests.
+
+
+class BenchmarkCostModel(unittest.TestCase):
+    def test_timeit_static_op_time(self):
+        cost_model = CostModel()
+        cost_model.static_cost_data()
+        start = time.time()
+        for _ in range(10000):
+            cost_model.get_static_op_time("conv2d")
+        print(
+            "get_static_op_time: {:.2f}us per query".format(
+                (time.time() - start) * 100
+            )
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
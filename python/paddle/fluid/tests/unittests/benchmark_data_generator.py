@@ -0,0 +1,59 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import sys
+import time
+import unittest
+
+import numpy as np
+from test_data_generator import MyColumnarDataGenerator, MyRowDataGenerator
+
+# Benchmark of the throughput of the row and columnar data generators, which
+# is not run in the unit tests.
+
+
+class BenchmarkColumnarDataGenerator(unittest.TestCase):
+    def setUp(self):
+        ids = np.random.randint(0, 1000000, [5000, 30])
+        self.data = "".join(" ".join(map(str, row)) + "\n" for row in ids)
+
+    def run_from_stdin(self, data_generator, columnar):
+        stdin, stdout = sys.stdin, sys.stdout
+        sys.stdin = io.StringIO(self.data)
+        sys.stdout = io.StringIO()
+        try:
+            start = time.time()
+            data_generator.run_from_stdin(columnar=columnar)
+            return time.time() - start
+        finally:
+            sys.stdin, sys.stdout = stdin, stdout
+
+    def test_timeit_throughput(self):
+        row_dg = MyRowDataGenerator()
+        row_dg.set_batch(1024)
+        row_cost = self.run_from_stdin(row_dg, False)
+        columnar_dg = MyColumnarDataGenerator()
+        columnar_dg.set_batch(1024)
+        columnar_cost = self.run_from_stdin(columnar_dg, True)
+        num_lines = self.data.count("\n")
+        print(
+            "throughput: row {:.0f} lines/s, columnar {:.0f} lines/s".format(
+                num_lines / row_cost, num_lines / columnar_cost
+            )
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+
+import numpy as np
+
+from paddle.fluid.dataloader.collate import _CachedCollateFn, default_collate_fn
+from paddle.fluid.dataloader.flat import _flatten_batch
+
+# Benchmark of collating and flattening batches by the cached collate
+# function versus default_collate_fn, which is not run in the unit tests.
+
+
+class BenchmarkCachedCollate(unittest.TestCase):
+    def test_timeit_collate(self):
+        batch = [
+            {
+                'x': np.random.random([64]).astype('float32'),
+                'y': np.random.random([16]).astype('float32'),
+                'label': 1,
+            }
+            for _ in range(1024)
+        ]
+        collate_fn = _CachedCollateFn(reuse_buffer=True)
+        collate_fn.flatten(collate_fn(batch))
+
+        iters = 20
+        start = time.time()
+        for _ in range(iters):
+            _flatten_batch(default_collate_fn(batch))
+        default_cost = (time.time() - start) / iters
+        start = time.time()
+        for _ in range(iters):
+            collate_fn.flatten(collate_fn(batch))
+        cached_cost = (time.time() - start) / iters
+        print(
+            "collate batch size 1024: default {:.6f}s, cached {:.6f}s".format(
+                default_cost, cached_cost
+            )
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+
+from test_dataparallel_flat_buffers import MLP
+
+import paddle
+from paddle.fluid import core
+
+# Benchmark of DataParallel.clear_gradients with and without flat buffers,
+# which is not run in the unit tests.
+
+
+class BenchmarkDataParallelFlatBuffers(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.places = ['cpu']
+        if core.is_compiled_with_cuda():
+            self.places.append('gpu')
+
+    def create_model(self, use_flat_buffers, **kwargs):
+        paddle.seed(10)
+        return paddle.DataParallel(
+            MLP(**kwargs),
+            comm_buffer_size=0.001,
+            last_comm_buffer_size=0.0005,
+            use_flat_buffers=use_flat_buffers,
+        )
+
+    def test_timeit_clear_gradients(self):
+        for place in self.places:
+            paddle.set_device(place)
+            costs = []
+            for use_flat_buffers in [False, True]:
+                model = self.create_model(
+                    use_flat_buffers, num_layers=500, hidden_size=16
+                )
+                paddle.mean(model(paddle.randn([4, 16]))).backward()
+                if place == 'gpu':
+                    paddle.device.cuda.synchronize()
+                start = time.time()
+                for _ in range(20):
+                    model.clear_gradients()
+                if place == 'gpu':
+                    paddle.device.cuda.synchronize()
+                costs.append((time.time() - start) / 20)
+            print(
+                "clear_gradients of {} parameters on {}: {:.2f}ms, "
+                "flat buffers {:.2f}ms".format(
+                    len(model.parameters()),
+                    place,
+                    costs[0] * 1000,
+                    costs[1] * 1000,
+                )
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
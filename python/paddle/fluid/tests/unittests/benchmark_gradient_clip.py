@@ -0,0 +1,65 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import paddle
+import paddle.fluid as fluid
+
+# Benchmark of the per-tensor versus multi-tensor ClipGradByGlobalNorm, which
+# is not run in the unit tests.
+
+
+class BenchmarkGradientClipByGlobalNorm(unittest.TestCase):
+    def build_params_grads(self, num, dtype='float32'):
+        params_grads = []
+        for i in range(num):
+            shape = [i % 5 + 1, 4]
+            param = paddle.create_parameter(shape, dtype)
+            grad = paddle.to_tensor(np.random.random(shape), dtype)
+            params_grads.append((param, grad))
+        return params_grads
+
+    def test_timeit_gradient_clip(self):
+        with fluid.dygraph.guard(paddle.CPUPlace()):
+            clip = paddle.nn.ClipGradByGlobalNorm(clip_norm=1.0)
+            for num in [1000, 10000]:
+                params_grads = self.build_params_grads(num)
+                costs = []
+                for multi_tensor in [False, True]:
+                    coalesce_grads = (
+                        paddle.nn.clip._coalesce_grads
+                        if multi_tensor
+                        else lambda params_grads: ({}, [])
+                    )
+                    with mock.patch(
+                        'paddle.nn.clip._coalesce_grads', coalesce_grads
+                    ):
+                        clip(params_grads)
+                        start = time.time()
+                        for _ in range(5):
+                            clip(params_grads)
+                        costs.append((time.time() - start) / 5)
+                print(
+                    "ClipGradByGlobalNorm of {} grads on CPU: per-tensor "
+                    "{:.4f}s, multi-tensor {:.4f}s".format(num, *costs)
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import unittest
+
+from test_launch_kv_server import get_free_port
+
+from paddle.distributed.launch.utils.kv_client import KVClient
+from paddle.distributed.launch.utils.kv_server import KVServer
+
+# Benchmark of the rendezvous latency on the launch KV server, which is not
+# run in the unit tests.
+
+
+class BenchmarkKVServer(unittest.TestCase):
+    def setUp(self):
+        self.port = get_free_port()
+        self.server = KVServer(self.port)
+        self.server.start()
+        self.endpoint = '127.0.0.1:{}'.format(self.port)
+        self.assertTrue(KVClient(self.endpoint).wait_server_ready(timeout=5))
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_timeit_rendezvous(self):
+        for size in [64, 256]:
+            prefix = '/rendezvous{}'.format(size)
+            released = []
+
+            def peer(rank):
+                client = KVClient(self.endpoint)
+                client.put('{}/{}'.format(prefix, rank), str(rank))
+                client.wait_prefix(prefix, size, timeout=30)
+                released.append(time.time())
+
+            threads = [
+                threading.Thread(target=peer, args=(rank,))
+                for rank in range(size)
+            ]
+            for t in threads:
+                t.start()
+            all_started = time.time()
+            for t in threads:
+                t.join()
+            print(
+                "rendezvous of {} peers: released {:.4f}s after all started, "
+                "spread {:.4f}s".format(
+                    size,
+                    max(released) - all_started,
+                    max(released) - min(released),
+                )
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+
+from test_multi_tensor_optimizer import MLP, create_optimizer
+
+import paddle
+from paddle.fluid import core
+
+# Benchmark of the optimizer step with and without use_multi_tensor, which is
+# not run in the unit tests.
+
+
+class BenchmarkMultiTensorOptimizer(unittest.TestCase):
+    optimizers = ['Lamb', 'RMSProp', 'Adagrad', 'Adadelta', 'Adamax']
+
+    def setUp(self):
+        paddle.disable_static()
+        self.places = ['cpu']
+        if core.is_compiled_with_cuda():
+            self.places.append('gpu')
+
+    def test_timeit_step(self):
+        for place in self.places:
+            paddle.set_device(place)
+            for name in self.optimizers:
+                costs = []
+                for use_multi_tensor in [False, True]:
+                    model = MLP(num_layers=100, hidden_size=32)
+                    optimizer = create_optimizer(
+                        name, model.parameters(), use_multi_tensor
+                    )
+                    paddle.mean(model(paddle.randn([4, 32]))).backward()
+                    optimizer.step()
+                    if place == 'gpu':
+                        paddle.device.cuda.synchronize()
+                    start = time.time()
+                    for _ in range(20):
+                        optimizer.step()
+                    if place == 'gpu':
+                        paddle.device.cuda.synchronize()
+                    costs.append((time.time() - start) / 20)
+                print(
+                    "{} step of {} parameters on {}: {:.2f}ms, "
+                    "multi tensor {:.2f}ms".format(
+                        name,
+                        len(model.parameters()),
+                        place,
+                        costs[0] * 1000,
+                        costs[1] * 1000,
+                    )
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
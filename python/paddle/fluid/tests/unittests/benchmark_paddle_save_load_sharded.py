@@ -0,0 +1,71 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import time
+import unittest
+
+import paddle
+
+# Benchmark of paddle.save/paddle.load with and without sharding, which is
+# not run in the unit tests.
+
+
+class BenchmarkSaveLoadSharded(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'model.pdparams')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_timeit_save_load(self):
+        obj = {
+            'w{}'.format(i): paddle.rand([512, 1024], dtype='float32')
+            for i in range(32)
+        }
+        pickle_path = os.path.join(self.temp_dir.name, 'pickle.pdparams')
+
+        start = time.time()
+        paddle.save(obj, pickle_path)
+        pickle_save_cost = time.time() - start
+        start = time.time()
+        paddle.save(obj, self.path, num_shards=8)
+        sharded_save_cost = time.time() - start
+
+        start = time.time()
+        paddle.load(pickle_path)
+        pickle_load_cost = time.time() - start
+        start = time.time()
+        paddle.load(self.path)
+        sharded_load_cost = time.time() - start
+        start = time.time()
+        paddle.load(self.path, mmap=True, return_numpy=True)
+        mmap_load_cost = time.time() - start
+        print(
+            "save: pickle {:.4f}s, sharded {:.4f}s; load: pickle {:.4f}s, "
+            "sharded {:.4f}s, mmap {:.4f}s".format(
+                pickle_save_cost,
+                sharded_save_cost,
+                pickle_load_cost,
+                sharded_load_cost,
+                mmap_load_cost,
+            )
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
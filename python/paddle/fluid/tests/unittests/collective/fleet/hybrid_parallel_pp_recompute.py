@@ -117,7 +117,7 @@ class CriterionPipe(Layer):
 
 
 class ModelPipe(PipelineLayer):
-    def __init__(self, hcg):
+    def __init__(self, hcg, recompute_interval=1):
         self.descs = []
         self.descs.append(LayerDesc(EmbeddingPipe))
         self.hcg = hcg
@@ -130,11 +130,12 @@ class ModelPipe(PipelineLayer):
             loss_fn=CriterionPipe(),
             topology=self.hcg.topology(),
             seg_method="layer:TransformerNetPipe",
-            recompute_interval=1,
+            recompute_interval=recompute_interval,
             recompute_ctx={
                 "mp_group": self.hcg.get_model_parallel_group(),
                 "offload": False,
                 "partition": False,
+                "memory_budget": 32 * 1024,
             },
         )
 
@@ -157,6 +158,14 @@ class TestDistPPTraning(unittest.TestCase):
         fleet.init(is_collective=True, strategy=strategy)
 
     def test_pp_model(self):
+        self.train_pp_model()
+
+    def test_pp_model_with_auto_recompute(self):
+        losses = self.train_pp_model(recompute_interval="auto")
+        losses_ref = self.train_pp_model(recompute_interval=1)
+        np.testing.assert_allclose(losses, losses_ref, rtol=1e-6)
+
+    def train_pp_model(self, recompute_interval=1):
         hcg = fleet.get_hybrid_communicate_group()
         word_size = hcg.get_model_parallel_world_size()
         dp_id = hcg.get_data_parallel_rank()
@@ -165,7 +174,7 @@ class TestDistPPTraning(unittest.TestCase):
         topology = hcg.topology()
         set_random_seed(1024, dp_id, rank_id)
 
-        model = ModelPipe(hcg)
+        model = ModelPipe(hcg, recompute_interval)
         scheduler = paddle.optimizer.lr.PiecewiseDecay(
             boundaries=[2], values=[0.001, 0.002], verbose=True
         )
@@ -176,6 +185,7 @@ class TestDistPPTraning(unittest.TestCase):
         model = fleet.distributed_model(model)
         optimizer = fleet.distributed_optimizer(optimizer)
 
+        losses = []
         for step_id in range(5):
             x_data = np.random.randint(0, vocab_size, size=[batch_size, length])
             x = paddle.to_tensor(x_data)
@@ -184,6 +194,12 @@ class TestDistPPTraning(unittest.TestCase):
             loss = model.train_batch([input_, x], optimizer, scheduler)
             # TODO(shenliang03) add utest for loss
             print("loss: ", loss)
+            losses.append(loss.numpy())
+
+        if recompute_interval == "auto":
+            planner = model._layers._recompute_planners[None]
+            self.assertIsNotNone(planner.segments)
+        return losses
 
 
 if __name__ == "__main__":
@@ -18,7 +18,10 @@ import unittest
 import numpy as np
 
 import paddle
+from paddle.distributed.fleet.recompute.recompute import _planners
+from paddle.distributed.fleet.recompute.recompute_planner import _solve_segments
 from paddle.distributed.fleet.utils import recompute
+from paddle.incubate.distributed.fleet import recompute_sequential
 
 
 class Model(paddle.nn.Layer):
@@ -114,7 +117,12 @@ class Naive_fc_net(paddle.nn.Layer):
 
         if self.use_fleet_sq and not self.use_raw_recompute:
             return paddle.incubate.distributed.fleet.recompute_sequential(
-                {"segments": self.segments}, self.runfuncs, inputs
+                {
+                    "segments": self.segments,
+                    "policy": self.recompute_kwargs.get("policy", "recompute"),
+                },
+                self.runfuncs,
+                inputs,
             )
 
         if self.use_raw_recompute:
@@ -123,9 +131,11 @@ class Naive_fc_net(paddle.nn.Layer):
 
         for i in range(len(self.layers)):
             if i in self.recompute_blocks:
-                inputs = recompute(
-                    self.layers[i], inputs, **self.recompute_kwargs
-                )
+                function = self.layers[i]
+                # the selective policy runs the sublayers of a Sequential
+                if self.recompute_kwargs.get("policy") == "selective":
+                    function = function.block
+                inputs = recompute(function, inputs, **self.recompute_kwargs)
             else:
                 inputs = self.layers[i](inputs)
 
@@ -279,6 +289,72 @@ class TestRecompute(unittest.TestCase):
     def test_fc_net_with_dropout(self):
         self.test_base_case()
 
+    def test_recompute_policy(self):
+        def check_identical(loss_ref, param_ref, grad_ref, loss, param, grad):
+            self.assertEqual(loss_ref, loss)
+            self.assertEqual(param_ref, param)
+            self.assertEqual(grad_ref, grad)
+
+        for enable_autocast in [False, True]:
+            loss_ref, param_ref, grad_ref = run_model(
+                recompute_block=[], enable_autocast=enable_autocast
+            )
+            for policy in ["offload", "selective"]:
+                for recompute_block in [[1], [1, 2, 3]]:
+                    loss, param, grad = run_model(
+                        recompute_block=recompute_block,
+                        enable_autocast=enable_autocast,
+                        recompute_kwargs={"policy": policy},
+                    )
+                    check_identical(
+                        loss_ref, param_ref, grad_ref, loss, param, grad
+                    )
+
+        loss_ref, param_ref, grad_ref = run_model(
+            recompute_block=[], use_raw_recompute=True
+        )
+        for policy in ["offload", "selective"]:
+            loss, param, grad = run_model(
+                recompute_block=[],
+                use_fleet_sq=True,
+                segments=2,
+                recompute_kwargs={"policy": policy},
+            )
+            check_identical(loss_ref, param_ref, grad_ref, loss, param, grad)
+
+        with self.assertRaises(ValueError):
+            run_model(recompute_block=[1], recompute_kwargs={"policy": "swap"})
+
+    def test_offload_memory(self):
+        paddle.set_device("gpu")
+        model = paddle.nn.Sequential(
+            *[
+                paddle.nn.Sequential(
+                    paddle.nn.Linear(1024, 1024), paddle.nn.Tanh()
+                )
+                for _ in range(8)
+            ]
+        )
+        x = paddle.randn([256, 1024])
+        x.stop_gradient = False
+
+        memory = []
+        grads = []
+        for policy in [None, "offload"]:
+            start = paddle.device.cuda.memory_allocated()
+            if policy is None:
+                y = model(x)
+            else:
+                y = recompute(model, x, policy=policy)
+            memory.append(paddle.device.cuda.memory_allocated() - start)
+            y.mean().backward()
+            grads.append(x.grad.numpy())
+            x.clear_gradient()
+            model.clear_gradients()
+        # the activations saved by linear and tanh are kept on host
+        self.assertLess(memory[1], memory[0])
+        np.testing.assert_array_equal(grads[0], grads[1])
+
     def test_fc_net_without_restore_rng(self):
         for flag in [True, False]:
             loss_ref, param_ref, grad_ref = run_model(
@@ -313,5 +389,92 @@ class TestRecompute(unittest.TestCase):
         )
 
 
+class TestRecomputePlanner(unittest.TestCase):
+    def plan_memory(self, segments, activation_bytes, input_bytes):
+        kept = 0
+        peak = 0
+        for begin, end, need_recompute in segments:
+            if need_recompute:
+                kept += input_bytes[begin]
+                peak = max(peak, sum(activation_bytes[begin:end]))
+            else:
+                kept += sum(activation_bytes[begin:end])
+        return kept + peak
+
+    def test_solve_segments(self):
+        activation_bytes, input_bytes = [100] * 8, [10] * 8
+        forward_times = [1.0] * 8
+        self.assertEqual(
+            _solve_segments(
+                activation_bytes, input_bytes, forward_times, 10000
+            ),
+            [(0, 8, False)],
+        )
+        for memory_budget in [800, 500, 200]:
+            segments = _solve_segments(
+                activation_bytes, input_bytes, forward_times, memory_budget
+            )
+            self.assertLessEqual(
+                self.plan_memory(segments, activation_bytes, input_bytes),
+                memory_budget,
+            )
+            self.assertEqual(segments[0][0], 0)
+            self.assertEqual(segments[-1][1], 8)
+        # recompute as few layers as the memory budget needs
+        num_recompute = sum(
+            end - begin
+            for begin, end, need_recompute in _solve_segments(
+                activation_bytes, input_bytes, forward_times, 500
+            )
+            if need_recompute
+        )
+        self.assertEqual(num_recompute, 5)
+
+        # the slow layer is kept rather than recomputed
+        self.assertEqual(
+            _solve_segments([100] * 4, [10] * 4, [1.0, 10.0, 1.0, 1.0], 350),
+            [(0, 1, True), (1, 2, False), (2, 3, True), (3, 4, False)],
+        )
+
+        # recompute all layers with the least memory if out of budget
+        self.assertTrue(
+            all(
+                need_recompute
+                for _, _, need_recompute in _solve_segments(
+                    activation_bytes, input_bytes, forward_times, 100
+                )
+            )
+        )
+
+    def test_recompute_sequential_auto(self):
+        paddle.set_device("gpu")
+        paddle.seed(10)
+        model = paddle.nn.Sequential(*[get_fc_block(i, 10) for i in range(5)])
+        x = paddle.randn([4, 10])
+        x.stop_gradient = False
+        rng_state = paddle.get_cuda_rng_state()
+
+        model(x).mean().backward()
+        grad_ref = x.grad.numpy()
+        x.clear_gradient()
+
+        ctx = {"segments": "auto", "memory_budget": 2048}
+        # the first step is profiled and the others are recomputed
+        for step in range(3):
+            paddle.set_cuda_rng_state(rng_state)
+            recompute_sequential(ctx, model, x).mean().backward()
+            np.testing.assert_array_equal(x.grad.numpy(), grad_ref)
+            x.clear_gradient()
+
+        planner = _planners[model]
+        self.assertEqual(len(planner.activation_bytes), 5)
+        self.assertTrue(
+            any(need_recompute for _, _, need_recompute in planner.segments)
+        )
+
+        with self.assertRaises(ValueError):
+            recompute_sequential({"segments": "auto"}, model, x)
+
+
 if __name__ == '__main__':
     unittest.main()
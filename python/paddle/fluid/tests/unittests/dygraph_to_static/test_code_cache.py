@@ -0,0 +1,118 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.jit.dy2static import program_translator
+from paddle.jit.dy2static.code_cache import CODE_CACHE_DIR_ENV_NAME, CodeCache
+from paddle.jit.dy2static.origin_info import global_origin_info_map
+
+
+def dyfunc_with_if(x):
+    if paddle.mean(x) > 0:
+        y = x + 1
+    else:
+        y = x - 1
+    return y
+
+
+def dyfunc_with_error(x):
+    y = x + 1
+    z = paddle.reshape(y, [-1, -1])
+    return z
+
+
+class TestCodeCache(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.cache_dir = tempfile.mkdtemp()
+        self.code_cache = CodeCache(self.cache_dir)
+        self.origin_code_cache = program_translator._CODE_CACHE
+        self.origin_function_cache = program_translator._FUNCTION_CACHE
+        program_translator._CODE_CACHE = self.code_cache
+
+    def tearDown(self):
+        program_translator._CODE_CACHE = self.origin_code_cache
+        program_translator._FUNCTION_CACHE = self.origin_function_cache
+        shutil.rmtree(self.cache_dir)
+
+    def new_process(self):
+        # a new FunctionCache behaves like the one in a new process
+        program_translator._FUNCTION_CACHE = program_translator.FunctionCache()
+
+    def test_hit_and_miss(self):
+        x = paddle.ones([2, 2])
+        self.new_process()
+        out = paddle.jit.to_static(dyfunc_with_if)(x)
+        np.testing.assert_allclose(out.numpy(), dyfunc_with_if(x).numpy())
+        info = self.code_cache.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 0)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+        self.new_process()
+        out = paddle.jit.to_static(dyfunc_with_if)(-x)
+        np.testing.assert_allclose(out.numpy(), dyfunc_with_if(-x).numpy())
+        info = self.code_cache.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+        # original information of cached code is recovered
+        static_func = program_translator.convert_to_static(dyfunc_with_error)
+        self.new_process()
+        static_func = program_translator.convert_to_static(dyfunc_with_error)
+        static_file = static_func.__code__.co_filename
+        self.assertTrue(static_file.startswith(self.cache_dir))
+        self.assertTrue(
+            any(loc[0] == static_file for loc in global_origin_info_map)
+        )
+
+        self.code_cache.clear()
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_broken_cache(self):
+        self.new_process()
+        program_translator.convert_to_static(dyfunc_with_if)
+        for name in os.listdir(self.cache_dir):
+            with open(os.path.join(self.cache_dir, name), 'w') as f:
+                f.write('broken')
+
+        self.new_process()
+        static_func = program_translator.convert_to_static(dyfunc_with_if)
+        self.assertEqual(self.code_cache.cache_info().errors, 1)
+        # overwritten by the new conversion
+        self.new_process()
+        self.assertEqual(
+            program_translator.convert_to_static(dyfunc_with_if).__name__,
+            static_func.__name__,
+        )
+        self.assertEqual(self.code_cache.cache_info().hits, 1)
+
+    def test_cache_dir_from_env(self):
+        self.assertFalse(CodeCache().enabled)
+        os.environ[CODE_CACHE_DIR_ENV_NAME] = self.cache_dir
+        try:
+            self.assertEqual(CodeCache().cache_dir, self.cache_dir)
+        finally:
+            del os.environ[CODE_CACHE_DIR_ENV_NAME]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import paddle
+from paddle.jit.dy2static import logging_utils
+from paddle.jit.dy2static.program_translator import (
+    MAX_TRACED_PROGRAM_COUNT,
+    PROGRAM_CACHE_CAPACITY_ENV_NAME,
+    ProgramCache,
+)
+
+
+def func(x):
+    return x * 2 + 1
+
+
+class TestProgramCacheLRU(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def test_eviction(self):
+        static_func = paddle.jit.to_static(func)
+        static_func.program_cache.capacity = 2
+
+        x1 = paddle.ones([1, 2])
+        x2 = paddle.ones([2, 2])
+        x3 = paddle.ones([3, 2])
+        for x in [x1, x2, x1, x3]:
+            out = static_func(x)
+            np.testing.assert_allclose(out.numpy(), func(x).numpy())
+
+        # x2 is the least recently used program when tracing x3
+        info = static_func.get_cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 3)
+        self.assertEqual(info.evictions, 1)
+        self.assertEqual(info.capacity, 2)
+        self.assertEqual(info.size, 2)
+        self.assertGreater(info.trace_time, 0)
+
+        static_func(x1)
+        self.assertEqual(static_func.get_cache_info().hits, 2)
+        static_func(x2)
+        info = static_func.get_cache_info()
+        self.assertEqual(info.misses, 4)
+        self.assertEqual(info.evictions, 2)
+
+        # shrink capacity
+        static_func.program_cache.capacity = 1
+        self.assertEqual(static_func.get_traced_count(), 1)
+        static_func(x2)
+        self.assertEqual(static_func.get_cache_info().hits, 3)
+
+    def test_capacity_from_env(self):
+        os.environ[PROGRAM_CACHE_CAPACITY_ENV_NAME] = '3'
+        try:
+            self.assertEqual(ProgramCache().capacity, 3)
+        finally:
+            del os.environ[PROGRAM_CACHE_CAPACITY_ENV_NAME]
+        self.assertEqual(ProgramCache().capacity, 0)
+        self.assertEqual(ProgramCache(5).capacity, 5)
+
+        with self.assertRaises(ValueError):
+            ProgramCache(-1)
+
+    def test_unbounded(self):
+        static_func = paddle.jit.to_static(func)
+        for i in range(1, 4):
+            static_func(paddle.ones([i, 2]))
+        info = static_func.get_cache_info()
+        self.assertEqual(info.size, 3)
+        self.assertEqual(info.evictions, 0)
+
+    def test_retrace_warning(self):
+        static_func = paddle.jit.to_static(func)
+        static_func.program_cache.capacity = 2
+        with mock.patch.object(logging_utils, 'warn') as warn:
+            for i in range(1, MAX_TRACED_PROGRAM_COUNT + 2):
+                static_func(paddle.ones([i, 2]))
+            messages = [call[0][0] for call in warn.call_args_list]
+        retrace_messages = [m for m in messages if 'differ in shapes' in m]
+        self.assertEqual(len(retrace_messages), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
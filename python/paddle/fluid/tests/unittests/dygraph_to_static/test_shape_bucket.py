@@ -0,0 +1,178 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.jit.dy2static.shape_bucket import (
+    bucket_size,
+    check_bucket_outputs,
+    check_shape_buckets,
+)
+
+
+def scale(x):
+    return x * 2 + 1
+
+
+def masked_sum(x, mask):
+    # padded positions are masked out
+    return paddle.sum(x * mask, axis=1), x + 1
+
+
+def scale_and_hidden(x):
+    # the hidden size of the second output is 8
+    hidden = paddle.sum(x, axis=1, keepdim=True).tile([1, 8])
+    return x * 2, hidden
+
+
+class SimpleNet(paddle.nn.Layer):
+    def __init__(self):
+        super().__init__()
+        self.linear = paddle.nn.Linear(4, 4)
+
+    def forward(self, x):
+        return self.linear(x)
+
+
+class TestBucketSize(unittest.TestCase):
+    def test_bucket_size(self):
+        self.assertEqual(bucket_size(1, 'pow2'), 1)
+        self.assertEqual(bucket_size(5, 'pow2'), 8)
+        self.assertEqual(bucket_size(8, 'pow2'), 8)
+        self.assertEqual(bucket_size(3, [4, 16]), 4)
+        self.assertEqual(bucket_size(16, [4, 16]), 16)
+        # larger than all buckets
+        self.assertEqual(bucket_size(17, [4, 16]), 17)
+        self.assertEqual(bucket_size(5, lambda n: (n + 3) // 4 * 4), 8)
+        with self.assertRaises(ValueError):
+            bucket_size(5, lambda n: n - 1)
+
+    def test_check_shape_buckets(self):
+        self.assertIsNone(check_shape_buckets(None))
+        self.assertEqual(check_shape_buckets({1: [16, 4]}), {1: [4, 16]})
+        with self.assertRaises(TypeError):
+            check_shape_buckets([1])
+        with self.assertRaises(TypeError):
+            check_shape_buckets({'1': 'pow2'})
+        with self.assertRaises(ValueError):
+            check_shape_buckets({1: 'pow3'})
+        with self.assertRaises(ValueError):
+            check_shape_buckets({1: [0, 4]})
+        with self.assertRaises(ValueError):
+            paddle.jit.to_static(scale, shape_buckets={1: []})
+
+    def test_check_bucket_outputs(self):
+        shape_buckets = {1: 'pow2'}
+        self.assertIsNone(check_bucket_outputs(None, shape_buckets))
+        self.assertEqual(
+            check_bucket_outputs({0: {1: 1}}, shape_buckets), {0: {1: 1}}
+        )
+        with self.assertRaises(ValueError):
+            check_bucket_outputs({0: {1: 1}}, None)
+        with self.assertRaises(TypeError):
+            check_bucket_outputs([0], shape_buckets)
+        with self.assertRaises(TypeError):
+            check_bucket_outputs({0: 1}, shape_buckets)
+        with self.assertRaises(ValueError):
+            check_bucket_outputs({0: {0: 0}}, shape_buckets)
+
+
+class TestShapeBucket(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+
+    def test_pow2(self):
+        static_func = paddle.jit.to_static(
+            scale, shape_buckets={1: 'pow2'}, bucket_outputs={0: {1: 1}}
+        )
+        for seq_len in range(1, 17):
+            x = paddle.rand([2, seq_len])
+            out = static_func(x)
+            self.assertEqual(out.shape, [2, seq_len])
+            np.testing.assert_allclose(out.numpy(), scale(x).numpy())
+        # buckets 1, 2, 4, 8 and 16
+        self.assertEqual(static_func.get_traced_count(), 5)
+
+    def test_list_buckets(self):
+        static_func = paddle.jit.to_static(
+            masked_sum,
+            shape_buckets={-1: [8, 32]},
+            bucket_outputs={1: {-1: -1}},
+        )
+        for seq_len in [3, 8, 20, 32, 40]:
+            x = paddle.rand([2, seq_len])
+            mask = paddle.ones([2, seq_len])
+            out, x_plus = static_func(x, mask)
+            ref, ref_plus = masked_sum(x, mask)
+            np.testing.assert_allclose(out.numpy(), ref.numpy(), rtol=1e-6)
+            np.testing.assert_allclose(x_plus.numpy(), ref_plus.numpy())
+        # buckets 8, 32 and the unpadded 40
+        self.assertEqual(static_func.get_traced_count(), 3)
+
+    def test_layer(self):
+        net = SimpleNet()
+        static_net = paddle.jit.to_static(
+            SimpleNet(), shape_buckets={0: 'pow2'}, bucket_outputs={0: {0: 0}}
+        )
+        static_net.set_state_dict(net.state_dict())
+        for n in [3, 5, 6, 7]:
+            x = paddle.rand([n, 4])
+            out = static_net(x)
+            self.assertEqual(out.shape, [n, 4])
+            np.testing.assert_allclose(
+                out.numpy(), net(x).numpy(), rtol=1e-5, atol=1e-6
+            )
+        self.assertEqual(static_net.forward.get_traced_count(), 2)
+
+    def test_undeclared_outputs(self):
+        static_func = paddle.jit.to_static(
+            scale_and_hidden,
+            shape_buckets={1: 'pow2'},
+            bucket_outputs={0: {1: 1}},
+        )
+        x = paddle.rand([2, 5])
+        out, hidden = static_func(x)
+        self.assertEqual(out.shape, [2, 5])
+        # the hidden size equals the padded size, but it is not sliced
+        self.assertEqual(hidden.shape, [2, 8])
+        np.testing.assert_allclose(
+            hidden.numpy(), scale_and_hidden(x)[1].numpy(), rtol=1e-6
+        )
+
+        # the declared axis does not have the padded size
+        static_func = paddle.jit.to_static(
+            scale_and_hidden,
+            shape_buckets={1: 'pow2'},
+            bucket_outputs={0: {1: 0}},
+        )
+        with self.assertRaises(ValueError):
+            static_func(x)
+
+    def test_backward(self):
+        static_func = paddle.jit.to_static(
+            scale, shape_buckets={1: 'pow2'}, bucket_outputs={0: {1: 1}}
+        )
+        x = paddle.rand([2, 3])
+        x.stop_gradient = False
+        out = static_func(x)
+        out.sum().backward()
+        self.assertEqual(x.grad.shape, [2, 3])
+        np.testing.assert_allclose(x.grad.numpy(), np.full([2, 3], 2.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+import paddle.distributed as dist
+from paddle.nn import Linear
+
+paddle.seed(1024)
+np.random.seed(2021)
+
+batch = 5
+in_dim = 10
+out_dim = 20
+
+
+class SimpleNet(paddle.nn.Layer):
+    def __init__(self):
+        super().__init__()
+        self.w1 = self.create_parameter(
+            shape=[in_dim, out_dim], dtype="float32"
+        )
+        self.w2 = self.create_parameter(
+            shape=[in_dim, out_dim], dtype="float32"
+        )
+        self.share_net = Linear(out_dim, 10)
+
+    def forward(self, x, use_w1):
+        tmp = paddle.matmul(x, self.w2)
+        if use_w1:
+            tmp = tmp + paddle.matmul(x, self.w1)
+        return self.share_net(tmp)
+
+
+class TestDistTraning(unittest.TestCase):
+    def test_multiple_gpus(self):
+        self.trainer_id = dist.get_rank()
+        self.pg = dist.init_parallel_env()
+
+        for find_unused_parameters in [False, True]:
+            self.check_flat_buffers(find_unused_parameters)
+
+    def check_flat_buffers(self, find_unused_parameters):
+        model_a = SimpleNet()
+        model_b = SimpleNet()
+        model_b.set_state_dict(model_a.state_dict())
+
+        model_a = paddle.DataParallel(
+            model_a,
+            find_unused_parameters=find_unused_parameters,
+            group=self.pg,
+        )
+        # buckets of 1KB, to allreduce more than one buffer
+        model_b = paddle.DataParallel(
+            model_b,
+            comm_buffer_size=0.001,
+            last_comm_buffer_size=0.001,
+            find_unused_parameters=find_unused_parameters,
+            group=self.pg,
+            use_flat_buffers=True,
+        )
+        self.assertGreater(len(model_b._grad_storages), 1)
+        opt_a = paddle.optimizer.RMSProp(
+            learning_rate=0.01, parameters=model_a.parameters()
+        )
+        opt_b = paddle.optimizer.RMSProp(
+            learning_rate=0.01,
+            parameters=model_b.parameters(),
+            use_multi_tensor=True,
+        )
+
+        for step_id in range(6):
+            x = paddle.rand(shape=(batch, in_dim))
+            # w1 is only used by the second trainer in odd steps, whose
+            # gradients are synchronized only with find_unused_parameters
+            sync = find_unused_parameters or step_id % 2 == 0
+            use_w1 = step_id % 2 == 0 or self.trainer_id == 1
+            if sync:
+                out_a = model_a(x, use_w1)
+                out_b = model_b(x, use_w1)
+            else:
+                with model_a.no_sync():
+                    out_a = model_a(x, use_w1)
+                with model_b.no_sync():
+                    out_b = model_b(x, use_w1)
+            out_a.sum().backward()
+            out_b.sum().backward()
+
+            if sync:
+                self.check_same_on_trainers(model_b.parameters())
+            for param_a, param_b in zip(
+                model_a.parameters(), model_b.parameters()
+            ):
+                if param_a.grad is not None:
+                    np.testing.assert_allclose(
+                        param_a.grad.numpy(), param_b.grad.numpy(), rtol=1e-6
+                    )
+
+            # accumulate the gradients of no_sync steps
+            if step_id % 2 == 1:
+                opt_a.step()
+                opt_b.step()
+                opt_a.clear_grad()
+                if step_id == 3:
+                    opt_b.clear_grad(set_to_zero=False)
+                else:
+                    model_b.clear_gradients()
+                for param_a, param_b in zip(
+                    model_a.parameters(), model_b.parameters()
+                ):
+                    np.testing.assert_allclose(
+                        param_a.numpy(), param_b.numpy(), rtol=1e-5
+                    )
+
+    def check_same_on_trainers(self, params):
+        for param in params:
+            grad = param.grad
+            other_grad = paddle.assign(grad)
+            self.pg.process_group.broadcast(other_grad, 1)
+            if self.trainer_id == 0:
+                np.testing.assert_allclose(other_grad.numpy(), grad.numpy())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+
+import numpy as np
+from test_rpc import identity, worker_name
+from test_rpc_base import RpcTestBase
+
+import paddle
+import paddle.distributed as dist
+
+paddle.device.set_device("cpu")
+
+# Benchmark of rpc_async versus rpc_async_batch, which is not run in the unit
+# tests.
+
+
+class BenchmarkAsyncBatchRpc(RpcTestBase):
+    def setUp(self):
+        self._port_set = set()
+        master_endpoint = "127.0.0.1:{}".format(self._find_free_port())
+        dist.rpc.init_rpc(worker_name(0), 0, 1, master_endpoint)
+
+    def tearDown(self):
+        dist.rpc.shutdown()
+
+    def test_timeit_async_batch_rpc(self):
+        for payload_size in [8, 1024 * 1024]:
+            x = np.random.random(payload_size)
+            num_calls = 1000 if payload_size < 1024 else 20
+            start = time.time()
+            futs = [
+                dist.rpc.rpc_async(worker_name(0), identity, args=(x,))
+                for _ in range(num_calls)
+            ]
+            for fut in futs:
+                fut.wait()
+            async_cost = time.time() - start
+            start = time.time()
+            futs = dist.rpc.rpc_async_batch(
+                worker_name(0), [(identity, (x,))] * num_calls
+            )
+            for fut in futs:
+                fut.wait()
+            batch_cost = time.time() - start
+            print(
+                "payload of {} float64: rpc_async {:.0f} calls/s, "
+                "rpc_async_batch {:.0f} calls/s".format(
+                    payload_size,
+                    num_calls / async_cost,
+                    num_calls / batch_cost,
+                )
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from multiprocessing import Process, Queue
+
+from test_rpc_barrier import run_barrier
+from test_rpc_base import RpcTestBase
+
+# Benchmark of the rpc barrier latency versus world size, which is not run in
+# the unit tests.
+
+
+class BenchmarkRpcBarrier(RpcTestBase):
+    def run_barriers(self, world_size, num_barriers):
+        master_port = self._find_free_port()
+        queue = Queue()
+        self.processes = procs = [
+            Process(
+                target=run_barrier,
+                args=(rank, world_size, master_port, num_barriers, queue),
+            )
+            for rank in range(world_size)
+        ]
+        for p in procs:
+            p.start()
+        results = dict(queue.get() for _ in range(world_size))
+        for p in procs:
+            p.join()
+            self.assertEqual(p.exitcode, 0)
+        return results
+
+    def test_timeit_barrier(self):
+        for world_size in [2, 4, 8, 16]:
+            results = self.run_barriers(world_size, 20)
+            print(
+                "barrier latency of world size {}: {:.2f}ms".format(
+                    world_size, max(results.values()) * 1000
+                )
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
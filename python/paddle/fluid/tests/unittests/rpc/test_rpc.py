@@ -13,13 +13,16 @@
 # limitations under the License.
 
 import os
+import pickle
 import unittest
+from unittest import mock
 
 import numpy as np
 from test_rpc_base import RpcLaunchTestBase, RpcTestBase
 
 import paddle
 import paddle.distributed as dist
+from paddle.distributed.rpc import internal
 
 paddle.device.set_device("cpu")
 
@@ -35,6 +38,14 @@ def paddle_add(a, b):
     return res
 
 
+def raise_error(message):
+    raise ValueError(message)
+
+
+def identity(x):
+    return x
+
+
 class TestMultiProcessRpc(RpcTestBase):
     def test_one_server_sync_paddle_add(self):
         a = np.random.random((10, 100))
@@ -104,6 +115,28 @@ class TestSingleProcessRpc(RpcTestBase):
         out = dist.rpc.rpc_async(worker_name(0), paddle_add, args=args).wait()
         np.testing.assert_allclose(out, res, rtol=1e-05)
 
+    def test_async_batch_rpc(self):
+        a = np.random.random((10, 100))
+        b = np.random.random((10, 100))
+        futs = dist.rpc.rpc_async_batch(
+            worker_name(0),
+            [
+                (paddle_add, (a, b)),
+                (raise_error, ("error",)),
+                (paddle_add, (a,), {"b": b}),
+                (identity, (a[:, ::2],)),
+            ],
+        )
+        self.assertEqual(len(futs), 4)
+        np.testing.assert_allclose(futs[2].wait(), a + b, rtol=1e-05)
+        np.testing.assert_allclose(futs[0].wait(), a + b, rtol=1e-05)
+        with self.assertRaises(ValueError):
+            futs[1].wait()
+        np.testing.assert_array_equal(futs[3].wait(), a[:, ::2])
+        self.assertEqual(dist.rpc.rpc_async_batch(worker_name(0), []), [])
+        with self.assertRaises(ValueError):
+            dist.rpc.rpc_async_batch(worker_name(0), [identity])
+
     def test_get_worker_info(self):
         info = dist.rpc.get_worker_info(worker_name(0))
         self.assertEqual(info.name, worker_name(0))
@@ -121,6 +154,29 @@ class TestSingleProcessRpc(RpcTestBase):
         self.assertEqual(info.rank, 0)
 
 
+class TestSerialize(unittest.TestCase):
+    def check_round_trip(self, obj):
+        data = internal._serialize(obj)
+        out = internal._deserialize(data)
+        self.assertEqual(out[0], obj[0])
+        np.testing.assert_array_equal(out[1], obj[1])
+        return data
+
+    def test_out_of_band(self):
+        obj = ("x", np.random.random((10, 100)))
+        data = self.check_round_trip(obj)
+        if pickle.HIGHEST_PROTOCOL >= 5:
+            self.assertTrue(data.startswith(internal._OOB_MAGIC))
+
+    def test_without_out_of_band(self):
+        # the fallback of Python without pickle protocol 5
+        obj = ("x", np.random.random((10, 100)))
+        with mock.patch.object(internal, "_HAS_OOB_PICKLE", False):
+            data = self.check_round_trip(obj)
+        self.assertFalse(data.startswith(internal._OOB_MAGIC))
+        np.testing.assert_array_equal(pickle.loads(data)[1], obj[1])
+
+
 class RpcLaunchTest(RpcLaunchTestBase):
     def test_sync_rpc_paddle_add1(self):
         nnodes = 2
@@ -0,0 +1,64 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+from multiprocessing import Process, Queue
+
+from test_rpc_base import RpcTestBase
+
+import paddle.fluid.core as core
+from paddle.distributed.rpc import rpc
+
+
+def run_barrier(rank, world_size, master_port, num_barriers, queue):
+    store = core.TCPStore(
+        "127.0.0.1", master_port, rank == 0, world_size, timeout=60
+    )
+    rpc._set_barrier_store(store)
+    # the first barrier waits all the ranks started
+    rpc._barrier_never_timeout(rank, world_size)
+    start = time.time()
+    for _ in range(num_barriers):
+        rpc._barrier_never_timeout(rank, world_size)
+    queue.put((rank, (time.time() - start) / num_barriers))
+    rpc._del_barrier_store()
+
+
+class TestRpcBarrier(RpcTestBase):
+    def run_barriers(self, world_size, num_barriers):
+        master_port = self._find_free_port()
+        queue = Queue()
+        self.processes = procs = [
+            Process(
+                target=run_barrier,
+                args=(rank, world_size, master_port, num_barriers, queue),
+            )
+            for rank in range(world_size)
+        ]
+        for p in procs:
+            p.start()
+        results = dict(queue.get() for _ in range(world_size))
+        for p in procs:
+            p.join()
+            self.assertEqual(p.exitcode, 0)
+        return results
+
+    def test_barrier(self):
+        results = self.run_barriers(4, 10)
+        self.assertEqual(sorted(results.keys()), list(range(4)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -81,6 +81,35 @@ class TestClipGradNorm(unittest.TestCase):
         self.assertRaises(RuntimeError, TestRuntimeErrorStaticMode)
 
 
+class TestClipGradNormMultiTensor(unittest.TestCase):
+    def test_multi_grads(self):
+        shapes = [[3, 4], [7], [2, 3, 5], [1]] * 5
+        for norm_type in [0, 1, 2, float("inf")]:
+            params = []
+            for shape in shapes:
+                param = paddle.to_tensor(np.random.random(shape), 'float32')
+                param.grad = paddle.to_tensor(
+                    np.random.random(shape) - 0.5, 'float32'
+                )
+                params.append(param)
+            grads = [p.grad.numpy() for p in params]
+            flat = np.concatenate([g.flatten() for g in grads])
+            if norm_type == 0:
+                expected = float(len(grads))
+            elif norm_type == float("inf"):
+                expected = np.abs(flat).max()
+            else:
+                expected = np.linalg.norm(flat, norm_type)
+
+            total_norm = clip_grad_norm_(
+                params, max_norm=0.5, norm_type=norm_type
+            )
+            np.testing.assert_allclose(total_norm.numpy(), expected, rtol=1e-5)
+            coef = min(0.5 / (expected + 1e-6), 1.0)
+            for p, g in zip(params, grads):
+                np.testing.assert_allclose(p.grad.numpy(), g * coef, rtol=1e-5)
+
+
 def run_test_equal(
     self,
     shape,
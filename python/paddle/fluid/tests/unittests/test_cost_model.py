@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import tempfile
 import unittest
 
 import paddle
@@ -90,6 +92,84 @@ class TestCostModel(unittest.TestCase):
         print("conv2d_fp16_op_time:", conv2d_fp16_op_time)
         print("conv2d_fp16_op_config:", conv2d_fp16_op_config)
 
+    def test_static_op_time_interpolation(self):
+        cost_model = CostModel()
+        cost_model.static_cost_data()
+        # the benchmarked config
+        shapes = [[16, 3000], [3000, 6000]]
+        op_cost = cost_model.get_static_op_time("matmul", shape=shapes)
+        self.assertIn("shape: [3000, 6000]", op_cost["config"])
+        op_time = float(op_cost["op_time"])
+        larger_op_time = float(
+            cost_model.get_static_op_time(
+                "matmul", shape=[[32, 3000]] + shapes
+            )["op_time"]
+        )
+        self.assertGreater(larger_op_time, op_time)
+        self.assertEqual(
+            cost_model.get_static_op_time(
+                "matmul", dtype=paddle.float32, shape=shapes
+            ),
+            op_cost,
+        )
+        self.assertEqual(
+            cost_model.get_static_op_time("not_benchmarked_op", shape=shapes),
+            {},
+        )
+
+    def test_program_time(self):
+        main_program = paddle.static.Program()
+        startup_program = paddle.static.Program()
+        with paddle.static.program_guard(main_program, startup_program):
+            data = paddle.ones(name='X', shape=[16, 100], dtype='float32')
+            hidden = paddle.static.nn.fc(data, 10)
+            loss = paddle.mean(hidden)
+        cost_model = CostModel()
+        cost_model.static_cost_data()
+        program_cost = cost_model.get_program_time(main_program)
+        num_ops = len(main_program.global_block().ops)
+        self.assertEqual(len(program_cost["op_times"]), num_ops)
+        self.assertGreaterEqual(program_cost["program_time"], 0)
+
+        cost_data = core.CostModel().profile_measure(
+            main_program, startup_program, device, ["time"]
+        )
+        cost_model.load_profile_data(main_program, cost_data)
+        program_cost = cost_model.get_program_time(main_program)
+        self.assertEqual(program_cost["missing_ops"], [])
+        for op_id in range(num_ops):
+            self.assertAlmostEqual(
+                program_cost["op_times"][op_id],
+                cost_data.get_op_time_ms(op_id),
+            )
+
+    def test_inference_program_time(self):
+        main_program = paddle.static.Program()
+        startup_program = paddle.static.Program()
+        with paddle.static.program_guard(main_program, startup_program):
+            data = paddle.static.data(
+                name='X', shape=[None, 100], dtype='float32'
+            )
+            hidden = paddle.static.nn.fc(data, 10)
+        exe = paddle.static.Executor(paddle.CPUPlace())
+        exe.run(startup_program)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path_prefix = os.path.join(temp_dir, 'inference')
+            paddle.static.save_inference_model(
+                path_prefix, [data], [hidden], exe, program=main_program
+            )
+            program, _, _ = paddle.static.load_inference_model(path_prefix, exe)
+        op_types = [op.type for op in program.global_block().ops]
+        self.assertIn("feed", op_types)
+        self.assertIn("fetch", op_types)
+
+        # feed and fetch variables are not counted as inputs
+        cost_model = CostModel()
+        cost_model.static_cost_data()
+        program_cost = cost_model.get_program_time(program, batch_size=16)
+        self.assertEqual(len(program_cost["op_times"]), len(op_types))
+        self.assertGreaterEqual(program_cost["program_time"], 0)
+
 
 if __name__ == '__main__':
     unittest.main()
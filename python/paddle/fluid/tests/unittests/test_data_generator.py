@@ -10,8 +10,12 @@
 # distributed under the License is distributed on an "AS IS" BASIS,
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
+import io
+import sys
 import unittest
 
+import numpy as np
+
 import paddle.distributed.fleet as fleet
 
 
@@ -186,5 +190,89 @@ class TestMultiSlotDataGeneratorZip(unittest.TestCase):
         my_ms_dg.run_from_memory()
 
 
+class MyRowDataGenerator(fleet.MultiSlotDataGenerator):
+    def generate_sample(self, line):
+        def data_iter():
+            ids = [int(x) for x in line.split()]
+            tags = ids[: ids[0] % 3 + 1]
+            score = [ids[0] / 7]
+            label = ids[-1:]
+            yield [
+                ("words", ids[:-1]),
+                ("tags", tags),
+                ("score", score),
+                ("label", label),
+            ]
+
+        return data_iter
+
+
+class MyColumnarDataGenerator(fleet.MultiSlotDataGenerator):
+    def generate_columnar_batch(self, lines):
+        ids = np.array([line.split() for line in lines], dtype='int64')
+        lengths = ids[:, 0] % 3 + 1
+        tags = np.concatenate([row[:n] for row, n in zip(ids, lengths)])
+        return [
+            ("words", ids[:, :-1]),
+            ("tags", (tags, lengths)),
+            ("score", ids[:, :1] / 7),
+            ("label", ids[:, -1:]),
+        ]
+
+
+class TestColumnarDataGenerator(unittest.TestCase):
+    def setUp(self):
+        ids = np.random.randint(0, 1000000, [5000, 30])
+        self.data = "".join(" ".join(map(str, row)) + "\n" for row in ids)
+
+    def run_from_stdin(self, data_generator, columnar):
+        stdin, stdout = sys.stdin, sys.stdout
+        sys.stdin = io.StringIO(self.data)
+        sys.stdout = io.StringIO()
+        try:
+            data_generator.run_from_stdin(columnar=columnar)
+            return sys.stdout.getvalue()
+        finally:
+            sys.stdin, sys.stdout = stdin, stdout
+
+    def test_same_output(self):
+        row_dg = MyRowDataGenerator()
+        row_dg.set_batch(64)
+        row_output = self.run_from_stdin(row_dg, False)
+        columnar_dg = MyColumnarDataGenerator()
+        columnar_dg.set_batch(64)
+        columnar_output = self.run_from_stdin(columnar_dg, True)
+        self.assertEqual(row_output, columnar_output)
+        self.assertEqual(row_dg._proto_info, columnar_dg._proto_info)
+        self.assertEqual(columnar_dg._proto_info[2], ("score", "float"))
+
+    def test_string_data_generator(self):
+        output = fleet.MultiSlotStringDataGenerator()._gen_columnar_str(
+            [
+                ("words", np.array([["1", "2"], ["3", "4"]])),
+                ("label", (np.array(["1", "2", "3"]), np.array([1, 2]))),
+            ]
+        )
+        self.assertEqual(output, "2 1 2 1 1\n2 3 4 2 2 3\n")
+
+    def test_error(self):
+        for columns in [
+            "words",
+            [("words", np.zeros([2, 0], dtype='int64'))],
+            [("words", np.zeros([2], dtype='int64'))],
+            [("words", np.array([["1"]]))],
+            [("words", (np.arange(3), np.array([1, 1])))],
+            [("words", (np.arange(3), np.array([0, 3])))],
+            [("words", np.zeros([2, 1])), ("label", np.zeros([3, 1]))],
+        ]:
+            with self.assertRaises(ValueError):
+                MyColumnarDataGenerator()._gen_columnar_str(columns)
+
+        data_generator = MyColumnarDataGenerator()
+        data_generator._gen_columnar_str([("words", np.zeros([2, 1]))])
+        with self.assertRaises(ValueError):
+            data_generator._gen_columnar_str([("label", np.zeros([2, 1]))])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -16,6 +16,7 @@ import json
 import os
 import sys
 import tempfile
+import time
 import unittest
 import warnings
 
@@ -23,7 +24,7 @@ import numpy as np
 
 import paddle
 import paddle.nn as nn
-from paddle.io import DataLoader, Dataset
+from paddle.io import DataLoader, Dataset, IterableDataset
 
 
 class RandomDataset(Dataset):
@@ -39,6 +40,34 @@ class RandomDataset(Dataset):
         return self.num_samples
 
 
+class SlowDataset(Dataset):
+    def __init__(self, num_samples, cost):
+        self.num_samples = num_samples
+        self.cost = cost
+
+    def __getitem__(self, idx):
+        time.sleep(self.cost)
+        return np.array([idx]).astype('int64')
+
+    def __len__(self):
+        return self.num_samples
+
+
+class SlowIterableDataset(IterableDataset):
+    def __init__(self, num_samples, cost):
+        self.num_samples = num_samples
+        self.cost = cost
+
+    def __iter__(self):
+        worker_info = paddle.io.get_worker_info()
+        start, step = 0, 1
+        if worker_info is not None:
+            start, step = worker_info.id, worker_info.num_workers
+        for idx in range(start, self.num_samples, step):
+            time.sleep(self.cost)
+            yield np.array([idx]).astype('int64')
+
+
 class SimpleNet(nn.Layer):
     def __init__(self):
         super().__init__()
@@ -65,6 +94,7 @@ class TestAutoTune(unittest.TestCase):
         loader = DataLoader(
             self.dataset, batch_size=self.batch_size, num_workers=0
         )
+        self.assertEqual(len(list(loader)), 10)
 
     def test_dataloader_disable_autotune(self):
         config = {"dataloader": {"enable": False, "tuning_steps": 1}}
@@ -98,6 +128,83 @@ class TestAutoTune(unittest.TestCase):
         )
 
 
+class TestOnlineAutoTune(unittest.TestCase):
+    def setUp(self):
+        paddle.incubate.autotune.set_config(
+            config={"dataloader": {"enable": True, "tuning_steps": 100}}
+        )
+
+    def tearDown(self):
+        paddle.incubate.autotune.set_config(
+            config={"dataloader": {"enable": False}}
+        )
+
+    def read(self, loader):
+        indices = []
+        for data in loader:
+            indices.extend(data[0].numpy().flatten().tolist())
+        return indices
+
+    @unittest.skipIf(
+        sys.platform == 'darwin' or sys.platform == 'win32',
+        "multi-process DataLoader is not supported",
+    )
+    def test_map_dataset(self):
+        loader = DataLoader(SlowDataset(400, 0.005), batch_size=2)
+        # samples are kept in order when num_workers is changed
+        self.assertEqual(self.read(loader), list(range(400)))
+        self.assertTrue(loader._autotune.done)
+        if os.cpu_count() >= 2:
+            self.assertGreater(loader.num_workers, 0)
+        self.assertEqual(self.read(loader), list(range(400)))
+
+    @unittest.skipIf(
+        sys.platform == 'darwin' or sys.platform == 'win32',
+        "multi-process DataLoader is not supported",
+    )
+    def test_iterable_dataset(self):
+        dataset = SlowIterableDataset(400, 0.005)
+        loader = DataLoader(dataset, batch_size=2, persistent_workers=True)
+        self.assertEqual(self.read(loader), list(range(400)))
+        # new num_workers takes effect in next iteration
+        if os.cpu_count() >= 2:
+            self.assertGreater(loader.num_workers, 0)
+        self.assertEqual(sorted(self.read(loader)), list(range(400)))
+
+    def test_compute_bound(self):
+        loader = DataLoader(RandomDataset(400), batch_size=2)
+        for _ in loader:
+            time.sleep(0.005)
+        self.assertTrue(loader._autotune.done)
+        self.assertEqual(loader.num_workers, 0)
+
+    @unittest.skipIf(
+        sys.platform == 'darwin' or sys.platform == 'win32',
+        "multi-process DataLoader is not supported",
+    )
+    def test_tuned_num_workers(self):
+        dataset = SlowDataset(800, 0.005)
+        paddle.incubate.autotune.set_config(
+            config={"dataloader": {"enable": False}}
+        )
+        loader = DataLoader(dataset, batch_size=4)
+        self.assertEqual(len(self.read(loader)), 800)
+        self.assertIsNone(loader._autotune)
+        self.assertEqual(loader.num_workers, 0)
+
+        paddle.incubate.autotune.set_config(
+            config={"dataloader": {"enable": True, "tuning_steps": 100}}
+        )
+        loader = DataLoader(dataset, batch_size=4)
+        self.assertEqual(self.read(loader), list(range(800)))
+        self.assertTrue(loader._autotune.done)
+        self.assertLessEqual(
+            loader.num_workers, loader._autotune.max_num_workers
+        )
+        if os.cpu_count() >= 2:
+            self.assertGreater(loader.num_workers, 0)
+
+
 class TestAutoTuneAPI(unittest.TestCase):
     def test_set_config_warnings(self):
         with warnings.catch_warnings(record=True) as w:
@@ -0,0 +1,179 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.fluid.dataloader.collate import _CachedCollateFn, default_collate_fn
+from paddle.fluid.dataloader.flat import _flatten_batch
+from paddle.io import DataLoader, Dataset
+
+
+def random_batch(batch_size, image_shape=(3, 8, 8)):
+    return [
+        {
+            'image': np.random.random(image_shape).astype('float32'),
+            'label': i,
+            'name': 'sample_{}'.format(i),
+            'meta': [np.random.random([2]).astype('float64'), 0.5],
+        }
+        for i in range(batch_size)
+    ]
+
+
+class DictDataset(Dataset):
+    def __init__(self, sample_num):
+        self.sample_num = sample_num
+
+    def __getitem__(self, idx):
+        np.random.seed(idx)
+        return {
+            'image': np.random.random([16]).astype('float32'),
+            'label': idx,
+        }
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestCachedCollateFn(unittest.TestCase):
+    def assert_batch_equal(self, out, ref):
+        if isinstance(ref, dict):
+            self.assertEqual(list(out.keys()), list(ref.keys()))
+            for key in ref:
+                self.assert_batch_equal(out[key], ref[key])
+        elif isinstance(ref, list):
+            self.assertEqual(len(out), len(ref))
+            for o, r in zip(out, ref):
+                self.assert_batch_equal(o, r)
+        elif isinstance(ref, np.ndarray):
+            self.assertEqual(out.dtype, ref.dtype)
+            np.testing.assert_array_equal(out, ref)
+        else:
+            self.assertEqual(out, ref)
+
+    def check_collate(self, collate_fn, batch):
+        out = collate_fn(batch)
+        ref = default_collate_fn(batch)
+        self.assert_batch_equal(out, ref)
+
+        flat, structure = collate_fn.flatten(out)
+        ref_flat, ref_structure = _flatten_batch(ref)
+        self.assertEqual(structure, ref_structure)
+        self.assertEqual(len(flat), len(ref_flat))
+        for f, r in zip(flat, ref_flat):
+            np.testing.assert_array_equal(f, r)
+
+    def test_same_as_default(self):
+        for reuse_buffer in [False, True]:
+            collate_fn = _CachedCollateFn(reuse_buffer=reuse_buffer)
+            for _ in range(3):
+                self.check_collate(collate_fn, random_batch(8))
+            # smaller last batch
+            self.check_collate(collate_fn, random_batch(5))
+
+    def test_shape_changed(self):
+        collate_fn = _CachedCollateFn(reuse_buffer=True)
+        self.check_collate(collate_fn, random_batch(4))
+        # fallback to default_collate_fn and learn the new structure
+        self.check_collate(collate_fn, random_batch(4, image_shape=(3, 4, 4)))
+        self.check_collate(collate_fn, random_batch(4, image_shape=(3, 4, 4)))
+
+        batch = random_batch(4)
+        batch[2]['image'] = batch[2]['image'][:, :4]
+        with self.assertRaises(ValueError):
+            collate_fn(batch)
+
+    def test_dtype_changed(self):
+        collate_fn = _CachedCollateFn()
+        self.check_collate(collate_fn, [(1, np.ones([2]))] * 4)
+        self.check_collate(collate_fn, [(1.5, np.ones([2]))] * 4)
+        self.check_collate(
+            collate_fn, [(1.5, np.ones([2]).astype('float32'))] * 4
+        )
+
+    def test_structure_changed(self):
+        collate_fn = _CachedCollateFn()
+        x = np.ones([2])
+        self.check_collate(collate_fn, [{'x': x}] * 4)
+        # the new keys are collated rather than dropped
+        self.check_collate(collate_fn, [{'x': x, 'y': 1}] * 4)
+        self.check_collate(collate_fn, [{'y': 1, 'x': x}] * 4)
+        self.check_collate(collate_fn, [{'y': 1, 'x': x}] * 4)
+        self.check_collate(collate_fn, [{'y': 1}] * 4)
+
+        self.check_collate(collate_fn, [[x, 1]] * 4)
+        self.check_collate(collate_fn, [[x, 1, 'a']] * 4)
+        self.check_collate(collate_fn, [[x, 'a']] * 4)
+        self.check_collate(collate_fn, [[x, {'y': 1}]] * 4)
+
+        # the lists of different lengths in a batch are not truncated
+        with self.assertRaises(RuntimeError):
+            collate_fn([[x, {'y': 1}]] * 3 + [[x, {'y': 1}, 2]])
+        self.check_collate(collate_fn, [{'x': x}] + [{'x': x, 'y': 1}] * 3)
+
+    def test_single_field(self):
+        collate_fn = _CachedCollateFn()
+        self.check_collate(collate_fn, [np.ones([3]) for _ in range(4)])
+        self.check_collate(collate_fn, [np.ones([3]) for _ in range(4)])
+        self.check_collate(collate_fn, ['a', 'b'])
+
+    def test_reuse_buffer(self):
+        collate_fn = _CachedCollateFn(reuse_buffer=True)
+        out0 = collate_fn(random_batch(8))
+        out1 = collate_fn(random_batch(8))
+        self.assertTrue(np.shares_memory(out0['image'], out1['image']))
+
+        collate_fn = _CachedCollateFn()
+        out0 = collate_fn(random_batch(8))
+        out1 = collate_fn(random_batch(8))
+        self.assertFalse(np.shares_memory(out0['image'], out1['image']))
+
+    def test_pickle(self):
+        collate_fn = _CachedCollateFn(reuse_buffer=True)
+        collate_fn(random_batch(4))
+        collate_fn = pickle.loads(pickle.dumps(collate_fn))
+        self.assertIsNone(collate_fn._spec)
+        self.check_collate(collate_fn, random_batch(4))
+
+
+class TestDataLoaderCachedCollate(unittest.TestCase):
+    def run_main(self, num_workers, use_shared_memory=True):
+        paddle.disable_static()
+        dataset = DictDataset(20)
+        loader = DataLoader(
+            dataset,
+            batch_size=8,
+            num_workers=num_workers,
+            use_shared_memory=use_shared_memory,
+        )
+        for i, data in enumerate(loader):
+            ref = default_collate_fn(
+                [dataset[j] for j in range(i * 8, min(i * 8 + 8, 20))]
+            )
+            np.testing.assert_array_equal(data['image'].numpy(), ref['image'])
+            np.testing.assert_array_equal(data['label'].numpy(), ref['label'])
+        self.assertEqual(i, 2)
+
+    def test_main(self):
+        self.run_main(num_workers=0)
+        self.run_main(num_workers=2)
+        self.run_main(num_workers=2, use_shared_memory=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
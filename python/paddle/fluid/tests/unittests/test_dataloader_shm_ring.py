@@ -0,0 +1,129 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import multiprocessing
+import os
+import pickle
+import threading
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.fluid.dataloader.collate import _CachedCollateFn
+from paddle.fluid.dataloader.shm_ring import (
+    _ShmRingReader,
+    _ShmRingWriter,
+    _use_shm_ring,
+)
+from paddle.io import DataLoader, Dataset
+
+
+class RandomDataset(Dataset):
+    def __init__(self, sample_num, image_size):
+        self.sample_num = sample_num
+        self.image_size = image_size
+
+    def __getitem__(self, idx):
+        np.random.seed(idx)
+        image = np.random.random([self.image_size]).astype('float32')
+        label = np.random.randint(0, 9, (1,)).astype('int64')
+        return image, label
+
+    def __len__(self):
+        return self.sample_num
+
+
+class TestShmRing(unittest.TestCase):
+    def setUp(self):
+        os.environ['FLAGS_dataloader_use_shm_ring'] = '1'
+        if not _use_shm_ring():
+            self.skipTest("shared memory ring is not supported")
+
+    def tearDown(self):
+        os.environ.pop('FLAGS_dataloader_use_shm_ring', None)
+
+    def test_writer_reader(self):
+        free_queue = multiprocessing.Queue()
+        reader = _ShmRingReader([free_queue], 2)
+        writer = _ShmRingWriter(0, free_queue)
+        collate_fn = _CachedCollateFn()
+        collate_fn._set_allocator(writer.allocate)
+        done_event = threading.Event()
+
+        def run_step(step, size):
+            self.assertTrue(writer.acquire(done_event, 1))
+            batch = [
+                (np.full([size], step, dtype='float32'), i) for i in range(4)
+            ]
+            flat, _ = collate_fn.flatten(collate_fn(batch))
+            payload = pickle.loads(pickle.dumps(writer.pack(flat)))
+            tensors = reader.unpack(payload)
+            self.check_tensors(tensors, step, size)
+            return [field[0] for field in payload.fields], tensors
+
+        # buffers of 2 slots are reused once the tensors are released
+        names = set()
+        for step in range(4):
+            step_names, tensors = run_step(step, 16)
+            del tensors
+            names.update(step_names)
+        self.assertEqual(len(names), 4)
+
+        # buffers are not reused while the tensors are held
+        held = [run_step(step, 16) for step in range(4)]
+        for step, (step_names, tensors) in enumerate(held):
+            self.check_tensors(tensors, step, 16)
+            for other_names, _ in held[step + 1 :]:
+                self.assertFalse(set(step_names) & set(other_names))
+        del held
+
+        # the last batches need larger buffers
+        for step in range(2):
+            step_names, _ = run_step(step, 1 << 18)
+            self.assertNotIn(step_names[0], names)
+
+        writer.release()
+
+    def check_tensors(self, tensors, step, size):
+        np.testing.assert_array_equal(
+            np.array(tensors[0]), np.full([4, size], step, dtype='float32')
+        )
+        np.testing.assert_array_equal(np.array(tensors[1]), np.arange(4))
+
+    def run_main(self, num_workers, persistent_workers=False):
+        paddle.disable_static()
+        dataset = RandomDataset(40, 64)
+        loader = DataLoader(
+            dataset,
+            batch_size=4,
+            num_workers=num_workers,
+            use_shared_memory=True,
+            persistent_workers=persistent_workers,
+        )
+        for _ in range(2):
+            for i, (image, label) in enumerate(loader):
+                for j in range(4):
+                    ref_image, ref_label = dataset[i * 4 + j]
+                    np.testing.assert_array_equal(image.numpy()[j], ref_image)
+                    np.testing.assert_array_equal(label.numpy()[j], ref_label)
+            self.assertEqual(i, 9)
+
+    def test_dataloader(self):
+        self.run_main(num_workers=2)
+        self.run_main(num_workers=2, persistent_workers=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle.fluid import core
+
+
+class MLP(paddle.nn.Layer):
+    def __init__(self, num_layers=4, hidden_size=8):
+        super().__init__()
+        self.layers = paddle.nn.LayerList(
+            [
+                paddle.nn.Linear(hidden_size, hidden_size)
+                for _ in range(num_layers)
+            ]
+        )
+        # synchronized and cleared one by one out of the flat buffers
+        self.scale = self.create_parameter([hidden_size], dtype='float64')
+
+    def forward(self, x):
+        for layer in self.layers:
+            x = paddle.tanh(layer(x))
+        return x * paddle.cast(self.scale, x.dtype)
+
+
+def is_view(tensor, buffer, offset):
+    return tensor.data_ptr() == (
+        buffer.data_ptr() + offset * core.size_of_dtype(buffer.dtype)
+    )
+
+
+class TestDataParallelFlatBuffers(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.places = ['cpu']
+        if core.is_compiled_with_cuda():
+            self.places.append('gpu')
+
+    def create_model(self, use_flat_buffers, **kwargs):
+        paddle.seed(10)
+        model = paddle.DataParallel(
+            MLP(**kwargs),
+            comm_buffer_size=0.001,
+            last_comm_buffer_size=0.0005,
+            use_flat_buffers=use_flat_buffers,
+        )
+        return model
+
+    def check_views(self, model):
+        for param_storage, grad_storage in zip(
+            model._param_storages, model._grad_storages
+        ):
+            offset = 0
+            for param in grad_storage._params:
+                self.assertTrue(is_view(param, param_storage.buffer, offset))
+                self.assertTrue(
+                    is_view(param.grad, grad_storage.buffer, offset)
+                )
+                offset += param._numel()
+
+    def test_flat_buffers(self):
+        model = self.create_model(True)
+        # the linear weights of 256 bytes and biases of 32 bytes, the first
+        # bucket is limited by last_comm_buffer_size
+        sizes = [p.buffer._numel() for p in model._param_storages]
+        self.assertEqual(sizes, [3 * 72, 72])
+        self.assertEqual(model._unflat_params, [model._layers.scale])
+        # the last layers are in the first buffer allreduced
+        self.assertIs(
+            model._grad_storages[0]._params[-1], model._layers.layers[3].bias
+        )
+        self.check_views(model)
+
+    def test_train(self):
+        for place in self.places:
+            paddle.set_device(place)
+            models, optimizers = [], []
+            for use_flat_buffers in [False, True]:
+                model = self.create_model(use_flat_buffers)
+                models.append(model)
+                optimizers.append(
+                    paddle.optimizer.RMSProp(
+                        learning_rate=0.01,
+                        parameters=model._layers.layers.parameters(),
+                        use_multi_tensor=use_flat_buffers,
+                    )
+                )
+
+            for step in range(6):
+                x = paddle.randn([4, 8])
+                for model, optimizer in zip(models, optimizers):
+                    paddle.mean(model(x)).backward()
+                    paddle.mean(model(x * 2)).backward()
+                    optimizer.step()
+                self.check_views(models[1])
+                for param, expected in zip(
+                    models[1].parameters(), models[0].parameters()
+                ):
+                    np.testing.assert_allclose(
+                        param.grad.numpy(), expected.grad.numpy(), rtol=1e-6
+                    )
+                    np.testing.assert_allclose(
+                        param.numpy(), expected.numpy(), rtol=1e-5
+                    )
+                models[0].clear_gradients()
+                if step % 3 == 0:
+                    models[1].clear_gradients()
+                else:
+                    # the gradients zeroed or released one by one are
+                    # accumulated in the buffers again in backward
+                    optimizers[1].clear_grad(set_to_zero=step % 3 == 1)
+                    models[1]._layers.scale.clear_gradient()
+
+            # the optimizer updates the parameters in the buffers in place
+            for group in optimizers[1]._flat_groups[0]:
+                param = group.params[0]
+                buffer, offset = param._flat_param
+                self.assertTrue(is_view(group.buffers['param'], buffer, offset))
+
+    def test_clear_gradients(self):
+        model = self.create_model(True)
+        paddle.mean(model(paddle.randn([4, 8]))).backward()
+        model.clear_gradients()
+        for param in model.parameters():
+            np.testing.assert_array_equal(
+                param.grad.numpy(), np.zeros(param.shape)
+            )
+        self.check_views(model)
+
+    def test_sparse_embedding(self):
+        with self.assertRaises(ValueError):
+            paddle.DataParallel(
+                paddle.nn.Embedding(10, 4, sparse=True), use_flat_buffers=True
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -481,6 +481,43 @@ class TestDygraphGradientClipByGlobalNorm(TestDygraphGradientClip):
         )
 
 
+class TestDygraphGradientClipByGlobalNormMultiTensor(unittest.TestCase):
+    def build_params_grads(self, num, dtype='float32'):
+        params_grads = []
+        for i in range(num):
+            shape = [i % 5 + 1, 4]
+            param = paddle.create_parameter(shape, dtype)
+            grad = paddle.to_tensor(np.random.random(shape), dtype)
+            params_grads.append((param, grad))
+        return params_grads
+
+    def test_gradient_clip(self):
+        with fluid.dygraph.guard():
+            params_grads = self.build_params_grads(50)
+            params_grads[3][0].need_clip = False
+            params_grads.insert(7, (params_grads[7][0], None))
+            grads = [g.numpy() for _, g in params_grads if g is not None]
+            global_norm = np.sqrt(
+                sum(
+                    np.sum(np.square(g.numpy()))
+                    for p, g in params_grads
+                    if g is not None and getattr(p, 'need_clip', True)
+                )
+            )
+            clip = paddle.nn.ClipGradByGlobalNorm(clip_norm=1.0)
+            clipped = clip(params_grads)
+            self.assertEqual(len(clipped), 50)
+            coef = 1.0 / max(global_norm, 1.0)
+            for i, (p, g) in enumerate(clipped):
+                expected = grads[i] if i == 3 else grads[i] * coef
+                np.testing.assert_allclose(g.numpy(), expected, rtol=1e-5)
+            # the input gradients are not changed
+            for (_, g), expected in zip(
+                [pg for pg in params_grads if pg[1] is not None], grads
+            ):
+                np.testing.assert_array_equal(g.numpy(), expected)
+
+
 class TestDygraphGradientClipByNorm(TestDygraphGradientClip):
     def setUp(self):
         self.clip_norm = 0.8
@@ -0,0 +1,384 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import stat
+import sys
+import tempfile
+import time
+import unittest
+
+from paddle.distributed.fleet.utils.fs import FSFileExistsError, HDFSClient
+
+# a fake `hadoop fs` which stores the files under a local root directory
+FAKE_HADOOP = '''#!{python}
+import os
+import shutil
+import sys
+import time
+
+ROOT = {root!r}
+LOG = {log!r}
+FAIL = {fail!r}
+
+args = [a for a in sys.argv[2:] if not a.startswith('-D')]
+cmd, args = args[0][1:], args[1:]
+with open(LOG, 'a') as f:
+    f.write(cmd + '\\n')
+time.sleep(0.05)
+
+
+def real(path):
+    if path.startswith('hdfs:'):
+        path = path[len('hdfs:'):]
+    return os.path.join(ROOT, path.lstrip('/'))
+
+
+def ls(path, out):
+    st = os.stat(real(path))
+    is_dir = os.path.isdir(real(path))
+    out.append(
+        '{{}} {{}} user group {{}} 2023-01-01 00:00 {{}}'.format(
+            'drwxr-xr-x' if is_dir else '-rw-r--r--',
+            '-' if is_dir else '3',
+            0 if is_dir else st.st_size,
+            path,
+        )
+    )
+
+
+options = [a for a in args if a.startswith('-')]
+args = [a for a in args if not a.startswith('-')]
+if cmd == 'ls':
+    out = []
+    missing = [path for path in args if not os.path.exists(real(path))]
+    for path in missing:
+        print("ls: `{{}}': No such file or directory".format(path))
+    for path in args:
+        if path in missing:
+            continue
+        if '-d' in options or not os.path.isdir(real(path)):
+            ls(path, out)
+            continue
+        for root, dirs, files in os.walk(real(path)):
+            rel = os.path.relpath(root, real(path))
+            for name in sorted(dirs + files):
+                ls(os.path.normpath(os.path.join(path, rel, name)), out)
+            if '-R' not in options:
+                break
+    print('\\n'.join(out))
+    sys.exit(1 if missing else 0)
+elif cmd == 'test':
+    check = os.path.isdir if '-d' in options else os.path.exists
+    sys.exit(0 if check(real(args[0])) else 1)
+elif cmd == 'mkdir':
+    for path in args:
+        os.makedirs(real(path), exist_ok=True)
+elif cmd == 'touchz':
+    open(real(args[0]), 'w').close()
+elif cmd == 'mv':
+    os.rename(real(args[0]), real(args[1]))
+elif cmd in ['rm', 'rmr']:
+    if os.path.isdir(real(args[0])):
+        shutil.rmtree(real(args[0]))
+    else:
+        os.remove(real(args[0]))
+elif cmd in ['put', 'get']:
+    srcs, dst = args[:-1], args[-1]
+    if cmd == 'put':
+        srcs, dst = srcs, real(dst)
+    else:
+        srcs = [real(src) for src in srcs]
+    for src in srcs:
+        target = dst
+        if os.path.isdir(dst):
+            target = os.path.join(dst, os.path.basename(src))
+        if os.path.exists(target) and '-f' not in options:
+            sys.exit(1)
+        if os.path.isdir(src):
+            shutil.copytree(src, target)
+        else:
+            shutil.copyfile(src, target)
+        # fail after the first file is uploaded
+        if cmd == 'put' and os.path.exists(FAIL):
+            os.remove(FAIL)
+            sys.exit(1)
+else:
+    sys.exit(1)
+'''
+
+
+class FakeHDFSTestBase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.hdfs_root = os.path.join(self.temp_dir.name, 'hdfs')
+        self.log = os.path.join(self.temp_dir.name, 'hadoop.log')
+        self.fail_flag = os.path.join(self.temp_dir.name, 'fail')
+        hadoop_home = os.path.join(self.temp_dir.name, 'hadoop')
+        hadoop_bin = os.path.join(hadoop_home, 'bin', 'hadoop')
+        os.makedirs(os.path.dirname(hadoop_bin))
+        os.makedirs(self.hdfs_root)
+        with open(hadoop_bin, 'w') as f:
+            f.write(
+                FAKE_HADOOP.format(
+                    python=sys.executable,
+                    root=self.hdfs_root,
+                    log=self.log,
+                    fail=self.fail_flag,
+                )
+            )
+        os.chmod(hadoop_bin, os.stat(hadoop_bin).st_mode | stat.S_IEXEC)
+        self.hadoop_home = hadoop_home
+        self.fs = self.new_client()
+        self.local_dir = os.path.join(self.temp_dir.name, 'local')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def new_client(self, cache_ttl=0):
+        return HDFSClient(
+            self.hadoop_home,
+            {"fs.default.name": "hdfs://fake"},
+            time_out=60 * 1000,
+            sleep_inter=100,
+            cache_ttl=cache_ttl,
+        )
+
+    def make_local_files(self, num_files, size=16):
+        for i in range(num_files):
+            path = os.path.join(self.local_dir, str(i % 3), str(i))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(os.urandom(size))
+        os.makedirs(os.path.join(self.local_dir, 'empty'), exist_ok=True)
+
+    def commands(self, cmd=None):
+        if not os.path.exists(self.log):
+            return 0
+        with open(self.log) as f:
+            cmds = f.read().split()
+        os.remove(self.log)
+        return len(cmds) if cmd is None else cmds.count(cmd)
+
+    def check_same_dir(self, dir1, dir2):
+        walk1 = [(os.path.relpath(r, dir1), d, f) for r, d, f in os.walk(dir1)]
+        walk2 = [(os.path.relpath(r, dir2), d, f) for r, d, f in os.walk(dir2)]
+        self.assertEqual(
+            sorted((r, sorted(d), sorted(f)) for r, d, f in walk1),
+            sorted((r, sorted(d), sorted(f)) for r, d, f in walk2),
+        )
+        for root, _, files in os.walk(dir1):
+            for name in files:
+                path = os.path.join(root, name)
+                with open(path, 'rb') as f1, open(
+                    os.path.join(dir2, os.path.relpath(path, dir1)), 'rb'
+                ) as f2:
+                    self.assertEqual(f1.read(), f2.read())
+
+
+class TestHDFSTransfer(FakeHDFSTestBase):
+    def test_upload_download_dir(self):
+        self.make_local_files(30)
+        stats = self.fs.upload(self.local_dir, 'hdfs:/ckpt', batch_size=4)
+        self.assertEqual((stats.files, stats.skipped_files), (30, 0))
+        self.assertEqual(stats.bytes, 30 * 16)
+        # 10 files in each of 3 directories
+        self.assertEqual(self.commands('put'), 9)
+        self.check_same_dir(
+            self.local_dir, os.path.join(self.hdfs_root, 'ckpt')
+        )
+
+        # only the new files are uploaded
+        with open(os.path.join(self.local_dir, '0', 'new'), 'wb') as f:
+            f.write(b'new')
+        stats = self.fs.upload(self.local_dir, 'hdfs:/ckpt')
+        self.assertEqual((stats.files, stats.skipped_files), (1, 30))
+        self.assertEqual(self.commands('put'), 1)
+        self.check_same_dir(
+            self.local_dir, os.path.join(self.hdfs_root, 'ckpt')
+        )
+        os.remove(os.path.join(self.local_dir, '0', 'new'))
+        self.fs.delete('hdfs:/ckpt/0/new')
+
+        download_dir = os.path.join(self.temp_dir.name, 'download')
+        stats = self.fs.download('hdfs:/ckpt', download_dir)
+        self.assertEqual((stats.files, stats.skipped_files), (30, 0))
+        self.assertEqual(self.commands('get'), 3)
+        self.check_same_dir(self.local_dir, download_dir)
+
+        # resume a partially downloaded directory
+        os.remove(os.path.join(download_dir, '1', '4'))
+        with open(os.path.join(download_dir, '2', '5'), 'wb') as f:
+            f.write(b'partial')
+        stats = self.fs.download('hdfs:/ckpt', download_dir)
+        self.assertEqual((stats.files, stats.skipped_files), (2, 28))
+        self.check_same_dir(self.local_dir, download_dir)
+
+    def test_upload_download_file(self):
+        self.make_local_files(1)
+        local_file = os.path.join(self.local_dir, '0', '0')
+        self.fs.mkdirs('hdfs:/dir')
+        stats = self.fs.upload(local_file, 'hdfs:/dir')
+        self.assertEqual(stats.files, 1)
+        self.assertTrue(os.path.isfile(os.path.join(self.hdfs_root, 'dir/0')))
+        stats = self.fs.upload(local_file, 'hdfs:/file')
+        self.assertTrue(os.path.isfile(os.path.join(self.hdfs_root, 'file')))
+        self.assertEqual(self.fs.upload(local_file, 'hdfs:/file').files, 0)
+
+        download_file = os.path.join(self.temp_dir.name, 'download')
+        self.assertEqual(self.fs.download('hdfs:/file', download_file).files, 1)
+        self.assertEqual(self.fs.download('hdfs:/file', download_file).files, 0)
+        stats = self.fs.download('hdfs:/file', download_file, overwrite=True)
+        self.assertEqual(stats.files, 1)
+        with open(local_file, 'rb') as f1, open(download_file, 'rb') as f2:
+            self.assertEqual(f1.read(), f2.read())
+
+    def test_upload_changed(self):
+        self.make_local_files(6)
+        self.fs.upload(self.local_dir, 'hdfs:/ckpt')
+        with open(os.path.join(self.local_dir, '0', '3'), 'wb') as f:
+            f.write(b'changed')
+        # the files of different sizes are not overwritten silently
+        with self.assertRaises(FSFileExistsError):
+            self.fs.upload(self.local_dir, 'hdfs:/ckpt')
+        with open(os.path.join(self.hdfs_root, 'ckpt', '0', '3'), 'rb') as f:
+            self.assertEqual(len(f.read()), 16)
+        with self.assertRaises(FSFileExistsError):
+            self.fs.upload(
+                os.path.join(self.local_dir, '0', '3'), 'hdfs:/ckpt/0/3'
+            )
+
+        stats = self.fs.upload(self.local_dir, 'hdfs:/ckpt', overwrite=True)
+        self.assertEqual(stats.files, 6)
+        self.check_same_dir(
+            self.local_dir, os.path.join(self.hdfs_root, 'ckpt')
+        )
+
+    def test_retry(self):
+        self.make_local_files(6)
+        open(self.fail_flag, 'w').close()
+        # the files uploaded by the failed try are overwritten by the retry
+        stats = self.fs.upload(self.local_dir, 'hdfs:/ckpt')
+        self.assertEqual(stats.files, 6)
+        self.assertFalse(os.path.exists(self.fail_flag))
+        self.check_same_dir(
+            self.local_dir, os.path.join(self.hdfs_root, 'ckpt')
+        )
+
+    def test_upload_batches(self):
+        self.make_local_files(30)
+        # one command per file, or per directory of files
+        for batch_size, num_puts in [(1, 30), (64, 3)]:
+            self.fs.upload(
+                self.local_dir,
+                'hdfs:/ckpt{}'.format(batch_size),
+                batch_size=batch_size,
+            )
+            self.assertEqual(self.commands('put'), num_puts)
+
+
+class TestHDFSMetadataCache(FakeHDFSTestBase):
+    def make_fs_files(self, num_dirs):
+        for i in range(num_dirs):
+            os.makedirs(os.path.join(self.hdfs_root, 'ckpt', str(i)))
+            with open(os.path.join(self.hdfs_root, 'ckpt', str(i), 'f'), 'w'):
+                pass
+        with open(os.path.join(self.hdfs_root, 'ckpt', 'done'), 'w') as f:
+            f.write('done')
+
+    def test_stat_paths(self):
+        self.make_fs_files(3)
+        stats = self.fs.stat_paths(
+            ['hdfs:/ckpt', 'hdfs:/ckpt/done', 'hdfs:/ckpt/1/f', 'hdfs:/none']
+        )
+        self.assertEqual(self.commands(), 1)
+        self.assertEqual(
+            stats,
+            [
+                {'path': 'hdfs:/ckpt', 'is_dir': True, 'size': 0},
+                {'path': 'hdfs:/ckpt/done', 'is_dir': False, 'size': 4},
+                {'path': 'hdfs:/ckpt/1/f', 'is_dir': False, 'size': 0},
+                None,
+            ],
+        )
+        self.fs.stat_paths(['hdfs:/ckpt/{}'.format(i) for i in range(5)], 2)
+        self.assertEqual(self.commands(), 3)
+
+    def test_cache(self):
+        self.make_fs_files(3)
+        fs = self.new_client(cache_ttl=60 * 1000)
+        self.assertEqual(fs.list_dirs('hdfs:/ckpt'), ['0', '1', '2'])
+        self.assertEqual(self.commands(), 2)
+        # answered by the listing
+        self.assertEqual(fs.ls_dir('hdfs:/ckpt'), (['0', '1', '2'], ['done']))
+        self.assertTrue(fs.is_dir('hdfs:/ckpt/0'))
+        self.assertTrue(fs.is_file('hdfs:/ckpt/done'))
+        self.assertFalse(fs.is_exist('hdfs:/ckpt/3'))
+        self.assertEqual(self.commands(), 0)
+
+        # invalidated by the writes
+        fs.delete('hdfs:/ckpt/0')
+        self.assertEqual(self.commands(), 1)
+        self.assertFalse(fs.is_exist('hdfs:/ckpt/0'))
+        self.assertEqual(fs.list_dirs('hdfs:/ckpt'), ['1', '2'])
+        self.assertEqual(self.commands(), 0)
+        fs.mkdirs('hdfs:/ckpt/3/sub')
+        self.assertTrue(fs.is_dir('hdfs:/ckpt/3'))
+        self.assertEqual(fs.list_dirs('hdfs:/ckpt'), ['1', '2', '3'])
+        fs.touch('hdfs:/ckpt/1/g')
+        fs.mv('hdfs:/ckpt/1', 'hdfs:/ckpt/4')
+        self.assertEqual(fs.ls_dir('hdfs:/ckpt/4'), ([], ['f', 'g']))
+        self.assertFalse(fs.is_exist('hdfs:/ckpt/1/g'))
+        self.assertEqual(fs.list_dirs('hdfs:/ckpt'), ['2', '3', '4'])
+        self.commands()
+
+        # not invalidated by the writes of others
+        os.makedirs(os.path.join(self.hdfs_root, 'ckpt', '5'))
+        self.assertFalse(fs.is_exist('hdfs:/ckpt/5'))
+        self.assertTrue(self.fs.is_exist('hdfs:/ckpt/5'))
+        self.commands()
+
+        fs = self.new_client(cache_ttl=100)
+        fs.is_exist('hdfs:/ckpt/done')
+        fs.is_exist('hdfs:/ckpt/done')
+        self.assertEqual(self.commands(), 1)
+        time.sleep(0.2)
+        fs.is_exist('hdfs:/ckpt/done')
+        self.assertEqual(self.commands(), 1)
+
+    def test_discovery_commands(self):
+        num_dirs = 20
+        self.make_fs_files(num_dirs)
+        paths = ['hdfs:/ckpt/{}/f'.format(i) for i in range(num_dirs)]
+        self.commands()
+        # more than one command for each path checked one by one
+        for path in paths[:2]:
+            self.assertTrue(self.fs.is_file(path))
+        self.assertGreater(self.commands(), 2)
+        # one command for all the paths
+        self.assertTrue(all(self.fs.stat_paths(paths)))
+        self.assertEqual(self.commands(), 1)
+
+        fs = self.new_client(cache_ttl=60 * 1000)
+        for i in range(3):
+            for d in fs.list_dirs('hdfs:/ckpt'):
+                self.assertTrue(fs.is_file('hdfs:/ckpt/{}/f'.format(d)))
+            if i == 0:
+                self.assertGreater(self.commands(), 0)
+        # answered by the cache
+        self.assertEqual(self.commands(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
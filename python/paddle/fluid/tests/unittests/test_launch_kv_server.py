@@ -0,0 +1,103 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import socket
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+from paddle.distributed.launch.controllers.master import HTTPMaster
+from paddle.distributed.launch.utils.kv_client import KVClient
+from paddle.distributed.launch.utils.kv_server import KVServer
+
+
+def get_free_port():
+    with socket.socket() as s:
+        s.bind(('', 0))
+        return s.getsockname()[1]
+
+
+def new_ctx(endpoint):
+    return SimpleNamespace(
+        args=SimpleNamespace(master=endpoint, rank=-1),
+        node=SimpleNamespace(
+            ip='127.0.0.1', is_server_ready=lambda ip, port: True
+        ),
+        status=SimpleNamespace(is_done=lambda: False),
+        logger=logging.getLogger(__name__),
+    )
+
+
+class TestKVServer(unittest.TestCase):
+    def setUp(self):
+        self.port = get_free_port()
+        self.server = KVServer(self.port)
+        self.server.start()
+        self.endpoint = '127.0.0.1:{}'.format(self.port)
+        self.client = KVClient(self.endpoint)
+        self.assertTrue(self.client.wait_server_ready(timeout=5))
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_wait_prefix(self):
+        self.client.put('/peers/0', 'a')
+        results = []
+        waiter = threading.Thread(
+            target=lambda: results.append(
+                self.client.wait_prefix('/peers', 2, timeout=10)
+            )
+        )
+        waiter.start()
+        time.sleep(0.2)
+        self.assertTrue(waiter.is_alive())
+        self.client.put('/peers/1', 'b')
+        waiter.join()
+        self.assertEqual(results, [{'/peers/0': 'a', '/peers/1': 'b'}])
+        self.assertEqual(self.server.watches, {})
+
+        # returns the current values when timeout
+        start = time.time()
+        self.assertEqual(
+            self.client.wait_prefix('/peers', 3, timeout=0.5), results[0]
+        )
+        self.assertGreaterEqual(time.time() - start, 0.5)
+
+    def test_sync_peers(self):
+        size = 16
+        results = [None] * size
+
+        def sync(rank):
+            master = HTTPMaster(new_ctx(self.endpoint))
+            results[rank] = master.sync_peers(
+                '/job/pods', 'pod{}'.format(rank), str(rank), size, rank
+            )
+
+        threads = [
+            threading.Thread(target=sync, args=(rank,)) for rank in range(size)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for rank in range(size):
+            self.assertEqual(
+                results[rank], ([str(i) for i in range(size)], rank)
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,237 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import paddle
+from paddle.fluid import core
+
+
+class MLP(paddle.nn.Layer):
+    def __init__(self, num_layers=4, hidden_size=8):
+        super().__init__()
+        slow_attr = paddle.ParamAttr(learning_rate=0.5)
+        self.layers = paddle.nn.LayerList(
+            [
+                paddle.nn.Linear(
+                    hidden_size,
+                    hidden_size,
+                    weight_attr=slow_attr if i % 2 else None,
+                )
+                for i in range(num_layers)
+            ]
+        )
+        self.unused = paddle.nn.Linear(hidden_size, hidden_size)
+
+    def forward(self, x, use_unused=True):
+        for layer in self.layers:
+            x = paddle.tanh(layer(x))
+        if use_unused:
+            x = self.unused(x)
+        return x
+
+
+def create_optimizer(name, parameters, use_multi_tensor):
+    if name == 'Lamb':
+        return paddle.optimizer.Lamb(
+            learning_rate=0.01,
+            parameters=parameters,
+            exclude_from_weight_decay_fn=lambda p: 'b_' in p.name,
+            use_multi_tensor=use_multi_tensor,
+        )
+    if name == 'RMSProp':
+        return paddle.optimizer.RMSProp(
+            learning_rate=0.01,
+            momentum=0.9,
+            centered=True,
+            parameters=parameters,
+            use_multi_tensor=use_multi_tensor,
+        )
+    if name == 'Adagrad':
+        return paddle.optimizer.Adagrad(
+            learning_rate=0.01,
+            parameters=parameters,
+            initial_accumulator_value=0.1,
+            use_multi_tensor=use_multi_tensor,
+        )
+    if name == 'Adadelta':
+        return paddle.optimizer.Adadelta(
+            learning_rate=0.01,
+            parameters=parameters,
+            use_multi_tensor=use_multi_tensor,
+        )
+    return paddle.optimizer.Adamax(
+        learning_rate=0.01,
+        parameters=parameters,
+        weight_decay=0.01,
+        use_multi_tensor=use_multi_tensor,
+    )
+
+
+class TestMultiTensorOptimizer(unittest.TestCase):
+    optimizers = ['Lamb', 'RMSProp', 'Adagrad', 'Adadelta', 'Adamax']
+
+    def setUp(self):
+        paddle.disable_static()
+        self.places = ['cpu']
+        if core.is_compiled_with_cuda():
+            self.places.append('gpu')
+
+    def run_steps(
+        self,
+        name,
+        use_multi_tensor,
+        use_param_group=False,
+        use_amp=False,
+        steps=4,
+        state_dict=None,
+    ):
+        paddle.seed(10)
+        model = MLP()
+        parameters = model.parameters()
+        if use_param_group:
+            parameters = [
+                {'params': parameters[:4]},
+                {'params': parameters[4:], 'learning_rate': 0.1},
+            ]
+        optimizer = create_optimizer(name, parameters, use_multi_tensor)
+        if use_amp:
+            model, optimizer = paddle.amp.decorate(
+                models=model, optimizers=optimizer, level='O2'
+            )
+            scaler = paddle.amp.GradScaler(init_loss_scaling=1024)
+        if state_dict is not None:
+            model.set_state_dict(state_dict[0])
+            optimizer.set_state_dict(state_dict[1])
+
+        x = paddle.randn([4, 8])
+        for step in range(steps):
+            # the unused layer has no gradients in the second step
+            use_unused = step != 1
+            if use_amp:
+                with paddle.amp.auto_cast(level='O2'):
+                    loss = paddle.mean(model(x, use_unused))
+                scaler.minimize(optimizer, scaler.scale(loss))
+            else:
+                loss = paddle.mean(model(x, use_unused))
+                loss.backward()
+                optimizer.step()
+            # the gradients are removed instead of zero filled
+            optimizer.clear_grad(set_to_zero=False)
+        return model, optimizer
+
+    def check_equal(self, results, expected, rtol=1e-5, atol=1e-6):
+        model, optimizer = results
+        expected_model, expected_optimizer = expected
+        for param, expected_param in zip(
+            model.parameters(), expected_model.parameters()
+        ):
+            np.testing.assert_allclose(
+                param.astype('float32').numpy(),
+                expected_param.astype('float32').numpy(),
+                rtol=rtol,
+                atol=atol,
+            )
+        state_dict = optimizer.state_dict()
+        expected_state_dict = expected_optimizer.state_dict()
+        for key, value in expected_state_dict.items():
+            if isinstance(value, paddle.Tensor):
+                np.testing.assert_allclose(
+                    state_dict[key].numpy(),
+                    value.numpy(),
+                    rtol=rtol,
+                    atol=atol,
+                )
+
+    def test_multi_tensor(self):
+        for place in self.places:
+            paddle.set_device(place)
+            for name in self.optimizers:
+                for use_param_group in [False, True]:
+                    self.check_equal(
+                        self.run_steps(name, True, use_param_group),
+                        self.run_steps(name, False, use_param_group),
+                    )
+
+    def test_amp(self):
+        if not core.is_compiled_with_cuda():
+            return
+        paddle.set_device('gpu')
+        for name in self.optimizers:
+            self.check_equal(
+                self.run_steps(name, True, use_amp=True),
+                self.run_steps(name, False, use_amp=True),
+                rtol=1e-3,
+                atol=1e-3,
+            )
+
+    def test_set_state_dict(self):
+        for name in self.optimizers:
+            model, optimizer = self.run_steps(name, True)
+            state_dict = (model.state_dict(), optimizer.state_dict())
+            self.check_equal(
+                self.run_steps(name, True, state_dict=state_dict),
+                self.run_steps(name, False, state_dict=state_dict),
+            )
+
+    def test_missing_grads(self):
+        for name in self.optimizers:
+            with mock.patch.object(
+                paddle.optimizer.Optimizer,
+                '_append_unfused_optimize_ops',
+                autospec=True,
+                side_effect=paddle.optimizer.Optimizer._append_unfused_optimize_ops,
+            ) as unfused:
+                model, optimizer = self.run_steps(name, True)
+            # the group of the unused layer is updated parameter by parameter
+            # in the second step
+            self.assertTrue(
+                any(call.args[2] is not None for call in unfused.call_args_list)
+            )
+            if name == 'Lamb':
+                # the beta powers of the unused layer fall behind
+                self.assertFalse(
+                    all(group.fusable for group in optimizer._flat_groups[0])
+                )
+
+    def test_flat_buffers(self):
+        model, optimizer = self.run_steps('RMSProp', True)
+        groups = optimizer._flat_groups[0]
+        # grouped by learning rate
+        self.assertEqual(len(groups), 2)
+        for group in groups:
+            self.assertTrue(group.is_flat())
+        # the values set in place are still in the buffer
+        param = model.layers[0].weight
+        param.set_value(np.ones(param.shape, dtype='float32'))
+        self.assertTrue(all(group.is_flat() for group in groups))
+
+        # the parameters moved out of the buffer are flattened again
+        paddle.zeros(param.shape)._share_buffer_to(param)
+        self.assertFalse(all(group.is_flat() for group in groups))
+        paddle.mean(model(paddle.randn([4, 8]))).backward()
+        optimizer.step()
+        self.assertTrue(all(group.is_flat() for group in groups))
+
+        optimizer.set_state_dict(optimizer.state_dict())
+        self.assertFalse(any(group.is_flat() for group in groups))
+        optimizer.step()
+        self.assertTrue(all(group.is_flat() for group in groups))
+
+
+if __name__ == '__main__':
+    unittest.main()
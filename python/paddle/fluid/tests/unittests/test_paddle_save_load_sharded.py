@@ -0,0 +1,132 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+import numpy as np
+
+import paddle
+
+
+class LinearNet(paddle.nn.Layer):
+    def __init__(self):
+        super().__init__()
+        self.linear1 = paddle.nn.Linear(64, 32)
+        self.linear2 = paddle.nn.Linear(32, 8)
+        self.bn = paddle.nn.BatchNorm1D(8)
+
+    def forward(self, x):
+        return self.bn(self.linear2(self.linear1(x)))
+
+
+class TensorHolder:
+    def __init__(self, tensor):
+        self.tensor = tensor
+
+
+class TestSaveLoadSharded(unittest.TestCase):
+    def setUp(self):
+        paddle.disable_static()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'model.pdparams')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_state_dict(self):
+        layer = LinearNet()
+        opt = paddle.optimizer.Adam(parameters=layer.parameters())
+        layer(paddle.rand([4, 64])).mean().backward()
+        opt.step()
+        obj = {
+            'model': layer.state_dict(),
+            'opt': opt.state_dict(),
+            'epoch': 3,
+            'tensors': [paddle.to_tensor(1.5), paddle.zeros([0, 2])],
+        }
+        paddle.save(obj, self.path, num_shards=3)
+        shard_files = [
+            name
+            for name in os.listdir(self.temp_dir.name)
+            if name.startswith('model.pdparams.shard-')
+        ]
+        self.assertEqual(len(shard_files), 3)
+
+        for configs in [
+            {},
+            {'num_workers': 1},
+            {'mmap': True},
+            {'mmap': True, 'return_numpy': True},
+        ]:
+            load_obj = paddle.load(self.path, **configs)
+            self.assertEqual(load_obj['epoch'], 3)
+            for key, value in obj['model'].items():
+                np.testing.assert_array_equal(
+                    np.array(load_obj['model'][key]), value.numpy()
+                )
+            for key, value in obj['opt'].items():
+                if isinstance(value, paddle.Tensor):
+                    np.testing.assert_array_equal(
+                        np.array(load_obj['opt'][key]), value.numpy()
+                    )
+            self.assertEqual(np.array(load_obj['tensors'][0]).shape, ())
+            self.assertEqual(
+                list(np.array(load_obj['tensors'][1]).shape), [0, 2]
+            )
+
+        load_obj = paddle.load(self.path, mmap=True, return_numpy=True)
+        self.assertIsInstance(load_obj['model']['linear1.weight'], np.memmap)
+        self.assertIsInstance(load_obj['tensors'][0], np.ndarray)
+
+        new_layer = LinearNet()
+        new_layer.set_state_dict(paddle.load(self.path)['model'])
+        x = paddle.rand([4, 64])
+        layer.eval()
+        new_layer.eval()
+        np.testing.assert_array_equal(layer(x).numpy(), new_layer(x).numpy())
+
+    def test_tensor(self):
+        x = paddle.rand([3, 4])
+        paddle.save(x, self.path, num_shards=2)
+        load_x = paddle.load(self.path)
+        self.assertEqual(load_x.name, x.name)
+        np.testing.assert_array_equal(load_x.numpy(), x.numpy())
+
+    def test_tensor_in_object(self):
+        # the tensor in an object is not sharded, but pickled in the index
+        # the same as the non-sharded format
+        x = paddle.rand([3, 4])
+        paddle.save({'holder': TensorHolder(x)}, self.path, num_shards=2)
+        name, data = paddle.load(self.path)['holder'].tensor
+        self.assertEqual(name, x.name)
+        np.testing.assert_array_equal(data, x.numpy())
+
+    def test_error(self):
+        with self.assertRaises(ValueError):
+            paddle.save({'x': paddle.rand([2])}, self.path, num_shards=0)
+        with self.assertRaises(ValueError):
+            paddle.save(
+                {'x': paddle.rand([2])}, self.path, num_shards=2, num_workers=0
+            )
+        with self.assertRaises(ValueError):
+            paddle.save({'x': paddle.rand([2])}, BytesIO(), num_shards=2)
+        with self.assertRaises(ValueError):
+            paddle.save({'layer': LinearNet()}, self.path, num_shards=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -227,5 +227,10 @@ class TestGradientCheckInEagerMode(TestMultipleGpus):
         self.run_mnist_2gpu('parallel_dygraph_gradient_check_in_eager_mode.py')
 
 
+class TestDataParallelWithFlatBuffers(TestMultipleGpus):
+    def test_multiple_gpus_dynamic(self):
+        self.run_mnist_2gpu('parallel_dygraph_dataparallel_flat_buffers.py')
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import collections
+import concurrent.futures
 import copyreg
 import os
 import pickle
@@ -229,6 +230,8 @@ def _parse_load_config(configs):
         'params_filename',
         'keep_name_table',
         'return_numpy',
+        'mmap',
+        'num_workers',
     ]
 
     # input check
@@ -249,12 +252,19 @@ def _parse_load_config(configs):
     inner_config.params_filename = configs.get('params_filename', None)
     inner_config.keep_name_table = configs.get('keep_name_table', None)
     inner_config.return_numpy = configs.get('return_numpy', False)
+    inner_config.mmap = configs.get('mmap', False)
+    inner_config.num_workers = configs.get('num_workers', None)
 
     return inner_config
 
 
 def _parse_save_config(configs):
-    supported_configs = ['use_binary_format', 'pickle_protocol']
+    supported_configs = [
+        'use_binary_format',
+        'pickle_protocol',
+        'num_shards',
+        'num_workers',
+    ]
 
     # input check
     for key in configs:
@@ -272,6 +282,8 @@ def _parse_save_config(configs):
     inner_config = _SaveLoadConfig()
     inner_config.use_binary_format = configs.get('use_binary_format', False)
     inner_config.pickle_protocol = configs.get('pickle_protocol', None)
+    inner_config.num_shards = configs.get('num_shards', None)
+    inner_config.num_workers = configs.get('num_workers', None)
 
     return inner_config
 
@@ -653,6 +665,243 @@ def _save_binary_var(obj, path):
         )
 
 
+# key of the index object of sharded format, which is a dict with the
+# version of sharded format as value of this key
+_SHARDED_FORMAT_KEY = "ShardedFormatVersion@@"
+_SHARDED_FORMAT_VERSION = 1
+_SHARDED_ALIGNMENT = 64
+
+
+class _ShardedTensorMeta:
+    """
+    Placeholder of a tensor in the index of sharded format, the data of the
+    tensor is stored as raw buffer in shard file :attr:`shard` from
+    :attr:`offset`.
+    """
+
+    def __init__(self, name, shard, offset, shape, dtype):
+        self.name = name
+        self.shard = shard
+        self.offset = offset
+        self.shape = shape
+        self.dtype = dtype
+
+    @property
+    def nbytes(self):
+        return int(np.prod(self.shape)) * np.dtype(self.dtype).itemsize
+
+
+def _shard_file_name(path, shard, num_shards):
+    return "{}.shard-{:05d}-of-{:05d}".format(path, shard, num_shards)
+
+
+def _check_num_workers(num_workers, default):
+    if num_workers is None:
+        return max(min(default, os.cpu_count() or 1), 1)
+    if not isinstance(num_workers, int) or num_workers < 1:
+        raise ValueError(
+            "The 'num_workers' MUST be positive int, but received {}".format(
+                num_workers
+            )
+        )
+    return num_workers
+
+
+def _map_tensors(obj, convert_func):
+    """
+    Returns a copy of the nested structure obj, in which tensors are
+    replaced by the results of :attr:`convert_func`.
+    """
+    if isinstance(obj, paddle.nn.Layer):
+        raise ValueError(
+            "paddle do not support saving `paddle.nn.Layer` object."
+        )
+    if isinstance(obj, (core.VarBase, core.eager.Tensor, core.LoDTensor)):
+        return convert_func(obj)
+    if type(obj) in (dict, collections.OrderedDict):
+        return type(obj)(
+            (key, _map_tensors(value, convert_func))
+            for key, value in obj.items()
+        )
+    if type(obj) in (list, tuple):
+        return type(obj)(_map_tensors(value, convert_func) for value in obj)
+    return obj
+
+
+def _sharded_save(obj, path, protocol, num_shards, num_workers=None):
+    """
+    Save obj in sharded format: tensors in obj are written as raw buffers
+    into :attr:`num_shards` shard files by a thread pool, and obj with
+    tensors replaced by :code:`_ShardedTensorMeta` is pickled into
+    :attr:`path` as index.
+    """
+    if not _is_file_path(path):
+        raise ValueError(
+            "Sharded format only supports saving objects to file, but got {}".format(
+                type(path)
+            )
+        )
+    if not isinstance(num_shards, int) or num_shards < 1:
+        raise ValueError(
+            "The 'num_shards' MUST be positive int, but received {}".format(
+                num_shards
+            )
+        )
+    num_workers = _check_num_workers(num_workers, num_shards)
+
+    # only the references of tensors are kept here, each tensor is copied
+    # to host by the writer of its shard and released once written, so the
+    # state dict is not duplicated in host memory
+    tensors = []
+    sizes = []
+    metas = []
+
+    def to_meta(tensor):
+        if isinstance(tensor, core.LoDTensor):
+            name = None
+            size = int(np.prod(tensor.shape())) * core.size_of_dtype(
+                tensor._dtype()
+            )
+        else:
+            if not tensor.value().get_tensor()._is_initialized():
+                raise ValueError(
+                    "The saved tensor is not initialized. If you used group sharded, please use save_group_sharded_model."
+                )
+            name = tensor.name
+            size = tensor._numel() * core.size_of_dtype(tensor.dtype)
+        # shape and dtype are filled when the tensor is written
+        meta = _ShardedTensorMeta(name, None, None, None, None)
+        tensors.append(tensor)
+        sizes.append(size)
+        metas.append(meta)
+        return meta
+
+    index = _map_tensors(obj, to_meta)
+
+    # assign the largest tensors first to the least loaded shard, offsets
+    # of tensors are aligned for memory mapped loading
+    shard_sizes = [0] * num_shards
+    shard_tensors = [[] for _ in range(num_shards)]
+    for i in sorted(range(len(tensors)), key=lambda i: -sizes[i]):
+        shard = shard_sizes.index(min(shard_sizes))
+        offset = (
+            -(-shard_sizes[shard] // _SHARDED_ALIGNMENT) * _SHARDED_ALIGNMENT
+        )
+        metas[i].shard = shard
+        metas[i].offset = offset
+        shard_sizes[shard] = offset + sizes[i]
+        shard_tensors[shard].append(i)
+
+    def write_shard(shard):
+        with open(_shard_file_name(path, shard, num_shards), 'wb') as f:
+            for i in shard_tensors[shard]:
+                tensor, meta = tensors[i], metas[i]
+                if isinstance(tensor, core.LoDTensor):
+                    data = np.array(tensor)
+                else:
+                    data = tensor.numpy()
+                # NOTE: np.ascontiguousarray turns 0-D array into 1-D
+                data = np.require(data, requirements='C')
+                assert (
+                    data.nbytes == sizes[i]
+                ), "The size of tensor {} changed while saving.".format(
+                    meta.name
+                )
+                meta.shape = data.shape
+                meta.dtype = data.dtype.str
+                f.seek(meta.offset)
+                f.write(memoryview(data.reshape(-1).view(np.uint8)))
+                del data
+            f.truncate(shard_sizes[shard])
+
+    with concurrent.futures.ThreadPoolExecutor(num_workers) as executor:
+        list(executor.map(write_shard, range(num_shards)))
+
+    # the tensors not replaced in index, e.g. in a set, are pickled as the
+    # non-sharded format
+    with open(path, 'wb') as f:
+        _pickle_save(
+            {
+                _SHARDED_FORMAT_KEY: _SHARDED_FORMAT_VERSION,
+                "num_shards": num_shards,
+                "obj": index,
+            },
+            f,
+            protocol,
+        )
+
+
+def _is_sharded_index(obj):
+    return isinstance(obj, dict) and _SHARDED_FORMAT_KEY in obj
+
+
+def _sharded_load(path, index, config):
+    """
+    Load obj saved in sharded format. Shards are read by a thread pool, or
+    memory mapped if :code:`config.mmap` is True, in which case tensors
+    are returned as read-only :code:`numpy.memmap` if
+    :code:`config.return_numpy` is True and materialized on demand.
+    """
+    if index[_SHARDED_FORMAT_KEY] > _SHARDED_FORMAT_VERSION:
+        raise ValueError(
+            "The sharded format version {} of {} is not supported, please upgrade paddle.".format(
+                index[_SHARDED_FORMAT_KEY], path
+            )
+        )
+    num_shards = index["num_shards"]
+    num_workers = _check_num_workers(config.num_workers, num_shards)
+
+    metas = []
+    _parse_every_object(
+        index["obj"],
+        lambda v: isinstance(v, _ShardedTensorMeta),
+        lambda v: metas.append(v) or v,
+    )
+
+    if config.mmap:
+        shards = [
+            np.memmap(_shard_file_name(path, shard, num_shards), mode='r')
+            if os.path.getsize(_shard_file_name(path, shard, num_shards)) > 0
+            else np.empty([0], dtype=np.uint8)
+            for shard in range(num_shards)
+        ]
+
+        def read_meta(meta):
+            data = shards[meta.shard][meta.offset : meta.offset + meta.nbytes]
+            return data.view(meta.dtype).reshape(meta.shape)
+
+        datas = {id(meta): read_meta(meta) for meta in metas}
+    else:
+        shard_metas = [[] for _ in range(num_shards)]
+        for meta in metas:
+            shard_metas[meta.shard].append(meta)
+
+        def read_shard(shard):
+            datas = []
+            with open(_shard_file_name(path, shard, num_shards), 'rb') as f:
+                for meta in sorted(shard_metas[shard], key=lambda m: m.offset):
+                    data = np.empty(meta.shape, dtype=meta.dtype)
+                    f.seek(meta.offset)
+                    f.readinto(memoryview(data.reshape(-1).view(np.uint8)))
+                    datas.append((id(meta), data))
+            return datas
+
+        datas = {}
+        with concurrent.futures.ThreadPoolExecutor(num_workers) as executor:
+            for shard_datas in executor.map(read_shard, range(num_shards)):
+                datas.update(shard_datas)
+
+    def to_tensor(meta):
+        data = datas[id(meta)]
+        if meta.name is None:
+            return _ndarray_to_tensor(data, config.return_numpy)
+        return _tuple_to_tensor((meta.name, data), config.return_numpy)
+
+    return _parse_every_object(
+        index["obj"], lambda v: isinstance(v, _ShardedTensorMeta), to_tensor
+    )
+
+
 def save(obj, path, protocol=4, **configs):
     '''
     Save an object to the specified path.
@@ -679,6 +928,9 @@ def save(obj, path, protocol=4, **configs):
           use_binary_format(bool): When the saved object is static graph variable, you can specify ``use_binary_for_var``.
           If True, save the file in the c++ binary format when saving a single static graph variable; otherwise, save it in pickle format.
           Default: False
+          num_shards(int): If set, save the object in sharded format, tensors are written as raw buffers into ``num_shards``
+          files named ``path.shard-xxxxx-of-xxxxx`` in parallel, and ``path`` only holds a small index. Default: None
+          num_workers(int): The number of threads writing the shard files. Default: min(num_shards, cpu count)
 
     Returns:
         None
@@ -782,6 +1034,15 @@ def save(obj, path, protocol=4, **configs):
             tensor = paddle.randn([2, 3], dtype='float32')
             paddle.save(tensor, byio)
 
+        .. code-block:: python
+            :name: code-example-6
+
+            # example 6: save large state_dict in sharded format
+            import paddle
+
+            linear = paddle.nn.Linear(1024, 1024)
+            paddle.save(linear.state_dict(), "linear.pdparams", num_shards=4)
+
     '''
     if _is_file_path(path):
         # 1. input check
@@ -823,7 +1084,12 @@ def save(obj, path, protocol=4, **configs):
                 "'pickle_protocol' is a deprecated argument. Please use 'protocol' instead."
             )
 
-        if isinstance(obj, Program):
+        if config.num_shards is not None:
+            _sharded_save(
+                obj, path, protocol, config.num_shards, config.num_workers
+            )
+
+        elif isinstance(obj, Program):
             obj.desc.flush()
             with _open_file_buffer(path, "wb") as f:
                 f.write(obj.desc.serialize_to_string())
@@ -895,6 +1161,46 @@ def _legacy_save(obj, path, protocol=2):
             pickle.dump(saved_obj, f, protocol=protocol)
 
 
+def _host_snapshot(obj):
+    """
+    Copies tensors in obj into host memory as the objects pickled by
+    `paddle.save` in dynamic graph mode. The returned snapshot is saved by
+    `_save_host_snapshot` without accessing any tensor, e.g. in a
+    background thread while the tensors are being updated.
+    """
+    if _is_state_dict(obj):
+        return True, _build_saved_state_dict(obj)
+
+    def to_host(tensor):
+        # the same as reduce_varbase and reduce_LoDTensor in _pickle_save
+        if isinstance(tensor, core.LoDTensor):
+            return np.array(tensor)
+        return (tensor.name, tensor.numpy())
+
+    return False, _map_tensors(obj, to_host)
+
+
+def _save_host_snapshot(snapshot, path, protocol=4):
+    """
+    Saves the snapshot returned by `_host_snapshot` to path, the saved file
+    is the same as `paddle.save` the object of the snapshot.
+    """
+    is_state_dict, obj = snapshot
+    if is_state_dict:
+        obj = _unpack_saved_dict(obj, protocol)
+
+    # When value of dict is lager than 4GB ,there is a Bug on 'MAC python3'
+    if sys.platform == 'darwin' and sys.version_info.major == 3:
+        pickle_bytes = pickle.dumps(obj, protocol=protocol)
+        with open(path, 'wb') as f:
+            max_bytes = 2**30
+            for i in range(0, len(pickle_bytes), max_bytes):
+                f.write(pickle_bytes[i : i + max_bytes])
+    else:
+        with open(path, 'wb') as f:
+            pickle.dump(obj, f, protocol=protocol)
+
+
 def load(path, **configs):
     '''
     Load an object can be used in paddle from specified path.
@@ -940,6 +1246,11 @@ def load(path, **configs):
             by default.
             (3) return_numpy(bool): If specified as True, return tensor as numpy.ndarray, otherwise return tensor as paddle.Tensor.
             Default False.
+            (4) mmap(bool): Only for the sharded format saved with ``num_shards``. If True, shard files are memory mapped
+            instead of read, and with ``return_numpy=True`` tensors are returned as read-only ``numpy.memmap`` which are
+            materialized on demand. Default False.
+            (5) num_workers(int): Only for the sharded format, the number of threads reading the shard files.
+            Default min(number of shards, cpu count).
 
     Returns:
         Object(Object): a target object can be used in paddle
@@ -1075,6 +1386,10 @@ def load(path, **configs):
                 else:
                     load_result = pickle.load(f, encoding='latin1')
 
+                # paddle.save with num_shards
+                if _is_sharded_index(load_result):
+                    return _sharded_load(path, load_result, config)
+
                 # TODO(weixin):If `obj` is any object, the judgment condition should be more precise.
                 if isinstance(load_result, dict):
                     load_result = _pack_loaded_dict(load_result)
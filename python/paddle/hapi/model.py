@@ -17,6 +17,7 @@ import inspect
 import os
 import pickle
 import socket
+import threading
 import time
 import warnings
 
@@ -34,6 +35,7 @@ from paddle.fluid.executor import global_scope
 from paddle.fluid.framework import Variable
 from paddle.fluid.framework import _current_expected_place as _get_device
 from paddle.fluid.framework import _get_paddle_place, _non_static_mode
+from paddle.framework.io import _host_snapshot, _save_host_snapshot
 from paddle.framework.io_utils import is_belong_to_optimizer
 from paddle.io import DataLoader, Dataset, DistributedBatchSampler
 from paddle.jit.translated_layer import INFER_MODEL_SUFFIX, INFER_PARAMS_SUFFIX
@@ -282,6 +284,48 @@ def _update_input_info(inputs):
     return shapes, dtypes
 
 
+class _AsyncSaver:
+    """
+    Writes snapshots of checkpoints in a background thread. At most one
+    checkpoint is being written at any time, saving a new one waits for
+    the previous writing, and errors in the background thread are raised
+    by the next `save` or `wait`.
+    """
+
+    def __init__(self):
+        self._thread = None
+        self._error = None
+
+    def _write(self, snapshots):
+        try:
+            for write_func, state, path in snapshots:
+                # write to a temporary file and rename it, so that a
+                # checkpoint file is either complete or not existing
+                tmp_path = path + '.tmp'
+                write_func(state, tmp_path)
+                os.replace(tmp_path, path)
+        except Exception as e:
+            self._error = e
+
+    def save(self, snapshot_func):
+        self.wait()
+        # copy states into host memory in the calling thread, then training
+        # is continued while the snapshots are being written
+        snapshots = snapshot_func()
+        self._thread = threading.Thread(target=self._write, args=(snapshots,))
+        self._thread.start()
+
+    def wait(self):
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(
+                "Failed to save checkpoint asynchronously: {}".format(error)
+            ) from error
+
+
 class StaticGraphAdapter:
     """
 
@@ -349,36 +393,48 @@ class StaticGraphAdapter:
     def parameters(self, *args, **kwargs):
         return self.model.network.parameters(*args, **kwargs)
 
-    def save(self, path):
-        def _save(state, path):
-            if not state:
-                return
-            state = {
+    def _save_states(self, path):
+        # states in host memory to save and their paths
+        def _to_numpy(state):
+            return {
                 k: to_numpy(v) if isinstance(v, Variable) else v
                 for k, v in state.items()
             }
-            with open(path, 'wb') as f:
-                pickle.dump(state, f)
 
         base = os.path.basename(path)
         assert base != "", "path should be of 'dirname/filename' format"
         dir_name = os.path.dirname(path)
         if dir_name and not os.path.exists(dir_name):
             os.makedirs(dir_name)
-        param_path = path + ".pdparams"
-        _save(self.model.network.state_dict(), param_path)
+        states = []
+        param_state = self.model.network.state_dict()
+        if param_state:
+            states.append((_to_numpy(param_state), path + ".pdparams"))
         prog = self._progs.get('train', None)
         if prog is None or self.model._optimizer is None:
-            return
+            return states
         # XXX `optimizer.state_dict()` only work in dygraph mode
-        optim_path = path + ".pdopt"
         optim = {
             p.name: p for p in filter(is_belong_to_optimizer, prog.list_vars())
         }
-        if not optim:
-            return
+        if optim:
+            states.append((_to_numpy(optim), path + ".pdopt"))
+        return states
 
-        _save(optim, optim_path)
+    @staticmethod
+    def _write_state(state, path):
+        with open(path, 'wb') as f:
+            pickle.dump(state, f)
+
+    def save(self, path):
+        for state, state_path in self._save_states(path):
+            self._write_state(state, state_path)
+
+    def snapshot(self, path):
+        return [
+            (self._write_state, state, state_path)
+            for state, state_path in self._save_states(path)
+        ]
 
     # TODO: support save/load scaler state in static graph
     def load(self, param_state_pairs, optim_state):
@@ -780,6 +836,9 @@ class DynamicGraphAdapter:
             'eval_batch': 0,
             'test_batch': 0,
         }
+        # the number of local samples without padding when the metrics are
+        # updated by the local samples and all reduced after evaluation
+        self._local_eval_samples = None
 
         self._input_info = None
         self._amp_level = "O0"
@@ -884,7 +943,21 @@ class DynamicGraphAdapter:
             losses = self.model._loss(*(to_list(outputs) + labels))
             losses = to_list(losses)
 
-        if self._nranks > 1:
+        if self._local_eval_samples is not None:
+            # cut off the local padding samples
+            outputs = to_list(outputs)
+            current_count = self._merge_count.get(self.mode + '_total', 0)
+            samples = max(
+                min(
+                    outputs[0].shape[0],
+                    self._local_eval_samples - current_count,
+                ),
+                0,
+            )
+            outputs = [o[:samples] for o in outputs]
+            labels = [l[:samples] for l in labels]
+            self._merge_count[self.mode + '_total'] = current_count + samples
+        elif self._nranks > 1:
             outputs = [_all_gather(o) for o in to_list(outputs)]
             labels = [_all_gather(l) for l in labels]
         metrics = []
@@ -893,6 +966,7 @@ class DynamicGraphAdapter:
             if (
                 self.model._test_dataloader is not None
                 and self._nranks > 1
+                and self._local_eval_samples is None
                 and isinstance(self.model._test_dataloader, DataLoader)
             ):
                 total_size = len(self.model._test_dataloader.dataset)
@@ -912,6 +986,10 @@ class DynamicGraphAdapter:
                 else:
                     self._merge_count[self.mode + '_total'] += samples
                     self._merge_count[self.mode + '_batch'] = samples
+            elif self._local_eval_samples is not None and samples == 0:
+                # all the local samples of the batch are padding
+                metrics.append(metric.accumulate())
+                continue
 
             metric_outs = metric.compute(*(to_list(outputs) + labels))
             m = metric.update(*[to_numpy(m) for m in to_list(metric_outs)])
@@ -938,17 +1016,31 @@ class DynamicGraphAdapter:
     def parameters(self, *args, **kwargs):
         return self.model.network.parameters(*args, **kwargs)
 
-    def save(self, path):
-        params = self.model.network.state_dict()
-        paddle.save(params, path + '.pdparams')
+    def _save_states(self, path):
+        # states to save and their paths
+        states = [(self.model.network.state_dict(), path + '.pdparams')]
         if self.model._optimizer is not None:
             if self.model._optimizer.state_dict():
                 optim = self.model._optimizer.state_dict()
-                paddle.save(optim, path + '.pdopt')
+                states.append((optim, path + '.pdopt'))
         if hasattr(self.model, '_scaler') and self.model._scaler is not None:
             if self.model._scaler.state_dict():
                 scaler = self.model._scaler.state_dict()
-                paddle.save(scaler, path + '.pdscaler')
+                states.append((scaler, path + '.pdscaler'))
+        return states
+
+    def save(self, path):
+        for state, state_path in self._save_states(path):
+            paddle.save(state, state_path)
+
+    def snapshot(self, path):
+        dir_name = os.path.dirname(path)
+        if dir_name and not os.path.exists(dir_name):
+            os.makedirs(dir_name, exist_ok=True)
+        return [
+            (_save_host_snapshot, _host_snapshot(state), state_path)
+            for state, state_path in self._save_states(path)
+        ]
 
     def load(self, param_state_pairs, optim_state, scaler_state=None):
         # restore parameter states
@@ -1165,6 +1257,7 @@ class Model:
         self._is_shape_inferred = False
         self._test_dataloader = None
         self.stop_training = False
+        self._async_saver = _AsyncSaver()
 
         if not _non_static_mode():
             if not isinstance(inputs, (list, tuple, dict, Input)):
@@ -1341,7 +1434,7 @@ class Model:
             self._update_inputs()
         return loss
 
-    def save(self, path, training=True):
+    def save(self, path, training=True, async_save=False):
         """
 
         This function saves parameters, optimizer information or model and
@@ -1364,6 +1457,13 @@ class Model:
                 A exception will be raised.
             training (bool, optional): Whether to save for training. If not, save
                 for inference only. Default: True.
+            async_save (bool, optional): Whether to save for training
+                asynchronously. If True, the states are copied into host
+                memory and written to files in a background thread, and the
+                training continues without waiting for the writing. Saving
+                again waits for the previous asynchronous saving, and
+                `wait_save` waits for it explicitly. It is ignored if
+                `training` is False. Default: False.
 
         Returns:
             None
@@ -1412,14 +1512,44 @@ class Model:
                 model.save('checkpoint/test')  # save for training
                 model.save('inference_model', False)  # save for inference
 
+                # save for training in a background thread
+                model.save('checkpoint/test_async', async_save=True)
+                model.wait_save()
+
         """
 
         if paddle.distributed.ParallelEnv().local_rank == 0:
+            if training and async_save:
+                self._async_saver.save(lambda: self._adapter.snapshot(path))
+                return
+            self._async_saver.wait()
             if not training:
                 self._save_inference_model(path)
             else:
                 self._adapter.save(path)
 
+    def wait_save(self):
+        """
+
+        Waits until the asynchronous saving by `save(path, async_save=True)`
+        finishes. It raises the error occurring in the saving if any.
+
+        Returns:
+            None
+
+        Examples:
+
+            .. code-block:: python
+
+                import paddle
+
+                model = paddle.Model(paddle.nn.Linear(4, 2))
+                model.save('checkpoint/test', async_save=True)
+                model.wait_save()
+
+        """
+        self._async_saver.wait()
+
     def load(self, path, skip_mismatch=False, reset_optimizer=False):
         """
 
@@ -1472,6 +1602,8 @@ class Model:
                 model.load('checkpoint/test')
 
         """
+        # the checkpoint to load may be being saved asynchronously
+        self._async_saver.wait()
 
         def _load_state_from_path(path):
             if not os.path.exists(path):
@@ -1986,6 +2118,8 @@ class Model:
                 break
 
         cbks.on_end('train', logs)
+        # checkpoints saved by callbacks are complete after fit
+        self._async_saver.wait()
         self._test_dataloader = None
 
     def evaluate(
@@ -2281,6 +2415,49 @@ class Model:
                 params_filename=params_filename,
             )
 
+    def _local_eval_samples(self, data_loader):
+        """
+        Return the number of the local samples excluding the padding ones of
+        DistributedBatchSampler, if the metrics can be updated by the local
+        samples and all reduced after evaluation, otherwise return None.
+        """
+        if (
+            not isinstance(self._adapter, DynamicGraphAdapter)
+            or self._adapter._nranks <= 1
+            or not self._metrics
+            or not isinstance(data_loader, DataLoader)
+        ):
+            return None
+        for metric in self._metrics:
+            if type(metric).all_reduce is Metric.all_reduce:
+                return None
+        sampler = data_loader.batch_sampler
+        if not isinstance(sampler, DistributedBatchSampler) or sampler.shuffle:
+            return None
+
+        # the padding samples are at the end of the samples of all the ranks
+        batch_size = sampler.batch_size
+        last_batch_size = sampler.total_size % (batch_size * sampler.nranks)
+        last_local_batch_size = last_batch_size // sampler.nranks
+        indices = [
+            np.arange(i, i + batch_size)
+            for i in range(
+                sampler.local_rank * batch_size,
+                sampler.total_size - last_batch_size,
+                batch_size * sampler.nranks,
+            )
+        ]
+        begin = (
+            sampler.total_size
+            - last_batch_size
+            + sampler.local_rank * last_local_batch_size
+        )
+        indices.append(np.arange(begin, begin + last_local_batch_size))
+        indices = np.concatenate(indices)
+        if sampler.drop_last:
+            indices = indices[: len(indices) // batch_size * batch_size]
+        return int(np.count_nonzero(indices < len(sampler.dataset)))
+
     def _run_one_epoch(
         self,
         data_loader,
@@ -2288,6 +2465,10 @@ class Model:
         mode,
         logs={},
     ):
+        if mode == 'eval':
+            self._adapter._local_eval_samples = self._local_eval_samples(
+                data_loader
+            )
         outputs = []
         for step, data in enumerate(data_loader):
             # data might come from different types of data_loader and have
@@ -2364,6 +2545,17 @@ class Model:
                     self.stop_training = True
                     del self.num_iters
                     break
+
+        if mode == 'eval' and self._adapter._local_eval_samples is not None:
+            # combine the metrics of the local samples of all the ranks
+            metrics = []
+            for metric in self._metrics:
+                metric.all_reduce()
+                metrics.extend(to_list(metric.accumulate()))
+            for k, v in zip(self._metrics_name()[-len(metrics) :], metrics):
+                logs[k] = v
+            self._adapter._local_eval_samples = None
+            self._adapter._merge_count[mode + '_total'] = 0
         self._reset_metrics()
 
         if mode == 'predict':
@@ -40,10 +40,13 @@ def set_config(config=None):
 
     - enable(bool): Whether to enable layout tuning.
 
-    3. dataloader: When it is enabled, the best num_workers will be selected to replace
-    the origin dataloader setting. Tuning parameters are as follows:
+    3. dataloader: When it is enabled, num_workers, prefetch_factor and the shared
+    memory cache of DataLoader are tuned online with the time waiting for data and
+    the step time measured in the first training steps. Tuning parameters are as
+    follows:
 
     - enable(bool): Whether to enable dataloader tuning.
+    - tuning_steps(int): Number of training steps to be tuned. Default: 500.
 
     Args:
         config (dict|str|None, optional): Configuration for auto-tuning. If it is a
@@ -156,3 +159,5 @@ def set_config(config=None):
                     "The `tuning_steps` should be int. Use default parameter instead."
                 )
                 paddle.fluid.reader.set_autotune_config(use_autoune)
+        else:
+            paddle.fluid.reader.set_autotune_config(use_autoune)
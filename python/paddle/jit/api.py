@@ -220,7 +220,12 @@ def ignore_module(modules: List[Any]):
 
 
 def to_static(
-    function=None, input_spec=None, build_strategy=None, property=False
+    function=None,
+    input_spec=None,
+    build_strategy=None,
+    property=False,
+    shape_buckets=None,
+    bucket_outputs=None,
 ):
     """
     Converts imperative dygraph APIs into declarative function APIs. Decorator
@@ -240,6 +245,16 @@ def to_static(
             of the computational graph. For more information about build_strategy,
             please refer to :code:`paddle.static.BuildStrategy`. The default is None.
         property(bool, Optional): whether the fucntion is python property. The default is False.
+        shape_buckets(dict|None, Optional): maps an axis of input Tensors to its bucket policy,
+            which is 'pow2', a list of bucket sizes or a callable mapping a size to the bucketed size.
+            Input Tensors are padded with zeros along the axis up to the bucketed size, so that inputs
+            with various sizes (e.g. sequence lengths) share a few programs instead of tracing a program
+            for each size. Sizes larger than all buckets in the list are not padded. Only functions
+            whose outputs are not affected by the padded zeros along the axis (e.g. with masking)
+            are applicable. The default is None.
+        bucket_outputs(dict|None, Optional): maps the index of a Tensor in the flattened outputs to a dict
+            from an axis in `shape_buckets` to the axis of the output, which is sliced back to the size
+            before padding. Outputs not in it are returned with the padded sizes. The default is None.
 
 
     Returns:
@@ -263,6 +278,16 @@ def to_static(
             x_v = func(x)
             print(x_v) # [[2. 2.]]
 
+            # inputs with sequence length 5, 6, 7 and 8 share one program,
+            # and axis 1 of the output 0 is sliced back
+            @to_static(shape_buckets={1: 'pow2'}, bucket_outputs={0: {1: 1}})
+            def scale(x):
+                return x * 2
+
+            for seq_len in range(5, 9):
+                out = scale(paddle.ones([2, seq_len]))
+                print(out.shape) # [2, seq_len]
+
     """
 
     def decorated(python_func):
@@ -280,6 +305,8 @@ def to_static(
                 input_spec=input_spec,
                 build_strategy=build_strategy,
                 property=property,
+                shape_buckets=shape_buckets,
+                bucket_outputs=bucket_outputs,
             ),
         )
 
@@ -0,0 +1,198 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import hashlib
+import inspect
+import os
+import pickle
+import shutil
+import sys
+
+import paddle
+
+from . import logging_utils
+from .origin_info import global_origin_info_map
+from .utils import source_file_to_func, unwrap
+
+__all__ = []
+
+CODE_CACHE_DIR_ENV_NAME = 'FLAGS_dy2static_code_cache_dir'
+
+# bump it when the layout of cache files changes
+CODE_CACHE_FORMAT_VERSION = 1
+
+CodeCacheInfo = collections.namedtuple(
+    'CodeCacheInfo', ['hits', 'misses', 'errors', 'cache_dir']
+)
+
+
+class CodeCache:
+    """
+    Persistent cache of the transformed source code of dygraph functions
+    across processes, which is enabled by setting the cache directory with
+    environment variable `FLAGS_dy2static_code_cache_dir`.
+
+    Each entry is keyed on the source code and location of the dygraph
+    function, Paddle version and Python version, and stores the transformed
+    source code as a python file and the original information map used in
+    error messages, so that the ast transformers are skipped in subsequent
+    processes. Entries are invalidated automatically when any part of the
+    key changes, and `clear()` removes all entries.
+
+    Args:
+        cache_dir(str, optional): directory of cache files, default is None,
+            which reads environment variable `FLAGS_dy2static_code_cache_dir`.
+    """
+
+    def __init__(self, cache_dir=None):
+        self._cache_dir = cache_dir
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+
+    @property
+    def cache_dir(self):
+        if self._cache_dir is not None:
+            return self._cache_dir
+        return os.environ.get(CODE_CACHE_DIR_ENV_NAME, None) or None
+
+    @cache_dir.setter
+    def cache_dir(self, cache_dir):
+        self._cache_dir = cache_dir
+
+    @property
+    def enabled(self):
+        return self.cache_dir is not None
+
+    def _key(self, func, source_code):
+        func = unwrap(func)
+        try:
+            source_file = inspect.getsourcefile(func)
+            _, begin_lineno = inspect.getsourcelines(func)
+        except (OSError, TypeError):
+            return None
+        # location of the function is in the original information map
+        items = [
+            str(CODE_CACHE_FORMAT_VERSION),
+            paddle.__version__,
+            paddle.version.commit,
+            sys.version,
+            os.path.abspath(source_file),
+            str(begin_lineno),
+            source_code,
+        ]
+        return hashlib.md5('\0'.join(items).encode('utf-8')).hexdigest()
+
+    def _paths(self, key):
+        prefix = os.path.join(self.cache_dir, 'd2s_' + key)
+        return prefix + '.py', prefix + '.info'
+
+    def load(self, func, source_code):
+        """
+        Returns the transformed function of `func` loaded from cache, or
+        None if the cache is missed.
+        """
+        key = self._key(func, source_code)
+        if key is None:
+            return None
+        source_path, info_path = self._paths(key)
+        if not (os.path.exists(source_path) and os.path.exists(info_path)):
+            self._misses += 1
+            logging_utils.log(
+                1, "Code cache missed for function {}.".format(func.__name__)
+            )
+            return None
+
+        try:
+            with open(info_path, 'rb') as f:
+                origin_infos = pickle.load(f)
+            static_func = source_file_to_func(source_path, func)
+        except Exception as e:
+            # broken cache files are regarded as missed, and overwritten
+            # after the conversion
+            self._errors += 1
+            logging_utils.warn(
+                "Failed to load code cache of function {} from {}: {}".format(
+                    func.__name__, source_path, e
+                )
+            )
+            return None
+
+        global_origin_info_map.update(
+            {
+                (source_path, lineno): origin_info
+                for lineno, origin_info in origin_infos
+            }
+        )
+        self._hits += 1
+        logging_utils.log(
+            1,
+            "Code cache hit for function {}: {}".format(
+                func.__name__, source_path
+            ),
+        )
+        return static_func
+
+    def save(self, func, source_code, static_file, origin_info_map):
+        """
+        Saves the transformed source file of `func` and its original
+        information map into cache.
+        """
+        key = self._key(func, source_code)
+        if key is None:
+            return
+        source_path, info_path = self._paths(key)
+        # only line numbers are kept, since the transformed code is loaded
+        # from the cache file in subsequent processes
+        origin_infos = [
+            (static_loc[1], origin_info)
+            for static_loc, origin_info in origin_info_map.items()
+            if static_loc[0] == static_file
+        ]
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # write temporary files and rename them, so that concurrent
+            # processes never read partially written cache files
+            tmp_suffix = '.{}.tmp'.format(os.getpid())
+            shutil.copyfile(static_file, source_path + tmp_suffix)
+            with open(info_path + tmp_suffix, 'wb') as f:
+                pickle.dump(origin_infos, f)
+            os.replace(source_path + tmp_suffix, source_path)
+            os.replace(info_path + tmp_suffix, info_path)
+        except (OSError, pickle.PicklingError) as e:
+            self._errors += 1
+            logging_utils.warn(
+                "Failed to save code cache of function {} to {}: {}".format(
+                    func.__name__, self.cache_dir, e
+                )
+            )
+
+    def clear(self):
+        """
+        Removes all cache files in the cache directory.
+        """
+        if not self.enabled or not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.startswith('d2s_'):
+                os.remove(os.path.join(self.cache_dir, name))
+
+    def cache_info(self):
+        """
+        Returns a named tuple of hits, misses, errors and cache directory.
+        """
+        return CodeCacheInfo(
+            self._hits, self._misses, self._errors, self.cache_dir
+        )
@@ -14,8 +14,10 @@
 
 import collections
 import inspect
+import os
 import textwrap
 import threading
+import time
 import warnings
 import weakref
 
@@ -24,10 +26,11 @@ from paddle.fluid import _non_static_mode, core, framework
 from paddle.fluid.data_feeder import check_type
 from paddle.fluid.dygraph.base import param_guard, switch_to_static_graph
 from paddle.nn.layer import layers
-from paddle.utils import flatten, gast
+from paddle.utils import flatten, gast, map_structure
 
 from . import error, logging_utils
 from .ast_transformer import DygraphToStaticAst
+from .code_cache import CodeCache
 from .function_spec import (
     FunctionSpec,
     _hash_spec_names,
@@ -40,6 +43,12 @@ from .origin_info import (
     update_op_callstack_with_origin_info,
 )
 from .partial_program import PartialProgramLayerHook, partial_program_from
+from .shape_bucket import (
+    check_bucket_outputs,
+    check_shape_buckets,
+    pad_inputs,
+    slice_outputs,
+)
 from .utils import (
     ALREADY_D2S,
     ast_to_func,
@@ -59,6 +68,17 @@ __all__ = []
 # Once exceeding the threshold, we will raise warning to users to make sure the conversion is as expected.
 MAX_TRACED_PROGRAM_COUNT = 10
 
+# The capacity of ProgramCache, the least recently used program will be evicted
+# once the number of cached programs exceeds it. It can be set by environment
+# variable `FLAGS_dy2static_program_cache_capacity`, 0 means unbounded.
+PROGRAM_CACHE_CAPACITY_ENV_NAME = 'FLAGS_dy2static_program_cache_capacity'
+DEFAULT_PROGRAM_CACHE_CAPACITY = 0
+
+ProgramCacheInfo = collections.namedtuple(
+    'ProgramCacheInfo',
+    ['hits', 'misses', 'evictions', 'capacity', 'size', 'trace_time'],
+)
+
 CONVERSION_OPTIONS = "__jst_not_to_static"
 
 
@@ -121,6 +141,12 @@ class FunctionCache:
         func = unwrap(func)
         source_code = func_to_source_code(func)
 
+        # Loads the transformed function saved by previous processes.
+        if _CODE_CACHE.enabled:
+            static_func = _CODE_CACHE.load(func, source_code)
+            if static_func is not None:
+                return static_func
+
         # TODO(liym27):
         #  Consider this case: source_code in self._code_to_ast_caches,
         #  but actually they are methods in different classes.
@@ -136,7 +162,11 @@ class FunctionCache:
         # Get static function from AST
         static_func, file_name = ast_to_func(root_wrapper.node, func)
 
-        create_and_update_origin_info_map(root_wrapper.node, static_func)
+        origin_info_map = create_and_update_origin_info_map(
+            root_wrapper.node, static_func, is_global=False
+        )
+        if _CODE_CACHE.enabled:
+            _CODE_CACHE.save(func, source_code, file_name, origin_info_map)
         return static_func
 
     def exist(self, func):
@@ -144,6 +174,7 @@ class FunctionCache:
 
 
 _CACHE_LOCK = threading.Lock()
+_CODE_CACHE = CodeCache()
 _FUNCTION_CACHE = FunctionCache()
 
 
@@ -354,6 +385,12 @@ class StaticFunction:
         self._cuda_graph_pool_id = 0
 
         self._property = kwargs.get("property", False)
+        self._shape_buckets = check_shape_buckets(
+            kwargs.get("shape_buckets", None)
+        )
+        self._bucket_outputs = check_bucket_outputs(
+            kwargs.get("bucket_outputs", None), self._shape_buckets
+        )
 
     @property
     def is_property(self):
@@ -463,6 +500,10 @@ class StaticFunction:
 
         # 2. trace ops from dygraph layers and cache the generated program.
         args, kwargs = self._function_spec.unified_args_and_kwargs(args, kwargs)
+        if self._shape_buckets:
+            args, kwargs, padded_sizes = pad_inputs(
+                args, kwargs, self._shape_buckets
+            )
 
         try:
             concrete_program, partial_program_layer = self.get_concrete_program(
@@ -481,7 +522,12 @@ class StaticFunction:
 
             # 4. return outputs.
             try:
-                return partial_program_layer(args)
+                outputs = partial_program_layer(args)
+                if self._shape_buckets:
+                    outputs = slice_outputs(
+                        outputs, padded_sizes, self._bucket_outputs
+                    )
+                return outputs
             except Exception as e:
                 if not hasattr(e, error.ERROR_DATA):
                     # runtime error
@@ -581,6 +627,14 @@ class StaticFunction:
         """
         return len(self._program_cache)
 
+    def get_cache_info(self):
+        """
+        Returns the statistics of the program cache for the decorated function,
+        which is a namedtuple of `hits`, `misses`, `evictions`, `capacity`,
+        `size` and `trace_time`.
+        """
+        return self._program_cache.cache_info()
+
     @property
     def code(self):
         """
@@ -1127,16 +1181,62 @@ class FallbackProgramLayer:
 class ProgramCache:
     """
     Wrapper class for the program functions defined by dygraph function.
+
+    Programs are evicted in LRU order once the number of cached programs
+    exceeds `capacity`, and the hit/miss counters and the time spent on
+    tracing programs are recorded, see `cache_info`.
+
+    Args:
+        capacity(int, optional): The max number of cached programs, 0 means
+            unbounded. Default None, which means reading it from environment
+            variable `FLAGS_dy2static_program_cache_capacity`.
     """
 
     dy2static_error_file = "to_static.error"
 
-    def __init__(self):
+    def __init__(self, capacity=None):
         # {hash_id : (concrete_program, partial_layer)}
         self._caches = collections.OrderedDict()
         # trace mostly recent used program
         self._recent_key = None
         self._recent_cache_key = None
+        if capacity is None:
+            capacity = int(
+                os.getenv(
+                    PROGRAM_CACHE_CAPACITY_ENV_NAME,
+                    DEFAULT_PROGRAM_CACHE_CAPACITY,
+                )
+            )
+        self.capacity = capacity
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._trace_time = 0.0
+        # number of traced programs for inputs only differ in shapes
+        self._shape_trace_counts = collections.Counter()
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, capacity):
+        check_type(capacity, 'capacity', int, 'ProgramCache')
+        if capacity < 0:
+            raise ValueError(
+                "The capacity of ProgramCache should be non-negative, but received {}.".format(
+                    capacity
+                )
+            )
+        self._capacity = capacity
+        self._evict()
+
+    def _evict(self):
+        if self._capacity <= 0:
+            return
+        while len(self._caches) > self._capacity:
+            self._caches.popitem(last=False)
+            self._evictions += 1
 
     def _build_once(self, cache_key):
         # TODO(Aurelius84): Need a gloabl FLAGS to enable/disable to_prim
@@ -1189,6 +1289,48 @@ class ProgramCache:
             )
         return concrete_program, partial_program
 
+    def _check_retrace(self, cache_key):
+        """
+        Warns once if the same function is traced repeatedly because of the
+        changes of input shapes.
+        """
+        from paddle.static import InputSpec
+
+        def erase_shape(x):
+            if isinstance(x, InputSpec):
+                return (x.dtype, len(x.shape), x.name)
+            return x
+
+        try:
+            signature = hash(
+                (
+                    make_hashable(
+                        map_structure(
+                            erase_shape, cache_key.input_args_with_spec
+                        )
+                    ),
+                    make_hashable(
+                        map_structure(
+                            erase_shape, cache_key.input_kwargs_with_spec
+                        )
+                    ),
+                    cache_key.kwargs.get("is_train", False),
+                )
+            )
+        except Exception:
+            return
+
+        self._shape_trace_counts[signature] += 1
+        if self._shape_trace_counts[signature] == MAX_TRACED_PROGRAM_COUNT + 1:
+            logging_utils.warn(
+                "Function `{}` has been traced {} times for inputs only differ in shapes, "
+                "the cost of retracing may be significant. Please consider specifying `input_spec` "
+                "with None in dynamic dimensions in `paddle.jit.to_static`.".format(
+                    cache_key.function_spec._dygraph_function.__name__,
+                    self._shape_trace_counts[signature],
+                )
+            )
+
     def __getitem__(self, item):
         if not isinstance(item, CacheKey):
             raise ValueError(
@@ -1199,7 +1341,12 @@ class ProgramCache:
         self._recent_cache_key = item
         self._recent_key = item_id
         if item_id not in self._caches:
+            self._misses += 1
+            start_time = time.time()
             self._caches[item_id] = self._build_once(item)
+            self._trace_time += time.time() - start_time
+            self._check_retrace(item)
+            self._evict()
             # Note: raise warnings if number of traced program is more than `max_tracing_count`
             current_tracing_count = len(self._caches)
             if current_tracing_count > MAX_TRACED_PROGRAM_COUNT:
@@ -1209,9 +1356,30 @@ class ProgramCache:
                         current_tracing_count, MAX_TRACED_PROGRAM_COUNT
                     )
                 )
+        else:
+            self._hits += 1
+            self._caches.move_to_end(item_id)
 
         return self._caches[item_id]
 
+    def cache_info(self):
+        """
+        Returns the statistics of the cache.
+
+        Returns:
+            ProgramCacheInfo: a namedtuple of `hits`, `misses`, `evictions`,
+                `capacity`, `size` and `trace_time`, `trace_time` is the total
+                seconds spent on tracing programs for cache misses.
+        """
+        return ProgramCacheInfo(
+            self._hits,
+            self._misses,
+            self._evictions,
+            self._capacity,
+            len(self._caches),
+            self._trace_time,
+        )
+
     def get_program(self, item):
         if not isinstance(item, CacheKey):
             raise ValueError(
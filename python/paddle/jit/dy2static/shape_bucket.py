@@ -0,0 +1,216 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import paddle
+from paddle.fluid import core
+
+__all__ = []
+
+POW2_BUCKET = 'pow2'
+
+
+def check_shape_buckets(shape_buckets):
+    """
+    Verifies `shape_buckets` of `paddle.jit.to_static`, which maps an axis of
+    input Tensors to the bucket policy of the axis, the policy can be
+    'pow2', a list of bucket sizes or a callable mapping a size to the
+    bucketed size.
+    """
+    if shape_buckets is None:
+        return None
+    if not isinstance(shape_buckets, dict):
+        raise TypeError(
+            "The type of `shape_buckets` should be dict, but received {}.".format(
+                type(shape_buckets).__name__
+            )
+        )
+    checked = {}
+    for axis, buckets in shape_buckets.items():
+        if not isinstance(axis, int):
+            raise TypeError(
+                "The keys of `shape_buckets` should be int axes, but received {}.".format(
+                    type(axis).__name__
+                )
+            )
+        if isinstance(buckets, (list, tuple)):
+            if len(buckets) == 0 or not all(
+                isinstance(b, int) and b > 0 for b in buckets
+            ):
+                raise ValueError(
+                    "The buckets of axis {} should be a non-empty list of positive int, but received {}.".format(
+                        axis, buckets
+                    )
+                )
+            buckets = sorted(buckets)
+        elif buckets != POW2_BUCKET and not callable(buckets):
+            raise ValueError(
+                "The bucket policy of axis {} should be '{}', a list of int or a callable, but received {}.".format(
+                    axis, POW2_BUCKET, buckets
+                )
+            )
+        checked[axis] = buckets
+    return checked
+
+
+def check_bucket_outputs(bucket_outputs, shape_buckets):
+    """
+    Verifies `bucket_outputs` of `paddle.jit.to_static`, which maps the index
+    of a Tensor in the flattened outputs to a dict from an axis in
+    `shape_buckets` to the axis of the output sliced back.
+    """
+    if bucket_outputs is None:
+        return None
+    if shape_buckets is None:
+        raise ValueError(
+            "`bucket_outputs` should be used together with `shape_buckets`."
+        )
+    if not isinstance(bucket_outputs, dict):
+        raise TypeError(
+            "The type of `bucket_outputs` should be dict, but received {}.".format(
+                type(bucket_outputs).__name__
+            )
+        )
+    for index, axes in bucket_outputs.items():
+        if not isinstance(index, int) or not isinstance(axes, dict):
+            raise TypeError(
+                "`bucket_outputs` should map int output indices to dicts of axes, but received {}: {}.".format(
+                    index, axes
+                )
+            )
+        for axis, out_axis in axes.items():
+            if axis not in shape_buckets or not isinstance(out_axis, int):
+                raise ValueError(
+                    "The axes of output {} should map an axis in `shape_buckets` {} to an int axis, but received {}.".format(
+                        index, list(shape_buckets.keys()), axes
+                    )
+                )
+    return bucket_outputs
+
+
+def bucket_size(size, buckets):
+    """
+    Returns the bucketed size of `size`, which is not less than `size`.
+    """
+    if buckets == POW2_BUCKET:
+        return 1 << max(size - 1, 0).bit_length()
+    if callable(buckets):
+        bucketed = int(buckets(size))
+        if bucketed < size:
+            raise ValueError(
+                "The bucketed size {} should not be less than the size {}.".format(
+                    bucketed, size
+                )
+            )
+        return bucketed
+    for bucket in buckets:
+        if bucket >= size:
+            return bucket
+    # larger than all buckets, keep the size unchanged
+    return size
+
+
+def _is_tensor(x):
+    return isinstance(x, (core.VarBase, core.eager.Tensor))
+
+
+def _pad_tensor(x, axis, size):
+    pad_shape = list(x.shape)
+    pad_shape[axis] = size - x.shape[axis]
+    padding = paddle.zeros(pad_shape, dtype=x.dtype)
+    out = paddle.concat([x, padding], axis=axis)
+    out.stop_gradient = x.stop_gradient
+    return out
+
+
+def pad_inputs(args, kwargs, shape_buckets):
+    """
+    Pads the Tensors in inputs with zeros along the axes in `shape_buckets`
+    up to the bucketed sizes.
+
+    Returns:
+        tuple: padded args and kwargs, and a dict mapping each axis in
+            `shape_buckets` to `(padded_size, origin_size)` of the first
+            Tensor padded on the axis, which is used to slice the outputs
+            back.
+    """
+    padded_sizes = {}
+
+    def pad(x):
+        if not _is_tensor(x):
+            return x
+        for bucket_axis, buckets in shape_buckets.items():
+            ndim = len(x.shape)
+            if bucket_axis >= ndim or bucket_axis < -ndim:
+                continue
+            axis = bucket_axis % ndim
+            size = x.shape[axis]
+            if size < 0:
+                continue
+            bucketed = bucket_size(size, buckets)
+            padded_sizes.setdefault(bucket_axis, (bucketed, size))
+            if bucketed != size:
+                x = _pad_tensor(x, axis, bucketed)
+        return x
+
+    flat_args = paddle.utils.flatten(args)
+    args = paddle.utils.pack_sequence_as(args, [pad(x) for x in flat_args])
+    if kwargs:
+        flat_kwargs = paddle.utils.flatten(kwargs)
+        kwargs = paddle.utils.pack_sequence_as(
+            kwargs, [pad(x) for x in flat_kwargs]
+        )
+    return args, kwargs, padded_sizes
+
+
+def slice_outputs(outputs, padded_sizes, bucket_outputs):
+    """
+    Slices the Tensors in outputs declared in `bucket_outputs` back to the
+    origin sizes along their axes of the padded axes, other outputs are
+    returned as they are.
+    """
+    if not bucket_outputs:
+        return outputs
+
+    flat_outputs = paddle.utils.flatten(outputs)
+    for index, axes in bucket_outputs.items():
+        if index >= len(flat_outputs) or index < -len(flat_outputs):
+            raise ValueError(
+                "The output {} in `bucket_outputs` is out of the range of {} outputs.".format(
+                    index, len(flat_outputs)
+                )
+            )
+        x = flat_outputs[index]
+        if not _is_tensor(x):
+            raise TypeError(
+                "The output {} in `bucket_outputs` should be a Tensor, but received {}.".format(
+                    index, type(x).__name__
+                )
+            )
+        for bucket_axis, out_axis in axes.items():
+            padded, origin = padded_sizes.get(bucket_axis, (None, None))
+            if padded == origin:
+                continue
+            out_axis = out_axis % len(x.shape)
+            if x.shape[out_axis] != padded:
+                raise ValueError(
+                    "The size of axis {} of output {} should be the padded size {}, but received {}.".format(
+                        out_axis, index, padded, x.shape[out_axis]
+                    )
+                )
+            x = paddle.slice(x, axes=[out_axis], starts=[0], ends=[origin])
+        flat_outputs[index] = x
+
+    if _is_tensor(outputs):
+        return flat_outputs[0]
+    return paddle.utils.pack_sequence_as(outputs, flat_outputs)
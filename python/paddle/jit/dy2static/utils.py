@@ -561,7 +561,6 @@ def ast_to_func(ast_root, dyfunc, delete_on_exit=True):
         encoding='utf-8',
     )
     with f:
-        module_name = os.path.basename(f.name[:-3])
         f.write(source)
 
     global DEL_TEMP_DIR
@@ -570,8 +569,17 @@ def ast_to_func(ast_root, dyfunc, delete_on_exit=True):
         atexit.register(remove_if_exit, dir_path=temp_dir)
         DEL_TEMP_DIR = False
 
+    callable_func = source_file_to_func(f.name, dyfunc)
+    return callable_func, f.name
+
+
+def source_file_to_func(file_path, dyfunc):
+    """
+    Load the transformed function of `dyfunc` from the python source file.
+    """
     func_name = dyfunc.__name__
-    loader = SourceFileLoader(module_name, f.name)
+    module_name = os.path.basename(file_path)[:-3]
+    loader = SourceFileLoader(module_name, file_path)
     spec = importlib.util.spec_from_loader(loader.name, loader)
     module = importlib.util.module_from_spec(spec)
     loader.exec_module(module)
@@ -592,7 +600,7 @@ def ast_to_func(ast_root, dyfunc, delete_on_exit=True):
     # Recovers the necessary variables by `__globals__`.
     recover_globals_attribute(dyfunc, callable_func)
 
-    return callable_func, f.name
+    return callable_func
 
 
 def _inject_import_statements():
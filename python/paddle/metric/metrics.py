@@ -30,6 +30,104 @@ def _is_numpy_(var):
     return isinstance(var, (np.ndarray, np.generic))
 
 
+def _preds_labels_to_numpy(preds, labels):
+    if isinstance(preds, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
+        preds = preds.numpy()
+    elif not _is_numpy_(preds):
+        raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
+
+    if isinstance(labels, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
+        labels = labels.numpy()
+    elif not _is_numpy_(labels):
+        raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
+    return preds, labels
+
+
+def _confusion_counts(preds, labels, thresholds, num_classes):
+    """
+    Count the true positives, false positives and false negatives. For
+    binary classification, the counts are of each threshold, the predictions
+    not less than the threshold are positive. For multi-class classification,
+    the counts are of each class, the class with the max score is predicted.
+    """
+    if num_classes is None:
+        labels = labels.reshape(-1) == 1
+        pos = preds.reshape(-1, 1) >= thresholds.reshape(1, -1)
+        tp = np.count_nonzero(pos & labels[:, np.newaxis], axis=0)
+        fp = np.count_nonzero(pos, axis=0) - tp
+        fn = np.count_nonzero(labels) - tp
+        shape = thresholds.shape
+        return tp.reshape(shape), fp.reshape(shape), fn.reshape(shape)
+
+    preds = preds.reshape(-1, num_classes).argmax(axis=-1)
+    if labels.ndim > 1 and labels.shape[-1] == num_classes:
+        # one-hot label
+        labels = labels.reshape(-1, num_classes).argmax(axis=-1)
+    labels = labels.reshape(-1).astype('int64')
+    tp = np.bincount(labels[preds == labels], minlength=num_classes)
+    fp = np.bincount(preds, minlength=num_classes) - tp
+    fn = np.bincount(labels, minlength=num_classes) - tp
+    return tp, fp, fn
+
+
+def _safe_divide(x, y):
+    return np.where(y > 0, x / np.maximum(y, 1), 0.0)
+
+
+def _average(x, y, num_classes, average):
+    """
+    Compute x / y (0 if y is 0), averaged over the classes in multi-class
+    classification by the `average` mode.
+    """
+    if num_classes is not None and average == 'micro':
+        x, y = x.sum(), y.sum()
+    result = _safe_divide(x.astype('float64'), y)
+    if num_classes is not None and average == 'macro':
+        result = result.mean()
+    return float(result) if result.ndim == 0 else result.tolist()
+
+
+def _check_mergeable(metric, other, attrs):
+    if type(other) is not type(metric):
+        raise TypeError(
+            "The metric to be merged must be a {}, but received {}.".format(
+                type(metric).__name__, type(other).__name__
+            )
+        )
+    for attr in attrs:
+        if not np.array_equal(getattr(metric, attr), getattr(other, attr)):
+            raise ValueError(
+                "Only {} with the same {} can be merged.".format(
+                    type(metric).__name__, attr.lstrip('_')
+                )
+            )
+
+
+def _all_reduce_states(states, group=None):
+    """
+    Sum the numpy states over all the ranks in the group by one all_reduce.
+    """
+    import paddle.distributed as dist
+
+    flat = np.concatenate(
+        [np.asarray(s, dtype='float64').reshape(-1) for s in states]
+    )
+    flat_tensor = paddle.to_tensor(flat, dtype='float64')
+    dist.all_reduce(flat_tensor, group=group)
+    flat = flat_tensor.numpy()
+    results = []
+    offset = 0
+    for s in states:
+        size = np.size(s)
+        results.append(
+            flat[offset : offset + size]
+            .reshape(np.shape(s))
+            .astype(np.asarray(s).dtype)
+        )
+        offset += size
+    return results
+
+
 class Metric(metaclass=abc.ABCMeta):
     r"""
     Base class for metric, encapsulates metric logic and APIs
@@ -183,6 +281,36 @@ class Metric(metaclass=abc.ABCMeta):
         """
         return args
 
+    def merge(self, other):
+        """
+        Merge the states of another metric of the same type and configuration
+        into this one, e.g. the metric updated by another shard of the data.
+
+        Args:
+            other (Metric): The metric to be merged.
+        """
+        raise NotImplementedError(
+            "function 'merge' not implemented in {}.".format(
+                self.__class__.__name__
+            )
+        )
+
+    def all_reduce(self, group=None):
+        """
+        Combine the states of all the ranks in the communication group, so
+        that :code:`accumulate` returns the metric over the data of all the
+        ranks. Only supported in dynamic graph mode.
+
+        Args:
+            group (Group, optional): The communication group. Default is None,
+                which means the global group.
+        """
+        raise NotImplementedError(
+            "function 'all_reduce' not implemented in {}.".format(
+                self.__class__.__name__
+            )
+        )
+
 
 class Accuracy(Metric):
     """
@@ -293,13 +421,17 @@ class Accuracy(Metric):
         """
         if isinstance(correct, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
             correct = correct.numpy()
+        correct = np.asarray(correct)
         num_samples = np.prod(np.array(correct.shape[:-1]))
-        accs = []
-        for i, k in enumerate(self.topk):
-            num_corrects = correct[..., :k].sum()
-            accs.append(float(num_corrects) / num_samples)
-            self.total[i] += num_corrects
-            self.count[i] += num_samples
+        # the correct count of top-k is the sum of the first k columns
+        num_corrects = (
+            correct.reshape(-1, correct.shape[-1])
+            .sum(axis=0, dtype='float64')
+            .cumsum()[np.asarray(self.topk) - 1]
+        )
+        self.total += num_corrects
+        self.count += num_samples
+        accs = [float(n) / num_samples for n in num_corrects]
         accs = accs[0] if len(self.topk) == 1 else accs
         return accs
 
@@ -307,20 +439,43 @@ class Accuracy(Metric):
         """
         Resets all of the metric state.
         """
-        self.total = [0.0] * len(self.topk)
-        self.count = [0] * len(self.topk)
+        self.total = np.zeros(len(self.topk), dtype='float64')
+        self.count = np.zeros(len(self.topk), dtype='int64')
 
     def accumulate(self):
         """
         Computes and returns the accumulated metric.
         """
-        res = []
-        for t, c in zip(self.total, self.count):
-            r = float(t) / c if c > 0 else 0.0
-            res.append(r)
+        res = _safe_divide(self.total, self.count).tolist()
         res = res[0] if len(self.topk) == 1 else res
         return res
 
+    def merge(self, other):
+        """
+        Merge the states of another Accuracy metric into this one.
+
+        Args:
+            other (Accuracy): The metric to be merged, which should be created
+                with the same `topk`.
+        """
+        _check_mergeable(self, other, ['topk'])
+        self.total += other.total
+        self.count += other.count
+
+    def all_reduce(self, group=None):
+        """
+        Sum the states of all the ranks in the communication group, so that
+        :code:`accumulate` returns the metric over the data of all the ranks.
+        Only supported in dynamic graph mode.
+
+        Args:
+            group (Group, optional): The communication group. Default is None,
+                which means the global group.
+        """
+        self.total, self.count = _all_reduce_states(
+            [self.total, self.count], group
+        )
+
     def _init_name(self, name):
         name = name or 'acc'
         if self.maxk != 1:
@@ -341,12 +496,26 @@ class Precision(Metric):
     relevant instances among the retrieved instances. Refer to
     https://en.wikipedia.org/wiki/Evaluation_of_binary_classifiers
 
-    Noted that this class manages the precision score only for binary
-    classification task.
+    The states are counted with vectorized NumPy operations, binary
+    classification with one or more thresholds and multi-class classification
+    are supported.
 
     Args:
         name (str, optional): String name of the metric instance.
             Default is `precision`.
+        threshold (float|list[float], optional): The predictions not less
+            than the threshold are positive in binary classification. If it's
+            a list, the metric of each threshold is computed and returned as
+            a list. Default is 0.5.
+        num_classes (int, optional): The number of classes in multi-class
+            classification, where `preds` is the scores of each class and the
+            class with the max score is predicted. Default is None, which means
+            binary classification.
+        average (str|None, optional): How the metric of multi-class
+            classification is averaged over the classes, 'macro' for the mean
+            of the metric of each class, 'micro' for the metric of the total
+            counts of all the classes, or None to return the metric of each
+            class as a list. Default is 'macro'.
 
     Example by standalone:
 
@@ -363,6 +532,19 @@ class Precision(Metric):
           res = m.accumulate()
           print(res) # 1.0
 
+          m = paddle.metric.Precision(threshold=[0.3, 0.55])
+          m.update(x, y)
+          res = m.accumulate()
+          print(res) # [1.0, 1.0]
+
+          x = np.array([[0.1, 0.9], [0.8, 0.2], [0.3, 0.7]])
+          y = np.array([1, 1, 0])
+
+          m = paddle.metric.Precision(num_classes=2, average=None)
+          m.update(x, y)
+          res = m.accumulate()
+          print(res) # [0.0, 0.5]
+
 
     Example with Model API:
 
@@ -401,62 +583,98 @@ class Precision(Metric):
           model.fit(data, batch_size=16)
     """
 
-    def __init__(self, name='precision', *args, **kwargs):
+    def __init__(
+        self,
+        name='precision',
+        threshold=0.5,
+        num_classes=None,
+        average='macro',
+        *args,
+        **kwargs
+    ):
         super().__init__(*args, **kwargs)
-        self.tp = 0  # true positive
-        self.fp = 0  # false positive
+        if average not in ['macro', 'micro', None]:
+            raise ValueError(
+                "The average must be 'macro', 'micro' or None, but received {}.".format(
+                    average
+                )
+            )
+        self._threshold = np.asarray(threshold, dtype='float64')
+        self._num_classes = num_classes
+        self._average = average
         self._name = name
+        self.reset()
 
     def update(self, preds, labels):
         """
         Update the states based on the current mini-batch prediction results.
 
         Args:
-            preds (numpy.ndarray): The prediction result, usually the output
-                of two-class sigmoid function. It should be a vector (column
-                vector or row vector) with data type: 'float64' or 'float32'.
-            labels (numpy.ndarray): The ground truth (labels),
-                the shape should keep the same as preds.
-                The data type is 'int32' or 'int64'.
-        """
-        if isinstance(preds, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
-            preds = preds.numpy()
-        elif not _is_numpy_(preds):
-            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
-
-        if isinstance(labels, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
-            labels = labels.numpy()
-        elif not _is_numpy_(labels):
-            raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
-
-        sample_num = labels.shape[0]
-        preds = np.floor(preds + 0.5).astype("int32")
+            preds (numpy.ndarray|Tensor): The prediction results. In binary
+                classification, it's usually the output of two-class sigmoid
+                function, in the shape of [batch_size] or [batch_size, 1].
+                In multi-class classification, it's the scores of each class
+                in the shape of [batch_size, num_classes].
+            labels (numpy.ndarray|Tensor): The ground truth (labels) in the
+                shape of [batch_size] or [batch_size, 1], the positive label
+                is 1 in binary classification. One-hot labels in the shape
+                of [batch_size, num_classes] are also supported in
+                multi-class classification.
+        """
+        preds, labels = _preds_labels_to_numpy(preds, labels)
+        tp, fp, fn = _confusion_counts(
+            preds, labels, self._threshold, self._num_classes
+        )
+        self.tp += tp
+        self.fp += fp
 
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if pred == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fp += 1
+    def _state_shape(self):
+        if self._num_classes is None:
+            return self._threshold.shape
+        return (self._num_classes,)
 
     def reset(self):
         """
         Resets all of the metric state.
         """
-        self.tp = 0
-        self.fp = 0
+        self.tp = np.zeros(self._state_shape(), dtype='int64')  # true positive
+        self.fp = np.zeros(self._state_shape(), dtype='int64')  # false positive
 
     def accumulate(self):
         """
         Calculate the final precision.
 
         Returns:
-            A scaler float: results of the calculated precision.
+            A scaler float: results of the calculated precision, or a list
+            of them for each threshold or class.
+        """
+        return _average(
+            self.tp, self.tp + self.fp, self._num_classes, self._average
+        )
+
+    def merge(self, other):
         """
-        ap = self.tp + self.fp
-        return float(self.tp) / ap if ap != 0 else 0.0
+        Merge the states of another Precision metric into this one.
+
+        Args:
+            other (Precision): The metric to be merged, which should be created
+                with the same `threshold` and `num_classes`.
+        """
+        _check_mergeable(self, other, ['_threshold', '_num_classes'])
+        self.tp += other.tp
+        self.fp += other.fp
+
+    def all_reduce(self, group=None):
+        """
+        Sum the states of all the ranks in the communication group, so that
+        :code:`accumulate` returns the metric over the data of all the ranks.
+        Only supported in dynamic graph mode.
+
+        Args:
+            group (Group, optional): The communication group. Default is None,
+                which means the global group.
+        """
+        self.tp, self.fp = _all_reduce_states([self.tp, self.fp], group)
 
     def name(self):
         """
@@ -474,12 +692,26 @@ class Recall(Metric):
     Refer to:
     https://en.wikipedia.org/wiki/Precision_and_recall
 
-    Noted that this class manages the recall score only for
-    binary classification task.
+    The states are counted with vectorized NumPy operations, binary
+    classification with one or more thresholds and multi-class classification
+    are supported.
 
     Args:
         name (str, optional): String name of the metric instance.
             Default is `recall`.
+        threshold (float|list[float], optional): The predictions not less
+            than the threshold are positive in binary classification. If it's
+            a list, the metric of each threshold is computed and returned as
+            a list. Default is 0.5.
+        num_classes (int, optional): The number of classes in multi-class
+            classification, where `preds` is the scores of each class and the
+            class with the max score is predicted. Default is None, which means
+            binary classification.
+        average (str|None, optional): How the metric of multi-class
+            classification is averaged over the classes, 'macro' for the mean
+            of the metric of each class, 'micro' for the metric of the total
+            counts of all the classes, or None to return the metric of each
+            class as a list. Default is 'macro'.
 
     Example by standalone:
 
@@ -496,6 +728,14 @@ class Recall(Metric):
           res = m.accumulate()
           print(res) # 2.0 / 3.0
 
+          x = np.array([[0.1, 0.9], [0.8, 0.2], [0.3, 0.7]])
+          y = np.array([1, 1, 0])
+
+          m = paddle.metric.Recall(num_classes=2, average=None)
+          m.update(x, y)
+          res = m.accumulate()
+          print(res) # [0.0, 0.5]
+
 
     Example with Model API:
 
@@ -534,62 +774,98 @@ class Recall(Metric):
           model.fit(data, batch_size=16)
     """
 
-    def __init__(self, name='recall', *args, **kwargs):
+    def __init__(
+        self,
+        name='recall',
+        threshold=0.5,
+        num_classes=None,
+        average='macro',
+        *args,
+        **kwargs
+    ):
         super().__init__(*args, **kwargs)
-        self.tp = 0  # true positive
-        self.fn = 0  # false negative
+        if average not in ['macro', 'micro', None]:
+            raise ValueError(
+                "The average must be 'macro', 'micro' or None, but received {}.".format(
+                    average
+                )
+            )
+        self._threshold = np.asarray(threshold, dtype='float64')
+        self._num_classes = num_classes
+        self._average = average
         self._name = name
+        self.reset()
 
     def update(self, preds, labels):
         """
         Update the states based on the current mini-batch prediction results.
 
         Args:
-            preds(numpy.array): prediction results of current mini-batch,
-                the output of two-class sigmoid function.
-                Shape: [batch_size, 1]. Dtype: 'float64' or 'float32'.
-            labels(numpy.array): ground truth (labels) of current mini-batch,
-                the shape should keep the same as preds.
-                Shape: [batch_size, 1], Dtype: 'int32' or 'int64'.
-        """
-        if isinstance(preds, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
-            preds = preds.numpy()
-        elif not _is_numpy_(preds):
-            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
-
-        if isinstance(labels, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
-            labels = labels.numpy()
-        elif not _is_numpy_(labels):
-            raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
-
-        sample_num = labels.shape[0]
-        preds = np.rint(preds).astype("int32")
-
-        for i in range(sample_num):
-            pred = preds[i]
-            label = labels[i]
-            if label == 1:
-                if pred == label:
-                    self.tp += 1
-                else:
-                    self.fn += 1
+            preds (numpy.ndarray|Tensor): The prediction results. In binary
+                classification, it's usually the output of two-class sigmoid
+                function, in the shape of [batch_size] or [batch_size, 1].
+                In multi-class classification, it's the scores of each class
+                in the shape of [batch_size, num_classes].
+            labels (numpy.ndarray|Tensor): The ground truth (labels) in the
+                shape of [batch_size] or [batch_size, 1], the positive label
+                is 1 in binary classification. One-hot labels in the shape
+                of [batch_size, num_classes] are also supported in
+                multi-class classification.
+        """
+        preds, labels = _preds_labels_to_numpy(preds, labels)
+        tp, fp, fn = _confusion_counts(
+            preds, labels, self._threshold, self._num_classes
+        )
+        self.tp += tp
+        self.fn += fn
 
     def accumulate(self):
         """
         Calculate the final recall.
 
         Returns:
-            A scaler float: results of the calculated Recall.
+            A scaler float: results of the calculated Recall, or a list of
+            them for each threshold or class.
         """
-        recall = self.tp + self.fn
-        return float(self.tp) / recall if recall != 0 else 0.0
+        return _average(
+            self.tp, self.tp + self.fn, self._num_classes, self._average
+        )
+
+    def _state_shape(self):
+        if self._num_classes is None:
+            return self._threshold.shape
+        return (self._num_classes,)
 
     def reset(self):
         """
         Resets all of the metric state.
         """
-        self.tp = 0
-        self.fn = 0
+        self.tp = np.zeros(self._state_shape(), dtype='int64')  # true positive
+        self.fn = np.zeros(self._state_shape(), dtype='int64')  # false negative
+
+    def merge(self, other):
+        """
+        Merge the states of another Recall metric into this one.
+
+        Args:
+            other (Recall): The metric to be merged, which should be created
+                with the same `threshold` and `num_classes`.
+        """
+        _check_mergeable(self, other, ['_threshold', '_num_classes'])
+        self.tp += other.tp
+        self.fn += other.fn
+
+    def all_reduce(self, group=None):
+        """
+        Sum the states of all the ranks in the communication group, so that
+        :code:`accumulate` returns the metric over the data of all the ranks.
+        Only supported in dynamic graph mode.
+
+        Args:
+            group (Group, optional): The communication group. Default is None,
+                which means the global group.
+        """
+        self.tp, self.fn = _all_reduce_states([self.tp, self.fn], group)
 
     def name(self):
         """
@@ -602,7 +878,9 @@ class Auc(Metric):
     """
     The auc metric is for binary classification.
     Refer to https://en.wikipedia.org/wiki/Receiver_operating_characteristic#Area_under_the_curve.
-    Please notice that the auc metric is implemented with python, which may be a little bit slow.
+    Statistics are bucketed with vectorized histogram operations, when the
+    inputs are Tensors the histogram is computed on the device of the inputs
+    and only the bucket counts are fetched.
 
     The `auc` function creates four local variables, `true_positives`,
     `true_negatives`, `false_positives` and `false_negatives` that are used to
@@ -620,6 +898,11 @@ class Auc(Metric):
             'ROC' or 'PR' for the Precision-Recall-curve. Default is 'ROC'.
         name (str, optional): String name of the metric instance. Default
             is `auc`.
+        exact (bool, optional): Whether to compute the exact ROC-AUC by
+            ranking all the predictions instead of discretizing them into
+            `num_thresholds` buckets. All the predictions are kept in host
+            memory in this mode, which is suitable for offline evaluation.
+            Default is False.
 
     "NOTE: only implement the ROC curve type via Python now."
 
@@ -681,52 +964,102 @@ class Auc(Metric):
     """
 
     def __init__(
-        self, curve='ROC', num_thresholds=4095, name='auc', *args, **kwargs
+        self,
+        curve='ROC',
+        num_thresholds=4095,
+        name='auc',
+        exact=False,
+        *args,
+        **kwargs
     ):
         super().__init__(*args, **kwargs)
         self._curve = curve
         self._num_thresholds = num_thresholds
-
-        _num_pred_buckets = num_thresholds + 1
-        self._stat_pos = np.zeros(_num_pred_buckets)
-        self._stat_neg = np.zeros(_num_pred_buckets)
+        self._exact = exact
         self._name = name
+        self.reset()
+
+    def _update_tensor(self, preds, labels):
+        # bucket on the device of the inputs, only the histograms are fetched
+        num_buckets = self._num_thresholds + 1
+        bin_idx = paddle.cast(preds[:, 1] * self._num_thresholds, 'int64')
+        labels = paddle.cast(paddle.reshape(labels, [-1]), 'float64')
+        stat_all = paddle.bincount(bin_idx, minlength=num_buckets).numpy()
+        stat_pos = paddle.bincount(
+            bin_idx, weights=labels, minlength=num_buckets
+        ).numpy()
+        assert stat_all.shape[0] == num_buckets
+        self._stat_pos += stat_pos
+        self._stat_neg += stat_all - stat_pos
 
     def update(self, preds, labels):
         """
         Update the auc curve with the given predictions and labels.
 
         Args:
-            preds (numpy.array): An numpy array in the shape of
-                (batch_size, 2), preds[i][j] denotes the probability of
+            preds (numpy.array|Tensor): An numpy array or Tensor in the shape
+                of (batch_size, 2), preds[i][j] denotes the probability of
                 classifying the instance i into the class j.
-            labels (numpy.array): an numpy array in the shape of
-                (batch_size, 1), labels[i] is either o or 1,
+            labels (numpy.array|Tensor): an numpy array or Tensor in the
+                shape of (batch_size, 1), labels[i] is either o or 1,
                 representing the label of the instance i.
         """
-        if isinstance(labels, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
-            labels = labels.numpy()
-        elif not _is_numpy_(labels):
+        is_tensor = (paddle.Tensor, paddle.fluid.core.eager.Tensor)
+        if not isinstance(labels, is_tensor) and not _is_numpy_(labels):
             raise ValueError("The 'labels' must be a numpy ndarray or Tensor.")
+        if not isinstance(preds, is_tensor) and not _is_numpy_(preds):
+            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
+
+        if (
+            not self._exact
+            and isinstance(preds, is_tensor)
+            and isinstance(labels, is_tensor)
+        ):
+            self._update_tensor(preds, labels)
+            return
 
-        if isinstance(preds, (paddle.Tensor, paddle.fluid.core.eager.Tensor)):
+        if isinstance(labels, is_tensor):
+            labels = labels.numpy()
+        if isinstance(preds, is_tensor):
             preds = preds.numpy()
-        elif not _is_numpy_(preds):
-            raise ValueError("The 'preds' must be a numpy ndarray or Tensor.")
 
-        for i, lbl in enumerate(labels):
-            value = preds[i, 1]
-            bin_idx = int(value * self._num_thresholds)
-            assert bin_idx <= self._num_thresholds
-            if lbl:
-                self._stat_pos[bin_idx] += 1.0
-            else:
-                self._stat_neg[bin_idx] += 1.0
+        labels = np.asarray(labels).reshape(-1).astype('bool')
+        values = np.asarray(preds)[:, 1]
+        if self._exact:
+            self._preds.append(values.astype('float64'))
+            self._labels.append(labels)
+            return
+
+        num_buckets = self._num_thresholds + 1
+        bin_idx = (values * self._num_thresholds).astype('int64')
+        assert bin_idx.size == 0 or bin_idx.max() <= self._num_thresholds
+        self._stat_pos += np.bincount(bin_idx[labels], minlength=num_buckets)
+        self._stat_neg += np.bincount(bin_idx[~labels], minlength=num_buckets)
 
     @staticmethod
     def trapezoid_area(x1, x2, y1, y2):
         return abs(x1 - x2) * (y1 + y2) / 2.0
 
+    def _exact_auc(self):
+        if len(self._preds) == 0:
+            return 0.0
+        preds = np.concatenate(self._preds)
+        labels = np.concatenate(self._labels)
+        tot_pos = float(labels.sum())
+        tot_neg = float(labels.size) - tot_pos
+        if tot_pos == 0.0 or tot_neg == 0.0:
+            return 0.0
+        # Mann-Whitney U statistic, tied predictions share their average rank
+        _, inverse, counts = np.unique(
+            preds, return_inverse=True, return_counts=True
+        )
+        ends = np.cumsum(counts)
+        avg_ranks = (ends - counts + 1 + ends) / 2.0
+        pos_rank_sum = avg_ranks[inverse][labels].sum()
+        return (pos_rank_sum - tot_pos * (tot_pos + 1) / 2.0) / (
+            tot_pos * tot_neg
+        )
+
     def accumulate(self):
         """
         Return the area (a float score) under auc curve
@@ -734,23 +1067,24 @@ class Auc(Metric):
         Return:
             float: the area under auc curve
         """
-        tot_pos = 0.0
-        tot_neg = 0.0
-        auc = 0.0
-
-        idx = self._num_thresholds
-        while idx >= 0:
-            tot_pos_prev = tot_pos
-            tot_neg_prev = tot_neg
-            tot_pos += self._stat_pos[idx]
-            tot_neg += self._stat_neg[idx]
-            auc += self.trapezoid_area(
-                tot_neg, tot_neg_prev, tot_pos, tot_pos_prev
-            )
-            idx -= 1
-
+        if self._exact:
+            return float(self._exact_auc())
+
+        # walk thresholds from high to low, as the cumulative sums
+        tot_pos = np.cumsum(self._stat_pos[::-1])
+        tot_neg = np.cumsum(self._stat_neg[::-1])
+        tot_pos_prev = np.concatenate(([0.0], tot_pos[:-1]))
+        tot_neg_prev = np.concatenate(([0.0], tot_neg[:-1]))
+        auc = self.trapezoid_area(
+            tot_neg, tot_neg_prev, tot_pos, tot_pos_prev
+        ).sum()
+
+        tot_pos = tot_pos[-1]
+        tot_neg = tot_neg[-1]
         return (
-            auc / tot_pos / tot_neg if tot_pos > 0.0 and tot_neg > 0.0 else 0.0
+            float(auc / tot_pos / tot_neg)
+            if tot_pos > 0.0 and tot_neg > 0.0
+            else 0.0
         )
 
     def reset(self):
@@ -760,6 +1094,60 @@ class Auc(Metric):
         _num_pred_buckets = self._num_thresholds + 1
         self._stat_pos = np.zeros(_num_pred_buckets)
         self._stat_neg = np.zeros(_num_pred_buckets)
+        self._preds = []
+        self._labels = []
+
+    def merge(self, other):
+        """
+        Merge the statistics of another Auc metric into this one, e.g. the
+        metric computed over another shard of the evaluation data.
+
+        Args:
+            other (Auc): The metric to be merged, which should be created
+                with the same `num_thresholds` and `exact`.
+        """
+        if not isinstance(other, Auc):
+            raise TypeError(
+                "The metric to be merged must be an Auc, but received {}.".format(
+                    type(other).__name__
+                )
+            )
+        if (
+            other._num_thresholds != self._num_thresholds
+            or other._exact != self._exact
+        ):
+            raise ValueError(
+                "Only Auc with the same num_thresholds and exact can be merged."
+            )
+        self._stat_pos += other._stat_pos
+        self._stat_neg += other._stat_neg
+        self._preds.extend(other._preds)
+        self._labels.extend(other._labels)
+
+    def all_reduce(self, group=None):
+        """
+        Sum the statistics of all the ranks in the communication group, so
+        that :code:`accumulate` returns the metric over the data of all the
+        ranks. Only supported in dynamic graph mode.
+
+        Args:
+            group (Group, optional): The communication group. Default is None,
+                which means the global group.
+        """
+        import paddle.distributed as dist
+
+        if self._exact:
+            states = []
+            dist.all_gather_object(
+                states, (self._preds, self._labels), group=group
+            )
+            self._preds = [p for state in states for p in state[0]]
+            self._labels = [lbl for state in states for lbl in state[1]]
+            return
+
+        self._stat_pos, self._stat_neg = _all_reduce_states(
+            [self._stat_pos, self._stat_neg], group
+        )
 
     def name(self):
         """
@@ -230,6 +230,61 @@ def _squared_l2_norm(x):
     return out
 
 
+def _can_coalesce(x):
+    # the dtypes and places supported by the coalesce_tensor op, shared by the
+    # flat buffers of gradient clipping and multi-tensor optimizers
+    if x.dtype in [core.VarDesc.VarType.FP32, core.VarDesc.VarType.FP64]:
+        return (
+            x.place.is_cpu_place()
+            or x.place.is_gpu_place()
+            or x.place.is_xpu_place()
+        )
+    if x.dtype == core.VarDesc.VarType.FP16:
+        return x.place.is_gpu_place() or x.place.is_xpu_place()
+    return False
+
+
+def _coalesce_grads(params_grads):
+    r"""
+    Copy the dense gradients to be clipped into a flat buffer of each place
+    and dtype with one coalesce_tensor op, so that the norm and the scaling
+    of gradients take a constant number of ops. Return the gradients in the
+    flat buffers as a dict by their indices in params_grads, and the flat
+    buffers. The gradients in params_grads are not changed.
+    """
+    if not in_dygraph_mode():
+        return {}, []
+    groups = {}
+    for i, (p, g) in enumerate(params_grads):
+        if g is None or getattr(p, 'need_clip', True) is False:
+            continue
+        if g.is_selected_rows() or not _can_coalesce(g):
+            continue
+        groups.setdefault((str(g.place), g.dtype), []).append(i)
+
+    fused_grads = {}
+    fused_buffers = []
+    for (_, dtype), indices in groups.items():
+        if len(indices) < 2:
+            continue
+        grads, fused_buffer = _C_ops.coalesce_tensor(
+            [params_grads[i][1] for i in indices],
+            dtype,
+            True,
+            False,
+            False,
+            0.0,
+            False,
+            -1,
+            -1,
+            [],
+            [],
+        )
+        fused_grads.update(zip(indices, grads))
+        fused_buffers.append(fused_buffer)
+    return fused_grads, fused_buffers
+
+
 class BaseErrorClipAttr:
     def __str__(self):
         raise NotImplementedError()
@@ -646,11 +701,15 @@ class ClipGradByGlobalNorm(ClipGradBase):
         sum_square_list = []
         sum_square_list_fp16 = []
         sum_square_list_fp32 = []
-        for p, g in params_grads:
+        fused_grads, fused_buffers = _coalesce_grads(params_grads)
+        merge_grads = list(fused_buffers)
+        for i, (p, g) in enumerate(params_grads):
             if g is None:
                 continue
             if getattr(p, 'need_clip', True) is False:
                 continue
+            if i in fused_grads:
+                continue
             merge_grad = g
 
             if in_dygraph_mode() and g.is_selected_rows():
@@ -660,7 +719,9 @@ class ClipGradByGlobalNorm(ClipGradBase):
             elif g.type == core.VarDesc.VarType.SELECTED_ROWS:
                 merge_grad = merge_selected_rows(g)
                 merge_grad = get_tensor_from_selected_rows(merge_grad)
+            merge_grads.append(merge_grad)
 
+        for merge_grad in merge_grads:
             sum_square = _squared_l2_norm(merge_grad)
             if (
                 sum_square.dtype == core.VarDesc.VarType.FP16
@@ -713,14 +774,26 @@ class ClipGradByGlobalNorm(ClipGradBase):
             need_clip = True
             clip_var = paddle.divide(x=max_global_norm, y=global_norm_var)
 
-        for p, g in params_grads:
+        if need_clip:
+            # the gradients in fused_grads share memory with the flat buffers
+            for fused_buffer in fused_buffers:
+                clip_input = (
+                    clip_var.astype(fused_buffer.dtype)
+                    if clip_var.dtype != fused_buffer.dtype
+                    else clip_var
+                )
+                _C_ops.multiply_(fused_buffer, clip_input)
+
+        for i, (p, g) in enumerate(params_grads):
             if g is None:
                 continue
             if getattr(p, 'need_clip', True) is False:
                 params_and_grads.append((p, g))
                 continue
             # TODO(wangxi): use inplace elementwise_mul
-            if need_clip:
+            if need_clip and i in fused_grads:
+                params_and_grads.append((p, fused_grads[i]))
+            elif need_clip:
                 clip_input = (
                     clip_var.astype(g.dtype)
                     if clip_var.dtype != g.dtype
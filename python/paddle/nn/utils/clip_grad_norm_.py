@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import paddle
+from paddle import _C_ops
+from paddle.nn.clip import _coalesce_grads
 
 __all__ = ['clip_grad_norm_']
 
@@ -68,11 +70,28 @@ def clip_grad_norm_(
     if norm_type not in support_norm_type:
         raise ValueError(f'norm_type only support {support_norm_type}')
 
+    parameters = list(parameters)
     grads = [p.grad for p in parameters if p.grad is not None]
     max_norm = float(max_norm)
     norm_type = float(norm_type)
     if len(grads) == 0:
         return paddle.to_tensor(0.0)
+
+    # NOTE: the gradients of each dtype are copied into a flat buffer, so
+    # that the norm and the scaling take a constant number of ops. The
+    # 0-norm counts the gradients with non-zero elements, which is computed
+    # for each gradient.
+    fused_grads, fused_buffers = {}, []
+    if norm_type != 0:
+        with paddle.no_grad():
+            fused_grads, fused_buffers = _coalesce_grads(
+                [(p, p.grad) for p in parameters]
+            )
+    grads = fused_buffers + [
+        p.grad
+        for i, p in enumerate(parameters)
+        if p.grad is not None and i not in fused_grads
+    ]
     if norm_type == float("inf"):
         norms = [g.detach().abs().max() for g in grads]
         total_norm = (
@@ -100,8 +119,15 @@ def clip_grad_norm_(
     # avoids the `if clip_coef < 1:` condition.
     clip_coef_clamped = paddle.clip(clip_coef, max=1.0)
     with paddle.no_grad():
-        for _, p in enumerate(parameters):
+        for fused_buffer in fused_buffers:
+            _C_ops.multiply_(
+                fused_buffer, clip_coef_clamped.astype(fused_buffer.dtype)
+            )
+        for i, p in enumerate(parameters):
             g = p.grad
-            if g is not None:
+            if i in fused_grads:
+                # copy the scaled gradient back from the flat buffer
+                p.grad = fused_grads[i]
+            elif g is not None:
                 p.grad = paddle.multiply(x=g, y=clip_coef_clamped)
     return total_norm
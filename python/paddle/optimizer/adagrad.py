@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import warnings
+from collections import defaultdict
+
+from paddle import _C_ops
 
 from ..fluid import framework
 from .optimizer import Optimizer
@@ -66,6 +69,8 @@ class Adagrad(Optimizer):
             The default value is None.
         initial_accumulator_value (float, optional): Initial value for moment accumulator.
             The default value is 0.0.
+        use_multi_tensor (bool, optional): Whether to use multi-tensor strategy to update all parameters at once,
+            which only takes effect in dygraph mode. Default is false.
 
     Examples:
         .. code-block:: python
@@ -115,6 +120,7 @@ class Adagrad(Optimizer):
         grad_clip=None,
         name=None,
         initial_accumulator_value=0.0,
+        use_multi_tensor=False,
     ):
         assert learning_rate is not None
         assert epsilon is not None
@@ -135,6 +141,10 @@ class Adagrad(Optimizer):
             'initial_accumulator_value': initial_accumulator_value,
         }
 
+        self._use_multi_tensor = use_multi_tensor
+        if self._use_multi_tensor:
+            self._flat_groups = defaultdict(list)
+
     def _create_accumulators(self, block, parameters):
         assert isinstance(block, framework.Block)
 
@@ -212,6 +222,43 @@ class Adagrad(Optimizer):
 
         return adagrad_op
 
+    def _multi_tensor_init(self, target_block, parameters, param_group_idx):
+        """
+        Create the accumulators and group the parameters of the same dtype,
+        place and learning rate, whose values and accumulators are updated as
+        flat buffers.
+
+        Args:
+            target_block: the block in which the loss tensor is present
+            parameters: list of parameter tensors for the optimizer
+        """
+        self._create_accumulators(target_block, parameters)
+        self._add_flat_groups(
+            parameters, param_group_idx, [self._moment_acc_str]
+        )
+
+    def _append_optimize_multi_tensor_op(
+        self, target_block, parameters_and_grads, param_group_idx
+    ):
+        """
+        For Multi Tensor, update the flat buffer of each parameter group by
+        one adagrad kernel.
+        """
+        self._append_flat_optimize_ops(
+            target_block, parameters_and_grads, param_group_idx
+        )
+
+    def _append_flat_optimize_op(self, target_block, group, grad):
+        _C_ops.adagrad_(
+            group.buffers['param'],
+            grad,
+            group.buffers[self._moment_acc_str],
+            self._create_param_lr((group.params[0], None)),
+            group.buffers.get('master_weight'),
+            self._epsilon,
+            group.find_master,
+        )
+
     def _update_param_group(self, parameters):
         self._epsilon = parameters.get('epsilon', self._default_dict['epsilon'])
         self.initial_accumulator_value = parameters.get(
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import warnings
+from collections import defaultdict
 
 from paddle import _C_ops
 
@@ -76,6 +77,8 @@ class Adamax(Optimizer):
             some derived class of ``GradientClipBase`` . There are three cliping strategies
             ( :ref:`api_fluid_clip_GradientClipByGlobalNorm` , :ref:`api_fluid_clip_GradientClipByNorm` ,
             :ref:`api_fluid_clip_GradientClipByValue` ). Default None, meaning there is no gradient clipping.
+        use_multi_tensor (bool, optional): Whether to use multi-tensor strategy to update all parameters at once,
+            which only takes effect in dygraph mode. Default is false.
         name (str, optional): Normally there is no need for user to set this property.
             For more information, please refer to :ref:`api_guide_Name`.
             The default value is None.
@@ -143,6 +146,7 @@ class Adamax(Optimizer):
         parameters=None,
         weight_decay=None,
         grad_clip=None,
+        use_multi_tensor=False,
         name=None,
     ):
         assert learning_rate is not None
@@ -175,6 +179,10 @@ class Adamax(Optimizer):
             'epsilon': epsilon,
         }
 
+        self._use_multi_tensor = use_multi_tensor
+        if self._use_multi_tensor:
+            self._flat_groups = defaultdict(list)
+
     def _add_moments_pows(self, p):
         acc_dtype = p.dtype
         if self._is_dtype_fp16_or_bf16(acc_dtype):
@@ -286,9 +294,79 @@ class Adamax(Optimizer):
 
             return adamax_op
 
+    def _multi_tensor_init(self, target_block, parameters, param_group_idx):
+        """
+        Create the accumulators and group the parameters of the same dtype,
+        place and learning rate, whose values and accumulators are updated as
+        flat buffers.
+
+        Args:
+            target_block: the block in which the loss tensor is present
+            parameters: list of parameter tensors for the optimizer
+        """
+        self._create_accumulators(target_block, parameters)
+        self._add_flat_groups(
+            parameters,
+            param_group_idx,
+            [
+                self._moment_acc_str,
+                self._inf_norm_acc_str,
+                self._beta1_pow_acc_str,
+            ],
+        )
+
+    def _append_optimize_multi_tensor_op(
+        self, target_block, parameters_and_grads, param_group_idx
+    ):
+        """
+        For Multi Tensor, update the flat buffer of each parameter group by
+        one adamax kernel.
+        """
+        self._append_flat_optimize_ops(
+            target_block, parameters_and_grads, param_group_idx
+        )
+
+    def _flatten_group(self, group):
+        super()._flatten_group(group)
+        # one adamax kernel takes one beta1 power for the whole group
+        beta1_pow = group.buffers[self._beta1_pow_acc_str].numpy()
+        group.fusable = bool((beta1_pow == beta1_pow[0]).all())
+
+    def _append_flat_optimize_op(self, target_block, group, grad):
+        beta1_pow_acc = group.buffers[self._beta1_pow_acc_str]
+        _C_ops.adamax_(
+            group.buffers['param'],
+            grad,
+            self._create_param_lr((group.params[0], None)),
+            group.buffers[self._moment_acc_str],
+            group.buffers[self._inf_norm_acc_str],
+            beta1_pow_acc._slice(0, 1),
+            group.buffers.get('master_weight'),
+            self._beta1,
+            self._beta2,
+            self._epsilon,
+            group.find_master,
+        )
+        _C_ops.scale_(beta1_pow_acc, self._beta1, 0.0, True)
+
+    def _append_unfused_optimize_ops(self, target_block, group, params_grads):
+        super()._append_unfused_optimize_ops(target_block, group, params_grads)
+        for param, _ in params_grads:
+            beta1_pow_acc = self._get_accumulator_master(
+                self._beta1_pow_acc_str, param
+            )
+            tmp = _C_ops.scale(beta1_pow_acc, self._beta1, 0.0, True)
+            beta1_pow_acc.copy_(tmp, False)
+        # the beta1 powers of the parameters without gradients fall behind
+        if group is not None and len(params_grads) < len(group.params):
+            group.fusable = False
+
     def _finish_update(self, block, parameters_and_grads):
         """Update Beta1 Power accumulator"""
         assert isinstance(block, framework.Block)
+        if self._flat_groups is not None and framework.in_dygraph_mode():
+            # updated with the parameters in multi tensor mode
+            return
         if isinstance(parameters_and_grads, list):
             for param, grad in parameters_and_grads:
                 if grad is None or param.stop_gradient is True:
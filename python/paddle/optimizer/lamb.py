@@ -12,6 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import defaultdict
+
+import numpy as np
+
+import paddle
 from paddle import _C_ops
 from paddle.fluid.executor import global_scope
 
@@ -71,6 +76,9 @@ class Lamb(Optimizer):
             ( :ref:`api_paddle_fluid_clip_ClipGradByGlobalNorm` , :ref:`api_paddle_fluid_clip_ClipGradByNorm` ,
             :ref:`api_paddle_fluid_clip_ClipGradByValue` ). If you want better convergence, it is recommended
             to use :ref:`api_paddle_fluid_clip_ClipGradByGlobalNorm` . Default None, meaning there is no gradient clipping.
+        multi_precision (bool, optional): Whether to use multi-precision during weight updating. Default is false.
+        use_multi_tensor (bool, optional): Whether to use multi-tensor strategy to update all parameters at once,
+            which only takes effect in dygraph mode. Default is false.
         name(str|None): For detailed information, please refer to
             :ref:`api_guide_Name` . Usually name is no need to set and None by default.
     Examples:
@@ -106,6 +114,7 @@ class Lamb(Optimizer):
         grad_clip=None,
         exclude_from_weight_decay_fn=None,
         multi_precision=False,
+        use_multi_tensor=False,
         name=None,
     ):
         assert learning_rate is not None
@@ -137,6 +146,10 @@ class Lamb(Optimizer):
         # TODO(zengjinle): expose API as soon as possible
         self._multi_precision = multi_precision
 
+        self._use_multi_tensor = use_multi_tensor
+        if self._use_multi_tensor:
+            self._flat_groups = defaultdict(list)
+
     def _get_parameter(self, name, scope=None):
         if scope is None:
             scope = global_scope()
@@ -219,13 +232,7 @@ class Lamb(Optimizer):
             self._beta2_pow_acc_str, param_and_grad[0]
         )
 
-        if (
-            self._exclude_from_weight_decay_fn is not None
-            and self._exclude_from_weight_decay_fn(param_and_grad[0])
-        ):
-            weight_decay = 0.0
-        else:
-            weight_decay = self._lamb_weight_decay
+        weight_decay = self._get_weight_decay(param_and_grad[0])
         lr = self._create_param_lr(param_and_grad)
 
         find_master = self._multi_precision and self._is_dtype_fp16_or_bf16(
@@ -300,6 +307,131 @@ class Lamb(Optimizer):
 
             return lamb_op
 
+    def _get_weight_decay(self, param):
+        if (
+            self._exclude_from_weight_decay_fn is not None
+            and self._exclude_from_weight_decay_fn(param)
+        ):
+            return 0.0
+        return self._lamb_weight_decay
+
+    def _multi_tensor_init(self, target_block, parameters, param_group_idx):
+        """
+        Create the accumulators and group the parameters of the same dtype,
+        place, learning rate and weight decay, whose values and accumulators
+        are updated as flat buffers.
+
+        Args:
+            target_block: the block in which the loss tensor is present
+            parameters: list of parameter tensors for the optimizer
+        """
+        self._create_accumulators(target_block, parameters)
+        self._add_flat_groups(
+            parameters,
+            param_group_idx,
+            [
+                self._moment1_acc_str,
+                self._moment2_acc_str,
+                self._beta1_pow_acc_str,
+                self._beta2_pow_acc_str,
+            ],
+            group_key=self._get_weight_decay,
+        )
+
+    def _append_optimize_multi_tensor_op(
+        self, target_block, parameters_and_grads, param_group_idx
+    ):
+        """
+        For Multi Tensor, update the flat buffers of each parameter group by
+        a constant number of ops, which compute the trust ratios of all the
+        parameters by segment sums.
+        """
+        self._append_flat_optimize_ops(
+            target_block, parameters_and_grads, param_group_idx
+        )
+
+    def _flatten_group(self, group):
+        super()._flatten_group(group)
+        numels = [p._numel() for p in group.params]
+        group.buffers['segment_ids'] = paddle.to_tensor(
+            np.repeat(np.arange(len(numels), dtype='int32'), numels),
+            place=group.params[0].place,
+        )
+        # the bias corrections are the same for the whole group
+        beta1_pow = group.buffers[self._beta1_pow_acc_str].numpy()
+        beta2_pow = group.buffers[self._beta2_pow_acc_str].numpy()
+        group.fusable = bool(
+            (beta1_pow == beta1_pow[0]).all()
+            and (beta2_pow == beta2_pow[0]).all()
+        )
+
+    def _append_flat_optimize_op(self, target_block, group, grad):
+        param = group.buffers['param']
+        moment1 = group.buffers[self._moment1_acc_str]
+        moment2 = group.buffers[self._moment2_acc_str]
+        beta1_pow_acc = group.buffers[self._beta1_pow_acc_str]
+        beta2_pow_acc = group.buffers[self._beta2_pow_acc_str]
+        segment_ids = group.buffers['segment_ids']
+        # compute in the dtype of the moments, which is float32 for float16
+        # and bfloat16 parameters
+        master_weight = (
+            group.buffers['master_weight'] if group.find_master else param
+        )
+        if master_weight.dtype != moment1.dtype:
+            master_weight = paddle.cast(master_weight, moment1.dtype)
+        if grad.dtype != moment1.dtype:
+            grad = paddle.cast(grad, moment1.dtype)
+        # the bias corrections are kept as tensors like the BetaPow inputs of
+        # lamb kernel, reading them to host would sync the device every step
+        bias_correction1 = 1.0 - beta1_pow_acc._slice(0, 1)
+        bias_correction2 = 1.0 - beta2_pow_acc._slice(0, 1)
+        weight_decay = self._get_weight_decay(group.params[0])
+
+        _C_ops.scale_(moment1, self._beta1, 0.0, True)
+        _C_ops.add_(moment1, _C_ops.scale(grad, 1.0 - self._beta1, 0.0, True))
+        _C_ops.scale_(moment2, self._beta2, 0.0, True)
+        _C_ops.add_(
+            moment2,
+            _C_ops.scale(_C_ops.square(grad), 1.0 - self._beta2, 0.0, True),
+        )
+        trust_ratio_div = (moment1 / bias_correction1) / (
+            paddle.sqrt(moment2 / bias_correction2) + self._epsilon
+        )
+        if weight_decay != 0.0:
+            trust_ratio_div += weight_decay * master_weight
+
+        param_norm = paddle.sqrt(
+            paddle.geometric.segment_sum(
+                paddle.square(master_weight), segment_ids
+            )
+        )
+        trust_ratio_div_norm = paddle.sqrt(
+            paddle.geometric.segment_sum(
+                paddle.square(trust_ratio_div), segment_ids
+            )
+        )
+        trust_ratio = paddle.where(
+            paddle.logical_and(param_norm > 0, trust_ratio_div_norm > 0),
+            param_norm / trust_ratio_div_norm,
+            paddle.ones_like(param_norm),
+        )
+        lr = self._create_param_lr((group.params[0], None))
+        _C_ops.subtract_(
+            master_weight,
+            paddle.gather(trust_ratio * lr, segment_ids) * trust_ratio_div,
+        )
+        if master_weight is not param:
+            _C_ops.assign_out_(paddle.cast(master_weight, param.dtype), param)
+
+        _C_ops.scale_(beta1_pow_acc, self._beta1, 0.0, True)
+        _C_ops.scale_(beta2_pow_acc, self._beta2, 0.0, True)
+
+    def _append_unfused_optimize_ops(self, target_block, group, params_grads):
+        super()._append_unfused_optimize_ops(target_block, group, params_grads)
+        # the beta powers of the parameters without gradients fall behind
+        if group is not None and len(params_grads) < len(group.params):
+            group.fusable = False
+
     def _update_param_group(self, parameters):
         self._beta1 = parameters.get('beta1', self._default_dict['beta1'])
         self._beta2 = parameters.get('beta2', self._default_dict['beta2'])
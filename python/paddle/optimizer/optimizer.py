@@ -88,6 +88,87 @@ def append_backward_new(
     return params_and_grads
 
 
+def _flatten_tensors(tensors):
+    """
+    Copy the tensors into one flat buffer and make each of them a view of its
+    slice of the buffer, so that an elementwise kernel on the buffer updates
+    all of them. Return the buffer.
+    """
+    buffer = paddle.concat([paddle.reshape(t, [-1]) for t in tensors])
+    offset = 0
+    for t in tensors:
+        numel = t._numel()
+        buffer._slice(offset, offset + numel)._share_buffer_to(t)
+        offset += numel
+    return buffer
+
+
+def _concat_grads(grads):
+    """
+    Copy the gradients into one flat tensor, with one coalesce_tensor op for
+    the dtypes and places it supports.
+    """
+    # lazy import to avoid circular import
+    from paddle.nn.clip import _can_coalesce
+
+    if not _can_coalesce(grads[0]):
+        return paddle.concat([paddle.reshape(g, [-1]) for g in grads])
+    _, fused_grad = _C_ops.coalesce_tensor(
+        grads, grads[0].dtype, True, False, False, 0.0, False, -1, -1, [], []
+    )
+    return fused_grad
+
+
+def _get_flat_view(params, tensors, attr):
+    """
+    Return the slice of a flat buffer in which the tensors lie one after
+    another, if the buffer and the offsets are recorded in the attribute attr
+    of the parameters, e.g. by DataParallel with flat buffers. Return None if
+    not, or if the tensors are no longer views of the buffer.
+    """
+    buffer, begin = getattr(params[0], attr, (None, 0))
+    if buffer is None or not buffer._is_initialized():
+        return None
+    base_ptr = buffer.data_ptr()
+    elem_size = core.size_of_dtype(buffer.dtype)
+    end = begin
+    for param, tensor in zip(params, tensors):
+        flat = getattr(param, attr, None)
+        if flat is None or flat[0] is not buffer or flat[1] != end:
+            return None
+        if tensor.data_ptr() != base_ptr + end * elem_size:
+            return None
+        end += tensor._numel()
+    if begin == 0 and end == buffer._numel():
+        return buffer
+    return buffer._slice(begin, end)
+
+
+class _FlatParamGroup:
+    """
+    The parameters of the same dtype, place and learning rate updated together
+    in the multi-tensor mode of dygraph. Their values, master weights and
+    accumulators are made the views of flat buffers by
+    Optimizer._flatten_group, so that the update of the group takes a
+    constant number of kernels.
+    """
+
+    def __init__(self, params, acc_strs):
+        self.params = params
+        self.acc_strs = acc_strs
+        self.buffers = {}
+        self.find_master = False
+        # False if the accumulators can not be updated by one kernel, such as
+        # the beta powers of the parameters are different
+        self.fusable = True
+        self.data_ptrs = None
+
+    def is_flat(self):
+        # the parameters stop being the views of the buffer if their memory
+        # is replaced, e.g. by Layer.to or by sharing the buffer of others
+        return self.data_ptrs == [p.data_ptr() for p in self.params]
+
+
 class Optimizer:
     r"""Optimizer Base class.
 
@@ -271,7 +352,11 @@ class Optimizer:
 
         # NOTE: Multi Tensor: Pass in all parameters and gradients to the op kernel of the Optimizer at one time for updating for dygraph mode.
         # Optimizer support list: [ paddle.optimizer.Momentum, paddle.optimizer.Adam].
+        # The optimizers without merged kernels, [ paddle.optimizer.Lamb, paddle.optimizer.RMSProp,
+        # paddle.optimizer.Adagrad, paddle.optimizer.Adadelta, paddle.optimizer.Adamax ], update the
+        # flat buffers of parameter groups instead, and set _flat_groups when multi tensor is used.
         self._use_multi_tensor = None
+        self._flat_groups = None
 
         self._param_dict = self._create_multi_tensor_dict()
         self._auxiliary_vars = {}
@@ -408,6 +493,13 @@ class Optimizer:
 
                 tensor.set(load_para_np, framework._current_expected_place())
 
+        # the loaded master weights and accumulators are not the views of the
+        # flat buffers, flatten the parameter groups again in the next step
+        if self._flat_groups is not None:
+            for groups in self._flat_groups.values():
+                for group in groups:
+                    group.data_ptrs = None
+
     def get_opti_var_name_list(self):
         return self._opti_name_list
 
@@ -888,11 +980,12 @@ class Optimizer:
 
         self._create_global_learning_rate()
 
-        # NOTE: Multi Tensor support [ Momentum, Adam ] for dygraph mode
-        if self._use_multi_tensor and self.__class__.__name__ in [
-            'Momentum',
-            'Adam',
-        ]:
+        # NOTE: Multi Tensor support [ Momentum, Adam ] for dygraph mode, and
+        # the optimizers updating flat buffers only for dygraph mode
+        if self._use_multi_tensor and (
+            self.__class__.__name__ in ['Momentum', 'Adam']
+            or (self._flat_groups is not None and in_dygraph_mode())
+        ):
             if (
                 len(self._param_dict['FP32_LODTensor'][param_group_idx]) == 0
                 and len(self._param_dict['FP16_LODTensor'][param_group_idx])
@@ -1580,6 +1673,173 @@ class Optimizer:
         """
         pass
 
+    @framework.dygraph_only
+    def _add_flat_groups(
+        self, parameters, param_group_idx, acc_strs, group_key=None
+    ):
+        """
+        For the optimizers updating flat buffers in multi tensor mode, group
+        the parameters by dtype, place and learning rate.
+
+        Args:
+            parameters: list of parameter tensors for the optimizer
+            param_group_idx: the index of the parameter group
+            acc_strs: names of the accumulators flattened with the parameters
+            group_key: a function returning the extra attribute a parameter
+                shares with its group, such as the weight decay of Lamb
+        """
+        groups = {}
+        for param in parameters:
+            if param.dtype == paddle.float32:
+                self._param_dict['FP32_LODTensor'][param_group_idx].append(
+                    param
+                )
+            elif self._is_dtype_fp16_or_bf16(param.dtype):
+                self._param_dict['FP16_LODTensor'][param_group_idx].append(
+                    param
+                )
+            else:
+                raise ValueError(
+                    "Now multi_tensor_{} only support fp32, fp16 or bf16 parameters.".format(
+                        self.type
+                    )
+                )
+            # a tensor of no elements can not be a slice of the flat buffer
+            if param._numel() == 0:
+                continue
+            param_lr = getattr(param, 'optimize_attr', {}).get(
+                'learning_rate', 1.0
+            )
+            # the parameters in different flat buffers of DataParallel are
+            # not grouped together, so that the groups reuse the buffers
+            flat_param = getattr(param, '_flat_param', None)
+            key = (
+                param.dtype,
+                str(param.place),
+                id(param_lr) if isinstance(param_lr, Variable) else param_lr,
+                id(flat_param[0]) if flat_param is not None else None,
+            )
+            if group_key is not None:
+                key += (group_key(param),)
+            groups.setdefault(key, []).append(param)
+        self._flat_groups[param_group_idx].extend(
+            _FlatParamGroup(params, acc_strs) for params in groups.values()
+        )
+
+    @framework.dygraph_only
+    def _flatten_group(self, group):
+        """
+        Make the parameters, master weights and accumulators of the group the
+        views of flat buffers, which are copied from their current values.
+        The parameters already in a flat buffer of DataParallel use its slice.
+        Subclasses check here whether the group can be updated by one kernel.
+        """
+        params = group.params
+        group.find_master = (
+            self._multi_precision
+            and self._is_dtype_fp16_or_bf16(params[0].dtype)
+        )
+        tensors = {}
+        param_buffer = _get_flat_view(params, params, '_flat_param')
+        if param_buffer is None:
+            tensors['param'] = params
+        if group.find_master:
+            tensors['master_weight'] = [
+                self._master_weights[p.name] for p in params
+            ]
+        for acc_str in group.acc_strs:
+            tensors[acc_str] = [
+                self._get_accumulator_master(acc_str, p) for p in params
+            ]
+        group.buffers = {
+            key: _flatten_tensors(value) for key, value in tensors.items()
+        }
+        if param_buffer is not None:
+            group.buffers['param'] = param_buffer
+        group.fusable = True
+        group.data_ptrs = [p.data_ptr() for p in params]
+
+    @framework.dygraph_only
+    def _append_flat_optimize_ops(
+        self, target_block, parameters_and_grads, param_group_idx
+    ):
+        """
+        For the optimizers updating flat buffers in multi tensor mode, update
+        each parameter group by _append_flat_optimize_op, or parameter by
+        parameter if the gradients of the group are missing or sparse.
+        """
+        if isinstance(parameters_and_grads, dict):
+            self._update_param_group(parameters_and_grads)
+            parameters_and_grads = parameters_and_grads['params']
+        grads = {
+            param.name: grad
+            for param, grad in parameters_and_grads
+            if grad is not None and not param.stop_gradient
+        }
+
+        found_inf = self._get_auxiliary_var('found_inf')
+        if found_inf:
+            if isinstance(found_inf, core.eager.Tensor):
+                self._set_auxiliary_var('found_inf', True)
+            return
+        if isinstance(found_inf, core.eager.Tensor):
+            self._set_auxiliary_var('found_inf', False)
+
+        for group in self._flat_groups[param_group_idx]:
+            group_grads = [grads.pop(p.name, None) for p in group.params]
+            dense = all(
+                grad is not None and not grad.is_selected_rows()
+                for grad in group_grads
+            )
+            if dense and not group.is_flat():
+                self._flatten_group(group)
+            if dense and group.fusable:
+                # the gradients in a flat buffer of DataParallel are not copied
+                grad = _get_flat_view(group.params, group_grads, '_flat_grad')
+                if grad is None:
+                    grad = _concat_grads(group_grads)
+                self._append_flat_optimize_op(target_block, group, grad)
+            else:
+                self._append_unfused_optimize_ops(
+                    target_block,
+                    group,
+                    [
+                        (param, grad)
+                        for param, grad in zip(group.params, group_grads)
+                        if grad is not None
+                    ],
+                )
+
+        # the parameters out of the groups, such as those without gradients
+        # when the groups are created
+        params_grads = [
+            (param, grad)
+            for param, grad in parameters_and_grads
+            if param.name in grads
+        ]
+        if params_grads:
+            self._create_accumulators(
+                target_block, [param for param, _ in params_grads]
+            )
+            self._append_unfused_optimize_ops(target_block, None, params_grads)
+
+    @framework.dygraph_only
+    def _append_flat_optimize_op(self, target_block, group, grad):
+        """
+        Update the flat buffers of the parameter group with the flat gradient.
+        This function will be overridden in the corresponding optimizer file.
+        """
+        pass
+
+    @framework.dygraph_only
+    def _append_unfused_optimize_ops(self, target_block, group, params_grads):
+        """
+        Update the parameters of the group, or out of the groups if group is
+        None, one by one.
+        """
+        for param_and_grad in params_grads:
+            self._append_optimize_op(target_block, param_and_grad)
+
     def _is_dtype_fp16_or_bf16(self, dtype):
         """
         check the dtype is fp16 or the dtype is bf16
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import warnings
+from collections import defaultdict
 
 from paddle import _C_ops
 
@@ -100,6 +101,8 @@ class RMSProp(Optimizer):
           some derived class of ``GradientClipBase`` . There are three cliping strategies
           ( :ref:`api_fluid_clip_GradientClipByGlobalNorm` , :ref:`api_fluid_clip_GradientClipByNorm` ,
           :ref:`api_fluid_clip_GradientClipByValue` ). Default None, meaning there is no gradient clipping.
+        use_multi_tensor (bool, optional): Whether to use multi-tensor strategy to update all parameters at once,
+          which only takes effect in dygraph mode. Default is false.
         name (str, optional): This parameter is used by developers to print debugging information.
           For details, please refer to :ref:`api_guide_Name`. Default is None.
 
@@ -156,6 +159,7 @@ class RMSProp(Optimizer):
         parameters=None,
         weight_decay=None,
         grad_clip=None,
+        use_multi_tensor=False,
         name=None,
     ):
         if learning_rate is None:
@@ -195,6 +199,10 @@ class RMSProp(Optimizer):
             'centered': centered,
         }
 
+        self._use_multi_tensor = use_multi_tensor
+        if self._use_multi_tensor:
+            self._flat_groups = defaultdict(list)
+
     def _create_accumulators(self, block, parameters):
         if not isinstance(block, framework.Block):
             raise TypeError("block is not instance of framework.Block.")
@@ -302,6 +310,54 @@ class RMSProp(Optimizer):
 
             return rmsprop_op
 
+    def _multi_tensor_init(self, target_block, parameters, param_group_idx):
+        """
+        Create the accumulators and group the parameters of the same dtype,
+        place and learning rate, whose values and accumulators are updated as
+        flat buffers.
+
+        Args:
+            target_block: the block in which the loss tensor is present
+            parameters: list of parameter tensors for the optimizer
+        """
+        self._create_accumulators(target_block, parameters)
+        self._add_flat_groups(
+            parameters,
+            param_group_idx,
+            [
+                self._momentum_acc_str,
+                self._mean_square_acc_str,
+                self._mean_grad_acc_str,
+            ],
+        )
+
+    def _append_optimize_multi_tensor_op(
+        self, target_block, parameters_and_grads, param_group_idx
+    ):
+        """
+        For Multi Tensor, update the flat buffer of each parameter group by
+        one rmsprop kernel.
+        """
+        self._append_flat_optimize_ops(
+            target_block, parameters_and_grads, param_group_idx
+        )
+
+    def _append_flat_optimize_op(self, target_block, group, grad):
+        _C_ops.rmsprop_(
+            group.buffers['param'],
+            group.buffers[self._mean_square_acc_str],
+            grad,
+            group.buffers[self._momentum_acc_str],
+            self._create_param_lr((group.params[0], None)),
+            group.buffers[self._mean_grad_acc_str],
+            group.buffers.get('master_weight'),
+            self._epsilon,
+            self._rho,
+            self._momentum,
+            self._centered,
+            group.find_master,
+        )
+
     def _update_param_group(self, parameters):
         self._epsilon = parameters.get('epsilon', self._default_dict['epsilon'])
         self._rho = parameters.get('rho', self._default_dict['rho'])
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import itertools
 import logging
 import multiprocessing
@@ -20,7 +21,7 @@ import sys
 import warnings
 from itertools import zip_longest
 from queue import Queue
-from threading import Thread
+from threading import Condition, Thread
 
 from paddle.fluid.reader import QUEUE_GET_TIMEOUT
 
@@ -403,7 +404,14 @@ class XmapEndSignal:
     pass
 
 
-def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
+def xmap_readers(
+    mapper,
+    reader,
+    process_num,
+    buffer_size,
+    order=False,
+    use_multiprocess=False,
+):
     """
     Use multi-threads to map samples from reader by a mapper defined by user.
 
@@ -414,11 +422,19 @@ def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
         buffer_size (int): size of the queue to read data in.
         order (bool): whether to keep the data order from original reader.
             Default False.
+        use_multiprocess (bool): whether to map samples in a pool of
+            ``process_num`` processes instead of threads, which is faster for
+            CPU-heavy mappers not releasing the GIL. In this case, ``mapper``
+            and the samples should be picklable, and the data order is always
+            kept. Default False.
 
     Returns:
         callable: a decorated reader with data mapping.
     """
     end = XmapEndSignal()
+    # the number of samples to yield that can be mapped ahead in order mode,
+    # which is unlimited like the queues if buffer_size is not positive
+    order_window = buffer_size if buffer_size > 0 else sys.maxsize
 
     # define a worker to read samples from reader to in_queue
     def read_worker(reader, in_queue):
@@ -446,24 +462,45 @@ def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
         out_queue.put(end)
 
     # define a worker to handle samples from in_queue by mapper
-    # and put mapped samples into out_queue by order
-    def order_handle_worker(in_queue, out_queue, mapper, out_order):
+    # and put mapped samples with their orders into out_queue, the samples
+    # are reordered by xreader
+    def order_handle_worker(in_queue, out_queue, mapper, out_order, cond):
         ins = in_queue.get()
         while not isinstance(ins, XmapEndSignal):
             order, sample = ins
             r = mapper(sample)
-            while order != out_order[0]:
-                pass
-            out_queue.put(r)
-            out_order[0] += 1
+            # block until the sample is in the window of samples to yield,
+            # which bounds the samples waiting to be reordered
+            with cond:
+                cond.wait_for(lambda: order < out_order[0] + order_window)
+            out_queue.put((order, r))
             ins = in_queue.get()
         in_queue.put(end)
         out_queue.put(end)
 
+    def order_xreader(out_queue, out_order, cond):
+        # reorder buffer of samples mapped before their preceding samples
+        reorder_buffer = {}
+        finish = 0
+        while finish < process_num:
+            ins = out_queue.get()
+            if isinstance(ins, XmapEndSignal):
+                finish += 1
+                continue
+            order, sample = ins
+            reorder_buffer[order] = sample
+            while out_order[0] in reorder_buffer:
+                sample = reorder_buffer.pop(out_order[0])
+                with cond:
+                    out_order[0] += 1
+                    cond.notify_all()
+                yield sample
+
     def xreader():
         in_queue = Queue(buffer_size)
         out_queue = Queue(buffer_size)
         out_order = [0]
+        cond = Condition()
         # start a read worker in a thread
         target = order_read_worker if order else read_worker
         t = Thread(target=target, args=(reader, in_queue))
@@ -472,7 +509,7 @@ def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
         # start several handle_workers
         target = order_handle_worker if order else handle_worker
         args = (
-            (in_queue, out_queue, mapper, out_order)
+            (in_queue, out_queue, mapper, out_order, cond)
             if order
             else (in_queue, out_queue, mapper)
         )
@@ -484,6 +521,10 @@ def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
         for w in workers:
             w.start()
 
+        if order:
+            yield from order_xreader(out_queue, out_order, cond)
+            return
+
         sample = out_queue.get()
         while not isinstance(sample, XmapEndSignal):
             yield sample
@@ -496,7 +537,23 @@ def xmap_readers(mapper, reader, process_num, buffer_size, order=False):
             else:
                 yield sample
 
-    return xreader
+    def multiprocess_xreader():
+        pool = fork_context.Pool(process_num)
+        try:
+            # results of at most buffer_size + process_num samples are pending
+            # to bound the memory, and they are yielded in order
+            pending = collections.deque()
+            for sample in reader():
+                pending.append(pool.apply_async(mapper, (sample,)))
+                if len(pending) >= buffer_size + process_num:
+                    yield pending.popleft().get()
+            while pending:
+                yield pending.popleft().get()
+        finally:
+            pool.terminate()
+            pool.join()
+
+    return multiprocess_xreader if use_multiprocess else xreader
 
 
 def multiprocess_reader(readers, use_pipe=True, queue_size=1000):
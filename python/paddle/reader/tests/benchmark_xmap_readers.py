@@ -0,0 +1,53 @@
+#   Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+
+import paddle.reader
+
+# Benchmark of the throughput of xmap_readers with and without order, which
+# is not run in the unit tests.
+
+
+class BenchmarkXmapReaders(unittest.TestCase):
+    def test_timeit_xmap(self):
+        def reader():
+            yield from range(2000)
+
+        def mapper(x):
+            # mapper releasing the GIL like IO or numpy
+            time.sleep(0.001)
+            return x
+
+        for thread_num in (1, 4, 16):
+            costs = []
+            for order in (False, True):
+                xreader = paddle.reader.xmap_readers(
+                    mapper, reader, thread_num, 64, order
+                )
+                start = time.time()
+                for _ in xreader():
+                    pass
+                costs.append(time.time() - start)
+            print(
+                "xmap_readers with {} threads: unordered {:.0f} samples/s, "
+                "ordered {:.0f} samples/s".format(
+                    thread_num, 2000 / costs[0], 2000 / costs[1]
+                )
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
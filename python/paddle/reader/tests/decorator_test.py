@@ -32,6 +32,10 @@ def reader_creator_10(dur):
     return reader
 
 
+def square_mapper(x):
+    return x * x
+
+
 class TestMap(unittest.TestCase):
     def test_map(self):
         d = {"h": 0, "i": 1}
@@ -152,6 +156,28 @@ class TestXmap(unittest.TestCase):
                         for idx, e in enumerate(result):
                             self.assertEqual(e, mapper(idx))
 
+    def test_xmap_multiprocess(self):
+        for order in (True, False):
+            for size in (1, 4):
+                reader = paddle.reader.xmap_readers(
+                    square_mapper, reader_creator_10(0), 4, size, order, True
+                )
+                for n in range(2):
+                    self.assertEqual(
+                        list(reader()), [square_mapper(i) for i in range(10)]
+                    )
+
+    def test_xmap_order_slow_mapper(self):
+        # later samples are mapped before earlier ones
+        def mapper(x):
+            time.sleep(0.01 * ((10 - x) % 4))
+            return x
+
+        reader = paddle.reader.xmap_readers(
+            mapper, reader_creator_10(0), 4, 2, True
+        )
+        self.assertEqual(list(reader()), list(range(10)))
+
 
 class TestMultiProcessReader(unittest.TestCase):
     def setup(self):
@@ -19,7 +19,10 @@ import numpy as np
 from PIL import Image
 
 import paddle
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import (
+    _check_exists_and_download,
+    _load_cached_arrays,
+)
 from paddle.io import Dataset
 
 __all__ = []
@@ -38,6 +41,25 @@ MODE_FLAG_MAP = {
 }
 
 
+class _Samples:
+    """
+    Read-only sequence of (image, label) samples, which are only paired
+    when indexed.
+    """
+
+    def __init__(self, images, labels):
+        self._images = images
+        self._labels = labels
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return _Samples(self._images[idx], self._labels[idx])
+        return self._images[idx], self._labels[idx]
+
+    def __len__(self):
+        return len(self._labels)
+
+
 class Cifar10(Dataset):
     """
     Implementation of `Cifar-10 <https://www.cs.toronto.edu/~kriz/cifar.html>`_
@@ -151,7 +173,21 @@ class Cifar10(Dataset):
         self.flag = MODE_FLAG_MAP[self.mode + '10']
 
     def _load_data(self):
-        self.data = []
+        # decoded images and labels are cached as .npy files and memory
+        # mapped, so that decoding is only done once and dataloader
+        # workers share the pages
+        self.images, self.labels = _load_cached_arrays(
+            [self.data_file],
+            [self.flag + '_images', self.flag + '_labels'],
+            self._decode_data,
+            'cifar',
+        )
+        # (image, label) samples, kept for compatibility
+        self.data = _Samples(self.images, self.labels)
+
+    def _decode_data(self):
+        images = []
+        labels = []
         with tarfile.open(self.data_file, mode='r') as f:
             names = (
                 each_item.name for each_item in f if self.flag in each_item.name
@@ -162,14 +198,16 @@ class Cifar10(Dataset):
             for name in names:
                 batch = pickle.load(f.extractfile(name), encoding='bytes')
 
-                data = batch[b'data']
-                labels = batch.get(b'labels', batch.get(b'fine_labels', None))
-                assert labels is not None
-                for sample, label in zip(data, labels):
-                    self.data.append((sample, label))
+                batch_labels = batch.get(
+                    b'labels', batch.get(b'fine_labels', None)
+                )
+                assert batch_labels is not None
+                images.append(np.asarray(batch[b'data'], dtype='uint8'))
+                labels.append(np.asarray(batch_labels, dtype='int64'))
+        return np.concatenate(images), np.concatenate(labels)
 
     def __getitem__(self, idx):
-        image, label = self.data[idx]
+        image, label = np.array(self.images[idx]), self.labels[idx]
         image = np.reshape(image, [3, 32, 32])
         image = image.transpose([1, 2, 0])
 
@@ -184,7 +222,7 @@ class Cifar10(Dataset):
         return image.astype(self.dtype), np.array(label).astype('int64')
 
     def __len__(self):
-        return len(self.data)
+        return len(self.labels)
 
 
 class Cifar100(Cifar10):
@@ -19,12 +19,38 @@ import numpy as np
 from PIL import Image
 
 import paddle
-from paddle.dataset.common import _check_exists_and_download
+from paddle.dataset.common import (
+    _check_exists_and_download,
+    _load_cached_arrays,
+)
 from paddle.io import Dataset
 
 __all__ = []
 
 
+class _FloatImages:
+    """
+    Read-only sequence of the images cached as uint8, each image is
+    converted to float32 when indexed, as the images of MNIST were kept as
+    float32 arrays before they were cached.
+    """
+
+    def __init__(self, images):
+        self._images = images
+
+    def __getitem__(self, idx):
+        images = self._images[idx]
+        if isinstance(idx, slice):
+            return _FloatImages(images)
+        return np.asarray(images, dtype='float32')
+
+    def __len__(self):
+        return len(self._images)
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self._images, dtype=dtype or 'float32')
+
+
 class MNIST(Dataset):
     """
     Implementation of `MNIST <http://yann.lecun.com/exdb/mnist/>`_ dataset.
@@ -167,58 +193,55 @@ class MNIST(Dataset):
 
         self.dtype = paddle.get_default_dtype()
 
-    def _parse_dataset(self, buffer_size=100):
-        self.images = []
-        self.labels = []
+    def _parse_dataset(self):
+        # decoded images and labels are cached as .npy files and memory
+        # mapped, so that decoding is only done once and dataloader
+        # workers share the pages, images are cached as uint8 and converted
+        # to float32 per sample
+        self._images, self.labels = _load_cached_arrays(
+            [self.image_path, self.label_path],
+            ['images_uint8', 'labels'],
+            self._decode_dataset,
+            self.NAME,
+        )
+        self.images = _FloatImages(self._images)
+
+    def _decode_dataset(self):
         with gzip.GzipFile(self.image_path, 'rb') as image_file:
             img_buf = image_file.read()
-            with gzip.GzipFile(self.label_path, 'rb') as label_file:
-                lab_buf = label_file.read()
-
-                step_label = 0
-                offset_img = 0
-                # read from Big-endian
-                # get file info from magic byte
-                # image file : 16B
-                magic_byte_img = '>IIII'
-                magic_img, image_num, rows, cols = struct.unpack_from(
-                    magic_byte_img, img_buf, offset_img
-                )
-                offset_img += struct.calcsize(magic_byte_img)
-
-                offset_lab = 0
-                # label file : 8B
-                magic_byte_lab = '>II'
-                magic_lab, label_num = struct.unpack_from(
-                    magic_byte_lab, lab_buf, offset_lab
-                )
-                offset_lab += struct.calcsize(magic_byte_lab)
-
-                while True:
-                    if step_label >= label_num:
-                        break
-                    fmt_label = '>' + str(buffer_size) + 'B'
-                    labels = struct.unpack_from(fmt_label, lab_buf, offset_lab)
-                    offset_lab += struct.calcsize(fmt_label)
-                    step_label += buffer_size
-
-                    fmt_images = '>' + str(buffer_size * rows * cols) + 'B'
-                    images_temp = struct.unpack_from(
-                        fmt_images, img_buf, offset_img
-                    )
-                    images = np.reshape(
-                        images_temp, (buffer_size, rows * cols)
-                    ).astype('float32')
-                    offset_img += struct.calcsize(fmt_images)
-
-                    for i in range(buffer_size):
-                        self.images.append(images[i, :])
-                        self.labels.append(
-                            np.array([labels[i]]).astype('int64')
-                        )
+        with gzip.GzipFile(self.label_path, 'rb') as label_file:
+            lab_buf = label_file.read()
+
+        # read from Big-endian
+        # get file info from magic byte
+        # image file : 16B
+        magic_byte_img = '>IIII'
+        magic_img, image_num, rows, cols = struct.unpack_from(
+            magic_byte_img, img_buf, 0
+        )
+        # label file : 8B
+        magic_byte_lab = '>II'
+        magic_lab, label_num = struct.unpack_from(magic_byte_lab, lab_buf, 0)
+
+        images = np.frombuffer(
+            img_buf,
+            dtype=np.uint8,
+            count=label_num * rows * cols,
+            offset=struct.calcsize(magic_byte_img),
+        )
+        images = images.reshape([label_num, rows * cols])
+        labels = np.frombuffer(
+            lab_buf,
+            dtype=np.uint8,
+            count=label_num,
+            offset=struct.calcsize(magic_byte_lab),
+        )
+        labels = labels.reshape([label_num, 1]).astype('int64')
+        return images, labels
 
     def __getitem__(self, idx):
-        image, label = self.images[idx], self.labels[idx]
+        image = np.array(self.images[idx], dtype='float32')
+        label = np.array(self.labels[idx])
         image = np.reshape(image, [28, 28])
 
         if self.backend == 'pil':
@@ -0,0 +1,52 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from test_hapi_async_save import build_model
+
+import paddle
+
+# Benchmark of the blocking time of Model.save with and without async_save,
+# which is not run in the unit tests.
+
+
+class BenchmarkAsyncSave(unittest.TestCase):
+    def setUp(self):
+        self.save_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        paddle.disable_static()
+        shutil.rmtree(self.save_dir)
+
+    def test_timeit_save(self):
+        model = build_model(True, hidden_size=4096)
+        costs = []
+        for async_save in [False, True]:
+            path = os.path.join(self.save_dir, str(async_save))
+            start = time.time()
+            model.save(path, async_save=async_save)
+            costs.append(time.time() - start)
+            model.wait_save()
+        print(
+            "blocking time of save: sync {:.4f}s, async {:.4f}s".format(*costs)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
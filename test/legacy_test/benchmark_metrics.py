@@ -0,0 +1,65 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+
+import numpy as np
+
+import paddle
+
+# Benchmarks of the update and accumulate cost of metrics, which are not run
+# in the unit tests.
+
+
+class BenchmarkAuc(unittest.TestCase):
+    def test_timeit_update(self):
+        # per-batch update cost versus batch size
+        m = paddle.metric.Auc()
+        for batch_size in [128, 1024, 8192, 65536]:
+            preds = np.random.random(size=(batch_size, 1))
+            preds = np.concatenate((1 - preds, preds), axis=1)
+            labels = np.random.randint(2, size=(batch_size, 1))
+            iters = 10
+            start = time.time()
+            for _ in range(iters):
+                m.update(preds, labels)
+            elapse = (time.time() - start) / iters
+            print(
+                "Auc.update with batch size {} cost {:.6f}s".format(
+                    batch_size, elapse
+                )
+            )
+        start = time.time()
+        m.accumulate()
+        print("Auc.accumulate cost {:.6f}s".format(time.time() - start))
+
+
+class BenchmarkPrecision(unittest.TestCase):
+    def test_timeit_update(self):
+        m = paddle.metric.Precision()
+        for batch_size in [1024, 65536]:
+            x = np.random.random(size=(batch_size, 1))
+            y = np.random.randint(2, size=(batch_size, 1))
+            start = time.time()
+            m.update(x, y)
+            print(
+                "Precision.update with batch size {} cost {:.6f}s".format(
+                    batch_size, time.time() - start
+                )
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
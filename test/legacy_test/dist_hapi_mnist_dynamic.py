@@ -94,6 +94,12 @@ class TestDistTraning(unittest.TestCase):
 
         np.testing.assert_allclose(acc, eval_result['acc'])
 
+        # the metrics are all reduced without the padding samples
+        val_subset = paddle.io.Subset(val_dataset, list(range(1001)))
+        eval_result = model.evaluate(val_subset, batch_size=64)
+        acc = compute_accuracy(output[0][:1001], val_dataset.labels[:1001])
+        np.testing.assert_allclose(acc, eval_result['acc'])
+
 
 if __name__ == '__main__':
     unittest.main()
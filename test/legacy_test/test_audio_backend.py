@@ -18,6 +18,7 @@ import numpy as np
 import soundfile
 
 import paddle.audio
+from paddle.audio.backends import wave_backend
 
 
 class TestAudioBackends(unittest.TestCase):
@@ -158,6 +159,42 @@ class TestAudioBackends(unittest.TestCase):
         if os.path.exists(wave_wav_path):
             os.remove(wave_wav_path)
 
+    def test_partial_load_and_stream(self):
+        wave_wav_path = os.path.join(os.getcwd(), "wave_stream_test.wav")
+        waveform = np.random.uniform(-0.5, 0.5, [2, 8000]).astype('float32')
+        paddle.audio.save(wave_wav_path, paddle.to_tensor(waveform), self.sr)
+        wav_data = paddle.audio.load(wave_wav_path)[0].numpy()
+
+        # seek-based partial load from path and file object
+        crop, _ = wave_backend.load(
+            wave_wav_path, frame_offset=1000, num_frames=500
+        )
+        np.testing.assert_array_equal(crop.numpy(), wav_data[:, 1000:1500])
+        with open(wave_wav_path, 'rb') as file_:
+            crop, _ = wave_backend.load(
+                file_, frame_offset=7000, channels_first=False
+            )
+        np.testing.assert_array_equal(crop.numpy(), wav_data[:, 7000:].T)
+        crop, _ = wave_backend.load(wave_wav_path, frame_offset=9000)
+        self.assertEqual(crop.shape, [2, 0])
+
+        chunks = list(
+            wave_backend.stream(
+                wave_wav_path, chunk_frames=3000, frame_offset=100
+            )
+        )
+        self.assertEqual(
+            [chunk.shape for chunk in chunks], [[2, 3000], [2, 3000], [2, 1900]]
+        )
+        np.testing.assert_array_equal(
+            np.concatenate([chunk.numpy() for chunk in chunks], axis=1),
+            wav_data[:, 100:],
+        )
+        with self.assertRaises(ValueError):
+            next(wave_backend.stream(wave_wav_path, chunk_frames=0))
+
+        os.remove(wave_wav_path)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,185 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import glob
+import gzip
+import io
+import os
+import pickle
+import shutil
+import struct
+import tarfile
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+from paddle.dataset.common import _load_cached_arrays
+from paddle.vision.datasets import MNIST, Cifar10, Cifar100
+
+
+def write_fake_mnist(data_dir, num):
+    images = np.random.randint(0, 256, [num, 28, 28]).astype('uint8')
+    labels = np.random.randint(0, 10, [num]).astype('uint8')
+    image_path = os.path.join(data_dir, 'images-idx3-ubyte.gz')
+    label_path = os.path.join(data_dir, 'labels-idx1-ubyte.gz')
+    with gzip.GzipFile(image_path, 'wb') as f:
+        f.write(struct.pack('>IIII', 2051, num, 28, 28) + images.tobytes())
+    with gzip.GzipFile(label_path, 'wb') as f:
+        f.write(struct.pack('>II', 2049, num) + labels.tobytes())
+    return image_path, label_path, images, labels
+
+
+def write_fake_cifar(data_dir, batch_names, label_key, num):
+    data_file = os.path.join(data_dir, 'cifar.tar.gz')
+    images = []
+    labels = []
+    with tarfile.open(data_file, 'w:gz') as tar:
+        for name in batch_names:
+            batch_images = np.random.randint(0, 256, [num, 3072])
+            batch_images = batch_images.astype('uint8')
+            batch_labels = np.random.randint(0, 10, [num]).tolist()
+            buf = pickle.dumps({b'data': batch_images, label_key: batch_labels})
+            info = tarfile.TarInfo('cifar/' + name)
+            info.size = len(buf)
+            tar.addfile(info, io.BytesIO(buf))
+            images.append(batch_images)
+            labels.extend(batch_labels)
+    return data_file, np.concatenate(images), np.array(labels)
+
+
+class TestLoadCachedArrays(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.src_path = os.path.join(self.data_dir, 'src')
+        with open(self.src_path, 'w') as f:
+            f.write('src')
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_cache(self):
+        decode_times = []
+
+        def decode():
+            decode_times.append(1)
+            return np.arange(6).reshape([2, 3]), np.ones([2])
+
+        for _ in range(2):
+            x, y = _load_cached_arrays([self.src_path], ['x', 'y'], decode, '')
+            np.testing.assert_array_equal(x, np.arange(6).reshape([2, 3]))
+            np.testing.assert_array_equal(y, np.ones([2]))
+            self.assertIsInstance(x, np.memmap)
+            self.assertFalse(x.flags.writeable)
+        self.assertEqual(len(decode_times), 1)
+        self.assertEqual(
+            len(glob.glob(os.path.join(self.data_dir, 'src.*.npy'))), 2
+        )
+
+        # changed source file is decoded again
+        time.sleep(0.01)
+        with open(self.src_path, 'w') as f:
+            f.write('changed')
+        _load_cached_arrays([self.src_path], ['x', 'y'], decode, '')
+        self.assertEqual(len(decode_times), 2)
+        # cache files of the old source file are removed
+        self.assertEqual(
+            len(glob.glob(os.path.join(self.data_dir, 'src.*.npy'))), 2
+        )
+
+
+class TestMNISTCache(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_main(self):
+        image_path, label_path, images, labels = write_fake_mnist(
+            self.data_dir, 250
+        )
+        for _ in range(2):
+            mnist = MNIST(image_path, label_path, backend='cv2')
+            self.assertEqual(len(mnist), 250)
+            self.assertIsInstance(mnist._images, np.memmap)
+            self.assertEqual(mnist._images.dtype, np.uint8)
+            self.assertEqual(len(mnist.images), 250)
+            self.assertEqual(mnist.images[5].dtype, np.float32)
+            np.testing.assert_array_equal(
+                mnist.images[5], images[5].reshape([-1])
+            )
+            for idx in [0, 100, 249]:
+                image, label = mnist[idx]
+                self.assertEqual(image.dtype, np.float32)
+                np.testing.assert_array_equal(image, images[idx])
+                self.assertEqual(label.dtype, np.int64)
+                np.testing.assert_array_equal(label, [labels[idx]])
+
+        mnist = MNIST(image_path, label_path, backend='pil')
+        image, label = mnist[3]
+        np.testing.assert_array_equal(np.array(image), images[3])
+
+    def test_subclass(self):
+        image_path, label_path, images, labels = write_fake_mnist(
+            self.data_dir, 20
+        )
+        # subclasses read and slice the float32 images directly
+        mnist = MNIST(image_path, label_path, backend='cv2')
+        mnist.images = mnist.images[:10]
+        self.assertEqual(len(mnist.images), 10)
+        image = np.reshape(mnist.images[9], [1, 28, 28])
+        self.assertEqual(image.dtype, np.float32)
+        np.testing.assert_array_equal(image[0], images[9])
+        self.assertEqual(np.array(mnist.images).dtype, np.float32)
+
+
+class TestCifarCache(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def check_cifar(self, dataset_cls, data_file, mode, images, labels):
+        for _ in range(2):
+            cifar = dataset_cls(data_file, mode=mode, backend='cv2')
+            self.assertEqual(len(cifar), len(labels))
+            for idx in [0, len(labels) - 1]:
+                image, label = cifar[idx]
+                np.testing.assert_array_equal(
+                    image, images[idx].reshape([3, 32, 32]).transpose([1, 2, 0])
+                )
+                self.assertEqual(int(label), labels[idx])
+        self.assertEqual(len(cifar.data), len(labels))
+        image, label = cifar.data[1]
+        np.testing.assert_array_equal(image, images[1])
+        self.assertEqual(int(label), labels[1])
+
+    def test_cifar10(self):
+        data_file, images, labels = write_fake_cifar(
+            self.data_dir, ['data_batch_1', 'data_batch_2'], b'labels', 20
+        )
+        self.check_cifar(Cifar10, data_file, 'train', images, labels)
+
+    def test_cifar100(self):
+        data_file, images, labels = write_fake_cifar(
+            self.data_dir, ['test'], b'fine_labels', 20
+        )
+        self.check_cifar(Cifar100, data_file, 'test', images, labels)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+# Copyright (c) 2023 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import paddle
+from paddle import Model
+from paddle.io import Dataset
+from paddle.nn import CrossEntropyLoss
+from paddle.static import InputSpec
+
+
+class MyModel(paddle.nn.Layer):
+    def __init__(self, hidden_size=20):
+        super().__init__()
+        self._fc1 = paddle.nn.Linear(20, hidden_size)
+        self._fc2 = paddle.nn.Linear(hidden_size, 10)
+
+    def forward(self, x):
+        return self._fc2(self._fc1(x))
+
+
+class MyDataset(Dataset):
+    def __getitem__(self, idx):
+        return (
+            np.random.random([20]).astype(np.float32),
+            np.random.randint(0, 10, (1,)).astype(np.int64),
+        )
+
+    def __len__(self):
+        return 40
+
+
+def build_model(dynamic, hidden_size=20):
+    paddle.disable_static() if dynamic else paddle.enable_static()
+    net = MyModel(hidden_size)
+    inputs = [InputSpec([None, 20], 'float32', 'x')]
+    labels = [InputSpec([None, 1], 'int64', 'label')]
+    model = Model(net, inputs, labels)
+    optim = paddle.optimizer.Adam(
+        learning_rate=0.001, parameters=net.parameters()
+    )
+    model.prepare(optimizer=optim, loss=CrossEntropyLoss())
+    return model
+
+
+class TestAsyncSave(unittest.TestCase):
+    def setUp(self):
+        self.save_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        paddle.disable_static()
+        shutil.rmtree(self.save_dir)
+
+    def check_same_files(self, sync_path, async_path):
+        for suffix in ['.pdparams', '.pdopt']:
+            self.assertFalse(os.path.exists(async_path + suffix + '.tmp'))
+            sync_state = paddle.load(sync_path + suffix, return_numpy=True)
+            async_state = paddle.load(async_path + suffix, return_numpy=True)
+            self.assertEqual(sync_state.keys(), async_state.keys())
+            for key, value in sync_state.items():
+                if isinstance(value, np.ndarray):
+                    np.testing.assert_array_equal(value, async_state[key])
+                else:
+                    self.assertEqual(value, async_state[key])
+
+    def test_save_load(self):
+        for dynamic in [True, False]:
+            model = build_model(dynamic)
+            model.fit(MyDataset(), batch_size=8, epochs=1, verbose=0)
+            sync_path = os.path.join(self.save_dir, str(dynamic), 'sync')
+            async_path = os.path.join(self.save_dir, str(dynamic), 'async')
+            model.save(sync_path)
+            model.save(async_path, async_save=True)
+            # the snapshot is taken when saving
+            model.fit(MyDataset(), batch_size=8, epochs=1, verbose=0)
+            model.wait_save()
+            self.check_same_files(sync_path, async_path)
+
+            # load waits for the saving
+            model.save(async_path, async_save=True)
+            model.load(async_path)
+
+    def test_model_checkpoint(self):
+        model = build_model(True)
+        callback = paddle.callbacks.ModelCheckpoint(
+            save_dir=self.save_dir, async_save=True
+        )
+        model.fit(
+            MyDataset(), batch_size=8, epochs=2, verbose=0, callbacks=callback
+        )
+        for name in ['0', '1', 'final']:
+            path = os.path.join(self.save_dir, name)
+            self.assertTrue(os.path.exists(path + '.pdparams'))
+            self.assertTrue(os.path.exists(path + '.pdopt'))
+        model.save(os.path.join(self.save_dir, 'sync'))
+        self.check_same_files(
+            os.path.join(self.save_dir, 'sync'),
+            os.path.join(self.save_dir, 'final'),
+        )
+
+    def test_error(self):
+        model = build_model(True)
+        path = os.path.join(self.save_dir, 'error')
+        # the temporary file can not be written
+        os.makedirs(path + '.pdparams.tmp')
+        model.save(path, async_save=True)
+        with self.assertRaises(RuntimeError):
+            model.wait_save()
+        # the error is raised only once
+        model.wait_save()
+
+
+if __name__ == '__main__':
+    unittest.main()
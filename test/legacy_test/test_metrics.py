@@ -238,6 +238,22 @@ class TestAccuracyStatic(TestAccuracyDynamic):
         paddle.disable_static()
 
 
+class TestAccuracyMerge(unittest.TestCase):
+    def test_merge(self):
+        correct = np.random.randint(2, size=(100, 5)).astype('float32')
+        full = paddle.metric.Accuracy(topk=(1, 5))
+        full.update(correct)
+        m0 = paddle.metric.Accuracy(topk=(1, 5))
+        m0.update(correct[:30])
+        m1 = paddle.metric.Accuracy(topk=(1, 5))
+        m1.update(correct[30:])
+        m0.merge(m1)
+        np.testing.assert_allclose(m0.accumulate(), full.accumulate())
+
+        with self.assertRaises(ValueError):
+            m0.merge(paddle.metric.Accuracy())
+
+
 class TestAccuracyStaticMultiTopk(TestAccuracyStatic):
     def setUp(self):
         self.topk = (1, 5)
@@ -285,6 +301,50 @@ class TestPrecision(unittest.TestCase):
         self.assertEqual(m.fp, 0.0)
         self.assertEqual(m.accumulate(), 0.0)
 
+    def test_thresholds(self):
+        x = np.random.random(size=(100, 1))
+        y = np.random.randint(2, size=(100, 1))
+        thresholds = [0.2, 0.5, 0.8]
+        m = paddle.metric.Precision(threshold=thresholds)
+        m.update(x, y)
+        for threshold, r in zip(thresholds, m.accumulate()):
+            single = paddle.metric.Precision(threshold=threshold)
+            single.update(x, y)
+            self.assertAlmostEqual(r, single.accumulate())
+
+    def test_multi_class(self):
+        x = np.array([[0.1, 0.9, 0.0], [0.8, 0.2, 0.0], [0.3, 0.7, 0.0]])
+        y = np.array([[1], [1], [0]])
+        m = paddle.metric.Precision(num_classes=3, average=None)
+        m.update(x, y)
+        self.assertEqual(m.accumulate(), [0.0, 0.5, 0.0])
+        m = paddle.metric.Precision(num_classes=3, average='micro')
+        m.update(paddle.to_tensor(x), paddle.to_tensor(y))
+        self.assertAlmostEqual(m.accumulate(), 1.0 / 3.0)
+        m = paddle.metric.Precision(num_classes=3)
+        m.update(x, np.eye(3)[y.reshape(-1)])
+        self.assertAlmostEqual(m.accumulate(), 0.5 / 3.0)
+
+        with self.assertRaises(ValueError):
+            paddle.metric.Precision(num_classes=3, average='weighted')
+
+    def test_merge(self):
+        x = np.random.random(size=(100, 4))
+        y = np.random.randint(4, size=(100, 1))
+        full = paddle.metric.Precision(num_classes=4)
+        full.update(x, y)
+        m0 = paddle.metric.Precision(num_classes=4)
+        m0.update(x[:60], y[:60])
+        m1 = paddle.metric.Precision(num_classes=4)
+        m1.update(x[60:], y[60:])
+        m0.merge(m1)
+        self.assertAlmostEqual(m0.accumulate(), full.accumulate())
+
+        with self.assertRaises(ValueError):
+            m0.merge(paddle.metric.Precision())
+        with self.assertRaises(TypeError):
+            m0.merge(paddle.metric.Recall(num_classes=4))
+
 
 class TestRecall(unittest.TestCase):
     def test_1d(self):
@@ -308,6 +368,21 @@ class TestRecall(unittest.TestCase):
         self.assertEqual(m.fn, 0.0)
         self.assertEqual(m.accumulate(), 0.0)
 
+    def test_multi_class(self):
+        x = np.array([[0.1, 0.9], [0.8, 0.2], [0.3, 0.7]])
+        y = np.array([1, 1, 0])
+        m = paddle.metric.Recall(num_classes=2, average=None)
+        m.update(x, y)
+        self.assertEqual(m.accumulate(), [0.0, 0.5])
+
+        m0 = paddle.metric.Recall(threshold=[0.3, 0.6])
+        m0.update(x[:, 1], y)
+        self.assertEqual(m0.accumulate(), [0.5, 0.5])
+        m1 = paddle.metric.Recall(threshold=[0.3, 0.6])
+        m1.update(np.array([0.5, 0.4]), np.array([1, 1]))
+        m0.merge(m1)
+        self.assertEqual(m0.accumulate(), [0.75, 0.25])
+
 
 class TestAuc(unittest.TestCase):
     def test_auc_numpy(self):
@@ -356,6 +431,71 @@ class TestAuc(unittest.TestCase):
         m.reset()
         self.assertEqual(m.accumulate(), 0.0)
 
+    def test_auc_exact(self):
+        x = np.array(
+            [
+                [0.78, 0.22],
+                [0.62, 0.38],
+                [0.55, 0.45],
+                [0.30, 0.70],
+                [0.14, 0.86],
+                [0.59, 0.41],
+                [0.91, 0.08],
+                [0.16, 0.84],
+            ]
+        )
+        y = np.array([[0], [1], [1], [0], [1], [0], [0], [1]])
+        m = paddle.metric.Auc(exact=True)
+        m.update(x, y)
+        self.assertAlmostEqual(m.accumulate(), 0.8125)
+        m.update(paddle.to_tensor(x), paddle.to_tensor(y))
+        self.assertAlmostEqual(m.accumulate(), 0.8125)
+
+        m.reset()
+        self.assertEqual(m.accumulate(), 0.0)
+
+    def test_auc_bucket_close_to_exact(self):
+        np.random.seed(2023)
+        n = 10000
+        labels = np.random.randint(2, size=(n, 1))
+        pos_score = np.clip(
+            np.random.normal(0.5 + 0.2 * labels[:, 0], 0.2), 0.0, 1.0
+        )
+        preds = np.stack([1 - pos_score, pos_score], axis=1)
+
+        bucket = paddle.metric.Auc()
+        exact = paddle.metric.Auc(exact=True)
+        for i in range(0, n, 1000):
+            bucket.update(preds[i : i + 1000], labels[i : i + 1000])
+            exact.update(preds[i : i + 1000], labels[i : i + 1000])
+        self.assertAlmostEqual(bucket.accumulate(), exact.accumulate(), 3)
+
+        tensor_bucket = paddle.metric.Auc()
+        tensor_bucket.update(paddle.to_tensor(preds), paddle.to_tensor(labels))
+        np.testing.assert_allclose(tensor_bucket._stat_pos, bucket._stat_pos)
+        np.testing.assert_allclose(tensor_bucket._stat_neg, bucket._stat_neg)
+
+    def test_auc_merge(self):
+        np.random.seed(2023)
+        preds = np.random.random(size=(64, 1))
+        preds = np.concatenate((1 - preds, preds), axis=1)
+        labels = np.random.randint(2, size=(64, 1))
+
+        for exact in [False, True]:
+            full = paddle.metric.Auc(exact=exact)
+            full.update(preds, labels)
+            m0 = paddle.metric.Auc(exact=exact)
+            m0.update(preds[:32], labels[:32])
+            m1 = paddle.metric.Auc(exact=exact)
+            m1.update(preds[32:], labels[32:])
+            m0.merge(m1)
+            self.assertAlmostEqual(m0.accumulate(), full.accumulate())
+
+        with self.assertRaises(ValueError):
+            paddle.metric.Auc().merge(paddle.metric.Auc(num_thresholds=255))
+        with self.assertRaises(TypeError):
+            paddle.metric.Auc().merge(paddle.metric.Precision())
+
 
 if __name__ == '__main__':
     unittest.main()